@@ -490,6 +490,7 @@ from .resolver import (
     CanonicalQuestionnaireResolver,
     CanonicalQuestionnaire,
     AssemblyProvenance,
+    QuestionPatternIndex,
     QuestionnairePort,
     ResolverError,
     AssemblyError,
@@ -505,6 +506,7 @@ __all__.extend(
         "CanonicalQuestionnaireResolver",
         "CanonicalQuestionnaire",
         "AssemblyProvenance",
+        "QuestionPatternIndex",
         "QuestionnairePort",
         "ResolverError",
         "AssemblyError",
@@ -28,8 +28,14 @@ Date: 2026-01-23
 
 from __future__ import annotations
 
+import gc
 import hashlib
+import hmac
 import json
+import mmap
+import os
+import pickle
+import struct
 import subprocess
 import time
 from dataclasses import dataclass, field
@@ -153,6 +159,10 @@ class CanonicalQuestionnaire:
     _micro_questions: list[dict[str, Any]]
     source: str  # 'modular_resolver' or 'legacy_monolith'
     provenance: AssemblyProvenance
+    _pattern_index: QuestionPatternIndex | None = field(default=None, repr=False, compare=False)
+    _questions_by_id: dict[str, dict[str, Any]] | None = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def data(self) -> dict[str, Any]:
@@ -174,6 +184,188 @@ class CanonicalQuestionnaire:
         """Iterator over micro questions for compatibility."""
         return iter(self._micro_questions)
 
+    @property
+    def pattern_index(self) -> QuestionPatternIndex:
+        """Inverted question → pattern index over the pattern registry."""
+        if self._pattern_index is None:
+            registry = self._data.get("patterns", {}).get("patterns", {})
+            self._pattern_index = QuestionPatternIndex.build(registry)
+        return self._pattern_index
+
+    def pattern_ids_for_question(self, question_id: str) -> tuple[str, ...]:
+        """
+        Registry pattern ids that apply to a question, wildcard patterns included.
+
+        Order follows the pattern registry. Unknown question ids get only the
+        wildcard patterns.
+        """
+        return self.pattern_index.pattern_ids(question_id)
+
+    def get_question(self, question_id: str) -> dict[str, Any] | None:
+        """Micro question by id, or None if the questionnaire does not define it."""
+        if self._questions_by_id is None:
+            self._questions_by_id = {
+                q["question_id"]: q for q in self._micro_questions if "question_id" in q
+            }
+        return self._questions_by_id.get(question_id)
+
+    def patterns_for_question(self, question_id: str) -> list[dict[str, Any]]:
+        """
+        Patterns attached to a micro question during assembly.
+
+        This is the per-question view consumers should use instead of scanning
+        micro_questions or re-filtering ``applies_to_questions`` themselves.
+        Returns an empty list for unknown question ids.
+        """
+        question = self.get_question(question_id)
+        if question is None:
+            return []
+        return question.get("patterns", [])
+
+
+@dataclass(frozen=True)
+class QuestionPatternIndex:
+    """
+    Inverted index from question id to applicable pattern ids.
+
+    Built once per pattern registry. ``by_question`` lists are pre-merged with
+    the wildcard bucket (patterns whose ``applies_to_questions`` contains
+    ``"*"``) and keep registry order, so a lookup is a single dict access.
+    """
+
+    by_question: dict[str, tuple[str, ...]]
+    wildcard: tuple[str, ...]
+
+    @classmethod
+    def build(cls, pattern_registry: dict[str, Any]) -> QuestionPatternIndex:
+        buckets: dict[str, list[str]] = {}
+        wildcard: list[str] = []
+        for pattern_id, pattern_data in pattern_registry.items():
+            if not isinstance(pattern_data, dict):
+                continue
+            applies_to = pattern_data.get("applies_to_questions") or []
+            if "*" in applies_to:
+                wildcard.append(pattern_id)
+                for ids in buckets.values():
+                    ids.append(pattern_id)
+                continue
+            for question_id in dict.fromkeys(applies_to):
+                if question_id not in buckets:
+                    buckets[question_id] = list(wildcard)
+                buckets[question_id].append(pattern_id)
+        return cls(
+            by_question={qid: tuple(ids) for qid, ids in buckets.items()},
+            wildcard=tuple(wildcard),
+        )
+
+    def pattern_ids(self, question_id: str) -> tuple[str, ...]:
+        return self.by_question.get(question_id, self.wildcard)
+
+    def __contains__(self, question_id: object) -> bool:
+        return question_id in self.by_question
+
+    def __len__(self) -> int:
+        return len(self.by_question)
+
+
+def _normalize_pattern(pattern_id: str, pattern_data: dict[str, Any]) -> dict[str, Any]:
+    """Shape a registry entry as the pattern dict embedded in micro questions."""
+    return {
+        "id": pattern_id,
+        "pattern": pattern_data.get("pattern", ""),
+        "match_type": pattern_data.get("match_type", "REGEX"),
+        "category": pattern_data.get("category", "GENERAL"),
+        "confidence_weight": pattern_data.get("confidence_weight", 0.85),
+        "semantic_expansion": pattern_data.get("semantic_expansion", []),
+        "context_requirement": pattern_data.get("context_requirement"),
+        "evidence_boost": pattern_data.get("evidence_boost", 1.0),
+    }
+
+
+# ============================================================================
+# COMPILED SNAPSHOT FORMAT
+# ============================================================================
+
+# Layout: struct header | JSON index | pickled payload | pickled source segments
+#   header:  magic (8s), format version (I), JSON index length (I),
+#            HMAC-SHA256 of everything after the header (32s)
+#   index:   sha256, version, provenance, payload [offset, length, sha256],
+#            sources {relative_path: [mtime_ns, size, sha256, offset, length,
+#                     segment_sha256]}
+# Offsets are relative to the end of the JSON index. The payload is the
+# assembled data; segments hold each parsed source file so that a rebuild
+# only re-parses the files whose fingerprint changed.
+#
+# The MAC key lives in a separate per-user file (mode 0600) next to the
+# snapshot, so whoever can rewrite the snapshot cannot make it verify
+# without also being able to read the key. Snapshots are written to the
+# user cache directory, never into the source tree.
+SNAPSHOT_MAGIC = b"FARFANQS"
+SNAPSHOT_FORMAT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct("<8sII32s")
+SNAPSHOT_KEY_NAME = "snapshot.key"
+SNAPSHOT_KEY_BYTES = 32
+
+
+def default_snapshot_path(root: Path) -> Path:
+    """Snapshot location for the questionnaire tree at ``root``.
+
+    ``$FARFAN_CACHE_DIR/questionnaire`` if set, else
+    ``$XDG_CACHE_HOME/farfan/questionnaire`` (``~/.cache`` by default).
+    The file name embeds a digest of ``root`` so checkouts do not collide.
+    """
+    cache_dir = os.environ.get("FARFAN_CACHE_DIR")
+    if cache_dir:
+        directory = Path(cache_dir) / "questionnaire"
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        directory = base / "farfan" / "questionnaire"
+    root_digest = hashlib.sha256(str(Path(root).resolve()).encode("utf-8")).hexdigest()[:16]
+    return directory / f"questionnaire_snapshot-{root_digest}.bin"
+
+
+def _load_snapshot_key(directory: Path) -> bytes:
+    """Per-user snapshot MAC key in ``directory``, created on first use.
+
+    Raises:
+        OSError: If the key cannot be read or created, or is malformed
+    """
+    key_path = directory / SNAPSHOT_KEY_NAME
+    if not key_path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = directory / f"{SNAPSHOT_KEY_NAME}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.urandom(SNAPSHOT_KEY_BYTES))
+            # link() fails if another process created the key first; keep theirs
+            os.link(tmp_path, key_path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    key = key_path.read_bytes()
+    if len(key) != SNAPSHOT_KEY_BYTES:
+        raise OSError(f"malformed snapshot key: {key_path}")
+    return key
+
+
+@dataclass
+class _SnapshotIndex:
+    """Parsed snapshot index plus the mapped body it points into."""
+
+    index: dict[str, Any]
+    body: memoryview
+    mapping: mmap.mmap
+
+    def segment(self, offset: int, length: int) -> memoryview:
+        return self.body[offset : offset + length]
+
+    def close(self) -> None:
+        self.body.release()
+        self.mapping.close()
+
 
 # ============================================================================
 # RESOLVER EXCEPTIONS
@@ -247,6 +439,8 @@ class CanonicalQuestionnaireResolver:
         strict_mode: bool = True,
         cache_enabled: bool = True,
         sdo_enabled: bool = True,
+        snapshot_enabled: bool = True,
+        snapshot_path: Path | None = None,
     ):
         """
         Initialize resolver.
@@ -258,16 +452,33 @@ class CanonicalQuestionnaireResolver:
                         If False, log warnings and continue.
             cache_enabled: If True, cache assembled payload.
             sdo_enabled: If True, initialize Signal Distribution Orchestrator.
+            snapshot_enabled: If True, load/write the compiled snapshot so
+                        other processes skip reassembly.
+            snapshot_path: Snapshot file location. Defaults to the user
+                        cache directory (see ``default_snapshot_path``).
         """
         self._root = root or Path(__file__).resolve().parent
         self._strict_mode = strict_mode
         self._cache_enabled = cache_enabled
         self._sdo_enabled = sdo_enabled and SDO_AVAILABLE
+        self._snapshot_enabled = snapshot_enabled
+        self._snapshot_path = snapshot_path or default_snapshot_path(self._root)
+        self._snapshot_key: bytes | None = None
+
+        # Snapshot state: previous snapshot (for incremental rebuilds) and
+        # fingerprints of every source read during the current assembly
+        self._snapshot: _SnapshotIndex | None = None
+        self._source_records: dict[str, dict[str, Any]] = {}
+        self._snapshot_status: str = "disabled" if not snapshot_enabled else "unused"
+        self._snapshot_reused_sources = 0
 
         # Cached payload
         self._cached_questionnaire: CanonicalQuestionnaire | None = None
         self._cache_hash: str | None = None
 
+        # Inverted question → pattern index, built by _load_patterns
+        self._pattern_lookup = QuestionPatternIndex(by_question={}, wildcard=())
+
         # Metrics
         self._metrics = AssemblyMetrics()
         
@@ -488,9 +699,29 @@ class CanonicalQuestionnaireResolver:
                 )
             return self._cached_questionnaire
 
+        # Compiled snapshot (shared across processes and runs)
+        if self._snapshot_enabled and not force_rebuild:
+            questionnaire = self._load_snapshot()
+            if questionnaire is not None:
+                if expected_hash and questionnaire.sha256 != expected_hash:
+                    self._close_snapshot()
+                    raise IntegrityError(
+                        f"Snapshot questionnaire hash mismatch. "
+                        f"Expected: {expected_hash[:16]}..., "
+                        f"Got: {questionnaire.sha256[:16]}..."
+                    )
+                self._close_snapshot()
+                if self._cache_enabled:
+                    self._cached_questionnaire = questionnaire
+                return questionnaire
+
         # Build fresh
         start_time = time.perf_counter()
         self._metrics = AssemblyMetrics()  # Reset metrics
+        self._source_records = {}
+        self._snapshot_reused_sources = 0
+        if force_rebuild:
+            self._close_snapshot()
 
         try:
             questionnaire = self._assemble()
@@ -518,6 +749,9 @@ class CanonicalQuestionnaireResolver:
             if self._cache_enabled:
                 self._cached_questionnaire = questionnaire
 
+            if self._snapshot_enabled and not self._metrics.validation_errors:
+                self._write_snapshot(questionnaire)
+
             return questionnaire
 
         except Exception as e:
@@ -527,6 +761,8 @@ class CanonicalQuestionnaireResolver:
                 metrics=self._metrics.__dict__,
             )
             raise
+        finally:
+            self._close_snapshot()
 
     def invalidate_cache(self) -> None:
         """Invalidate cached questionnaire."""
@@ -545,6 +781,9 @@ class CanonicalQuestionnaireResolver:
             "cache_enabled": self._cache_enabled,
             "cache_populated": self._cached_questionnaire is not None,
             "sdo_enabled": self._sdo_enabled,
+            "snapshot_status": self._snapshot_status,
+            "snapshot_reused_sources": self._snapshot_reused_sources,
+            "snapshot_path": str(self._snapshot_path),
         }
         
         # Add SDO metrics if available
@@ -579,54 +818,28 @@ class CanonicalQuestionnaireResolver:
         14. Compute integrity hash
         15. Create provenance record
         """
-        source_paths: list[str] = []
         start_time = time.perf_counter()
+        source_paths = self._collect_source_paths()
 
         # 1. Canonical Notation (foundation) - located in config/
         canonical_notation = self._load_json("config/canonical_notation.json")
-        source_paths.append(str(self._root / "config/canonical_notation.json"))
 
-        # 2. Governance
+        # 2-9. Governance, dimensions, policy areas, clusters, scoring,
+        # patterns, semantic, cross-cutting
         governance = self._load_governance()
-        source_paths.extend(self._get_dir_paths("governance"))
-
-        # 3. Dimensions
         dimensions = self._load_dimensions()
-        source_paths.extend(self._get_dir_paths("dimensions"))
-
-        # 4. Policy Areas
         policy_areas = self._load_policy_areas()
-        source_paths.extend(self._get_dir_paths("policy_areas"))
-
-        # 5. Clusters
         clusters = self._load_clusters()
-        source_paths.extend(self._get_dir_paths("clusters"))
-
-        # 6. Scoring
         scoring = self._load_scoring()
-        source_paths.extend(self._get_dir_paths("scoring"))
-
-        # 7. Patterns
         patterns = self._load_patterns()
-        source_paths.extend(self._get_dir_paths("patterns"))
-
-        # 8. Semantic
         semantic = self._load_semantic()
-        source_paths.extend(self._get_dir_paths("semantic"))
-
-        # 9. Cross-Cutting
         cross_cutting = self._load_cross_cutting()
-        source_paths.extend(self._get_dir_paths("cross_cutting"))
 
         # 10. MESO Questions - located in _registry/questions/
         meso_questions = self._load_json_safe("_registry/questions/meso_questions.json", default=[])
-        if (self._root / "_registry/questions/meso_questions.json").exists():
-            source_paths.append(str(self._root / "_registry/questions/meso_questions.json"))
 
         # 11. MACRO Question - located in _registry/questions/
         macro_question = self._load_json_safe("_registry/questions/macro_question.json", default={})
-        if (self._root / "_registry/questions/macro_question.json").exists():
-            source_paths.append(str(self._root / "_registry/questions/macro_question.json"))
 
         # 12. Assemble Micro Questions
         micro_questions = self._assemble_micro_questions(dimensions, policy_areas, patterns)
@@ -686,20 +899,42 @@ class CanonicalQuestionnaireResolver:
             _micro_questions=micro_questions,
             source="modular_resolver",
             provenance=provenance,
+            _pattern_index=self._pattern_lookup,
         )
 
     # ========================================================================
     # COMPONENT LOADERS
     # ========================================================================
 
+    def _collect_source_paths(self) -> list[str]:
+        """List every file the assembly depends on, in assembly order."""
+        source_paths = [str(self._root / "config/canonical_notation.json")]
+        for dirname in (
+            "governance",
+            "dimensions",
+            "policy_areas",
+            "clusters",
+            "scoring",
+            "patterns",
+            "semantic",
+            "cross_cutting",
+        ):
+            source_paths.extend(self._get_dir_paths(dirname))
+        for relative_path in (
+            "_registry/questions/meso_questions.json",
+            "_registry/questions/macro_question.json",
+        ):
+            if (self._root / relative_path).exists():
+                source_paths.append(str(self._root / relative_path))
+        return source_paths
+
     def _load_json(self, relative_path: str) -> dict[str, Any]:
         """Load JSON file from root."""
         path = self._root / relative_path
         if not path.exists():
             raise AssemblyError(f"Required file not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_source(relative_path)
 
         self._metrics.files_loaded += 1
         return data
@@ -714,12 +949,51 @@ class CanonicalQuestionnaireResolver:
         if not path.exists():
             return default
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_source(relative_path)
 
         self._metrics.files_loaded += 1
         return data
 
+    def _read_source(self, relative_path: str) -> Any:
+        """Parse one source file, reusing the previous snapshot's copy if unchanged.
+
+        Records the file's fingerprint and parsed form for the next snapshot.
+        """
+        path = self._root / relative_path
+        key = Path(relative_path).as_posix()
+        stat = path.stat()
+
+        previous = None
+        if self._snapshot is not None:
+            previous = self._snapshot.index["sources"].get(key)
+        segment = None
+        if (
+            previous is not None
+            and previous[3] is not None
+            and previous[0] == stat.st_mtime_ns
+            and previous[1] == stat.st_size
+        ):
+            with self._snapshot.segment(previous[3], previous[4]) as view:
+                segment = bytes(view)
+            if hashlib.sha256(segment).hexdigest() != previous[5]:
+                segment = None
+        if segment is not None:
+            record = {"sha256": previous[2], "segment": segment}
+            # Segment of a snapshot whose HMAC was verified in _open_snapshot
+            data = pickle.loads(segment)  # nosec B301
+            self._snapshot_reused_sources += 1
+        else:
+            raw = path.read_bytes()
+            data = json.loads(raw.decode("utf-8"))
+            record = {
+                "sha256": hashlib.sha256(raw).hexdigest(),
+                "segment": pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+            }
+
+        record.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._source_records[key] = record
+        return data
+
     def _get_dir_paths(self, dirname: str) -> list[str]:
         """Get all JSON file paths in directory."""
         dir_path = self._root / dirname
@@ -879,22 +1153,23 @@ class CanonicalQuestionnaireResolver:
         return scoring
 
     def _load_patterns(self) -> dict[str, Any]:
-        """Load pattern registry."""
+        """Load pattern registry and build the question → pattern index."""
+        self._pattern_lookup = QuestionPatternIndex(by_question={}, wildcard=())
         patterns_dir = self._root / "patterns"
         if not patterns_dir.exists():
             return {}
 
-        # Prefer index.json if exists
-        index_path = patterns_dir / "index.json"
-        if index_path.exists():
-            return self._load_json("patterns/index.json")
+        patterns: dict[str, Any] = {}
 
-        # Fallback to pattern_registry_v3.json
-        v3_path = patterns_dir / "pattern_registry_v3.json"
-        if v3_path.exists():
-            return self._load_json("patterns/pattern_registry_v3.json")
+        # Prefer index.json if exists, fallback to pattern_registry_v3.json
+        if (patterns_dir / "index.json").exists():
+            patterns = self._load_json("patterns/index.json")
+        elif (patterns_dir / "pattern_registry_v3.json").exists():
+            patterns = self._load_json("patterns/pattern_registry_v3.json")
 
-        return {}
+        # Invert applies_to_questions once so per-question enrichment is a lookup
+        self._pattern_lookup = QuestionPatternIndex.build(patterns.get("patterns", {}))
+        return patterns
 
     def _load_semantic(self) -> dict[str, Any]:
         """Load semantic configuration."""
@@ -1028,29 +1303,12 @@ class CanonicalQuestionnaireResolver:
         question_id: str,
         pattern_index: dict[str, Any],
     ) -> list[dict[str, Any]]:
-        """Get patterns applicable to a question."""
-        patterns = []
-
-        for pattern_id, pattern_data in pattern_index.items():
-            if not isinstance(pattern_data, dict):
-                continue
-
-            applies_to = pattern_data.get("applies_to_questions", [])
-            if question_id in applies_to or "*" in applies_to:
-                patterns.append(
-                    {
-                        "id": pattern_id,
-                        "pattern": pattern_data.get("pattern", ""),
-                        "match_type": pattern_data.get("match_type", "REGEX"),
-                        "category": pattern_data.get("category", "GENERAL"),
-                        "confidence_weight": pattern_data.get("confidence_weight", 0.85),
-                        "semantic_expansion": pattern_data.get("semantic_expansion", []),
-                        "context_requirement": pattern_data.get("context_requirement"),
-                        "evidence_boost": pattern_data.get("evidence_boost", 1.0),
-                    }
-                )
-                self._metrics.patterns_merged += 1
-
+        """Get patterns applicable to a question via the inverted index."""
+        patterns = [
+            _normalize_pattern(pattern_id, pattern_index[pattern_id])
+            for pattern_id in self._pattern_lookup.pattern_ids(question_id)
+        ]
+        self._metrics.patterns_merged += len(patterns)
         return patterns
 
     # ========================================================================
@@ -1103,6 +1361,256 @@ class CanonicalQuestionnaireResolver:
                 for error in errors:
                     logger.warning("validation_error", error=error)
 
+    # ========================================================================
+    # COMPILED SNAPSHOT
+    # ========================================================================
+
+    def _snapshot_mac(self, parts: list[bytes | memoryview]) -> bytes:
+        """HMAC-SHA256 of ``parts`` under the per-user snapshot key.
+
+        Raises:
+            OSError: If the key is unavailable
+        """
+        if self._snapshot_key is None:
+            self._snapshot_key = _load_snapshot_key(self._snapshot_path.parent)
+        mac = hmac.new(self._snapshot_key, digestmod=hashlib.sha256)
+        for part in parts:
+            mac.update(part)
+        return mac.digest()
+
+    def _open_snapshot(self) -> _SnapshotIndex | None:
+        """Memory-map the snapshot, verify its HMAC and parse its index.
+
+        Returns None if the snapshot is missing, malformed or not signed
+        with this user's key; nothing in it is unpickled in that case.
+        """
+        try:
+            with open(self._snapshot_path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, format_version, index_length, mac = SNAPSHOT_HEADER.unpack_from(mapping, 0)
+            if magic != SNAPSHOT_MAGIC or format_version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"unsupported snapshot format {magic!r} v{format_version}")
+            with memoryview(mapping) as view:
+                expected_mac = self._snapshot_mac([view[SNAPSHOT_HEADER.size :]])
+            if not hmac.compare_digest(mac, expected_mac):
+                raise ValueError("snapshot HMAC mismatch")
+            index_end = SNAPSHOT_HEADER.size + index_length
+            index = json.loads(mapping[SNAPSHOT_HEADER.size : index_end].decode("utf-8"))
+            if index.get("resolver_version") != self.RESOLVER_VERSION:
+                raise ValueError(f"snapshot built by resolver {index.get('resolver_version')}")
+            return _SnapshotIndex(index=index, body=memoryview(mapping)[index_end:], mapping=mapping)
+        except Exception as e:
+            mapping.close()
+            logger.warning(
+                "questionnaire_snapshot_unreadable", path=str(self._snapshot_path), error=str(e)
+            )
+            return None
+
+    def _close_snapshot(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _snapshot_is_current(self, index: dict[str, Any]) -> tuple[bool, dict[str, int]]:
+        """Check every source against its recorded fingerprint.
+
+        A file whose mtime changed but whose content hash did not (e.g.
+        after a checkout or touch) still counts as current.
+
+        Returns:
+            (current, touched) where ``touched`` maps such files to their
+            new mtime so the index can be refreshed.
+        """
+        sources = index["sources"]
+        touched: dict[str, int] = {}
+        if not {self._source_key(path) for path in self._collect_source_paths()}.issubset(sources):
+            return False, touched
+        root = str(self._root)
+        for key, (mtime_ns, size, sha256, *_segment) in sources.items():
+            path = os.path.join(root, key)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False, touched
+            if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+                continue
+            with open(path, "rb") as f:
+                if stat.st_size != size or hashlib.sha256(f.read()).hexdigest() != sha256:
+                    return False, touched
+            touched[key] = stat.st_mtime_ns
+        return True, touched
+
+    def _source_key(self, path: str) -> str:
+        """Snapshot key of a source path: relative to root, POSIX separators."""
+        return os.path.relpath(path, self._root).replace(os.sep, "/")
+
+    def _load_snapshot(self) -> CanonicalQuestionnaire | None:
+        """Load the questionnaire from the compiled snapshot if it is current.
+
+        A readable but stale snapshot is kept open so the rebuild can reuse
+        the parsed copies of unchanged source files.
+        """
+        start_time = time.perf_counter()
+        snapshot = self._open_snapshot()
+        if snapshot is None:
+            self._snapshot_status = "missing"
+            return None
+        self._snapshot = snapshot
+
+        current, touched = self._snapshot_is_current(snapshot.index)
+        if not current:
+            self._snapshot_status = "stale"
+            logger.info("questionnaire_snapshot_stale", path=str(self._snapshot_path))
+            return None
+
+        offset, length, payload_sha256 = snapshot.index["payload"]
+        with snapshot.segment(offset, length) as payload:
+            if hashlib.sha256(payload).hexdigest() != payload_sha256:
+                self._snapshot_status = "corrupt"
+                logger.warning("questionnaire_snapshot_corrupt", path=str(self._snapshot_path))
+                data = None
+            else:
+                # Materializing the payload allocates ~1e5 containers; the cyclic
+                # GC would otherwise rescan them repeatedly while they are created
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    # Payload of a snapshot whose HMAC was verified in _open_snapshot
+                    data = pickle.loads(payload)  # nosec B301
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+        if data is None:
+            self._close_snapshot()
+            return None
+        if touched:
+            self._refresh_snapshot_index(snapshot, touched)
+        provenance = dict(snapshot.index["provenance"])
+        provenance["source_paths"] = tuple(provenance["source_paths"])
+        self._snapshot_status = "hit"
+        logger.info(
+            "questionnaire_snapshot_loaded",
+            sha256=snapshot.index["sha256"][:16],
+            elapsed_ms=round((time.perf_counter() - start_time) * 1000, 2),
+        )
+        return CanonicalQuestionnaire(
+            _data=data,
+            _sha256=snapshot.index["sha256"],
+            _version=snapshot.index["version"],
+            _micro_questions=data["blocks"]["micro_questions"],
+            source="modular_resolver",
+            provenance=AssemblyProvenance(**provenance),
+        )
+
+    def _refresh_snapshot_index(self, snapshot: _SnapshotIndex, touched: dict[str, int]) -> None:
+        """Record new mtimes of content-identical sources so they are not rehashed."""
+        index = dict(snapshot.index)
+        index["sources"] = dict(index["sources"])
+        for key, mtime_ns in touched.items():
+            index["sources"][key] = [mtime_ns, *index["sources"][key][1:]]
+        self._write_snapshot_file(json.dumps(index, ensure_ascii=False).encode("utf-8"), [snapshot.body])
+
+    def _write_snapshot_file(self, index: bytes, chunks: list[bytes | memoryview]) -> bool:
+        """Atomically replace the snapshot file; returns False if it cannot be written."""
+        tmp_path = self._snapshot_path.with_name(f"{self._snapshot_path.name}.{os.getpid()}.{id(self)}.tmp")
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            mac = self._snapshot_mac([index, *chunks])
+            with open(tmp_path, "wb") as f:
+                f.write(
+                    SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(index), mac)
+                )
+                f.write(index)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, self._snapshot_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(
+                "questionnaire_snapshot_write_failed", path=str(self._snapshot_path), error=str(e)
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _source_entry(
+        record: dict[str, Any], append: Callable[[bytes], tuple[int, int]]
+    ) -> list[Any]:
+        """Index entry for a parsed source whose segment is appended to the body."""
+        segment_offset, segment_length = append(record["segment"])
+        return [
+            record["mtime_ns"],
+            record["size"],
+            record["sha256"],
+            segment_offset,
+            segment_length,
+            hashlib.sha256(record["segment"]).hexdigest(),
+        ]
+
+    def _write_snapshot(self, questionnaire: CanonicalQuestionnaire) -> None:
+        """Atomically write the compiled snapshot for ``questionnaire``."""
+        chunks: list[bytes] = []
+        offset = 0
+
+        def append(blob: bytes) -> tuple[int, int]:
+            nonlocal offset
+            chunks.append(blob)
+            start, offset = offset, offset + len(blob)
+            return start, len(blob)
+
+        payload = pickle.dumps(questionnaire.data, protocol=pickle.HIGHEST_PROTOCOL)
+        payload_offset, payload_length = append(payload)
+
+        sources: dict[str, list[Any]] = {}
+        for path in self._collect_source_paths():
+            key = self._source_key(path)
+            record = self._source_records.get(key)
+            if record is None:
+                # Listed (so it invalidates the snapshot) but not parsed
+                raw = (self._root / key).read_bytes()
+                stat = (self._root / key).stat()
+                sources[key] = [
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    hashlib.sha256(raw).hexdigest(),
+                    None,
+                    None,
+                    None,
+                ]
+            else:
+                sources[key] = self._source_entry(record, append)
+        for key, record in self._source_records.items():
+            if key not in sources:
+                sources[key] = self._source_entry(record, append)
+
+        index = json.dumps(
+            {
+                "resolver_version": self.RESOLVER_VERSION,
+                "sha256": questionnaire.sha256,
+                "version": questionnaire.version,
+                "provenance": questionnaire.provenance.to_dict(),
+                "payload": [payload_offset, payload_length, hashlib.sha256(payload).hexdigest()],
+                "sources": sources,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        if not self._write_snapshot_file(index, chunks):
+            return
+
+        self._snapshot_status = "written"
+        logger.info(
+            "questionnaire_snapshot_written",
+            path=str(self._snapshot_path),
+            sources=len(sources),
+            reused_sources=self._snapshot_reused_sources,
+            size_bytes=SNAPSHOT_HEADER.size + len(index) + offset,
+        )
+
     # ========================================================================
     # INTEGRITY
     # ========================================================================
@@ -1191,6 +1699,7 @@ __all__ = [
     "CanonicalQuestionnaireResolver",
     "CanonicalQuestionnaire",
     "AssemblyProvenance",
+    "QuestionPatternIndex",
     # Protocol
     "QuestionnairePort",
     # Exceptions
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Regenera registries/class_registry_manifest.json: para cada ruta de clase del
+registro de la Fase 2, los módulos de terceros que su módulo importa de forma
+incondicional.
+
+El modo perezoso del registro (FARFAN_LAZY_CLASS_REGISTRY=1) usa este
+manifiesto para decidir qué clases están disponibles sin importar nada.
+Se obtiene por análisis estático (AST); el script no importa los módulos de
+métodos.
+
+Uso:
+    python scripts/generation/build_class_registry_manifest.py
+    python scripts/generation/build_class_registry_manifest.py --check
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = REPO_ROOT / "src/farfan_pipeline/phases/Phase_02/phase2_10_01_class_registry.py"
+
+
+def load_module_from_file(module_name, file_path):
+    """Carga un módulo desde un archivo sin ejecutar __init__.py del paquete"""
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> int:
+    class_registry = load_module_from_file("phase2_10_01_class_registry", MODULE_PATH)
+
+    parser = argparse.ArgumentParser(
+        description="Regenera el manifiesto de dependencias del registro de clases"
+    )
+    parser.add_argument("--output", default=str(class_registry.DEPENDENCY_MANIFEST_PATH))
+    parser.add_argument(
+        "--check", action="store_true", help="Solo verificar que el manifiesto esté al día"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        current = class_registry.load_dependency_manifest(args.output)
+        if current != class_registry.generate_dependency_manifest():
+            print(f"{args.output} está desactualizado; ejecute este script sin --check")
+            return 1
+        print(f"Al día: {args.output} ({len(current)} rutas de clase)")
+        return 0
+
+    manifest = class_registry.write_dependency_manifest(args.output)
+    dependencies = sorted({dep for deps in manifest.values() for dep in deps})
+    print(f"Rutas de clase: {len(manifest)}")
+    print(f"Manifiesto: {args.output}")
+    print(f"Dependencias de terceros: {', '.join(dependencies)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
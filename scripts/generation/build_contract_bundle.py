@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Compila los contratos v4 de generated_contracts/ en el bundle precompilado
+(contracts.bundle-<hash>.sqlite, en la caché del usuario) que cargan los
+ejecutores de la Fase 2.
+
+Solo se leen y validan los contratos nuevos o modificados; ejecutarlo de nuevo
+sin cambios no vuelve a validar nada.
+
+Uso:
+    python scripts/generation/build_contract_bundle.py
+    python scripts/generation/build_contract_bundle.py --no-validate
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = REPO_ROOT / "src/farfan_pipeline/phases/Phase_02/phase2_60_06_contract_bundle.py"
+
+
+def load_module_from_file(module_name, file_path):
+    """Carga un módulo desde un archivo sin ejecutar __init__.py del paquete"""
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    contract_bundle = load_module_from_file("phase2_60_06_contract_bundle", MODULE_PATH)
+
+    parser = argparse.ArgumentParser(description="Compila el bundle de contratos de ejecutores")
+    parser.add_argument("--contracts-dir", default=str(contract_bundle.DEFAULT_CONTRACTS_DIR))
+    parser.add_argument("--bundle", help="Ruta del bundle (por defecto: en la caché del usuario, $FARFAN_CACHE_DIR o ~/.cache/farfan)")
+    parser.add_argument("--schema", default=str(contract_bundle.DEFAULT_SCHEMA_PATH))
+    parser.add_argument("--no-validate", action="store_true", help="No validar contra el JSON Schema")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    stats = contract_bundle.build_contract_bundle(
+        args.contracts_dir, args.bundle, args.schema, validate=not args.no_validate
+    )
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from collections import defaultdict
 import statistics
 
+from farfan_pipeline.dashboard_atroz_.artifact_warehouse import AGGREGATION_LEVELS, ArtifactWarehouse
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,11 +89,14 @@ class AnalyticsEngine:
     6. Predictive insights using statistical methods
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, warehouse: Optional[ArtifactWarehouse] = None):
         self.data_dir = data_dir
         self.jobs_dir = data_dir / "jobs"
         self.logger = logging.getLogger(__name__)
 
+        # Same indexed artifact store as the DataMiningEngine
+        self.warehouse = warehouse or ArtifactWarehouse(self.jobs_dir)
+
         # Load reference data
         self.questionnaire_metadata = self._load_questionnaire_metadata()
         self.benchmark_data = self._load_benchmark_data()
@@ -394,9 +399,13 @@ class AnalyticsEngine:
     # Helper methods
 
     def _load_entity_data(self, entity: str, entity_type: str) -> Dict[str, Any]:
-        """Load data for a specific entity"""
-        # Placeholder - will load from jobs directory
-        return {"entity": entity, "type": entity_type, "scores": {}}
+        """Load per-policy-area mean scores for a specific entity from the artifact warehouse"""
+        if entity_type not in AGGREGATION_LEVELS:
+            return {"entity": entity, "type": entity_type, "scores": {}}
+
+        self.warehouse.refresh()
+        scores = self.warehouse.group_means("policy_area", filters={entity_type: [entity]})
+        return {"entity": entity, "type": entity_type, "scores": scores}
 
     def _calculate_entity_metrics(self, data: Dict[str, Any]) -> Dict[str, float]:
         """Calculate comprehensive metrics for an entity"""
@@ -558,13 +567,31 @@ class AnalyticsEngine:
         return steps
 
     def _load_all_entities_data(self, entity_type: str) -> List[Dict[str, Any]]:
-        """Load data for all entities of a type"""
-        return []
+        """Load mean scores for all entities of a type from the artifact warehouse"""
+        if entity_type not in AGGREGATION_LEVELS:
+            return []
+
+        self.warehouse.refresh()
+        return [
+            {"entity": entity, "type": entity_type, "mean_score": mean_score}
+            for entity, mean_score in self.warehouse.group_means(entity_type).items()
+        ]
 
     def _calculate_percentile_ranking(self, entity: str,
                                      all_entities: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate percentile ranking"""
-        return {"percentile": 50, "rank": 85, "total": 170}
+        entity_scores = {d["entity"]: d["mean_score"] for d in all_entities}
+        if entity not in entity_scores:
+            # Placeholder until the entity has scored artifacts
+            return {"percentile": 50, "rank": 85, "total": 170}
+
+        total = len(entity_scores)
+        higher_count = sum(1 for score in entity_scores.values() if score > entity_scores[entity])
+        return {
+            "percentile": ((total - higher_count) / total) * 100,
+            "rank": higher_count + 1,
+            "total": total,
+        }
 
     def _benchmark_policy_areas(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Benchmark individual policy areas"""
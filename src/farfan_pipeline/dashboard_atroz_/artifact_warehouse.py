@@ -0,0 +1,377 @@
+"""
+ATROZ Dashboard - Artifact Warehouse
+====================================
+
+Local SQLite store of the score records found in job artifacts
+(``jobs/job_*/phase_0N/{scores,results,aggregated,final}_*.json``), shared by
+the DataMiningEngine and the AnalyticsEngine.
+
+Artifacts are ingested incrementally: every refresh stats the artifact files
+and only (re)parses those whose mtime or size changed since they were last
+ingested; records of deleted files are dropped. Records are indexed by
+municipality, policy area, dimension and phase, and queries push their
+filters and column projection down to SQL, so a dashboard query reads only
+the matching rows instead of re-parsing the whole corpus.
+
+Version: 1.0.0
+"""
+
+import json
+import logging
+import sqlite3
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PATTERNS = (
+    "scores_*.json",
+    "results_*.json",
+    "aggregated_*.json",
+    "final_*.json",
+)
+
+# Record fields promoted to indexed columns (filter and group-by keys)
+KEY_COLUMNS = ("municipality", "policy_area", "dimension", "cluster", "subregion")
+AGGREGATION_LEVELS = KEY_COLUMNS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifact_files (
+    path TEXT PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    record_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    municipality,
+    policy_area,
+    dimension,
+    cluster,
+    subregion,
+    question_number,
+    has_score INTEGER NOT NULL,
+    score REAL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_path ON records(path);
+CREATE INDEX IF NOT EXISTS idx_records_municipality ON records(municipality);
+CREATE INDEX IF NOT EXISTS idx_records_policy_area ON records(policy_area, dimension);
+CREATE INDEX IF NOT EXISTS idx_records_dimension ON records(dimension);
+CREATE INDEX IF NOT EXISTS idx_records_phase ON records(phase);
+"""
+
+
+def _column_value(value: Any) -> Any:
+    """Value stored in an indexed column (unhashable values are stored as JSON)."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def _numeric(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class ArtifactWarehouse:
+    """
+    Incrementally maintained, indexed store of job artifact records.
+
+    Args:
+        jobs_dir: Directory holding the ``job_*`` directories
+        db_path: SQLite database path (default: ``<jobs_dir>/../.artifact_warehouse.sqlite3``;
+                 in-memory when the directory is not writable)
+        min_refresh_interval: Seconds during which a refresh is skipped after
+                              the previous one (0 rescans on every query)
+    """
+
+    def __init__(
+        self,
+        jobs_dir: Path,
+        db_path: Optional[Path] = None,
+        min_refresh_interval: float = 2.0,
+    ):
+        self.jobs_dir = Path(jobs_dir)
+        self.min_refresh_interval = min_refresh_interval
+        self._lock = threading.RLock()
+        self._last_refresh: Optional[float] = None
+        self.metrics = {"refreshes": 0, "files_ingested": 0, "files_removed": 0, "queries": 0}
+
+        if db_path is None:
+            db_path = self.jobs_dir.parent / ".artifact_warehouse.sqlite3"
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self.db_path = str(db_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Artifact warehouse at {db_path} unavailable ({e}); using in-memory store")
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self.db_path = ":memory:"
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the store up to date with the artifacts on disk.
+
+        Returns:
+            Counts of files ingested (new or changed) and removed in this refresh
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_refresh is not None
+                and now - self._last_refresh < self.min_refresh_interval
+            ):
+                return {"ingested": 0, "removed": 0}
+
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM artifact_files"
+                )
+            }
+            seen = set()
+            ingested = 0
+            with self._conn:
+                for artifact_file, job_id, phase in self._scan():
+                    path = str(artifact_file)
+                    try:
+                        stat = artifact_file.stat()
+                    except OSError:
+                        continue
+                    seen.add(path)
+                    if known.get(path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    self._ingest_file(artifact_file, job_id, phase, stat.st_mtime_ns, stat.st_size)
+                    ingested += 1
+
+                removed = [path for path in known if path not in seen]
+                for path in removed:
+                    self._delete_file(path)
+
+            self._last_refresh = time.monotonic()
+            self.metrics["refreshes"] += 1
+            self.metrics["files_ingested"] += ingested
+            self.metrics["files_removed"] += len(removed)
+            if ingested or removed:
+                logger.info(f"Artifact warehouse: {ingested} file(s) ingested, {len(removed)} removed")
+            return {"ingested": ingested, "removed": len(removed)}
+
+    def _scan(self) -> Iterable[Tuple[Path, str, str]]:
+        """Yield (artifact_file, job_id, phase) for every artifact on disk."""
+        if not self.jobs_dir.exists():
+            logger.warning(f"Jobs directory does not exist: {self.jobs_dir}")
+            return
+        for job_dir in sorted(self.jobs_dir.iterdir()):
+            if not (job_dir.is_dir() and job_dir.name.startswith("job_")):
+                continue
+            for phase_num in range(10):
+                phase_dir = job_dir / f"phase_0{phase_num}"
+                if not phase_dir.is_dir():
+                    continue
+                for pattern in ARTIFACT_PATTERNS:
+                    for artifact_file in sorted(phase_dir.glob(pattern)):
+                        yield artifact_file, job_dir.name, phase_dir.name
+
+    def _ingest_file(self, artifact_file: Path, job_id: str, phase: str, mtime_ns: int, size: int) -> None:
+        path = str(artifact_file)
+        self._conn.execute("DELETE FROM records WHERE path = ?", (path,))
+        try:
+            with open(artifact_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.debug(f"Could not load artifact {artifact_file}: {e}")
+            data = None
+
+        items = data if isinstance(data, list) else [data]
+        rows = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            record = dict(item)
+            record["_job_id"] = job_id
+            record["_phase"] = phase
+            record["_artifact_file"] = path
+            rows.append((
+                path, job_id, phase,
+                *(_column_value(record.get(column)) for column in KEY_COLUMNS),
+                _column_value(record.get("question_number")),
+                1 if "score" in record else 0,
+                _numeric(record.get("score")),
+                json.dumps(record, ensure_ascii=False, default=str),
+            ))
+        self._conn.executemany(
+            "INSERT INTO records(path, job_id, phase, municipality, policy_area, dimension, "
+            "cluster, subregion, question_number, has_score, score, payload) "
+            "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        # A file that failed to parse is still recorded, so it is retried only once it changes
+        self._conn.execute(
+            "INSERT OR REPLACE INTO artifact_files(path, job_id, phase, mtime_ns, size, record_count) "
+            "VALUES(?, ?, ?, ?, ?, ?)",
+            (path, job_id, phase, mtime_ns, size, len(rows)),
+        )
+
+    def _delete_file(self, path: str) -> None:
+        self._conn.execute("DELETE FROM records WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM artifact_files WHERE path = ?", (path,))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def count_records(self) -> int:
+        """Total number of records in the store."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def select(
+        self,
+        filters: Optional[Dict[str, Sequence[Any]]] = None,
+        question_range: Optional[Tuple[int, int]] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        phases: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Full records matching the filters, in ingestion order."""
+        where, params = self._where(filters, question_range, min_score, max_score, phases)
+        with self._lock:
+            self.metrics["queries"] += 1
+            rows = self._conn.execute(f"SELECT payload FROM records{where} ORDER BY id", params)
+            return [json.loads(payload) for (payload,) in rows]
+
+    def aggregate(
+        self,
+        group_by: str,
+        filters: Optional[Dict[str, Sequence[Any]]] = None,
+        question_range: Optional[Tuple[int, int]] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        phases: Optional[Sequence[str]] = None,
+        include_items: bool = True,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Group the matching records by a key column and compute score statistics.
+
+        Only groups with at least one scored record are returned (a missing
+        key groups as "unknown"). Record payloads are decoded only when
+        ``include_items`` is set.
+
+        Returns:
+            (number of matching records, aggregated groups in first-seen order)
+        """
+        if group_by not in AGGREGATION_LEVELS:
+            raise ValueError(f"Unsupported aggregation level: {group_by}")
+        where, params = self._where(filters, question_range, min_score, max_score, phases)
+        columns = f"{group_by}, has_score, score" + (", payload" if include_items else "")
+
+        groups: Dict[Any, Dict[str, Any]] = {}
+        matched = 0
+        with self._lock:
+            self.metrics["queries"] += 1
+            for row in self._conn.execute(f"SELECT {columns} FROM records{where} ORDER BY id", params):
+                matched += 1
+                key = "unknown" if row[0] is None else row[0]
+                group = groups.setdefault(key, {"count": 0, "scores": [], "items": []})
+                group["count"] += 1
+                if row[1]:
+                    group["scores"].append(row[2] if row[2] is not None else 0)
+                if include_items:
+                    group["items"].append(row[3])
+
+        aggregated = []
+        for key, group in groups.items():
+            scores = group["scores"]
+            if not scores:
+                continue
+            agg_item = {
+                group_by: key,
+                "count": group["count"],
+                "mean_score": statistics.mean(scores),
+                "median_score": statistics.median(scores),
+                "std_score": statistics.stdev(scores) if len(scores) > 1 else 0,
+                "min_score": min(scores),
+                "max_score": max(scores),
+            }
+            if include_items:
+                agg_item["items"] = [json.loads(payload) for payload in group["items"]]
+            aggregated.append(agg_item)
+        return matched, aggregated
+
+    def group_means(
+        self,
+        group_by: str,
+        filters: Optional[Dict[str, Sequence[Any]]] = None,
+    ) -> Dict[Any, float]:
+        """Mean score per group key, computed in SQL (scored records only)."""
+        if group_by not in AGGREGATION_LEVELS:
+            raise ValueError(f"Unsupported aggregation level: {group_by}")
+        where, params = self._where(filters, None, None, None, None)
+        where += (" AND " if where else " WHERE ") + f"has_score = 1 AND {group_by} IS NOT NULL"
+        with self._lock:
+            self.metrics["queries"] += 1
+            rows = self._conn.execute(
+                f"SELECT {group_by}, AVG(COALESCE(score, 0)) FROM records{where} "
+                f"GROUP BY {group_by} ORDER BY MIN(id)",
+                params,
+            )
+            return {key: mean for key, mean in rows}
+
+    @staticmethod
+    def _where(
+        filters: Optional[Dict[str, Sequence[Any]]],
+        question_range: Optional[Tuple[int, int]],
+        min_score: Optional[float],
+        max_score: Optional[float],
+        phases: Optional[Sequence[str]],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, values in (filters or {}).items():
+            if column not in KEY_COLUMNS:
+                raise ValueError(f"Unsupported filter column: {column}")
+            if values:
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(_column_value(v) for v in values)
+        if phases:
+            clauses.append(f"phase IN ({', '.join('?' * len(phases))})")
+            params.extend(phases)
+        if question_range:
+            clauses.append("COALESCE(question_number, 0) BETWEEN ? AND ?")
+            params.extend(question_range)
+        if min_score is not None:
+            clauses.append("COALESCE(score, 0) >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("(CASE WHEN has_score THEN COALESCE(score, 0) ELSE 100 END) <= ?")
+            params.append(max_score)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            files, records = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(record_count), 0) FROM artifact_files"
+            ).fetchone()
+        return {**self.metrics, "files": files, "records": records, "db_path": self.db_path}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
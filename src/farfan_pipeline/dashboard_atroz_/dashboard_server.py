@@ -48,6 +48,7 @@ from farfan_pipeline.dashboard_atroz_.data_mining_engine import (
 from farfan_pipeline.dashboard_atroz_.analytics_engine import (
     AnalyticsEngine, AnalyticsReport, ComparativeAnalysis, TrendAnalysis, GapAnalysis
 )
+from farfan_pipeline.dashboard_atroz_.artifact_warehouse import ArtifactWarehouse
 
 # Register enhanced monitoring endpoints
 register_monitoring_endpoints(app)
@@ -73,8 +74,10 @@ pipeline_bridge: PipelineDashboardBridge = None
 dashboard_data_service = DashboardDataService(jobs_dir=DATA_DIR / "jobs")
 
 # Initialize advanced data mining and analytics engines
-data_mining_engine = DataMiningEngine(data_dir=DATA_DIR)
-analytics_engine = AnalyticsEngine(data_dir=DATA_DIR)
+# (both query the same incrementally maintained artifact warehouse)
+artifact_warehouse = ArtifactWarehouse(jobs_dir=DATA_DIR / "jobs")
+data_mining_engine = DataMiningEngine(data_dir=DATA_DIR, warehouse=artifact_warehouse)
+analytics_engine = AnalyticsEngine(data_dir=DATA_DIR, warehouse=artifact_warehouse)
 
 # Evidence stream - will be populated by pipeline analysis
 EVIDENCE_STREAM = [
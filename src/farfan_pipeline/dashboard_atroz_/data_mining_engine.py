@@ -26,6 +26,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from collections import defaultdict
 import statistics
 
+from farfan_pipeline.dashboard_atroz_.artifact_warehouse import ArtifactWarehouse
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,12 +73,15 @@ class DataMiningEngine:
     6. Trend analysis and forecasting
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, warehouse: Optional[ArtifactWarehouse] = None):
         self.data_dir = data_dir
         self.jobs_dir = data_dir / "jobs"
         self.cache = {}
         self.logger = logging.getLogger(__name__)
 
+        # Indexed store of job artifact records (shared with the AnalyticsEngine)
+        self.warehouse = warehouse or ArtifactWarehouse(self.jobs_dir)
+
         # Load canonic questionnaire metadata
         self.questionnaire_metadata = self._load_questionnaire_metadata()
 
@@ -155,14 +160,10 @@ class DataMiningEngine:
         Returns:
             MiningResult with statistics, correlations, anomalies, and trends
         """
-        # Load all available data from jobs
-        raw_data = self._load_all_job_data()
-
-        # Apply filters
-        filtered_data = self._apply_filters(raw_data, query)
-
-        # Aggregate data according to query level
-        aggregated_data = self._aggregate_data(filtered_data, query.aggregation_level)
+        # Ingest new or changed job artifacts, then filter and aggregate in the store
+        self.warehouse.refresh()
+        total_records = self.warehouse.count_records()
+        filtered_count, aggregated_data = self._query_warehouse(query)
 
         # Calculate statistics
         statistics_result = self._calculate_statistics(aggregated_data)
@@ -181,8 +182,8 @@ class DataMiningEngine:
 
         return MiningResult(
             query=query,
-            total_records=len(raw_data),
-            filtered_records=len(filtered_data),
+            total_records=total_records,
+            filtered_records=filtered_count,
             statistics=statistics_result,
             data=aggregated_data,
             correlations=correlations,
@@ -191,130 +192,27 @@ class DataMiningEngine:
             geographic_clusters=geographic_clusters
         )
 
-    def _load_all_job_data(self) -> List[Dict[str, Any]]:
-        """Load all job artifacts from the jobs directory"""
-        all_data = []
-
-        if not self.jobs_dir.exists():
-            self.logger.warning(f"Jobs directory does not exist: {self.jobs_dir}")
-            return all_data
-
-        # Scan for job directories
-        for job_dir in self.jobs_dir.iterdir():
-            if job_dir.is_dir() and job_dir.name.startswith("job_"):
-                # Load artifacts from each phase
-                for phase_num in range(10):
-                    phase_dir = job_dir / f"phase_0{phase_num}"
-                    if phase_dir.exists():
-                        artifacts = self._load_phase_artifacts(phase_dir, job_dir.name)
-                        all_data.extend(artifacts)
-
-        return all_data
-
-    def _load_phase_artifacts(self, phase_dir: Path, job_id: str) -> List[Dict[str, Any]]:
-        """Load artifacts from a specific phase directory"""
-        artifacts = []
-
-        # Look for common artifact patterns
-        artifact_patterns = [
-            "scores_*.json",
-            "results_*.json",
-            "aggregated_*.json",
-            "final_*.json"
-        ]
-
-        for pattern in artifact_patterns:
-            for artifact_file in phase_dir.glob(pattern):
-                try:
-                    with open(artifact_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, dict):
-                            data['_job_id'] = job_id
-                            data['_phase'] = phase_dir.name
-                            data['_artifact_file'] = str(artifact_file)
-                            artifacts.append(data)
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict):
-                                    item['_job_id'] = job_id
-                                    item['_phase'] = phase_dir.name
-                                    item['_artifact_file'] = str(artifact_file)
-                                    artifacts.append(item)
-                except Exception as e:
-                    self.logger.debug(f"Could not load artifact {artifact_file}: {e}")
-
-        return artifacts
-
-    def _apply_filters(self, data: List[Dict[str, Any]], query: DataMiningQuery) -> List[Dict[str, Any]]:
-        """Apply query filters to the dataset"""
-        filtered = data
-
-        if query.municipalities:
-            filtered = [d for d in filtered if d.get('municipality') in query.municipalities]
-
-        if query.policy_areas:
-            filtered = [d for d in filtered if d.get('policy_area') in query.policy_areas]
-
-        if query.dimensions:
-            filtered = [d for d in filtered if d.get('dimension') in query.dimensions]
-
-        if query.clusters:
-            filtered = [d for d in filtered if d.get('cluster') in query.clusters]
-
-        if query.subregions:
-            filtered = [d for d in filtered if d.get('subregion') in query.subregions]
-
-        if query.question_range:
-            min_q, max_q = query.question_range
-            filtered = [d for d in filtered
-                       if min_q <= d.get('question_number', 0) <= max_q]
-
-        if query.min_score is not None:
-            filtered = [d for d in filtered if d.get('score', 0) >= query.min_score]
-
-        if query.max_score is not None:
-            filtered = [d for d in filtered if d.get('score', 100) <= query.max_score]
-
-        return filtered
-
-    def _aggregate_data(self, data: List[Dict[str, Any]], level: str) -> List[Dict[str, Any]]:
-        """Aggregate data according to the specified level"""
-        if not data:
-            return []
-
-        aggregation_key = {
-            "municipality": "municipality",
-            "subregion": "subregion",
-            "policy_area": "policy_area",
-            "dimension": "dimension",
-            "cluster": "cluster"
-        }.get(level, "municipality")
-
-        # Group by aggregation key
-        groups = defaultdict(list)
-        for item in data:
-            key = item.get(aggregation_key, "unknown")
-            groups[key].append(item)
-
-        # Aggregate each group
-        aggregated = []
-        for key, items in groups.items():
-            scores = [item.get('score', 0) for item in items if 'score' in item]
-
-            if scores:
-                agg_item = {
-                    aggregation_key: key,
-                    "count": len(items),
-                    "mean_score": statistics.mean(scores),
-                    "median_score": statistics.median(scores),
-                    "std_score": statistics.stdev(scores) if len(scores) > 1 else 0,
-                    "min_score": min(scores),
-                    "max_score": max(scores),
-                    "items": items
-                }
-                aggregated.append(agg_item)
-
-        return aggregated
+    def _query_warehouse(self, query: DataMiningQuery,
+                         include_items: bool = True) -> Tuple[int, List[Dict[str, Any]]]:
+        """Push the query's filters and aggregation level down to the artifact warehouse"""
+        aggregation_key = query.aggregation_level if query.aggregation_level in (
+            "municipality", "subregion", "policy_area", "dimension", "cluster"
+        ) else "municipality"
+
+        return self.warehouse.aggregate(
+            aggregation_key,
+            filters={
+                "municipality": query.municipalities,
+                "policy_area": query.policy_areas,
+                "dimension": query.dimensions,
+                "cluster": query.clusters,
+                "subregion": query.subregions,
+            },
+            question_range=query.question_range,
+            min_score=query.min_score,
+            max_score=query.max_score,
+            include_items=include_items,
+        )
 
     def _calculate_statistics(self, data: List[Dict[str, Any]]) -> Dict[str, float]:
         """Calculate comprehensive statistics on the dataset"""
@@ -455,27 +353,27 @@ class DataMiningEngine:
 
     def _calculate_ranking(self, municipality_code: str) -> Dict[str, Any]:
         """Calculate municipality ranking compared to all others"""
-        # Load all municipality scores
+        # Load all municipality scores (aggregates only, no record payloads)
         all_query = DataMiningQuery(aggregation_level="municipality")
-        all_results = self.execute_query(all_query)
+        _, all_data = self._query_warehouse(all_query, include_items=False)
 
         # Find position
-        municipality_scores = [d for d in all_results.data
+        municipality_scores = [d for d in all_data
                               if d.get('municipality') == municipality_code]
 
         if not municipality_scores:
-            return {"rank": None, "total": len(all_results.data)}
+            return {"rank": None, "total": len(all_data)}
 
         muni_score = municipality_scores[0].get('mean_score', 0)
 
         # Count municipalities with higher scores
-        higher_count = sum(1 for d in all_results.data
+        higher_count = sum(1 for d in all_data
                           if d.get('mean_score', 0) > muni_score)
 
         return {
             "rank": higher_count + 1,
-            "total": len(all_results.data),
-            "percentile": ((len(all_results.data) - higher_count) / len(all_results.data)) * 100
+            "total": len(all_data),
+            "percentile": ((len(all_data) - higher_count) / len(all_data)) * 100
         }
 
     def _identify_strengths(self, policy_area_data: List[Dict[str, Any]]) -> List[str]:
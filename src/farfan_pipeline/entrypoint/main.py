@@ -9,9 +9,15 @@ import sys
 from pathlib import Path
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for farfan-pipeline CLI command.
-    
+
+    Single-plan and batch runs (``--batch DIR_OR_MANIFEST``) share this
+    entry point; arguments are forwarded to the orchestration CLI.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv)
+
     Returns:
         int: Exit code (0 for success, non-zero for failure)
     """
@@ -19,7 +25,7 @@ def main() -> int:
         # Import CLI only when needed to avoid import-time overhead
         from farfan_pipeline.orchestration.cli import main as cli_main
         
-        return cli_main()
+        return cli_main(argv)
     except ImportError as e:
         print(f"Error: Failed to import CLI module: {e}", file=sys.stderr)
         print("Please ensure the package is properly installed.", file=sys.stderr)
@@ -0,0 +1,133 @@
+"""
+Benchmark: page-parallel PDF parsing in the parsed-document store.
+
+Builds the layout layer (per-page text and blocks) and the table layer
+(find_tables) of a plan with 1, 2, 4 and 8 workers, each into a fresh store,
+and reports wall time, speedup and scaling efficiency (speedup / workers).
+Every parallel artifact must be byte-identical to the serial one.
+
+Without --pdf the benchmark plan is data/plans/Plan_1.pdf repeated up to
+--pages pages (default 500, the size of a large PDM).
+
+Usage:
+    python -m farfan_pipeline.infrastructure.benchmark_pdf_extraction
+    python -m farfan_pipeline.infrastructure.benchmark_pdf_extraction --workers 1 2 4 --text-only
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from .parsed_document_store import (
+    LAYOUT_LAYER,
+    PYMUPDF_AVAILABLE,
+    TABLES_LAYER,
+    ParsedDocumentStore,
+    file_sha256,
+)
+
+if PYMUPDF_AVAILABLE:
+    import fitz
+
+DEFAULT_PLAN = Path(__file__).resolve().parents[3] / "data" / "plans" / "Plan_1.pdf"
+
+
+def build_plan(source: Path, pages: int, target: Path) -> Path:
+    """Write a ``pages``-page PDF made of ``source`` repeated."""
+    with fitz.open(source) as src, fitz.open() as out:
+        while len(out) < pages:
+            out.insert_pdf(src, to_page=min(len(src), pages - len(out)) - 1)
+        out.save(target)
+    return target
+
+
+def run_extraction_benchmark(
+    pdf_path: Path,
+    worker_counts: list[int],
+    layers: tuple[str, ...] = (LAYOUT_LAYER, TABLES_LAYER),
+) -> dict[str, Any]:
+    """
+    Time each layer build per worker count.
+
+    Returns:
+        Dict with page count and, per layer, per-worker seconds, speedup,
+        efficiency and whether the artifact matched the first worker count's.
+    """
+    sha256 = file_sha256(pdf_path)
+    report: dict[str, Any] = {"pages": 0, "layers": {}}
+    for layer in layers:
+        rows = []
+        reference = None
+        for workers in worker_counts:
+            with tempfile.TemporaryDirectory() as root:
+                store = ParsedDocumentStore(Path(root), workers=workers)
+                start = time.perf_counter()
+                document = store.open(pdf_path, sha256=sha256)
+                if layer == TABLES_LAYER:
+                    document.page_tables(0)
+                seconds = time.perf_counter() - start
+                if layer == TABLES_LAYER:
+                    # Opening also built the layout layer; time the table layer alone
+                    seconds -= _layout_seconds(report, workers)
+                artifact = store.artifact_path(sha256, layer).read_bytes()
+                report["pages"] = document.page_count
+                store.close()
+            reference = reference if reference is not None else artifact
+            rows.append({"workers": workers, "seconds": round(seconds, 3),
+                         "identical": artifact == reference})
+        # Speedup and efficiency are relative to the first worker count (1 by default)
+        base = rows[0]
+        for row in rows:
+            row["speedup"] = round(base["seconds"] / row["seconds"], 2) if row["seconds"] else None
+            row["efficiency"] = (
+                round(row["speedup"] * base["workers"] / row["workers"], 2) if row["speedup"] else None
+            )
+        report["layers"][layer] = rows
+    return report
+
+
+def _layout_seconds(report: dict[str, Any], workers: int) -> float:
+    for row in report["layers"].get(LAYOUT_LAYER, []):
+        if row["workers"] == workers:
+            return row["seconds"]
+    return 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pdf", help="Plan PDF (default: Plan_1.pdf repeated to --pages)")
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--text-only", action="store_true", help="Skip the table layer")
+    args = parser.parse_args()
+
+    if not PYMUPDF_AVAILABLE:
+        raise SystemExit("PyMuPDF is required to parse PDFs")
+    logging.disable(logging.INFO)
+
+    layers = (LAYOUT_LAYER,) if args.text_only else (LAYOUT_LAYER, TABLES_LAYER)
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pdf:
+            pdf_path = Path(args.pdf)
+        elif DEFAULT_PLAN.exists():
+            pdf_path = build_plan(DEFAULT_PLAN, args.pages, Path(tmp) / "plan.pdf")
+        else:
+            raise SystemExit(f"Plan not found: {DEFAULT_PLAN}; pass --pdf")
+        report = run_extraction_benchmark(pdf_path, args.workers, layers)
+
+    print(f"{report['pages']} pages")
+    for layer, rows in report["layers"].items():
+        print(f"  {layer} layer")
+        for row in rows:
+            print(
+                f"    {row['workers']} worker(s): {row['seconds']:8.2f} s  "
+                f"speedup x{row['speedup']}  efficiency {row['efficiency']:.0%}  "
+                f"identical: {row['identical']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,12 @@ Available Extractors:
 - CausalVerbExtractor (MC08): Causal relationships
 - InstitutionalNERExtractor (MC09): Colombian institutions
 
+Single-pass scanning:
+- MultiExtractorScanEngine runs several extractors over a chunk with one
+  literal prefilter pass, evaluating only the patterns that can match
+- DocumentExtractionCache memoizes results per document by chunk content
+  hash, so phases asking about the same chunk share one extraction
+
 Usage:
     from farfan_pipeline.infrastructure.extractors import FinancialChainExtractor
 
@@ -94,6 +100,21 @@ from .extractor_validator import (
     ValidationMetrics
 )
 
+from .scan_engine import (
+    ChunkScan,
+    MultiExtractorScanEngine
+)
+
+from .extraction_cache import (
+    DocumentExtractionCache,
+    ExtractionCacheKey,
+    active_document_extraction_cache,
+    document_extraction_scope,
+    get_document_extraction_cache,
+    peek_document_extraction_cache,
+    release_document_extraction_cache
+)
+
 # NOTE: ExtractorOrchestrator is DEPRECATED
 # Use UnifiedOrchestrator from farfan_pipeline.orchestration.orchestrator instead
 # See DEPRECATED_ORCHESTRATORS.md for migration guide
@@ -133,6 +154,19 @@ __all__ = [
     'ExtractorValidator',
     'ValidationMetrics',
 
+    # Single-pass scanning
+    'MultiExtractorScanEngine',
+    'ChunkScan',
+
+    # Per-document result cache
+    'DocumentExtractionCache',
+    'ExtractionCacheKey',
+    'active_document_extraction_cache',
+    'document_extraction_scope',
+    'get_document_extraction_cache',
+    'peek_document_extraction_cache',
+    'release_document_extraction_cache',
+
     # Utilities
     'load_all_extractors_from_calibration',
     'generate_test_suite',
@@ -218,6 +218,9 @@ class CausalVerbExtractor(PatternBasedExtractor):
             re.IGNORECASE,
         )
 
+    def scan_patterns(self) -> list[re.Pattern]:
+        return list(self.verb_patterns.values())
+
     def extract(self, text: str, context: dict | None = None) -> ExtractionResult:
         """
         Extract causal links from text.
@@ -234,7 +237,7 @@ class CausalVerbExtractor(PatternBasedExtractor):
 
         # Extract verbs by causal strength
         for strength, pattern in self.verb_patterns.items():
-            for match in pattern.finditer(text):
+            for match in self._finditer(pattern, text):
                 verb_text = match.group(0)
                 verb_start = match.start()
                 verb_end = match.end()
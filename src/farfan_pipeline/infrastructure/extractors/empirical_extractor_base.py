@@ -16,10 +16,14 @@ Version: 2.0.0
 Date: 2026-01-06
 """
 
+import hashlib
 import json
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -27,6 +31,19 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Chunk scan prepared by MultiExtractorScanEngine for the extraction in progress
+_ACTIVE_SCAN: ContextVar[Any] = ContextVar("extractor_active_scan", default=None)
+
+
+@contextmanager
+def activate_scan(scan: Any) -> Iterator[None]:
+    """Serve full-text pattern scans from ``scan`` while the block runs."""
+    token = _ACTIVE_SCAN.set(scan)
+    try:
+        yield
+    finally:
+        _ACTIVE_SCAN.reset(token)
+
 
 @dataclass
 class ExtractionPattern:
@@ -40,9 +57,13 @@ class ExtractionPattern:
     captures: dict[str, Any] = field(default_factory=dict)
     validation_rules: list[dict] = field(default_factory=list)
     empirical_frequency: dict[str, Any] = field(default_factory=dict)
+    _compiled: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
 
     def compile(self) -> re.Pattern:
-        """Compile regex pattern with flags."""
+        """Compile regex pattern with flags (once per pattern)."""
+        if self._compiled is not None:
+            return self._compiled
+
         flag_map = {
             "IGNORECASE": re.IGNORECASE,
             "MULTILINE": re.MULTILINE,
@@ -53,7 +74,8 @@ class ExtractionPattern:
         for flag in self.flags:
             flags_combined |= flag_map.get(flag, 0)
 
-        return re.compile(self.pattern, flags_combined)
+        self._compiled = re.compile(self.pattern, flags_combined)
+        return self._compiled
 
 
 @dataclass
@@ -161,6 +183,61 @@ class EmpiricallyCalibrated(ABC):
         """Extract signals from text. Must be implemented by subclass."""
         pass
 
+    def scan_patterns(self) -> list[re.Pattern]:
+        """
+        Compiled patterns that extract() runs over the whole input text.
+
+        MultiExtractorScanEngine prefilters these across extractors; scans of
+        them inside extract() must go through _finditer().
+        """
+        return []
+
+    def recalibrate(self, calibration_file: Path | None = None) -> None:
+        """Reload calibration data, patterns and gold standards from ``calibration_file``."""
+        if calibration_file is None:
+            calibration_file = self._default_calibration_path()
+        self.calibration = self._load_calibration(calibration_file)
+        self.patterns = self._load_patterns()
+        self.gold_standards = self._load_gold_standards()
+
+    @property
+    def calibration_version(self) -> str:
+        """
+        Digest of the calibration data and scan patterns behind extract().
+
+        Extraction caches key results on it, so a recalibrated extractor never
+        reuses results computed with its previous patterns. The digest is
+        recomputed whenever ``calibration`` is replaced (see recalibrate())
+        or scan_patterns() returns different patterns; edit calibration data
+        by replacing the dict rather than mutating it in place.
+        """
+        calibration = self.calibration
+        patterns = tuple(self.scan_patterns())
+        cached = self.__dict__.get("_calibration_version")
+        if cached is not None and cached[0] is calibration and cached[1] == patterns:
+            return cached[2]
+        payload = json.dumps(
+            {
+                "calibration": calibration,
+                "patterns": [[p.pattern, p.flags] for p in patterns],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        version = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        # Holding the calibration object keeps its identity from being reused
+        self._calibration_version = (calibration, patterns, version)
+        return version
+
+    def _finditer(self, pattern: re.Pattern, text: str) -> Iterator[re.Match]:
+        """pattern.finditer(text), served from the active chunk scan when there is one."""
+        scan = _ACTIVE_SCAN.get()
+        if scan is not None and scan.text is text:
+            matches = scan.matches_for(pattern)
+            if matches is not None:
+                return iter(matches)
+        return pattern.finditer(text)
+
     def validate_extraction(self, result: ExtractionResult) -> tuple[bool, list[str]]:
         """Validate extraction against empirical rules."""
         errors = []
@@ -284,6 +361,9 @@ class EmpiricallyCalibrated(ABC):
 class PatternBasedExtractor(EmpiricallyCalibrated):
     """Base class for pattern-based extractors (regex, keyword)."""
 
+    def scan_patterns(self) -> list[re.Pattern]:
+        return [pattern_obj.compile() for pattern_obj in self.patterns]
+
     def extract(self, text: str, context: dict | None = None) -> ExtractionResult:
         """Extract using compiled patterns."""
         matches = []
@@ -291,7 +371,7 @@ class PatternBasedExtractor(EmpiricallyCalibrated):
         for pattern_obj in self.patterns:
             compiled = pattern_obj.compile()
 
-            for match in compiled.finditer(text):
+            for match in self._finditer(compiled, text):
                 match_dict = {
                     "pattern_id": pattern_obj.pattern_id,
                     "text": match.group(0),
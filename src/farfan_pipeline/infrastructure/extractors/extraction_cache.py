@@ -0,0 +1,432 @@
+"""
+Document-Scoped Extraction Result Cache.
+
+The same chunk text is extracted many times per document: Phase 1 signal
+enrichment runs every extractor over each chunk it enriches, and identical
+chunk texts (repeated headers, boilerplate, re-segmented passages) recur
+throughout a plan.
+
+DocumentExtractionCache memoizes those results for one document, keyed by:
+
+    (extractor id, calibration version, sha256(chunk text), context digest)
+
+The calibration version changes whenever the extractor is recalibrated or its
+scan patterns change, and the context digest separates extractions whose
+output depends on the caller's context (e.g. programmatic hierarchy links).
+
+Entries are stored pickled: the memory tier is bounded in bytes and evicts
+least-recently-used entries to a per-document spill directory instead of
+dropping them, and every hit returns a fresh copy, so callers may mutate
+results freely.
+
+Usage:
+    from farfan_pipeline.infrastructure.extractors import get_document_extraction_cache
+
+    cache = get_document_extraction_cache(plan_id)
+    result = cache.extract(extractor, chunk_text, context)
+    ...
+    release_document_extraction_cache(plan_id)  # drops memory and spill files
+
+Caches are registered per document id; callers must pass an id that is
+unique per plan in the process (the batch runner's deduplicated plan id),
+not the PDF file stem, or two plans would share and release one cache.
+
+Code that is not handed a cache explicitly (SISAS vehicles, extractors
+called deep inside a phase) finds the current document's cache through
+active_document_extraction_cache(); the orchestrator runs every phase
+inside document_extraction_scope(document_id):
+
+    with document_extraction_scope(plan_id):
+        cache = active_document_extraction_cache()  # same as above
+
+Author: CQC Extractor Excellence Framework
+Version: 2.0.0
+Date: 2026-01-06
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .empirical_extractor_base import EmpiricallyCalibrated, ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+
+# Marks a lookup miss, so that a cached None is still a hit
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ExtractionCacheKey:
+    """Identity of one memoized extraction."""
+
+    extractor_id: str
+    calibration_version: str
+    chunk_sha256: str
+    context_digest: str = ""
+
+    @property
+    def digest(self) -> str:
+        """Stable file-name-safe digest of the whole key."""
+        raw = "\x1f".join(
+            (self.extractor_id, self.calibration_version, self.chunk_sha256, self.context_digest)
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def chunk_sha256(text: str) -> str:
+    """sha256 of the chunk text (UTF-8)."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def context_digest(context: dict | None) -> str:
+    """Digest of an extraction context; empty for no context."""
+    if not context:
+        return ""
+    payload = json.dumps(context, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def extractor_id(extractor: EmpiricallyCalibrated) -> str:
+    """Cache identity of an extractor: its class and signal type."""
+    cls = type(extractor)
+    return f"{cls.__module__}.{cls.__qualname__}:{extractor.signal_type}"
+
+
+class DocumentExtractionCache:
+    """
+    Memoizes extraction results for the chunks of one document.
+
+    Args:
+        document_id: Document the cache is scoped to (used for logging and
+            the spill directory name).
+        max_memory_bytes: Budget for pickled entries held in memory; entries
+            beyond it are spilled to disk, least recently used first.
+        spill_dir: Directory for spilled entries. Defaults to a temporary
+            directory owned (and removed on close) by the cache. None with
+            ``spill=False`` evicts instead of spilling.
+        spill: Whether evicted entries are kept on disk.
+    """
+
+    def __init__(
+        self,
+        document_id: str,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        spill_dir: Path | None = None,
+        spill: bool = True,
+    ):
+        self.document_id = document_id
+        self.max_memory_bytes = max_memory_bytes
+        self._spill_enabled = spill
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._owns_spill_dir = spill_dir is None
+
+        self._memory: OrderedDict[ExtractionCacheKey, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: dict[ExtractionCacheKey, tuple[Path, int]] = {}
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._spills = 0
+        self._evictions = 0
+        self._unpicklable = 0
+        self._bytes_saved = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def key_for(
+        self, extractor: EmpiricallyCalibrated, text: str, context: dict | None = None
+    ) -> ExtractionCacheKey:
+        """Cache key for running ``extractor`` over ``text``."""
+        return ExtractionCacheKey(
+            extractor_id=extractor_id(extractor),
+            calibration_version=extractor.calibration_version,
+            chunk_sha256=chunk_sha256(text),
+            context_digest=context_digest(context),
+        )
+
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+
+    def extract(
+        self,
+        extractor: EmpiricallyCalibrated,
+        text: str,
+        context: dict | None = None,
+        compute: Callable[[], ExtractionResult] | None = None,
+    ) -> ExtractionResult:
+        """
+        Cached ``extractor.extract(text, context)``.
+
+        Args:
+            compute: Alternative way to produce the result on a miss (e.g. a
+                MultiExtractorScanEngine chunk scan); defaults to calling
+                the extractor directly.
+        """
+        key = self.key_for(extractor, text, context)
+        return self.memoize(key, text, compute or (lambda: extractor.extract(text, context)))
+
+    def memoize_analysis(
+        self, analysis_id: str, version: str, text: str, compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Memoize any pure analysis of ``text`` that is not an extractor;
+        ``version`` must change whenever the analysis' patterns change.
+        """
+        key = ExtractionCacheKey(analysis_id, version, chunk_sha256(text))
+        return self.memoize(key, text, compute)
+
+    def memoize(self, key: ExtractionCacheKey, text: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key`` or compute, store and return it."""
+        cached = self._lookup(key, text)
+        if cached is not _MISSING:
+            return cached
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def get(self, key: ExtractionCacheKey, text: str = "") -> Any | None:
+        """Fresh copy of the cached value, or None (a miss, or a cached None)."""
+        value = self._lookup(key, text)
+        return None if value is _MISSING else value
+
+    def _lookup(self, key: ExtractionCacheKey, text: str) -> Any:
+        """Fresh copy of the cached value, or _MISSING (counted as a miss)."""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+            elif key in self._disk:
+                blob = self._read_spilled(key)
+                if blob is not None:
+                    self._disk_hits += 1
+                    self._remember(key, blob)
+            if blob is None:
+                self._misses += 1
+                return _MISSING
+            self._hits += 1
+            self._bytes_saved += len(text.encode("utf-8", "surrogatepass"))
+        return pickle.loads(blob)
+
+    def put(self, key: ExtractionCacheKey, value: Any) -> None:
+        """Store a value; values that cannot be pickled are not cached."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            with self._lock:
+                self._unpicklable += 1
+            logger.debug(f"Extraction result for {key.extractor_id} not cacheable: {e}")
+            return
+        with self._lock:
+            self._stores += 1
+            self._remember(key, blob)
+
+    def _remember(self, key: ExtractionCacheKey, blob: bytes) -> None:
+        """Insert into the memory tier and spill LRU entries over budget (lock held)."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = blob
+        self._memory_bytes += len(blob)
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            old_key, old_blob = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old_blob)
+            self._spill(old_key, old_blob)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _spill_root(self) -> Path | None:
+        if not self._spill_enabled:
+            return None
+        if self._spill_dir is None:
+            safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.document_id)
+            self._spill_dir = Path(tempfile.mkdtemp(prefix=f"farfan_extraction_{safe_id}_"))
+        else:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+        return self._spill_dir
+
+    def _spill(self, key: ExtractionCacheKey, blob: bytes) -> None:
+        if key in self._disk:
+            return  # Already on disk from an earlier eviction
+        root = self._spill_root()
+        if root is None:
+            self._evictions += 1
+            return
+        path = root / f"{key.digest}.pkl"
+        try:
+            path.write_bytes(blob)
+        except OSError as e:
+            logger.warning(f"Extraction cache spill failed for {self.document_id}: {e}")
+            self._evictions += 1
+            return
+        self._disk[key] = (path, len(blob))
+        self._disk_bytes += len(blob)
+        self._spills += 1
+
+    def _read_spilled(self, key: ExtractionCacheKey) -> bytes | None:
+        path, size = self._disk[key]
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Spilled extraction result unreadable ({path}): {e}")
+            del self._disk[key]
+            self._disk_bytes -= size
+            return None
+
+    # ------------------------------------------------------------------
+    # Lifecycle and metrics
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory.keys() | self._disk.keys())
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for path, _size in self._disk.values():
+                path.unlink(missing_ok=True)
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    def close(self) -> None:
+        """Clear the cache and remove the spill directory if the cache created it."""
+        self.clear()
+        with self._lock:
+            if self._owns_spill_dir and self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    def __enter__(self) -> "DocumentExtractionCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Hit/miss counters, bytes of chunk text not re-extracted, and tier sizes."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "document_id": self.document_id,
+                "hits": self._hits,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "unpicklable": self._unpicklable,
+                "bytes_saved": self._bytes_saved,
+                "entries": len(self._memory.keys() | self._disk.keys()),
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "spills": self._spills,
+                "evictions": self._evictions,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+            }
+
+
+# Caches shared by every phase working on the same document
+_document_caches: dict[str, DocumentExtractionCache] = {}
+_document_caches_lock = threading.Lock()
+
+# Document whose phases run in the current thread or task
+_active_document: ContextVar[str | None] = ContextVar("active_extraction_document", default=None)
+
+
+def get_document_extraction_cache(document_id: str, **kwargs: Any) -> DocumentExtractionCache:
+    """
+    Get or create the extraction cache of a document.
+
+    Phases that process the same document get the same cache. Keyword
+    arguments configure the cache when it is created and are ignored after.
+    """
+    with _document_caches_lock:
+        cache = _document_caches.get(document_id)
+        if cache is None:
+            cache = DocumentExtractionCache(document_id, **kwargs)
+            _document_caches[document_id] = cache
+        return cache
+
+
+def peek_document_extraction_cache(document_id: str) -> DocumentExtractionCache | None:
+    """The document's cache if one was created, without creating it."""
+    with _document_caches_lock:
+        return _document_caches.get(document_id)
+
+
+def release_document_extraction_cache(document_id: str) -> dict[str, Any] | None:
+    """Close and forget a document's cache; returns its final metrics."""
+    with _document_caches_lock:
+        cache = _document_caches.pop(document_id, None)
+    if cache is None:
+        return None
+    metrics = cache.get_metrics()
+    cache.close()
+    return metrics
+
+
+@contextmanager
+def document_extraction_scope(document_id: str | None) -> Iterator[None]:
+    """
+    Make ``document_id`` the active document for the current thread or task.
+
+    Context variables do not cross into new threads: code that hands work to
+    a thread pool opens the scope again inside the worker.
+    """
+    token = _active_document.set(document_id or None)
+    try:
+        yield
+    finally:
+        _active_document.reset(token)
+
+
+def active_document_extraction_cache() -> DocumentExtractionCache | None:
+    """Extraction cache of the active document, or None outside any scope."""
+    document_id = _active_document.get()
+    if not document_id:
+        return None
+    return get_document_extraction_cache(document_id)
+
+
+__all__ = [
+    "DEFAULT_MAX_MEMORY_BYTES",
+    "DocumentExtractionCache",
+    "ExtractionCacheKey",
+    "active_document_extraction_cache",
+    "chunk_sha256",
+    "context_digest",
+    "document_extraction_scope",
+    "extractor_id",
+    "get_document_extraction_cache",
+    "peek_document_extraction_cache",
+    "release_document_extraction_cache",
+]
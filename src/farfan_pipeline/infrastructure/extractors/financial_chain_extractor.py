@@ -70,6 +70,27 @@ class FinancialChainExtractor(PatternBasedExtractor):
     4. Períodos de vigencia (fiscal years)
     """
 
+    # Patterns from empirical calibration, used when the calibration file has none
+    DEFAULT_MONTO_PATTERNS = [
+        r"\$\s*([\d.,]+)\s*(billones?|mil(?:es)?\s+de\s+millones?|mil\s+millones?|millones?|MM|M)?",
+        r"([\d.,]+)\s*(billones?|mil(?:es)?\s+de\s+millones?|millones?(?:\s+de\s+pesos)?|COP|pesos)",
+        r"valor:\s*\$?\s*([\d.,]+)",
+        r"presupuesto:\s*\$?\s*([\d.,]+)",
+    ]
+
+    DEFAULT_PERIODO_PATTERNS = [
+        r"(20[2-3]\d)\s*[-–]\s*(20[2-3]\d)",
+        r"vigencia\s+(20[2-3]\d)",
+        r"año\s+(20[2-3]\d)",
+        r"(20[2-3]\d)",
+    ]
+
+    # Simple pattern-based program extraction
+    PROGRAMA_PATTERNS = [
+        r"(?:programa|proyecto|iniciativa)[\s:]+([\w\s]+?)(?:\.|,|\n)",
+        r"(?:Programa|Proyecto|Iniciativa):\s*(.*?)(?:\n|$)",
+    ]
+
     def __init__(self, calibration_file: Path | None = None):
         super().__init__(
             signal_type="FINANCIAL_CHAIN", calibration_file=calibration_file, auto_validate=True
@@ -135,6 +156,25 @@ class FinancialChainExtractor(PatternBasedExtractor):
             for pattern_str in config.get("patterns", []):
                 self.periodo_patterns.append(re.compile(pattern_str, re.IGNORECASE))
 
+        # Effective scan patterns: calibrated ones win over the built-in defaults
+        self.active_monto_patterns = self.monto_patterns or [
+            re.compile(p, re.IGNORECASE) for p in self.DEFAULT_MONTO_PATTERNS
+        ]
+        self.active_periodo_patterns = self.periodo_patterns or [
+            re.compile(p) for p in self.DEFAULT_PERIODO_PATTERNS
+        ]
+        self.programa_patterns = [
+            re.compile(p, re.IGNORECASE | re.MULTILINE) for p in self.PROGRAMA_PATTERNS
+        ]
+
+    def scan_patterns(self) -> list[re.Pattern]:
+        return [
+            *self.active_monto_patterns,
+            *(pattern for _fuente_type, pattern in self.fuente_compiled_patterns),
+            *self.programa_patterns,
+            *self.active_periodo_patterns,
+        ]
+
     def extract(self, text: str, context: dict | None = None) -> ExtractionResult:
         """
         Extract financial chains from text.
@@ -203,22 +243,8 @@ class FinancialChainExtractor(PatternBasedExtractor):
         """Extract monetary amounts."""
         montos = []
 
-        # Patterns from empirical calibration
-        default_patterns = [
-            r"\$\s*([\d.,]+)\s*(billones?|mil(?:es)?\s+de\s+millones?|mil\s+millones?|millones?|MM|M)?",
-            r"([\d.,]+)\s*(billones?|mil(?:es)?\s+de\s+millones?|millones?(?:\s+de\s+pesos)?|COP|pesos)",
-            r"valor:\s*\$?\s*([\d.,]+)",
-            r"presupuesto:\s*\$?\s*([\d.,]+)",
-        ]
-
-        patterns = (
-            self.monto_patterns
-            if self.monto_patterns
-            else [re.compile(p, re.IGNORECASE) for p in default_patterns]
-        )
-
-        for pattern in patterns:
-            for match in pattern.finditer(text):
+        for pattern in self.active_monto_patterns:
+            for match in self._finditer(pattern, text):
                 valor_str = match.group(1)
                 unidad = match.group(2) if match.lastindex >= 2 else None
 
@@ -322,7 +348,7 @@ class FinancialChainExtractor(PatternBasedExtractor):
         fuentes = []
 
         for fuente_type, pattern in self.fuente_compiled_patterns:
-            for match in pattern.finditer(text):
+            for match in self._finditer(pattern, text):
                 fuente = {
                     "text": match.group(0),
                     "fuente_type": fuente_type,
@@ -352,14 +378,8 @@ class FinancialChainExtractor(PatternBasedExtractor):
             )
 
         # Simple pattern-based extraction
-        programa_patterns = [
-            r"(?:programa|proyecto|iniciativa)[\s:]+([\w\s]+?)(?:\.|,|\n)",
-            r"(?:Programa|Proyecto|Iniciativa):\s*(.*?)(?:\n|$)",
-        ]
-
-        for pattern_str in programa_patterns:
-            pattern = re.compile(pattern_str, re.IGNORECASE | re.MULTILINE)
-            for match in pattern.finditer(text):
+        for pattern in self.programa_patterns:
+            for match in self._finditer(pattern, text):
                 programa = {
                     "text": match.group(1).strip(),
                     "start": match.start(),
@@ -376,21 +396,8 @@ class FinancialChainExtractor(PatternBasedExtractor):
         periodos = []
         covered_spans = set()
 
-        default_patterns = [
-            r"(20[2-3]\d)\s*[-–]\s*(20[2-3]\d)",
-            r"vigencia\s+(20[2-3]\d)",
-            r"año\s+(20[2-3]\d)",
-            r"(20[2-3]\d)",
-        ]
-
-        patterns = (
-            self.periodo_patterns
-            if self.periodo_patterns
-            else [re.compile(p) for p in default_patterns]
-        )
-
-        for pattern in patterns:
-            for match in pattern.finditer(text):
+        for pattern in self.active_periodo_patterns:
+            for match in self._finditer(pattern, text):
                 # Check if this span is already covered by a previous (more specific) match
                 is_covered = False
                 for start, end in covered_spans:
@@ -162,6 +162,9 @@ class InstitutionalNERExtractor(PatternBasedExtractor):
 
             self.entity_patterns[entity_id] = patterns
 
+    def scan_patterns(self) -> list[re.Pattern]:
+        return [pattern for patterns in self.entity_patterns.values() for pattern in patterns]
+
     def extract(self, text: str, context: dict | None = None) -> ExtractionResult:
         """
         Extract institutional entities from text.
@@ -184,7 +187,7 @@ class InstitutionalNERExtractor(PatternBasedExtractor):
             entity_data = self.entity_registry[entity_id]
 
             for pattern in patterns:
-                for match in pattern.finditer(text):
+                for match in self._finditer(pattern, text):
                     start = match.start()
                     end = match.end()
 
@@ -135,6 +135,9 @@ class NormativeReferenceExtractor(PatternBasedExtractor):
             all_norms.update(pa_norms)
         return all_norms
 
+    def scan_patterns(self) -> List[re.Pattern]:
+        return [pattern for _norm_type, pattern in self.norm_patterns] + [self.acronym_pattern]
+
     def extract(self, text: str, context: Optional[Dict] = None) -> ExtractionResult:
         """Extract normative references from text."""
         references = []
@@ -189,7 +192,7 @@ class NormativeReferenceExtractor(PatternBasedExtractor):
         """Extract references of a specific normative type."""
         references = []
 
-        for match in pattern.finditer(text):
+        for match in self._finditer(pattern, text):
             if norm_type in ["LEY", "DECRETO"]:
                 norm_number = match.group(1)
                 year = int(match.group(2)) if len(match.groups()) >= 2 else None
@@ -241,7 +244,7 @@ class NormativeReferenceExtractor(PatternBasedExtractor):
         """Extract normative acronyms."""
         references = []
 
-        for match in self.acronym_pattern.finditer(text):
+        for match in self._finditer(self.acronym_pattern, text):
             acronym = match.group(0).upper()
 
             ref = {
@@ -133,6 +133,9 @@ class QuantitativeTripletExtractor(PatternBasedExtractor):
             re.IGNORECASE
         )
 
+    def scan_patterns(self) -> List[re.Pattern]:
+        return [self.triplet_inline_pattern, self.lb_pattern, self.meta_pattern]
+
     def extract(self, text: str, context: Optional[Dict] = None) -> ExtractionResult:
         """Extract quantitative triplets from text."""
         triplets = []
@@ -185,7 +188,7 @@ class QuantitativeTripletExtractor(PatternBasedExtractor):
         """Extract complete triplets from single line patterns."""
         triplets = []
 
-        for match in self.triplet_inline_pattern.finditer(text):
+        for match in self._finditer(self.triplet_inline_pattern, text):
             lb_year = match.group(1)
             lb_value = self._normalize_numeric(match.group(2))
             lb_unit = match.group(3)
@@ -219,7 +222,7 @@ class QuantitativeTripletExtractor(PatternBasedExtractor):
 
         # Extract all LBs
         lbs = []
-        for match in self.lb_pattern.finditer(text):
+        for match in self._finditer(self.lb_pattern, text):
             year = match.group(1)
             value = self._normalize_numeric(match.group(2))
             unit = match.group(3)
@@ -235,7 +238,7 @@ class QuantitativeTripletExtractor(PatternBasedExtractor):
 
         # Extract all Metas
         metas = []
-        for match in self.meta_pattern.finditer(text):
+        for match in self._finditer(self.meta_pattern, text):
             year = match.group(1)
             value = self._normalize_numeric(match.group(2))
             unit = match.group(3)
@@ -0,0 +1,378 @@
+"""
+Single-Pass Multi-Extractor Scanning Engine.
+
+Every text extractor scans the whole chunk with its own compiled patterns
+(institutional NER alone holds ~470 entity regexes), so running the six
+extractors over one chunk walks the same text hundreds of times even though
+most patterns cannot possibly match it.
+
+The engine merges the full-text patterns of all registered extractors once:
+
+1. Each regex is parsed and reduced to its *required literals*: a set of
+   strings of which at least one must occur in any match (e.g.
+   ``Decreto\\s+(?:Ley\\s+)?(\\d+)`` requires ``"Decreto"``). Patterns without
+   such a set are always evaluated.
+2. All required literals go into one keyword trie compiled as a single regex
+   and run over a case-folded copy of the chunk. One pass yields every
+   literal present, and therefore the candidate regexes for that chunk.
+3. Extractors then run their normal ``extract`` with the chunk scan active:
+   their full-text ``finditer`` loops are served from the scan (candidates
+   are evaluated once and shared between extractors, non-candidates yield
+   nothing) and all post-processing is unchanged, so the engine returns the
+   same ``ExtractionResult`` objects as calling each extractor directly.
+
+Case folding mirrors the ``re`` module's own IGNORECASE equivalence classes,
+so the prefilter never rejects a chunk a regex could match, whatever the
+pattern's flags.
+
+Usage:
+    from farfan_pipeline.infrastructure.extractors import (
+        CausalVerbExtractor,
+        InstitutionalNERExtractor,
+        MultiExtractorScanEngine,
+    )
+
+    engine = MultiExtractorScanEngine([CausalVerbExtractor(), InstitutionalNERExtractor()])
+    for chunk in chunks:
+        causal, institutional = engine.extract(chunk)
+
+Author: CQC Extractor Excellence Framework
+Version: 2.0.0
+Date: 2026-01-06
+"""
+
+import logging
+import re
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from .empirical_extractor_base import (
+    EmpiricallyCalibrated,
+    ExtractionResult,
+    activate_scan,
+)
+
+if TYPE_CHECKING:
+    from .extraction_cache import DocumentExtractionCache
+
+try:
+    import _sre
+    from re import _casefix
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+
+    _REPEATS = tuple(
+        getattr(sre_constants, name)
+        for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+        if hasattr(sre_constants, name)
+    )
+    LITERAL_PREFILTER_AVAILABLE = True
+except ImportError:  # pragma: no cover - interpreters without CPython's re internals
+    LITERAL_PREFILTER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _FoldTable(dict):
+    """str.translate table mapping each character to its IGNORECASE class representative."""
+
+    def __missing__(self, code: int) -> int:
+        lower = _sre.unicode_tolower(code)
+        representative = min((lower, *_casefix._EXTRA_CASES.get(lower, ())))
+        self[code] = representative
+        return representative
+
+
+_FOLD_TABLE = _FoldTable() if LITERAL_PREFILTER_AVAILABLE else None
+
+
+def fold_case(text: str) -> str:
+    """Fold text so that two strings match under re.IGNORECASE iff their folds are equal."""
+    return text.translate(_FOLD_TABLE)
+
+
+def required_literals(pattern: re.Pattern) -> frozenset[str] | None:
+    """
+    Literals of which at least one occurs in every match of ``pattern``.
+
+    Returns None when no such set can be derived (e.g. ``\\d+`` or an optional
+    group at top level), meaning the pattern must always be evaluated.
+    Literals are case-folded with :func:`fold_case`.
+    """
+    if not LITERAL_PREFILTER_AVAILABLE or not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except (re.error, TypeError, ValueError):
+        return None
+    literals = _sequence_literals(list(parsed))
+    if not literals:
+        return None
+    return frozenset(fold_case(literal) for literal in literals)
+
+
+def _sequence_literals(items: list[tuple[Any, Any]]) -> frozenset[str] | None:
+    """Best required-literal set of a concatenation of parsed regex nodes."""
+    best: frozenset[str] | None = None
+    run: list[str] = []
+
+    def consider(candidate: frozenset[str] | None) -> None:
+        nonlocal best
+        if not candidate:
+            return
+        if best is None or _selectivity(candidate) > _selectivity(best):
+            best = candidate
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            prefix = "".join(run)
+            consider(frozenset([prefix]))
+            if op is sre_constants.BRANCH:
+                # The parser hoists common prefixes out of alternations
+                # ("LB|Línea" -> "L" + ("B"|"ínea")); glue them back on.
+                consider(frozenset(prefix + _leading_run(alt) for alt in av[1]))
+            run = []
+        consider(_node_literals(op, av))
+    if run:
+        consider(frozenset(["".join(run)]))
+    return best
+
+
+def _leading_run(items: Iterable[tuple[Any, Any]]) -> str:
+    """Literal characters at the start of a parsed sequence."""
+    run = []
+    for op, av in items:
+        if op is not sre_constants.LITERAL:
+            break
+        run.append(chr(av))
+    return "".join(run)
+
+
+def _node_literals(op: Any, av: Any) -> frozenset[str] | None:
+    """Required-literal set contributed by a single non-literal node."""
+    if op is sre_constants.SUBPATTERN:
+        return _sequence_literals(list(av[3]))
+    if op is getattr(sre_constants, "ATOMIC_GROUP", None):
+        return _sequence_literals(list(av))
+    if op is sre_constants.BRANCH:
+        union: set[str] = set()
+        for alternative in av[1]:
+            literals = _sequence_literals(list(alternative))
+            if not literals:
+                return None
+            union.update(literals)
+        return frozenset(union)
+    if op in _REPEATS:
+        minimum, _maximum, body = av
+        if minimum >= 1:
+            return _sequence_literals(list(body))
+    return None
+
+
+def _selectivity(literals: frozenset[str]) -> tuple[int, int]:
+    """Longer shortest literal first, then fewer alternatives."""
+    return min(len(literal) for literal in literals), -len(literals)
+
+
+def _trie_regex(literals: Iterable[str]) -> str:
+    """Regex source for a keyword trie; greedy, so it yields the longest key at a position."""
+    root: dict[str, Any] = {}
+    for literal in literals:
+        node = root
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict[str, Any]) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return f"(?:{body})?"
+        return body
+
+    return render(root)
+
+
+class ChunkScan:
+    """
+    Prefiltered view of one chunk, consulted by extractors' full-text scans.
+
+    Candidate patterns are evaluated lazily, at most once per chunk, and their
+    matches are shared by every extractor that scans with an equal pattern.
+    """
+
+    def __init__(self, engine: "MultiExtractorScanEngine", text: str, candidates: frozenset[int]):
+        self.text = text
+        self._engine = engine
+        self._candidates = candidates
+        self._matches: dict[int, list[re.Match]] = {}
+
+    def matches_for(self, pattern: re.Pattern) -> list[re.Match] | None:
+        """Matches of ``pattern`` over the chunk, or None if the engine does not track it."""
+        # Slots are keyed by identity: hashing a compiled pattern hashes its whole program
+        slot = self._engine._slots.get(id(pattern))
+        if slot is None:
+            return None
+        if slot not in self._candidates:
+            self._engine._skipped_evaluations += 1
+            return []
+        matches = self._matches.get(slot)
+        if matches is None:
+            matches = list(pattern.finditer(self.text))
+            self._matches[slot] = matches
+            self._engine._regex_evaluations += 1
+        return matches
+
+    def run(self, extractor: EmpiricallyCalibrated, context: dict | None = None) -> ExtractionResult:
+        """Run an extractor over the chunk with this scan active."""
+        with activate_scan(self):
+            return extractor.extract(self.text, context)
+
+
+class MultiExtractorScanEngine:
+    """
+    Runs several text extractors over chunks with a shared, prefiltered scan.
+
+    Args:
+        extractors: Extractor instances. Their ``scan_patterns()`` declare the
+            full-text regexes the engine prefilters; everything else they do
+            runs unchanged.
+        prefilter: Disable to serve every tracked pattern without the literal
+            prefilter (useful to isolate its effect in benchmarks).
+    """
+
+    def __init__(self, extractors: Sequence[EmpiricallyCalibrated], prefilter: bool = True):
+        self.extractors = list(extractors)
+
+        # Equal (pattern, flags) pairs share one slot across extractors
+        slot_of: dict[re.Pattern, int] = {}
+        self._patterns: list[re.Pattern] = []  # keeps every registered id alive
+        self._slots: dict[int, int] = {}
+        for extractor in self.extractors:
+            for pattern in extractor.scan_patterns():
+                slot = slot_of.setdefault(pattern, len(slot_of))
+                self._slots[id(pattern)] = slot
+                self._patterns.append(pattern)
+
+        always: list[int] = []
+        owners: dict[str, list[int]] = {}
+        for pattern, slot in slot_of.items():
+            literals = required_literals(pattern) if prefilter else None
+            if literals is None:
+                always.append(slot)
+                continue
+            for literal in literals:
+                owners.setdefault(literal, []).append(slot)
+        self._slot_count = len(slot_of)
+        self._always = frozenset(always)
+        self._owners = {literal: tuple(slots) for literal, slots in owners.items()}
+        # The trie reports the longest key at each position; shorter keys that
+        # are prefixes of it are present there too.
+        self._prefix_keys = {
+            literal: tuple(
+                literal[:end] for end in range(1, len(literal) + 1) if literal[:end] in self._owners
+            )
+            for literal in self._owners
+        }
+        self._prefilter = (
+            re.compile(f"(?=({_trie_regex(self._owners)}))", re.DOTALL) if self._owners else None
+        )
+
+        self._chunks_scanned = 0
+        self._regex_evaluations = 0
+        self._skipped_evaluations = 0
+        self._prefilter_seconds = 0.0
+
+        logger.info(
+            f"MultiExtractorScanEngine tracking {self._slot_count} patterns from "
+            f"{len(self.extractors)} extractors ({len(self._always)} without literal prefilter)"
+        )
+
+    def candidates(self, text: str) -> frozenset[int]:
+        """Slots of the tracked patterns that may match ``text``."""
+        if self._prefilter is None:
+            return self._always
+        start = time.perf_counter()
+        found: set[str] = set()
+        for key in self._prefilter.findall(fold_case(text)):
+            if key not in found:
+                found.update(self._prefix_keys[key])
+        candidates = set(self._always)
+        for literal in found:
+            candidates.update(self._owners[literal])
+        self._prefilter_seconds += time.perf_counter() - start
+        return frozenset(candidates)
+
+    def scan(self, text: str) -> ChunkScan:
+        """Prefilter a chunk; run extractors against it with :meth:`ChunkScan.run`."""
+        self._chunks_scanned += 1
+        return ChunkScan(self, text, self.candidates(text))
+
+    def extract(
+        self,
+        text: str,
+        context: dict | None = None,
+        cache: "DocumentExtractionCache | None" = None,
+    ) -> list[ExtractionResult]:
+        """
+        Run every extractor over one chunk; results follow extractor order.
+
+        With a document extraction cache, cached results are reused and the
+        chunk is only prefiltered if some extractor misses.
+        """
+        if cache is None:
+            chunk = self.scan(text)
+            return [chunk.run(extractor, context) for extractor in self.extractors]
+
+        chunk: ChunkScan | None = None
+
+        def run(extractor: EmpiricallyCalibrated) -> ExtractionResult:
+            nonlocal chunk
+            if chunk is None:
+                chunk = self.scan(text)
+            return chunk.run(extractor, context)
+
+        return [
+            cache.extract(extractor, text, context, compute=lambda e=extractor: run(e))
+            for extractor in self.extractors
+        ]
+
+    def extract_chunks(
+        self,
+        chunks: Iterable[str],
+        context: dict | None = None,
+        cache: "DocumentExtractionCache | None" = None,
+    ) -> list[list[ExtractionResult]]:
+        """Run every extractor over each chunk."""
+        return [self.extract(text, context, cache) for text in chunks]
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Prefilter effectiveness counters."""
+        served = self._regex_evaluations + self._skipped_evaluations
+        return {
+            "extractors": len(self.extractors),
+            "tracked_patterns": self._slot_count,
+            "unfiltered_patterns": len(self._always),
+            "prefilter_literals": len(self._owners),
+            "chunks_scanned": self._chunks_scanned,
+            "regex_evaluations": self._regex_evaluations,
+            "skipped_evaluations": self._skipped_evaluations,
+            "skip_rate": self._skipped_evaluations / served if served else 0.0,
+            "prefilter_seconds": round(self._prefilter_seconds, 6),
+        }
+
+
+__all__ = [
+    "LITERAL_PREFILTER_AVAILABLE",
+    "ChunkScan",
+    "MultiExtractorScanEngine",
+    "fold_case",
+    "required_literals",
+]
@@ -112,6 +112,12 @@ class StructuralMarkerExtractor(PatternBasedExtractor):
             re.MULTILINE
         )
 
+        # Simple pattern for "Gráfica N:" or "Figura N:"
+        self.graph_pattern = re.compile(
+            r"(?:Gráfica|Gráfico|Figura|Cuadro)\s+(\d+)[:\s.-]+(.*?)(?=\n|$)",
+            re.IGNORECASE
+        )
+
     def _build_section_patterns(self):
         """Build regex patterns for section detection."""
         self.section_patterns = []
@@ -119,6 +125,13 @@ class StructuralMarkerExtractor(PatternBasedExtractor):
             compiled = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
             self.section_patterns.append((section_name, compiled))
 
+    def scan_patterns(self) -> List[re.Pattern]:
+        return [
+            self.table_title_pattern,
+            *(pattern for _section_name, pattern in self.section_patterns),
+            self.graph_pattern,
+        ]
+
     def extract(self, text: str, context: Optional[Dict] = None) -> ExtractionResult:
         """Extract structural markers from text."""
         structural_elements = []
@@ -170,7 +183,7 @@ class StructuralMarkerExtractor(PatternBasedExtractor):
         tables = []
 
         # Find table titles
-        for match in self.table_title_pattern.finditer(text):
+        for match in self._finditer(self.table_title_pattern, text):
             table_number = match.group(1)
             table_title = match.group(2).strip()
 
@@ -209,7 +222,7 @@ class StructuralMarkerExtractor(PatternBasedExtractor):
         sections = []
 
         for section_name, pattern in self.section_patterns:
-            for match in pattern.finditer(text):
+            for match in self._finditer(pattern, text):
                 section_elem = {
                     "element_id": f"SECTION-{section_name}",
                     "element_type": "SECTION",
@@ -228,13 +241,7 @@ class StructuralMarkerExtractor(PatternBasedExtractor):
         """Extract graph/figure references from text."""
         graphs = []
 
-        # Simple pattern for "Gráfica N:" or "Figura N:"
-        graph_pattern = re.compile(
-            r"(?:Gráfica|Gráfico|Figura|Cuadro)\s+(\d+)[:\s.-]+(.*?)(?=\n|$)",
-            re.IGNORECASE
-        )
-
-        for match in graph_pattern.finditer(text):
+        for match in self._finditer(self.graph_pattern, text):
             graph_number = match.group(1)
             graph_title = match.group(2).strip()
 
@@ -0,0 +1,170 @@
+"""
+Tests for DocumentExtractionCache - per-document memoization of extractions.
+"""
+
+import pytest
+
+from farfan_pipeline.infrastructure.extractors import (
+    CausalVerbExtractor,
+    DocumentExtractionCache,
+    ExtractionPattern,
+    MultiExtractorScanEngine,
+    NormativeReferenceExtractor,
+    PatternBasedExtractor,
+    get_document_extraction_cache,
+    peek_document_extraction_cache,
+    release_document_extraction_cache,
+)
+
+CHUNK = "Ley 1448 de 2011 y Decreto 4800 de 2011. Fortalecer la red para mejorar la atención."
+OTHER_CHUNK = "Resolución 1841 de 2013 del Ministerio de Salud."
+
+
+class CountingExtractor(PatternBasedExtractor):
+    """Pattern-based extractor that counts real extractions."""
+
+    def __init__(self, tmp_path, pattern=r"ley\s+\d+"):
+        super().__init__(signal_type="COUNTING", calibration_file=tmp_path / "missing.json")
+        self.patterns = [
+            ExtractionPattern(pattern_id="P0", pattern=pattern, pattern_type="REGEX",
+                              confidence_base=0.8, flags=["IGNORECASE"])
+        ]
+        self.calls = 0
+
+    def extract(self, text, context=None):
+        self.calls += 1
+        return super().extract(text, context)
+
+
+def test_hits_return_equal_independent_copies(tmp_path):
+    extractor = NormativeReferenceExtractor()
+    with DocumentExtractionCache("plan") as cache:
+        first = cache.extract(extractor, CHUNK)
+        first.matches.append({"mutated": True})
+        second = cache.extract(extractor, CHUNK)
+        third = cache.extract(extractor, CHUNK)
+
+        assert second == third == extractor.extract(CHUNK)
+        assert second is not third
+        metrics = cache.get_metrics()
+        assert (metrics["hits"], metrics["misses"]) == (2, 1)
+        assert metrics["bytes_saved"] == 2 * len(CHUNK.encode("utf-8"))
+
+
+def test_key_separates_text_context_and_calibration(tmp_path):
+    extractor = CountingExtractor(tmp_path)
+    cache = DocumentExtractionCache("plan", spill=False)
+
+    cache.extract(extractor, CHUNK)
+    cache.extract(extractor, OTHER_CHUNK)
+    cache.extract(extractor, CHUNK, {"programa": "Salud"})
+    cache.extract(extractor, CHUNK, {"programa": "Salud"})
+    assert extractor.calls == 3
+
+    recalibrated = CountingExtractor(tmp_path, pattern=r"decreto\s+\d+")
+    assert recalibrated.calibration_version != extractor.calibration_version
+    assert cache.extract(recalibrated, CHUNK).matches[0]["text"] == "Decreto 4800"
+    assert recalibrated.calls == 1
+
+
+def test_recalibrating_an_extractor_changes_its_key(tmp_path):
+    extractor = CountingExtractor(tmp_path)
+    cache = DocumentExtractionCache("plan", spill=False)
+    cache.extract(extractor, CHUNK)
+    version = extractor.calibration_version
+    assert extractor.calibration_version == version
+
+    extractor.patterns = [
+        ExtractionPattern(pattern_id="P1", pattern=r"decreto\s+\d+", pattern_type="REGEX",
+                          confidence_base=0.8, flags=["IGNORECASE"])
+    ]
+    assert extractor.calibration_version != version
+    assert cache.extract(extractor, CHUNK).matches[0]["text"] == "Decreto 4800"
+
+    patterns_version = extractor.calibration_version
+    extractor.calibration = {**extractor.calibration, "confidence_threshold": 0.9}
+    assert extractor.calibration_version != patterns_version
+    cache.extract(extractor, CHUNK)
+    assert extractor.calls == 3
+
+
+def test_cached_none_is_a_hit():
+    cache = DocumentExtractionCache("plan", spill=False)
+    calls = []
+    for _ in range(3):
+        assert cache.memoize_analysis("none", "v1", CHUNK, lambda: calls.append(1)) is None
+    assert len(calls) == 1
+    assert (cache.get_metrics()["hits"], cache.get_metrics()["misses"]) == (2, 1)
+
+
+def test_memory_budget_spills_to_disk_and_reloads(tmp_path):
+    extractor = CountingExtractor(tmp_path)
+    chunks = [f"Ley {n} de 2020 " * 20 for n in range(10)]
+    cache = DocumentExtractionCache("plan", max_memory_bytes=2_000, spill_dir=tmp_path / "spill")
+
+    direct = [extractor.extract(text) for text in chunks]
+    for text in chunks:
+        cache.extract(extractor, text)
+    metrics = cache.get_metrics()
+    assert metrics["memory_bytes"] <= 2_000
+    assert metrics["spills"] > 0
+    assert len(list((tmp_path / "spill").glob("*.pkl"))) == metrics["disk_entries"]
+
+    calls = extractor.calls
+    assert [cache.extract(extractor, text) for text in chunks] == direct
+    assert extractor.calls == calls
+    assert cache.get_metrics()["disk_hits"] > 0
+
+    cache.close()
+    assert not list((tmp_path / "spill").glob("*.pkl"))
+
+
+def test_without_spill_entries_are_evicted(tmp_path):
+    extractor = CountingExtractor(tmp_path)
+    cache = DocumentExtractionCache("plan", max_memory_bytes=1, spill=False)
+    cache.extract(extractor, CHUNK)
+    cache.extract(extractor, OTHER_CHUNK)
+    cache.extract(extractor, CHUNK)
+    assert extractor.calls == 3
+    assert cache.get_metrics()["evictions"] == 2
+
+
+def test_engine_skips_scan_when_every_extractor_hits():
+    extractors = [NormativeReferenceExtractor(), CausalVerbExtractor()]
+    engine = MultiExtractorScanEngine(extractors)
+    cache = DocumentExtractionCache("plan", spill=False)
+
+    first = engine.extract(CHUNK, cache=cache)
+    second = engine.extract(CHUNK, cache=cache)
+
+    assert first == second == [e.extract(CHUNK) for e in extractors]
+    assert engine.get_metrics()["chunks_scanned"] == 1
+
+
+def test_document_registry_shares_and_releases():
+    cache = get_document_extraction_cache("doc-registry-test")
+    assert get_document_extraction_cache("doc-registry-test") is cache
+    assert peek_document_extraction_cache("doc-registry-test") is cache
+
+    metrics = release_document_extraction_cache("doc-registry-test")
+    assert metrics["document_id"] == "doc-registry-test"
+    assert peek_document_extraction_cache("doc-registry-test") is None
+    assert release_document_extraction_cache("doc-registry-test") is None
+
+
+def test_unpicklable_results_are_not_cached(tmp_path):
+    cache = DocumentExtractionCache("plan", spill=False)
+    value = cache.memoize_analysis("lambda", "v1", CHUNK, lambda: {"fn": lambda: None})
+    assert callable(value["fn"])
+    metrics = cache.get_metrics()
+    assert metrics["unpicklable"] == 1
+    assert metrics["entries"] == 0
+
+
+@pytest.mark.parametrize("context", [None, {}])
+def test_empty_contexts_share_an_entry(tmp_path, context):
+    extractor = CountingExtractor(tmp_path)
+    cache = DocumentExtractionCache("plan", spill=False)
+    cache.extract(extractor, CHUNK)
+    cache.extract(extractor, CHUNK, context)
+    assert extractor.calls == 1
@@ -0,0 +1,154 @@
+"""
+Tests for MultiExtractorScanEngine - single-pass prefiltered scanning.
+
+The engine must return exactly what calling each extractor directly returns;
+the literal prefilter may only skip patterns that cannot match.
+"""
+
+import random
+import re
+
+import pytest
+
+from farfan_pipeline.infrastructure.extractors import (
+    CausalVerbExtractor,
+    ExtractionPattern,
+    FinancialChainExtractor,
+    InstitutionalNERExtractor,
+    MultiExtractorScanEngine,
+    NormativeReferenceExtractor,
+    PatternBasedExtractor,
+    QuantitativeTripletExtractor,
+    StructuralMarkerExtractor,
+)
+from farfan_pipeline.infrastructure.extractors.scan_engine import fold_case, required_literals
+
+PLAN_EXCERPTS = [
+    "Fortalecer la capacidad institucional de la Secretaría de Salud con el fin de mejorar la "
+    "atención primaria. El DNP y el ICBF apoyarán el programa de vacunación.",
+    "Tabla 3: Plan Plurianual de Inversiones\nPrograma | Meta | Presupuesto | Fuente\n"
+    "Línea Base 2023: 45.2%, Meta 2027: 65.0%. Recursos del SGP por $1.500 millones para 2024-2027.",
+    "DECRETO 1067 DE 2015 y Ley 1448 de 2011 en el marco del Acuerdo de Paz (2016); "
+    "Constitución Política de Colombia. CONPES 3918 y ODS.",
+    "Gráfica 2: Cobertura educativa\nLB 2023: 38.5 km; Meta: 85 km. Regalías del SGR.",
+    "Texto sin marcadores: solo palabras comunes que no activan ningún patrón.",
+    "",
+]
+
+
+class ToyExtractor(PatternBasedExtractor):
+    """Pattern-based extractor with patterns set directly instead of calibration."""
+
+    def __init__(self, patterns, tmp_path):
+        super().__init__(signal_type="TOY", calibration_file=tmp_path / "missing.json")
+        self.patterns = [
+            ExtractionPattern(pattern_id=f"P{i}", pattern=p, pattern_type="REGEX", confidence_base=0.8)
+            for i, p in enumerate(patterns)
+        ]
+
+
+@pytest.fixture(scope="module")
+def extractors():
+    return [
+        QuantitativeTripletExtractor(),
+        NormativeReferenceExtractor(),
+        StructuralMarkerExtractor(),
+        FinancialChainExtractor(),
+        CausalVerbExtractor(),
+        InstitutionalNERExtractor(),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (re.compile(r"Decreto\s+(?:Ley\s+)?(\d+)"), {"decreto"}),
+        # The parser hoists the shared "L" out of the alternation
+        (re.compile(r"(?:LB|Línea\s+Base)\s*(\d{4})?", re.IGNORECASE), {"lb", "línea"}),
+        (re.compile(r"\b(?:CEDAW|PIDESC|ODS)\b"), {"cedaw", "pidesc", "ods"}),
+        (re.compile(r"(?:ab)+c?"), {"ab"}),
+        (re.compile(r"\d+"), None),
+        (re.compile(r"(?:Meta)?\s*\d+"), None),
+        (re.compile(r"(?:Meta|\d+)"), None),
+    ],
+)
+def test_required_literals(pattern, expected):
+    literals = required_literals(pattern)
+    assert (set(literals) if literals is not None else None) == expected
+
+
+def test_fold_case_matches_ignorecase_equivalence():
+    # Includes characters whose IGNORECASE classes differ from str.lower()
+    sample = "aAiIsSkKñÑéÉµ" + "İıſKμßẞ"
+    for a in sample:
+        for b in sample:
+            matches = re.fullmatch(re.escape(a), b, re.IGNORECASE) is not None
+            assert matches == (fold_case(a) == fold_case(b)), (a, b)
+
+
+@pytest.mark.parametrize("text", PLAN_EXCERPTS)
+def test_engine_results_match_direct_extraction(extractors, text):
+    engine = MultiExtractorScanEngine(extractors)
+    direct = [extractor.extract(text) for extractor in extractors]
+    assert engine.extract(text) == direct
+
+
+def test_prefilter_skips_patterns_that_cannot_match(extractors):
+    engine = MultiExtractorScanEngine(extractors)
+    engine.extract_chunks(PLAN_EXCERPTS)
+    metrics = engine.get_metrics()
+
+    assert metrics["chunks_scanned"] == len(PLAN_EXCERPTS)
+    assert metrics["tracked_patterns"] > 400
+    assert metrics["unfiltered_patterns"] == 0
+    assert metrics["skip_rate"] > 0.9
+
+
+def test_equal_patterns_are_evaluated_once_per_chunk(tmp_path):
+    first = ToyExtractor([r"meta\s+\d+", r"\d{4}"], tmp_path)
+    second = ToyExtractor([r"meta\s+\d+"], tmp_path)
+    engine = MultiExtractorScanEngine([first, second])
+
+    results = engine.extract("Meta 2027 y meta 80")
+    metrics = engine.get_metrics()
+
+    assert metrics["tracked_patterns"] == 2
+    assert metrics["unfiltered_patterns"] == 1  # \d{4} has no required literal
+    assert metrics["regex_evaluations"] == 2
+    assert [m["text"] for m in results[1].matches] == ["meta 80"]
+
+
+def test_scans_fall_back_outside_the_active_chunk(tmp_path):
+    toy = ToyExtractor([r"meta\s+\d+"], tmp_path)
+    engine = MultiExtractorScanEngine([toy])
+    chunk = engine.scan("sin coincidencias")
+
+    # A nested extraction over other text must not be served from this chunk
+    class Nested(ToyExtractor):
+        def extract(self, text, context=None):
+            inner = toy.extract("meta 12")
+            assert [m["text"] for m in inner.matches] == ["meta 12"]
+            return super().extract(text, context)
+
+    assert chunk.run(Nested([r"meta\s+\d+"], tmp_path)).matches == []
+    assert toy.patterns[0].compile() is toy.patterns[0].compile()
+
+
+def test_random_texts_never_lose_matches(tmp_path):
+    patterns = [
+        r"\bley\s+(\d+)",
+        r"(?:LB|Línea\s+Base)\s*:?\s*(\d+)",
+        r"(?i:SGP|SGR)\b",
+        r"Meta(?:s)?\s+\d{4}",
+        r"(?:valor|monto):\s*\$?\d+",
+        r"ſistema",
+    ]
+    toy = ToyExtractor(patterns, tmp_path)
+    engine = MultiExtractorScanEngine([toy])
+    fragments = ["ley ", "LEY ", "Línea ", "LÍNEA ", "Base", "lb", "LB", ": ", "12", "2027", " ",
+                 "sgp", "SGR", "Meta", "METAS ", "valor:", "monto: $", "$", "sistema", "SISTEMA",
+                 "ſistema", "\n"]
+    rng = random.Random(7)
+    for _ in range(300):
+        text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 25)))
+        assert engine.extract(text)[0] == toy.extract(text), text
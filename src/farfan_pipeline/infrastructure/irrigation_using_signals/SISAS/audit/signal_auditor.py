@@ -42,9 +42,13 @@ class SignalAuditor:
         invalid_sources = 0
 
         for bus_name, bus in self.bus_registry.buses.items():
-            # Nota: Acceder a _message_history para auditoría interna
-            messages = getattr(bus, '_message_history', [])
-            total_signals += len(messages)
+            # Nota: recorre el historial interno sin copiar ni ordenar fragmentos
+            if hasattr(bus, 'iter_history'):
+                total_signals += bus.history_size()
+                messages = bus.iter_history()
+            else:
+                messages = getattr(bus, '_message_history', [])
+                total_signals += len(messages)
 
             for msg in messages:
                 signal = msg.signal
@@ -7,8 +7,9 @@ Este módulo expone la infraestructura base del sistema SISAS (Signal-based Irri
 Exports:
     Signal, SignalContext, SignalSource, SignalCategory, SignalConfidence: Clases base de señales
     Event, EventStore, EventType, EventPayload: Sistema de eventos empíricos
+    EventStorageEngine, InMemoryEventStorage, SegmentedLogEventStorage: Motores de almacenamiento de eventos
     PublicationContract, ConsumptionContract, IrrigationContract, ContractRegistry: Sistema de contratos
-    SignalBus, BusRegistry, BusType, BusMessage: Sistema de buses de señales
+    SignalBus, BusRegistry, BusType, BusMessage, DeliveryMode: Sistema de buses de señales
 """
 
 from .signal import (
@@ -23,7 +24,11 @@ from .event import (
     Event,
     EventStore,
     EventType,
-    EventPayload
+    EventPayload,
+    EventStorageEngine,
+    InMemoryEventStorage,
+    SegmentedLogEventStorage,
+    LazyEventPayload
 )
 
 from .contracts import (
@@ -40,7 +45,8 @@ from .bus import (
     SignalBus,
     BusRegistry,
     BusType,
-    BusMessage
+    BusMessage,
+    DeliveryMode
 )
 
 __all__ = [
@@ -55,6 +61,10 @@ __all__ = [
     "EventStore",
     "EventType",
     "EventPayload",
+    "EventStorageEngine",
+    "InMemoryEventStorage",
+    "SegmentedLogEventStorage",
+    "LazyEventPayload",
     # Contract components
     "PublicationContract",
     "ConsumptionContract",
@@ -68,4 +78,5 @@ __all__ = [
     "BusRegistry",
     "BusType",
     "BusMessage",
+    "DeliveryMode",
 ]
\ No newline at end of file
@@ -4,13 +4,26 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Protocol
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Protocol, Tuple
 from collections import defaultdict
-from queue import Queue, Empty
-from threading import Lock
+from itertools import count
+from queue import Queue, Empty, Full
+from threading import Condition, Lock, Thread
 from pathlib import Path
+import bisect
+import heapq
 import logging
 import json
+import struct
+import time
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
 
 from . signal import Signal, SignalCategory
 from .contracts import PublicationContract, ConsumptionContract, ContractRegistry
@@ -28,6 +41,12 @@ class BusType(Enum):
     UNIVERSAL = "universal_bus"  # Recibe todo
 
 
+class DeliveryMode(Enum):
+    """Modo de entrega de mensajes a los suscriptores"""
+    SYNC = "sync"    # on_receive se invoca en el hilo del publicador
+    ASYNC = "async"  # cada suscriptor tiene su cola acotada y su worker
+
+
 @dataclass
 class BusMessage:
     """Mensaje que circula por el bus"""
@@ -124,6 +143,373 @@ class FileSystemMessagePersistence:
         return messages
 
 
+class _PartialWriteError(Exception):
+    """Fallo de escritura tras persistir ya los primeros ``written_messages`` del lote."""
+
+    def __init__(self, written_messages: int, written_bytes: int, cause: Exception):
+        super().__init__(str(cause))
+        self.written_messages = written_messages
+        self.written_bytes = written_bytes
+
+
+class SegmentedBinaryMessagePersistence:
+    """
+    Persistencia binaria por lotes para el historial desbordado del bus.
+
+    ``persist_messages`` sólo encola el lote (O(1), sin E/S en el hilo del
+    publicador); un hilo flusher en segundo plano serializa y escribe frames
+    ``<uint32 longitud><cuerpo>`` (msgpack si está instalado, JSON si no) en
+    segmentos rotativos por bus. Cada ``index_interval`` frames se registra
+    (número de frame, offset) en un índice disperso ``.idx`` para que
+    ``retrieve_messages(limit=N)`` lea sólo la cola del último segmento.
+
+    El bus ya liberó de memoria los mensajes que recibe, así que un lote cuya
+    escritura falla nunca se descarta: vuelve al frente de la cola pendiente y
+    se reintenta en el siguiente flush. Tras ``max_write_attempts`` fallos
+    consecutivos de un bus (o al cerrar) el lote se escribe como JSONL en
+    ``<storage_dir>/dead_letter/<bus>.jsonl``; si eso también falla el lote
+    sigue pendiente. ``get_stats`` expone errores, reintentos y dead letters.
+    """
+
+    MAGIC = b"SISASMH1"
+    _FRAME = struct.Struct("<I")
+    _INDEX_ENTRY = struct.Struct("<QQ")
+
+    def __init__(
+        self,
+        storage_dir: str = "artifacts/sisas/message_history",
+        segment_max_bytes: int = 32 * 1024 * 1024,
+        flush_interval: float = 0.5,
+        index_interval: int = 256,
+        max_write_attempts: int = 5,
+    ):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_interval = flush_interval
+        self.index_interval = index_interval
+        self.max_write_attempts = max(1, max_write_attempts)
+        self.codec = "msgpack" if MSGPACK_AVAILABLE else "json"
+        self._logger = logging.getLogger(__name__)
+
+        self._pending: List[Tuple[str, List[BusMessage]]] = []
+        self._pending_lock = Lock()
+        self._wakeup = Condition(self._pending_lock)
+        self._io_lock = Lock()
+        self._segments: Dict[str, List[Dict[str, Any]]] = {}
+        self._write_attempts: Dict[str, int] = {}
+        self._retry_backoff = False
+        self._stats = {
+            "batches_enqueued": 0,
+            "messages_enqueued": 0,
+            "messages_written": 0,
+            "bytes_written": 0,
+            "flushes": 0,
+            "write_errors": 0,
+            "messages_requeued": 0,
+            "messages_dead_lettered": 0,
+            "last_write_error": None,
+            "enqueue_latency_ms_total": 0.0,
+            "enqueue_latency_ms_max": 0.0,
+            "flush_latency_ms_total": 0.0,
+            "flush_latency_ms_max": 0.0,
+        }
+        self._closed = False
+        self._flusher = Thread(target=self._run_flusher, name="SISAS.MessageFlusher", daemon=True)
+        self._flusher.start()
+
+    # ------------------------------------------------------------------
+    # MessagePersistenceBackend
+    # ------------------------------------------------------------------
+
+    def persist_messages(self, bus_name: str, messages: List[BusMessage]) -> None:
+        """Encola un lote para el flusher; no bloquea en E/S."""
+        if not messages:
+            return
+        start = time.perf_counter()
+        with self._pending_lock:
+            if self._closed:
+                raise RuntimeError("SegmentedBinaryMessagePersistence is closed")
+            self._pending.append((bus_name, list(messages)))
+            self._stats["batches_enqueued"] += 1
+            self._stats["messages_enqueued"] += len(messages)
+            self._wakeup.notify()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._stats["enqueue_latency_ms_total"] += elapsed_ms
+            self._stats["enqueue_latency_ms_max"] = max(self._stats["enqueue_latency_ms_max"], elapsed_ms)
+
+    def retrieve_messages(self, bus_name: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retorna los ``limit`` mensajes persistidos más recientes (orden cronológico).
+        Sólo se leen los frames a partir de la entrada del índice disperso
+        más cercana a la cola.
+        """
+        self.flush()
+        with self._io_lock:
+            segments = self._load_segments(bus_name)
+            tail: List[Dict[str, Any]] = []
+            for segment in reversed(segments):
+                needed = limit - len(tail)
+                if needed <= 0:
+                    break
+                first_frame = max(0, segment["frames"] - needed)
+                tail = self._read_frames(segment, first_frame) + tail
+        return tail[-limit:] if limit > 0 else []
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Escribe de forma síncrona todos los lotes pendientes."""
+        self._drain()
+
+    def close(self) -> None:
+        """Detiene el flusher tras vaciar los lotes pendientes."""
+        with self._pending_lock:
+            self._closed = True
+            self._wakeup.notify()
+        self._flusher.join()
+        self._drain(final=True)
+
+    def _run_flusher(self) -> None:
+        while True:
+            with self._pending_lock:
+                # Tras un fallo de escritura se espera un intervalo antes de reintentar
+                if (not self._pending or self._retry_backoff) and not self._closed:
+                    self._wakeup.wait(self.flush_interval)
+                closed = self._closed
+            if closed:
+                return
+            self._drain()
+
+    def _drain(self, final: bool = False) -> None:
+        # Tomar los lotes bajo el lock de E/S preserva el orden de escritura
+        with self._io_lock:
+            with self._pending_lock:
+                batches, self._pending = self._pending, []
+                self._retry_backoff = False
+            if batches:
+                self._write_batches(batches, final=final)
+
+    def _write_batches(
+        self, batches: List[Tuple[str, List[BusMessage]]], final: bool = False
+    ) -> None:
+        start = time.perf_counter()
+        written = 0
+        written_bytes = 0
+        by_bus: Dict[str, List[BusMessage]] = defaultdict(list)
+        for bus_name, messages in batches:
+            by_bus[bus_name].extend(messages)
+        failed: List[Tuple[str, List[BusMessage]]] = []
+        for bus_name, messages in by_bus.items():
+            try:
+                written_bytes += self._append_frames(bus_name, messages)
+                written += len(messages)
+                self._write_attempts.pop(bus_name, None)
+            except Exception as e:
+                if isinstance(e, _PartialWriteError):
+                    # Sólo se reintenta lo que no llegó a escribirse
+                    written += e.written_messages
+                    written_bytes += e.written_bytes
+                    messages = messages[e.written_messages:]
+                attempts = self._write_attempts.get(bus_name, 0) + 1
+                self._logger.error(
+                    f"Failed to persist {len(messages)} messages from {bus_name} "
+                    f"(attempt {attempts}/{self.max_write_attempts}): {e}"
+                )
+                with self._pending_lock:
+                    self._stats["write_errors"] += 1
+                    self._stats["last_write_error"] = f"{bus_name}: {e}"
+                if (final or attempts >= self.max_write_attempts) and self._dead_letter(
+                    bus_name, messages
+                ):
+                    self._write_attempts.pop(bus_name, None)
+                    continue
+                self._write_attempts[bus_name] = attempts
+                failed.append((bus_name, messages))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._pending_lock:
+            if failed:
+                # Los lotes fallidos vuelven al frente, antes de los encolados después
+                self._pending[:0] = failed
+                self._stats["messages_requeued"] += sum(len(m) for _, m in failed)
+                self._retry_backoff = True
+            self._stats["messages_written"] += written
+            self._stats["bytes_written"] += written_bytes
+            self._stats["flushes"] += 1
+            self._stats["flush_latency_ms_total"] += elapsed_ms
+            self._stats["flush_latency_ms_max"] = max(self._stats["flush_latency_ms_max"], elapsed_ms)
+
+    def _dead_letter(self, bus_name: str, messages: List[BusMessage]) -> bool:
+        """Escribe un lote no persistible como JSONL aparte; retorna True si lo logró."""
+        path = self.storage_dir / "dead_letter" / f"{bus_name}.jsonl"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                for message in messages:
+                    f.write(json.dumps(message.to_dict(), default=str) + "\n")
+        except Exception as e:
+            self._logger.critical(
+                f"Dead-letter write failed for {len(messages)} messages from {bus_name}, "
+                f"keeping them pending: {e}"
+            )
+            return False
+        self._logger.error(f"Dead-lettered {len(messages)} messages from {bus_name} to {path}")
+        with self._pending_lock:
+            self._stats["messages_dead_lettered"] += len(messages)
+        return True
+
+    # ------------------------------------------------------------------
+    # Segment files
+    # ------------------------------------------------------------------
+
+    def _encode(self, message: BusMessage) -> bytes:
+        record = message.to_dict()
+        if self.codec == "msgpack":
+            return msgpack.packb(record, default=str)
+        return json.dumps(record, default=str).encode("utf-8")
+
+    @staticmethod
+    def _decode(codec: str, body: bytes) -> Dict[str, Any]:
+        if codec == "msgpack":
+            return msgpack.unpackb(body)
+        return json.loads(body)
+
+    def _segment_path(self, bus_name: str, number: int) -> Path:
+        return self.storage_dir / bus_name / f"segment_{number:06d}.bin"
+
+    def _load_segments(self, bus_name: str) -> List[Dict[str, Any]]:
+        """Metadatos de segmentos de un bus (recuperados del disco la primera vez)."""
+        segments = self._segments.get(bus_name)
+        if segments is not None:
+            return segments
+        segments = []
+        bus_dir = self.storage_dir / bus_name
+        for path in sorted(bus_dir.glob("segment_*.bin")) if bus_dir.exists() else []:
+            segments.append(self._recover_segment(path))
+        self._segments[bus_name] = segments
+        return segments
+
+    def _recover_segment(self, path: Path) -> Dict[str, Any]:
+        index: List[Tuple[int, int]] = []
+        index_path = path.with_suffix(".idx")
+        if index_path.exists():
+            raw = index_path.read_bytes()
+            usable = len(raw) - len(raw) % self._INDEX_ENTRY.size
+            index = [entry for entry in self._INDEX_ENTRY.iter_unpack(raw[:usable])]
+        with open(path, "rb") as f:
+            header = f.read(len(self.MAGIC) + 1)
+            codec = "msgpack" if header[-1:] == b"m" else "json"
+            frame, offset = (index[-1] if index else (0, len(header)))
+            size = path.stat().st_size
+            f.seek(offset)
+            while offset + self._FRAME.size <= size:
+                (length,) = self._FRAME.unpack(f.read(self._FRAME.size))
+                if offset + self._FRAME.size + length > size:
+                    break
+                f.seek(length, 1)
+                offset += self._FRAME.size + length
+                frame += 1
+        return {"path": path, "codec": codec, "frames": frame, "size": offset, "index": index}
+
+    def _append_frames(self, bus_name: str, messages: List[BusMessage]) -> int:
+        """Escribe los frames del lote, rotando de segmento al superar segment_max_bytes."""
+        segments = self._load_segments(bus_name)
+        written = 0
+        position = 0
+        while position < len(messages):
+            segment = segments[-1] if segments else None
+            if (
+                segment is None
+                or segment["codec"] != self.codec
+                or segment["size"] >= self.segment_max_bytes
+            ):
+                segment = self._new_segment(bus_name, len(segments) + 1)
+                segments.append(segment)
+            try:
+                position, size = self._append_to_segment(segment, messages, position)
+            except Exception as e:
+                if position == 0:
+                    raise
+                raise _PartialWriteError(position, written, e) from e
+            written += size
+        return written
+
+    def _append_to_segment(
+        self, segment: Dict[str, Any], messages: List[BusMessage], position: int
+    ) -> Tuple[int, int]:
+        frames = bytearray()
+        new_index: List[Tuple[int, int]] = []
+        offset = segment["size"]
+        frame_no = segment["frames"]
+        while position < len(messages) and (
+            offset < self.segment_max_bytes or offset == segment["size"]
+        ):
+            if frame_no % self.index_interval == 0:
+                new_index.append((frame_no, offset))
+            body = self._encode(messages[position])
+            frames += self._FRAME.pack(len(body))
+            frames += body
+            offset += self._FRAME.size + len(body)
+            frame_no += 1
+            position += 1
+
+        with open(segment["path"], "r+b") as f:
+            f.seek(segment["size"])
+            f.write(frames)
+            f.truncate()
+        if new_index:
+            with open(segment["path"].with_suffix(".idx"), "ab") as f:
+                for entry in new_index:
+                    f.write(self._INDEX_ENTRY.pack(*entry))
+            segment["index"].extend(new_index)
+        segment["size"] = offset
+        segment["frames"] = frame_no
+        return position, len(frames)
+
+    def _new_segment(self, bus_name: str, number: int) -> Dict[str, Any]:
+        path = self._segment_path(bus_name, number)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = self.MAGIC + (b"m" if self.codec == "msgpack" else b"j")
+        path.write_bytes(header)
+        path.with_suffix(".idx").write_bytes(b"")
+        return {"path": path, "codec": self.codec, "frames": 0, "size": len(header), "index": []}
+
+    def _read_frames(self, segment: Dict[str, Any], first_frame: int) -> List[Dict[str, Any]]:
+        frame, offset = 0, len(self.MAGIC) + 1
+        for indexed_frame, indexed_offset in segment["index"]:
+            if indexed_frame > first_frame:
+                break
+            frame, offset = indexed_frame, indexed_offset
+        records = []
+        with open(segment["path"], "rb") as f:
+            f.seek(offset)
+            while frame < segment["frames"]:
+                (length,) = self._FRAME.unpack(f.read(self._FRAME.size))
+                if frame >= first_frame:
+                    records.append(self._decode(segment["codec"], f.read(length)))
+                else:
+                    f.seek(length, 1)
+                frame += 1
+        return records
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Contadores de escritura/flush (latencias en milisegundos)."""
+        with self._pending_lock:
+            stats = dict(self._stats)
+            stats["pending_batches"] = len(self._pending)
+        stats["codec"] = self.codec
+        stats["enqueue_latency_ms_avg"] = (
+            stats["enqueue_latency_ms_total"] / stats["batches_enqueued"]
+            if stats["batches_enqueued"] else 0.0
+        )
+        stats["flush_latency_ms_avg"] = (
+            stats["flush_latency_ms_total"] / stats["flushes"] if stats["flushes"] else 0.0
+        )
+        return stats
+
+
 # Global message persistence backend
 _message_persistence_backend: Optional[MessagePersistenceBackend] = None
 
@@ -142,6 +528,80 @@ def get_message_persistence_backend() -> Optional[MessagePersistenceBackend]:
     return _message_persistence_backend
 
 
+class _HistoryShard:
+    """Fragmento del historial con su propio lock (reduce contención entre publicadores)."""
+
+    __slots__ = ("lock", "entries")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.entries: List[Tuple[int, BusMessage]] = []
+
+
+class _DeliveryWorker:
+    """
+    Worker de entrega asíncrona para un suscriptor.
+
+    Consume una cola acotada en un hilo daemon propio e invoca la misma rutina
+    de entrega que el modo síncrono; un consumidor lento sólo llena su cola.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        bus: "SignalBus",
+        consumer_id: str,
+        contract: ConsumptionContract,
+        queue_size: int,
+    ):
+        self.bus = bus
+        self.consumer_id = consumer_id
+        self.contract = contract
+        self.queue: Queue = Queue(maxsize=queue_size)
+        self._thread = Thread(
+            target=self._run,
+            name=f"SISAS.Bus.{bus.name}.{consumer_id}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, message: BusMessage, timeout: Optional[float]) -> bool:
+        try:
+            self.queue.put(message, timeout=timeout)
+            return True
+        except Full:
+            return False
+
+    def pending(self) -> int:
+        """Mensajes encolados o en proceso (no reconocidos aún)."""
+        return self.queue.unfinished_tasks
+
+    def oldest_pending(self) -> Optional[BusMessage]:
+        with self.queue.mutex:
+            return self.queue.queue[0] if self.queue.queue else None
+
+    def wait_idle(self, timeout: Optional[float]) -> bool:
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(
+                lambda: self.queue.unfinished_tasks == 0, timeout
+            )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self.queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            message = self.queue.get()
+            try:
+                if message is self._STOP:
+                    return
+                self.bus._deliver(self.consumer_id, self.contract, message)
+            finally:
+                self.queue.task_done()
+
+
 @dataclass
 class SignalBus:
     """
@@ -151,29 +611,52 @@ class SignalBus:
     1. Nada circula sin contrato
     2. Todo se registra
     3. Los consumidores analizan, no ejecutan
+
+    Concurrencia:
+    - Los suscriptores se publican copy-on-write: ``publish`` los lee sin lock.
+    - El historial está fragmentado en ``history_shards`` fragmentos con lock
+      propio, asignados round-robin por número de secuencia (el mensaje ``n``
+      vive en el fragmento ``n % history_shards``). ``_max_history_size`` se
+      aplica al historial completo: al publicar ``n`` se desborda a
+      persistencia el mensaje ``n - _max_history_size``.
+    - En DeliveryMode.ASYNC cada suscriptor recibe por una cola acotada
+      (``delivery_queue_size``) atendida por su propio worker. Si la cola se
+      llena el publicador se bloquea, y ``adaptive_publish_rate`` frena al
+      publicador proporcionalmente al backlog del consumidor más lento.
     """
     
     bus_type: BusType
     name: str = ""
+
+    # Entrega a suscriptores
+    delivery_mode: DeliveryMode = DeliveryMode.SYNC
+    delivery_queue_size: int = 1000
+    max_backpressure_delay: float = 0.05  # segundos de pausa con backpressure total
+    history_shards: int = 16
     
     # Cola de mensajes
     _queue: Queue = field(default_factory=Queue)
     _lock: Lock = field(default_factory=Lock)
     
-    # Suscriptores
+    # Suscriptores (copy-on-write)
     _subscribers:  Dict[str, ConsumptionContract] = field(default_factory=dict)
+    _workers: Dict[str, _DeliveryWorker] = field(default_factory=dict)
     
-    # Historial (NUNCA se borra)
-    _message_history: List[BusMessage] = field(default_factory=list)
+    # Historial (NUNCA se borra), fragmentado round-robin
+    _history: List[_HistoryShard] = field(default_factory=list)
     _max_history_size: int = 100000
+    _sequence: Any = field(default_factory=count)
     
     # Estadísticas
     _stats: Dict[str, int] = field(default_factory=lambda: {
         "total_published": 0,
         "total_delivered": 0,
         "total_rejected": 0,
-        "total_errors": 0
+        "total_errors": 0,
+        "total_backpressure_blocks": 0,
+        "total_throttled": 0,
     })
+    _stats_lock: Lock = field(default_factory=Lock)
     
     # Logger
     _logger: logging.Logger = field(default=None)
@@ -183,6 +666,40 @@ class SignalBus:
             self. name = self. bus_type.value
         if self._logger is None:
             self._logger = logging.getLogger(f"SISAS.Bus.{self.name}")
+        if not self._history:
+            self._history = [_HistoryShard() for _ in range(max(1, self.history_shards))]
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    @property
+    def _message_history(self) -> List[BusMessage]:
+        """
+        Copia del historial en memoria en orden de publicación (fusión de
+        fragmentos). Para contar o recorrer sin orden usar ``history_size`` /
+        ``iter_history``.
+        """
+        snapshots = []
+        for shard in self._history:
+            with shard.lock:
+                snapshots.append(list(shard.entries))
+        return [message for _, message in heapq.merge(*snapshots, key=lambda e: e[0])]
+
+    def history_size(self) -> int:
+        """Mensajes en el historial en memoria, sin copiar ni tomar locks."""
+        return sum(len(shard.entries) for shard in self._history)
+
+    def iter_history(self) -> Iterator[BusMessage]:
+        """
+        Recorre el historial en memoria fragmento a fragmento, sin fusionar.
+        El orden global de publicación no se garantiza.
+        """
+        for shard in self._history:
+            with shard.lock:
+                entries = list(shard.entries)
+            for _, message in entries:
+                yield message
     
     def publish(
         self,
@@ -199,14 +716,14 @@ class SignalBus:
         is_valid, errors = publication_contract.validate_signal(signal)
         
         if not is_valid: 
-            self._stats["total_rejected"] += 1
+            self._count("total_rejected")
             error_msg = f"Contract validation failed: {errors}"
             self._logger.warning(error_msg)
             return (False, error_msg)
         
         # Verificar que el bus está permitido
         if self.name not in publication_contract.allowed_buses:
-            self._stats["total_rejected"] += 1
+            self._count("total_rejected")
             error_msg = f"Bus '{self. name}' not in allowed buses"
             self._logger.warning(error_msg)
             return (False, error_msg)
@@ -217,17 +734,28 @@ class SignalBus:
             publisher_vehicle=publisher_vehicle
         )
         
-        # Encolar mensaje
-        with self._lock:
-            self._queue.put(message)
-            self._message_history.append(message)
-            
-            # Limitar historial si excede máximo
-            if len(self._message_history) > self._max_history_size:
+        # Encolar mensaje y registrarlo en su fragmento de historial
+        self._queue.put(message)
+        sequence = next(self._sequence)
+        shards = len(self._history)
+        shard = self._history[sequence % shards]
+        with shard.lock:
+            if shard.entries and shard.entries[-1][0] > sequence:
+                bisect.insort(shard.entries, (sequence, message))
+            else:
+                shard.entries.append((sequence, message))
+
+        # Limitar historial si excede máximo: el mensaje más antiguo sobrante
+        # vive en el fragmento de la secuencia ``sequence - _max_history_size``
+        cutoff = sequence - self._max_history_size
+        if cutoff >= 0:
+            oldest_shard = self._history[cutoff % shards]
+            with oldest_shard.lock:
                 # No borramos, movemos a almacenamiento persistente
-                self._persist_overflow()
-            
-            self._stats["total_published"] += 1
+                overflow = self._take_overflow(oldest_shard, cutoff)
+            if overflow:
+                self._persist_overflow(oldest_shard, overflow)
+        self._count("total_published")
         
         self._logger.info(
             f"Signal published: {signal.signal_type} from {publisher_vehicle}"
@@ -250,40 +778,100 @@ class SignalBus:
             return False
         
         with self._lock:
-            self._subscribers[contract.consumer_id] = contract
+            previous = self._workers.get(contract.consumer_id)
+            if self.delivery_mode is DeliveryMode.ASYNC:
+                workers = dict(self._workers)
+                workers[contract.consumer_id] = _DeliveryWorker(
+                    self, contract.consumer_id, contract, self.delivery_queue_size
+                )
+                self._workers = workers
+            subscribers = dict(self._subscribers)
+            subscribers[contract.consumer_id] = contract
+            self._subscribers = subscribers
+        if previous is not None:
+            previous.stop()
         
         self._logger.info(f"Consumer {contract.consumer_id} subscribed to {self.name}")
         return True
     
     def unsubscribe(self, consumer_id: str) -> bool:
-        """Desuscribe un consumidor"""
+        """Desuscribe un consumidor (en modo ASYNC, tras entregar su cola pendiente)"""
         with self._lock:
-            if consumer_id in self._subscribers:
-                del self._subscribers[consumer_id]
-                self._logger.info(f"Consumer {consumer_id} unsubscribed from {self.name}")
-                return True
-        return False
+            if consumer_id not in self._subscribers:
+                return False
+            subscribers = dict(self._subscribers)
+            del subscribers[consumer_id]
+            self._subscribers = subscribers
+            workers = dict(self._workers)
+            worker = workers.pop(consumer_id, None)
+            self._workers = workers
+        if worker is not None:
+            worker.stop()
+        self._logger.info(f"Consumer {consumer_id} unsubscribed from {self.name}")
+        return True
     
     def _notify_subscribers(self, message: BusMessage):
         """Notifica a todos los suscriptores que coincidan"""
-        for consumer_id, contract in self._subscribers.items():
-            if contract.matches_signal(message.signal):
-                try:
-                    if contract.on_receive: 
-                        contract.on_receive(message. signal, consumer_id)
-                    message.acknowledge(consumer_id)
-                    self._stats["total_delivered"] += 1
-                except Exception as e: 
-                    self._stats["total_errors"] += 1
-                    self._logger.error(
-                        f"Error notifying {consumer_id}: {str(e)}"
-                    )
-                    if contract.on_process_error:
-                        contract. on_process_error(message. signal, consumer_id, e)
+        subscribers = self._subscribers
+        if self.delivery_mode is DeliveryMode.SYNC:
+            for consumer_id, contract in subscribers.items():
+                if contract.matches_signal(message.signal):
+                    self._deliver(consumer_id, contract, message)
+            return
+
+        workers = self._workers
+        for consumer_id, contract in subscribers.items():
+            worker = workers.get(consumer_id)
+            if worker is None or not contract.matches_signal(message.signal):
+                continue
+            if not worker.submit(message, timeout=0):
+                # Cola llena: backpressure duro, el publicador espera
+                self._count("total_backpressure_blocks")
+                worker.submit(message, timeout=None)
+
+        rate = self.adaptive_publish_rate(quiet=True)
+        if rate < 1.0:
+            self._count("total_throttled")
+            time.sleep(self.max_backpressure_delay * (1.0 - rate))
+
+    def _deliver(self, consumer_id: str, contract: ConsumptionContract, message: BusMessage):
+        """Entrega un mensaje a un suscriptor (hilo del publicador o worker)"""
+        try:
+            if contract.on_receive: 
+                contract.on_receive(message. signal, consumer_id)
+            message.acknowledge(consumer_id)
+            self._count("total_delivered")
+        except Exception as e: 
+            self._count("total_errors")
+            self._logger.error(
+                f"Error notifying {consumer_id}: {str(e)}"
+            )
+            if contract.on_process_error:
+                contract. on_process_error(message. signal, consumer_id, e)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que los workers asíncronos entreguen todo lo encolado.
+        Retorna False si se agotó el timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in list(self._workers.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not worker.wait_idle(remaining):
+                return False
+        return True
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Detiene los workers asíncronos tras entregar su cola pendiente"""
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers = {}
+        for worker in workers:
+            worker.stop(timeout)
     
     def get_pending_messages(self) -> List[BusMessage]:
         """Obtiene mensajes pendientes sin vaciar la cola"""
-        with self._lock:
+        with self._queue.mutex:
             return list(self._queue.queue)
     
     def consume_next(self, timeout: float = 1.0) -> Optional[BusMessage]:
@@ -293,20 +881,39 @@ class SignalBus:
         except Empty: 
             return None
     
-    def get_stats(self) -> Dict[str, int]:
-        """Obtiene estadísticas del bus"""
-        return self._stats. copy()
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene estadísticas del bus.
+        Si el backend de persistencia expone get_stats, sus contadores de
+        escritura/flush se incluyen bajo la clave "persistence".
+        """
+        with self._stats_lock:
+            stats: Dict[str, Any] = self._stats. copy()
+        backend = _message_persistence_backend
+        if backend is not None and hasattr(backend, "get_stats"):
+            stats["persistence"] = backend.get_stats()
+        return stats
     
-    def check_consumer_backpressure(self, consumer_id: str, threshold: int = 100) -> Dict[str, Any]:
+    def check_consumer_backpressure(
+        self,
+        consumer_id: str,
+        threshold: int = 100,
+        quiet: bool = False,
+    ) -> Dict[str, Any]:
         """
         ENHANCEMENT: Check if a consumer is experiencing backpressure.
         
         Backpressure occurs when a consumer cannot keep up with the rate of
         incoming signals. This can cause the bus queue to grow unbounded.
+
+        In DeliveryMode.ASYNC the unacknowledged messages are exactly the
+        consumer's delivery queue (queued + in flight), so the check is O(1)
+        instead of a scan over the history.
         
         Args:
             consumer_id: Consumer to check
             threshold: Number of unacknowledged messages that indicates backpressure
+            quiet: Do not log a warning when backpressure is detected
             
         Returns:
             Dict with backpressure status and metrics
@@ -319,32 +926,45 @@ class SignalBus:
             "recommendation": "normal_operation"
         }
         
-        # Count unacknowledged messages for this consumer
-        unacknowledged = []
-        for msg in self._message_history:
-            if consumer_id not in msg.acknowledged_by:
-                unacknowledged.append(msg)
+        worker = self._workers.get(consumer_id)
+        if worker is not None:
+            unacknowledged_count = worker.pending()
+            oldest = worker.oldest_pending() if unacknowledged_count > threshold else None
+        else:
+            # Count unacknowledged messages for this consumer (single unordered pass)
+            unacknowledged_count = 0
+            oldest = None
+            for msg in self.iter_history():
+                if consumer_id in msg.acknowledged_by:
+                    continue
+                unacknowledged_count += 1
+                if oldest is None or msg.published_at < oldest.published_at:
+                    oldest = msg
         
-        backpressure_status["unacknowledged_count"] = len(unacknowledged)
+        backpressure_status["unacknowledged_count"] = unacknowledged_count
         
-        if len(unacknowledged) > threshold:
+        if unacknowledged_count > threshold:
             backpressure_status["has_backpressure"] = True
             backpressure_status["recommendation"] = "slow_down_publishing"
             
             # Calculate age of oldest unacknowledged message
-            if unacknowledged:
-                oldest = min(unacknowledged, key=lambda m: m.published_at)
+            if oldest is not None:
                 age = (datetime.utcnow() - oldest.published_at).total_seconds()
                 backpressure_status["oldest_unacknowledged_age_seconds"] = age
                 
-                self._logger.warning(
-                    f"[BACKPRESSURE DETECTED] Consumer {consumer_id} has {len(unacknowledged)} "
-                    f"unacknowledged messages (threshold: {threshold}), oldest: {age:.0f}s"
-                )
+                if not quiet:
+                    self._logger.warning(
+                        f"[BACKPRESSURE DETECTED] Consumer {consumer_id} has {unacknowledged_count} "
+                        f"unacknowledged messages (threshold: {threshold}), oldest: {age:.0f}s"
+                    )
         
         return backpressure_status
     
-    def adaptive_publish_rate(self, target_consumer: Optional[str] = None) -> float:
+    def adaptive_publish_rate(
+        self,
+        target_consumer: Optional[str] = None,
+        quiet: bool = False,
+    ) -> float:
         """
         ENHANCEMENT: Calculate adaptive publishing rate based on consumer health.
         
@@ -355,6 +975,7 @@ class SignalBus:
         
         Args:
             target_consumer: Optional specific consumer to check (checks all if None)
+            quiet: Do not log backpressure warnings (used on the publish path)
             
         Returns:
             Rate multiplier between 0.1 and 1.0
@@ -363,7 +984,7 @@ class SignalBus:
         
         max_backpressure = 0.0
         for consumer_id in consumers_to_check:
-            bp_status = self.check_consumer_backpressure(consumer_id)
+            bp_status = self.check_consumer_backpressure(consumer_id, quiet=quiet)
             if bp_status["has_backpressure"]:
                 # Calculate backpressure severity (0.0-1.0)
                 unack_count = bp_status["unacknowledged_count"]
@@ -378,27 +999,35 @@ class SignalBus:
     def get_subscriber_count(self) -> int:
         """Número de suscriptores"""
         return len(self._subscribers)
+
+    @staticmethod
+    def _take_overflow(shard: _HistoryShard, cutoff: int) -> List[Tuple[int, BusMessage]]:
+        """Extrae (con el lock del fragmento tomado) las entradas con secuencia <= cutoff"""
+        overflow_count = bisect.bisect_right(shard.entries, cutoff, key=lambda e: e[0])
+        taken = shard.entries[:overflow_count]
+        del shard.entries[:overflow_count]
+        return taken
     
-    def _persist_overflow(self):
-        """Persiste mensajes cuando excede el límite"""
-        overflow_count = len(self._message_history) - self._max_history_size
-        if overflow_count > 0:
-            # Los primeros N mensajes van a persistencia
-            to_persist = self._message_history[:overflow_count]
-            self._message_history = self._message_history[overflow_count:]
-
-            # IMPLEMENTED: Persist messages to storage backend
-            persistence_backend = get_message_persistence_backend()
-            if persistence_backend:
-                try:
-                    persistence_backend.persist_messages(self.name, to_persist)
-                    self._logger.info(f"Persisted {overflow_count} messages from {self.name} to storage")
-                except Exception as e:
-                    self._logger.error(f"Failed to persist messages from {self.name}: {e}")
-                    # Keep messages in memory if persistence fails
-                    self._message_history = to_persist + self._message_history
-            else:
-                self._logger.warning(f"No persistence backend configured, messages from {self.name} will be lost")
+    def _persist_overflow(self, shard: _HistoryShard, overflow: List[Tuple[int, BusMessage]]):
+        """Persiste mensajes cuando excede el límite (fuera del lock del fragmento)"""
+        to_persist = [message for _, message in overflow]
+        overflow_count = len(to_persist)
+
+        # IMPLEMENTED: Persist messages to storage backend
+        persistence_backend = get_message_persistence_backend()
+        if persistence_backend:
+            try:
+                persistence_backend.persist_messages(self.name, to_persist)
+                self._logger.info(f"Persisted {overflow_count} messages from {self.name} to storage")
+                return
+            except Exception as e:
+                self._logger.error(f"Failed to persist messages from {self.name}: {e}")
+        else:
+            self._logger.warning(f"No persistence backend configured, messages from {self.name} will be lost")
+            return
+        # Keep messages in memory if persistence fails
+        with shard.lock:
+            shard.entries[:0] = overflow
 
 
 @dataclass
@@ -409,6 +1038,7 @@ class BusRegistry:
     
     buses: Dict[str, SignalBus] = field(default_factory=dict)
     _lock: Lock = field(default_factory=Lock)
+    delivery_mode: DeliveryMode = DeliveryMode.SYNC
     
     def __post_init__(self):
         # Crear buses por defecto para cada categoría
@@ -422,7 +1052,8 @@ class BusRegistry:
             if bus_name not in self.buses:
                 self.buses[bus_name] = SignalBus(
                     bus_type=bus_type,
-                    name=bus_name
+                    name=bus_name,
+                    delivery_mode=self.delivery_mode
                 )
         return self.buses[bus_name]
     
@@ -1,11 +1,16 @@
 # src/farfan_pipeline/infrastructure/irrigation_using_signals/SISAS/core/event.py
 
 from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from itertools import islice
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol
+from threading import RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
 from uuid import uuid4
+import heapq
 import json
 from pathlib import Path
 import logging
@@ -108,6 +113,30 @@ class Event:
             "processed": self.processed
         }
     
+    @classmethod
+    def from_dict(cls, event_data: Dict[str, Any]) -> Event:
+        """Reconstituye un evento desde su forma serializada (to_dict)"""
+        event = cls(
+            event_id=event_data['event_id'],
+            event_type=EventType(event_data['event_type']),
+            timestamp=datetime.fromisoformat(event_data['timestamp']),
+            source_component=event_data.get('source_component', ''),
+            source_file=event_data.get('source_file', ''),
+            source_path=event_data.get('source_path', ''),
+            phase=event_data.get('phase', ''),
+            consumer_scope=event_data.get('consumer_scope', ''),
+            correlation_id=event_data.get('correlation_id'),
+            causation_id=event_data.get('causation_id'),
+            processed=event_data.get('processed', False),
+            processing_errors=list(event_data.get('processing_errors', [])),
+        )
+        if event_data.get('payload'):
+            event.payload = EventPayload(
+                data=event_data['payload']['data'],
+                schema_version=event_data['payload'].get('schema_version', '1.0.0')
+            )
+        return event
+
     @classmethod
     def from_canonical_file(
         cls,
@@ -195,26 +224,7 @@ class FileSystemColdStorage:
             for line in f:
                 if not line.strip():
                     continue
-                event_data = json.loads(line)
-                event = Event(
-                    event_id=event_data['event_id'],
-                    event_type=EventType(event_data['event_type']),
-                    timestamp=datetime.fromisoformat(event_data['timestamp']),
-                    source_component=event_data.get('source_component', ''),
-                    source_file=event_data.get('source_file', ''),
-                    source_path=event_data.get('source_path', ''),
-                    phase=event_data.get('phase', ''),
-                    consumer_scope=event_data.get('consumer_scope', ''),
-                    correlation_id=event_data.get('correlation_id'),
-                    causation_id=event_data.get('causation_id'),
-                    processed=event_data.get('processed', False)
-                )
-                if event_data.get('payload'):
-                    event.payload = EventPayload(
-                        data=event_data['payload']['data'],
-                        schema_version=event_data['payload'].get('schema_version', '1.0.0')
-                    )
-                events.append(event)
+                events.append(Event.from_dict(json.loads(line)))
 
         return events
 
@@ -245,78 +255,606 @@ def get_cold_storage_backend() -> Optional[ColdStorageBackend]:
     return _cold_storage_backend
 
 
+# =============================================================================
+# EVENT STORAGE ENGINES
+# =============================================================================
+
+# Índices hash mantenidos por todos los motores de almacenamiento
+EVENT_INDEXES: Tuple[str, ...] = ("type", "file", "phase", "correlation")
+
+
+def _index_keys(
+    event_type: str,
+    source_file: str,
+    phase: str,
+    correlation_id: Optional[str],
+) -> List[Tuple[str, str]]:
+    """Claves (índice, valor) bajo las que se indexa un evento."""
+    keys = [("type", event_type)]
+    if source_file:
+        keys.append(("file", source_file))
+    if phase:
+        keys.append(("phase", phase))
+    if correlation_id:
+        keys.append(("correlation", correlation_id))
+    return keys
+
+
+class LazyEventPayload(EventPayload):
+    """
+    Payload leído del log cuyo JSON se decodifica en el primer acceso a ``data``.
+
+    Las consultas por índice (tipo, fase, archivo, correlación) reconstruyen
+    eventos sin pagar el costo de decodificar payloads grandes que nunca se leen.
+    """
+
+    def __init__(self, raw: str, schema_version: str = "1.0.0"):
+        object.__setattr__(self, "raw", raw)
+        object.__setattr__(self, "_decoded", None)
+        object.__setattr__(self, "schema_version", schema_version)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        decoded = self.__dict__["_decoded"]
+        if decoded is None:
+            decoded = json.loads(self.raw)
+            object.__setattr__(self, "_decoded", decoded)
+        return decoded
+
+    @property
+    def is_decoded(self) -> bool:
+        return self.__dict__["_decoded"] is not None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EventPayload):
+            return NotImplemented
+        return self.data == other.data and self.schema_version == other.schema_version
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        state = "decoded" if self.is_decoded else f"{len(self.raw)} bytes"
+        return f"LazyEventPayload({state}, schema_version={self.schema_version!r})"
+
+
+class EventStorageEngine(Protocol):
+    """Protocol for EventStore storage engines (in-memory, segmented log, ...)."""
+
+    def append(self, event: Event) -> None:
+        """Append an event; re-appending an existing event_id updates its state."""
+        ...
+
+    def get(self, event_id: str) -> Optional[Event]:
+        """O(1) lookup by event_id."""
+        ...
+
+    def get_many(self, event_ids: Sequence[str]) -> List[Event]:
+        """Fetch several events preserving the order of ``event_ids``."""
+        ...
+
+    def ids_for(self, index: str, key: str) -> Sequence[str]:
+        """Event ids stored under ``key`` in one of EVENT_INDEXES, in append order."""
+        ...
+
+    def index_counts(self, index: str) -> Dict[str, int]:
+        """Number of events per key of one of EVENT_INDEXES."""
+        ...
+
+    def iter_events(self) -> Iterator[Event]:
+        """Iterate all events in append order."""
+        ...
+
+    def evict(self, event_ids: Sequence[str]) -> None:
+        """Release events from memory once they are safely archived."""
+        ...
+
+    def count(self) -> int:
+        """Total number of events."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release any resources."""
+        ...
+
+
+class InMemoryEventStorage:
+    """
+    Motor por defecto: lista en memoria con índices hash.
+
+    ``events`` es la lista viva (compartida con EventStore.events). Los índices
+    guardan event_ids en orden de inserción, y ``_by_id`` resuelve cada id en
+    O(1), de modo que las consultas por índice cuestan O(k) y no O(n·k).
+    """
+
+    def __init__(self, events: Optional[List[Event]] = None):
+        self.events: List[Event] = events if events is not None else []
+        self._by_id: Dict[str, Event] = {}
+        self._indexes: Dict[str, Dict[str, List[str]]] = {name: {} for name in EVENT_INDEXES}
+        for event in self.events:
+            self._index(event)
+
+    @staticmethod
+    def _keys(event: Event) -> List[Tuple[str, str]]:
+        return _index_keys(
+            event.event_type.value, event.source_file, event.phase, event.correlation_id
+        )
+
+    def _index(self, event: Event) -> None:
+        self._by_id[event.event_id] = event
+        for index, key in self._keys(event):
+            self._indexes[index].setdefault(key, []).append(event.event_id)
+
+    def append(self, event: Event) -> None:
+        existing = self._by_id.get(event.event_id)
+        if existing is None:
+            self.events.append(event)
+            self._index(event)
+            return
+        if existing is event:
+            return
+        # Re-anexar un event_id existente reemplaza el evento en su posición
+        for position, stored in enumerate(self.events):
+            if stored is existing:
+                self.events[position] = event
+                break
+        self._by_id[event.event_id] = event
+        old_keys, new_keys = self._keys(existing), self._keys(event)
+        if old_keys != new_keys:
+            for index, key in old_keys:
+                ids = self._indexes[index][key]
+                ids.remove(event.event_id)
+                if not ids:
+                    del self._indexes[index][key]
+            for index, key in new_keys:
+                self._indexes[index].setdefault(key, []).append(event.event_id)
+
+    def get(self, event_id: str) -> Optional[Event]:
+        return self._by_id.get(event_id)
+
+    def get_many(self, event_ids: Sequence[str]) -> List[Event]:
+        return [self._by_id[event_id] for event_id in event_ids if event_id in self._by_id]
+
+    def ids_for(self, index: str, key: str) -> Sequence[str]:
+        return self._indexes[index].get(key, [])
+
+    def index_counts(self, index: str) -> Dict[str, int]:
+        return {key: len(ids) for key, ids in self._indexes[index].items()}
+
+    def iter_events(self) -> Iterator[Event]:
+        return iter(list(self.events))
+
+    def evict(self, event_ids: Sequence[str]) -> None:
+        evicted = set(event_ids)
+        self.events[:] = [e for e in self.events if e.event_id not in evicted]
+        self._by_id = {}
+        self._indexes = {name: {} for name in EVENT_INDEXES}
+        for event in self.events:
+            self._index(event)
+
+    def count(self) -> int:
+        return len(self.events)
+
+    def close(self) -> None:
+        pass
+
+
+class SegmentedLogEventStorage:
+    """
+    Motor persistente: log append-only en segmentos JSONL con índice de offsets.
+
+    Cada registro ocupa una línea ``<header JSON>\\t<payload JSON>\\n``; el header
+    contiene los campos de identificación/estado y el payload se decodifica de
+    forma perezosa (LazyEventPayload). Los segmentos rotan al superar
+    ``segment_max_bytes`` y nunca se reescriben.
+
+    En memoria sólo se mantienen columnas compactas por evento (segmento, offset,
+    longitud, estado) y los índices hash como arrays de números de fila; los
+    eventos decodificados viven en una caché LRU de ``hot_capacity`` entradas.
+    Cuando un evento caliente cambió de estado (processed / processing_errors)
+    se re-anexa al salir de la caché: el último registro de un event_id gana.
+
+    ``evict`` (eventos ya archivados en cold storage) anexa un tombstone por
+    event_id y compacta las columnas e índices, de modo que el índice por id
+    sólo crece con los eventos vivos y no con todo el historial del log.
+
+    Al abrir un directorio existente el índice se reconstruye recorriendo los
+    headers de los segmentos (respetando los tombstones), y una última línea
+    truncada se descarta.
+    """
+
+    SEGMENT_GLOB = "events-*.log"
+
+    def __init__(
+        self,
+        storage_dir: str = "artifacts/sisas/event_log",
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        hot_capacity: int = 10_000,
+    ):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.hot_capacity = hot_capacity
+        self._logger = logging.getLogger(__name__)
+        self._lock = RLock()
+
+        # Almacén columnar: una fila por event_id distinto
+        self._ids: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._segment = array("I")
+        self._offset = array("Q")
+        self._length = array("I")
+        self._processed = array("B")
+        self._error_count = array("I")
+        self._indexes: Dict[str, Dict[str, array]] = {name: {} for name in EVENT_INDEXES}
+
+        self._hot: "OrderedDict[int, Event]" = OrderedDict()
+        self._readers: Dict[int, Any] = {}
+        self._active_segment = 0
+        self._active_size = 0
+        self._writer: Any = None
+
+        self._recover()
+        self._open_writer(max(self._active_segment, 1))
+
+    # ------------------------------------------------------------------
+    # Segment files
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.storage_dir / f"events-{segment:06d}.log"
+
+    def _open_writer(self, segment: int) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._active_segment = segment
+        self._writer = open(self._segment_path(segment), "ab")
+        self._active_size = self._writer.tell()
+
+    def _reader(self, segment: int) -> Any:
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = open(self._segment_path(segment), "rb")
+            self._readers[segment] = reader
+        return reader
+
+    def _recover(self) -> None:
+        segments = sorted(
+            int(path.stem.split("-", 1)[1]) for path in self.storage_dir.glob(self.SEGMENT_GLOB)
+        )
+        dead: set = set()
+        for segment in segments:
+            path = self._segment_path(segment)
+            offset = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        self._logger.warning(
+                            f"Discarding truncated record at {path}:{offset}"
+                        )
+                        break
+                    header = json.loads(line.partition(b"\t")[0])
+                    if header.get("evicted"):
+                        row = self._row_by_id.pop(header["event_id"], None)
+                        if row is not None:
+                            dead.add(row)
+                    else:
+                        self._upsert_row(header, segment, offset, len(line))
+                    offset += len(line)
+            if offset != path.stat().st_size:
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+            self._active_segment = segment
+        if dead:
+            self._compact(dead)
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(event: Event) -> Tuple[Dict[str, Any], bytes]:
+        header = event.to_dict()
+        header.pop("payload")
+        header["processing_errors"] = list(event.processing_errors)
+        payload = event.payload
+        body = ""
+        if payload is not None:
+            header["payload_schema"] = payload.schema_version
+            if isinstance(payload, LazyEventPayload) and not payload.is_decoded:
+                body = payload.raw
+            else:
+                body = json.dumps(payload.data, default=str)
+        record = (json.dumps(header) + "\t" + body + "\n").encode("utf-8")
+        return header, record
+
+    @staticmethod
+    def _decode(record: bytes) -> Event:
+        header_bytes, _, body = record.rstrip(b"\n").partition(b"\t")
+        header = json.loads(header_bytes)
+        schema_version = header.pop("payload_schema", None)
+        event = Event.from_dict(header)
+        if schema_version is not None:
+            event.payload = LazyEventPayload(body.decode("utf-8"), schema_version)
+        return event
+
+    # ------------------------------------------------------------------
+    # Row bookkeeping
+    # ------------------------------------------------------------------
+
+    def _write(self, record: bytes) -> Tuple[int, int]:
+        if self._active_size and self._active_size + len(record) > self.segment_max_bytes:
+            self._open_writer(self._active_segment + 1)
+        offset = self._active_size
+        self._writer.write(record)
+        self._active_size += len(record)
+        return self._active_segment, offset
+
+    def _upsert_row(self, header: Dict[str, Any], segment: int, offset: int, length: int) -> int:
+        event_id = header["event_id"]
+        row = self._row_by_id.get(event_id)
+        processed = 1 if header.get("processed") else 0
+        error_count = len(header.get("processing_errors", []))
+        if row is None:
+            row = len(self._ids)
+            self._ids.append(event_id)
+            self._row_by_id[event_id] = row
+            self._segment.append(segment)
+            self._offset.append(offset)
+            self._length.append(length)
+            self._processed.append(processed)
+            self._error_count.append(error_count)
+            for index, key in _index_keys(
+                header["event_type"],
+                header.get("source_file", ""),
+                header.get("phase", ""),
+                header.get("correlation_id"),
+            ):
+                self._indexes[index].setdefault(key, array("I")).append(row)
+        else:
+            self._segment[row] = segment
+            self._offset[row] = offset
+            self._length[row] = length
+            self._processed[row] = processed
+            self._error_count[row] = error_count
+        return row
+
+    def _compact(self, dead: set) -> None:
+        """Elimina las filas ``dead`` renumerando columnas, índices y caché caliente."""
+        keep = [row for row in range(len(self._ids)) if row not in dead]
+        remap = {old: new for new, old in enumerate(keep)}
+        self._ids = [self._ids[row] for row in keep]
+        self._row_by_id = {event_id: row for row, event_id in enumerate(self._ids)}
+        for column in ("_segment", "_offset", "_length", "_processed", "_error_count"):
+            values = getattr(self, column)
+            setattr(self, column, array(values.typecode, (values[row] for row in keep)))
+        indexes: Dict[str, Dict[str, array]] = {name: {} for name in EVENT_INDEXES}
+        for name, keyed in self._indexes.items():
+            for key, rows in keyed.items():
+                live = array("I", (remap[row] for row in rows if row in remap))
+                if live:
+                    indexes[name][key] = live
+        self._indexes = indexes
+        self._hot = OrderedDict(
+            (remap[row], event) for row, event in self._hot.items() if row in remap
+        )
+
+    def _store(self, event: Event) -> int:
+        header, record = self._encode(event)
+        segment, offset = self._write(record)
+        return self._upsert_row(header, segment, offset, len(record))
+
+    def _is_dirty(self, row: int, event: Event) -> bool:
+        return (
+            int(bool(event.processed)) != self._processed[row]
+            or len(event.processing_errors) != self._error_count[row]
+        )
+
+    def _remember(self, row: int, event: Event) -> None:
+        self._hot[row] = event
+        self._hot.move_to_end(row)
+        while len(self._hot) > self.hot_capacity:
+            cold_row, cold_event = self._hot.popitem(last=False)
+            self._spill(cold_row, cold_event)
+
+    def _spill(self, row: int, event: Event) -> None:
+        if self._is_dirty(row, event):
+            self._store(event)
+
+    def _load(self, row: int, remember: bool = True) -> Event:
+        event = self._hot.get(row)
+        if event is not None:
+            self._hot.move_to_end(row)
+            return event
+        segment = self._segment[row]
+        if segment == self._active_segment:
+            self._writer.flush()
+        reader = self._reader(segment)
+        reader.seek(self._offset[row])
+        event = self._decode(reader.read(self._length[row]))
+        if remember:
+            self._remember(row, event)
+        return event
+
+    # ------------------------------------------------------------------
+    # EventStorageEngine
+    # ------------------------------------------------------------------
+
+    def append(self, event: Event) -> None:
+        with self._lock:
+            row = self._store(event)
+            self._remember(row, event)
+
+    def get(self, event_id: str) -> Optional[Event]:
+        with self._lock:
+            row = self._row_by_id.get(event_id)
+            return None if row is None else self._load(row)
+
+    def get_many(self, event_ids: Sequence[str]) -> List[Event]:
+        with self._lock:
+            rows = [self._row_by_id[i] for i in event_ids if i in self._row_by_id]
+            return [self._load(row) for row in rows]
+
+    def ids_for(self, index: str, key: str) -> Sequence[str]:
+        with self._lock:
+            return [self._ids[row] for row in self._indexes[index].get(key, ())]
+
+    def index_counts(self, index: str) -> Dict[str, int]:
+        with self._lock:
+            return {key: len(rows) for key, rows in self._indexes[index].items()}
+
+    def iter_events(self) -> Iterator[Event]:
+        with self._lock:
+            total = len(self._ids)
+        for row in range(total):
+            with self._lock:
+                event = self._load(row, remember=False)
+            yield event
+
+    def evict(self, event_ids: Sequence[str]) -> None:
+        # Los eventos ya están en cold storage: tombstone en el log y fuera del índice
+        with self._lock:
+            dead = set()
+            for event_id in event_ids:
+                row = self._row_by_id.get(event_id)
+                if row is None:
+                    continue
+                self._hot.pop(row, None)
+                tombstone = json.dumps({"event_id": event_id, "evicted": True}) + "\t\n"
+                self._write(tombstone.encode("utf-8"))
+                dead.add(row)
+            if dead:
+                self._compact(dead)
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def flush(self) -> None:
+        """Persiste cambios de estado de eventos calientes y vacía el buffer."""
+        with self._lock:
+            for row, event in list(self._hot.items()):
+                self._spill(row, event)
+            self._writer.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._writer.close()
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas del motor (filas, segmentos, caché caliente)."""
+        with self._lock:
+            return {
+                "events": len(self._ids),
+                "hot_events": len(self._hot),
+                "hot_capacity": self.hot_capacity,
+                "active_segment": self._active_segment,
+                "active_segment_bytes": self._active_size,
+            }
+
+
+class StoredEventsView(Sequence):
+    """
+    Vista de sólo lectura, en orden de inserción, sobre los eventos de un motor.
+
+    Es el ``EventStore.events`` de los motores que no mantienen una lista en
+    memoria: cada acceso recorre ``iter_events`` en lugar de materializar todo.
+    """
+
+    def __init__(self, storage: EventStorageEngine):
+        self._storage = storage
+
+    def __len__(self) -> int:
+        return self._storage.count()
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._storage.iter_events())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        return next(islice(self._storage.iter_events(), index, None))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, StoredEventsView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"StoredEventsView({len(self)} events)"
+
+
 @dataclass
 class EventStore:
     """
     Almacén de eventos - NUNCA se borran. 
     Implementa el axioma:  Ningún evento se pierde.
+
+    El almacenamiento se delega a un EventStorageEngine: por defecto
+    InMemoryEventStorage (``events`` es su lista viva); con otro motor, p. ej.
+    SegmentedLogEventStorage, los eventos viven en el motor y ``events`` es una
+    StoredEventsView de sólo lectura sobre él, sin materializarlos en memoria.
     """
     
-    events: List[Event] = field(default_factory=list)
-    _index_by_type: Dict[str, List[str]] = field(default_factory=dict)
-    _index_by_file: Dict[str, List[str]] = field(default_factory=dict)
-    _index_by_phase: Dict[str, List[str]] = field(default_factory=dict)
+    events: Sequence[Event] = field(default_factory=list)
+    storage: Optional[EventStorageEngine] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.storage is None:
+            self.storage = InMemoryEventStorage(self.events)
+        elif isinstance(self.storage, InMemoryEventStorage):
+            for event in self.events:
+                self.storage.append(event)
+            self.events = self.storage.events
+        else:
+            for event in self.events:
+                self.storage.append(event)
+            self.events = StoredEventsView(self.storage)
     
     def append(self, event: Event) -> str:
         """
         Añade evento al store.
         Retorna el event_id. 
         """
-        self.events.append(event)
-        
-        # Indexar por tipo
-        if event.event_type.value not in self._index_by_type:
-            self._index_by_type[event.event_type.value] = []
-        self._index_by_type[event.event_type.value].append(event.event_id)
-        
-        # Indexar por archivo
-        if event.source_file:
-            if event.source_file not in self._index_by_file:
-                self._index_by_file[event.source_file] = []
-            self._index_by_file[event.source_file].append(event.event_id)
-        
-        # Indexar por fase
-        if event.phase:
-            if event.phase not in self._index_by_phase:
-                self._index_by_phase[event.phase] = []
-            self._index_by_phase[event.phase].append(event.event_id)
-        
+        self.storage.append(event)
         return event.event_id
     
     def get_by_id(self, event_id: str) -> Optional[Event]:
         """Obtiene evento por ID"""
-        for event in self.events:
-            if event.event_id == event_id:
-                return event
-        return None
+        return self.storage.get(event_id)
     
     def get_by_type(self, event_type: EventType) -> List[Event]:
         """Obtiene eventos por tipo"""
-        ids = self._index_by_type.get(event_type.value, [])
-        return [e for e in self.events if e.event_id in ids]
+        return self.storage.get_many(self.storage.ids_for("type", event_type.value))
     
     def get_by_file(self, source_file: str) -> List[Event]:
         """Obtiene eventos por archivo fuente"""
-        ids = self._index_by_file.get(source_file, [])
-        return [e for e in self.events if e.event_id in ids]
+        return self.storage.get_many(self.storage.ids_for("file", source_file))
     
     def get_by_phase(self, phase: str) -> List[Event]:
         """Obtiene eventos por fase"""
-        ids = self._index_by_phase.get(phase, [])
-        return [e for e in self.events if e.event_id in ids]
+        return self.storage.get_many(self.storage.ids_for("phase", phase))
     
     def get_unprocessed(self) -> List[Event]:
         """Obtiene eventos no procesados"""
-        return [e for e in self.events if not e.processed]
+        return [e for e in self.storage.iter_events() if not e.processed]
     
     def count(self) -> int:
         """Total de eventos"""
-        return len(self.events)
+        return self.storage.count()
     
     def to_jsonl(self) -> str:
         """Exporta a formato JSONL para persistencia"""
         lines = []
-        for event in self.events:
+        for event in self.storage.iter_events():
             lines.append(json.dumps(event.to_dict()))
         return "\n".join(lines)
 
@@ -329,28 +867,7 @@ class EventStore:
         for line in jsonl_content.strip().split('\n'):
             if not line.strip():
                 continue
-            event_data = json.loads(line)
-            # Reconstituir evento
-            event = Event(
-                event_id=event_data['event_id'],
-                event_type=EventType(event_data['event_type']),
-                timestamp=datetime.fromisoformat(event_data['timestamp']),
-                source_component=event_data.get('source_component', ''),
-                source_file=event_data.get('source_file', ''),
-                source_path=event_data.get('source_path', ''),
-                phase=event_data.get('phase', ''),
-                consumer_scope=event_data.get('consumer_scope', ''),
-                correlation_id=event_data.get('correlation_id'),
-                causation_id=event_data.get('causation_id'),
-                processed=event_data.get('processed', False)
-            )
-            # Reconstituir payload si existe
-            if event_data.get('payload'):
-                event.payload = EventPayload(
-                    data=event_data['payload']['data'],
-                    schema_version=event_data['payload'].get('schema_version', '1.0.0')
-                )
-            store.append(event)
+            store.append(Event.from_dict(json.loads(line)))
         return store
 
     def persist_to_file(self, file_path: str):
@@ -365,9 +882,13 @@ class EventStore:
             content = f.read()
         return cls.from_jsonl(content)
 
+    def close(self) -> None:
+        """Cierra el motor de almacenamiento (flush de logs persistentes)"""
+        self.storage.close()
+
     def get_by_correlation(self, correlation_id: str) -> List[Event]:
         """Obtiene todos los eventos con el mismo correlation_id"""
-        return [e for e in self.events if e.correlation_id == correlation_id]
+        return self.storage.get_many(self.storage.ids_for("correlation", correlation_id))
 
     def get_event_chain(self, event_id: str) -> List[Event]:
         """
@@ -389,35 +910,41 @@ class EventStore:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Obtiene estadísticas del store"""
+        processed = 0
+        with_errors = 0
+        for event in self.storage.iter_events():
+            processed += 1 if event.processed else 0
+            with_errors += 1 if event.processing_errors else 0
+        total = self.storage.count()
+
         stats = {
-            "total_events": len(self.events),
-            "processed": len([e for e in self.events if e.processed]),
-            "unprocessed": len([e for e in self.events if not e.processed]),
+            "total_events": total,
+            "processed": processed,
+            "unprocessed": total - processed,
             "by_type": {},
             "by_phase": {},
-            "with_errors": len([e for e in self.events if e.processing_errors]),
+            "with_errors": with_errors,
         }
 
         # Contar por tipo
+        type_counts = self.storage.index_counts("type")
         for event_type in EventType:
-            count = len(self._index_by_type.get(event_type.value, []))
+            count = type_counts.get(event_type.value, 0)
             if count > 0:
                 stats["by_type"][event_type.value] = count
 
         # Contar por fase
-        for phase in self._index_by_phase.keys():
-            stats["by_phase"][phase] = len(self._index_by_phase[phase])
+        stats["by_phase"].update(self.storage.index_counts("phase"))
 
         return stats
 
     def get_recent(self, limit: int = 10) -> List[Event]:
         """Obtiene los eventos más recientes"""
-        sorted_events = sorted(self.events, key=lambda e: e.timestamp, reverse=True)
-        return sorted_events[:limit]
+        return heapq.nlargest(limit, self.storage.iter_events(), key=lambda e: e.timestamp)
 
     def get_errors(self) -> List[Event]:
         """Obtiene eventos que tuvieron errores de procesamiento"""
-        return [e for e in self.events if e.processing_errors]
+        return [e for e in self.storage.iter_events() if e.processing_errors]
 
     def query(self, predicate: Callable[[Event], bool]) -> List[Event]:
         """
@@ -441,7 +968,7 @@ class EventStore:
         Returns:
             List of events matching the predicate
         """
-        return [e for e in self.events if predicate(e)]
+        return [e for e in self.storage.iter_events() if predicate(e)]
 
     def query_with_payload_filter(self, payload_predicate: Callable[[Dict[str, Any]], bool]) -> List[Event]:
         """
@@ -461,7 +988,7 @@ class EventStore:
             List of events with matching payloads
         """
         return [
-            e for e in self.events 
+            e for e in self.storage.iter_events()
             if e.payload and payload_predicate(e.payload.data)
         ]
 
@@ -481,7 +1008,7 @@ class EventStore:
         """
         cutoff_date = datetime.utcnow() - timedelta(days=older_than_days)
         to_archive = [
-            e for e in self.events
+            e for e in self.storage.iter_events()
             if e.processed and e.timestamp < cutoff_date
         ]
 
@@ -504,7 +1031,7 @@ class EventStore:
                 cold_storage.store_events(archive_id, to_archive)
 
                 # Only remove from memory after successful cold storage
-                self.events = [e for e in self.events if e not in to_archive]
+                self.storage.evict([e.event_id for e in to_archive])
 
                 logger = logging.getLogger(__name__)
                 logger.info(f"Archived {len(to_archive)} events to cold storage: {archive_id}")
@@ -539,10 +1066,11 @@ class EventStore:
             if event is None:
                 break
             
-            chain.insert(0, event)  # Insert at beginning for correct ordering
+            chain.append(event)
             current_id = event.causation_id
             depth += 1
         
+        chain.reverse()  # Root cause first
         return chain
     
     def get_correlation_group(self, correlation_id: str) -> List[Event]:
@@ -558,7 +1086,7 @@ class EventStore:
         Returns:
             List of all events sharing this correlation_id
         """
-        return [e for e in self.events if e.correlation_id == correlation_id]
+        return self.get_by_correlation(correlation_id)
     
     def replay_events(
         self,
@@ -580,7 +1108,7 @@ class EventStore:
         Returns:
             List of events in chronological order
         """
-        filtered_events = self.events
+        filtered_events = list(self.storage.iter_events())
         
         # Filter by time range
         if start_time:
@@ -590,7 +1118,7 @@ class EventStore:
         
         # Filter by event type
         if event_types:
-            type_values = [et.value for et in event_types]
+            type_values = {et.value for et in event_types}
             filtered_events = [e for e in filtered_events if e.event_type.value in type_values]
         
         # Sort chronologically
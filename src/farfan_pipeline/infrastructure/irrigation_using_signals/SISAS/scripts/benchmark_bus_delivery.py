@@ -0,0 +1,124 @@
+# src/farfan_pipeline/infrastructure/irrigation_using_signals/SISAS/scripts/benchmark_bus_delivery.py
+
+"""
+Microbenchmark de throughput de publicación del SignalBus.
+
+Compara DeliveryMode.SYNC (on_receive en el hilo del publicador) contra
+DeliveryMode.ASYNC (cola acotada + worker por suscriptor) con N suscriptores
+y un costo configurable por entrega.
+
+Uso:
+    python -m farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.scripts.benchmark_bus_delivery
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..core.bus import BusType, DeliveryMode, SignalBus
+from ..core.contracts import ConsumptionContract, PublicationContract, SignalTypeSpec
+
+BENCHMARK_SIGNAL_TYPE = "BusBenchmarkSignal"
+
+
+@dataclass
+class _BenchmarkSignal:
+    """Señal mínima (duck-typed) para medir sólo el costo del bus."""
+    sequence: int
+    signal_type: str = BENCHMARK_SIGNAL_TYPE
+    context: Optional[Any] = None
+    source: Optional[Any] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+def run_publish_benchmark(
+    mode: DeliveryMode,
+    subscribers: int,
+    messages: int,
+    consumer_delay: float = 0.0,
+    delivery_queue_size: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Publica ``messages`` señales con ``subscribers`` suscriptores.
+
+    Returns:
+        Dict con publish_seconds (tiempo visto por el publicador),
+        total_seconds (hasta entregar todo), msgs_per_second y stats del bus.
+    """
+    bus = SignalBus(
+        bus_type=BusType.OPERATIONAL,
+        name="benchmark_bus",
+        delivery_mode=mode,
+        delivery_queue_size=delivery_queue_size,
+        _max_history_size=max(messages, 1) * 2,
+    )
+    publication = PublicationContract(
+        contract_id="PC_BENCHMARK",
+        publisher_vehicle="benchmark_publisher",
+        allowed_signal_types=[SignalTypeSpec(signal_type=BENCHMARK_SIGNAL_TYPE)],
+        allowed_buses=[bus.name],
+        require_context=False,
+        require_source=False,
+    )
+
+    def on_receive(signal: Any, consumer_id: str) -> None:
+        if consumer_delay:
+            time.sleep(consumer_delay)
+
+    for i in range(subscribers):
+        bus.subscribe(ConsumptionContract(
+            contract_id=f"CC_BENCHMARK_{i}",
+            consumer_id=f"benchmark_consumer_{i}",
+            subscribed_signal_types=[BENCHMARK_SIGNAL_TYPE],
+            subscribed_buses=[bus.name],
+            on_receive=on_receive,
+        ))
+
+    start = time.perf_counter()
+    for sequence in range(messages):
+        bus.publish(_BenchmarkSignal(sequence=sequence), "benchmark_publisher", publication)
+    publish_seconds = time.perf_counter() - start
+    bus.drain()
+    total_seconds = time.perf_counter() - start
+    bus.shutdown()
+
+    return {
+        "mode": mode.value,
+        "subscribers": subscribers,
+        "messages": messages,
+        "consumer_delay": consumer_delay,
+        "publish_seconds": publish_seconds,
+        "total_seconds": total_seconds,
+        "msgs_per_second": messages / publish_seconds if publish_seconds else float("inf"),
+        "stats": bus.get_stats(),
+    }
+
+
+def run_comparison(
+    subscriber_counts: List[int],
+    messages: int = 2000,
+    consumer_delay: float = 0.0002,
+) -> List[Dict[str, Any]]:
+    """Ejecuta el benchmark en ambos modos para cada número de suscriptores."""
+    results = []
+    for subscribers in subscriber_counts:
+        for mode in (DeliveryMode.SYNC, DeliveryMode.ASYNC):
+            results.append(run_publish_benchmark(mode, subscribers, messages, consumer_delay))
+    return results
+
+
+def main() -> None:
+    import logging
+    logging.getLogger("SISAS").setLevel(logging.WARNING)
+
+    print(f"{'mode':<6} {'subs':>4} {'publish msg/s':>14} {'publish s':>10} {'total s':>9}")
+    for result in run_comparison([1, 4, 16]):
+        print(
+            f"{result['mode']:<6} {result['subscribers']:>4} "
+            f"{result['msgs_per_second']:>14.0f} {result['publish_seconds']:>10.3f} "
+            f"{result['total_seconds']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
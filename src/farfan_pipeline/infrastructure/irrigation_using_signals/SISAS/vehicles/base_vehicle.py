@@ -3,8 +3,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Type
 from datetime import datetime
+import hashlib
+import json
 
 from .. core.signal import Signal, SignalContext, SignalSource
 from ..core.event import Event, EventStore, EventType, EventPayload
@@ -64,6 +66,10 @@ class BaseVehicle(ABC):
         "signals_published": 0,
         "errors":  0
     })
+
+    # Caché de extracción del documento (DocumentExtractionCache), compartida entre fases;
+    # None usa la del documento activo
+    extraction_cache: Optional[Any] = None
     
     @abstractmethod
     def process(self, data: Any, context: SignalContext) -> List[Signal]:
@@ -108,6 +114,40 @@ class BaseVehicle(ABC):
         
         return event
     
+    def memoize_text_analysis(
+        self,
+        analysis_id: str,
+        patterns: Any,
+        text: str,
+        compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Memoiza un análisis puro de texto en la caché de extracción del documento.
+
+        La clave combina vehículo y análisis, la huella de los patrones usados y
+        el sha256 del texto: otra pregunta o fase que analice el mismo fragmento
+        reutiliza el resultado, y cambiar los patrones lo invalida. Sin caché
+        propia se usa la del documento activo (document_extraction_scope, que
+        el orquestador abre en cada fase).
+        """
+        cache = self.extraction_cache
+        if cache is None:
+            try:
+                from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+                    active_document_extraction_cache,
+                )
+            except ImportError:
+                return compute()
+            cache = active_document_extraction_cache()
+        if cache is None:
+            return compute()
+        version = hashlib.sha256(
+            json.dumps(patterns, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        return cache.memoize_analysis(
+            f"{self.vehicle_id}.{analysis_id}", version, text, compute
+        )
+
     def create_signal_source(self, event: Event) -> SignalSource:
         """Crea SignalSource a partir de un evento"""
         return SignalSource(
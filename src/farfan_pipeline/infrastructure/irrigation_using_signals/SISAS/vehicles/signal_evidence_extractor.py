@@ -356,6 +356,47 @@ class SignalEvidenceExtractorVehicle(BaseVehicle):
             return str(data)
         return ""
 
+    def _scan_references(self, text: str) -> Dict[str, List[str]]:
+        """Referencias normativas e institucionales del texto (memoizadas por documento)"""
+
+        def compute() -> Dict[str, List[str]]:
+            text_lower = text.lower()
+
+            # Buscar referencias normativas
+            normative_references = []
+            for pattern in self.normative_patterns:
+                matches = re.findall(pattern, text_lower, re.IGNORECASE)
+                normative_references.extend(matches)
+
+            # Buscar referencias institucionales
+            institutional_references = []
+            for pattern in self.institutional_patterns:
+                matches = re.findall(pattern, text_lower, re.IGNORECASE)
+                institutional_references.extend(matches)
+
+            return {"normative": normative_references, "institutional": institutional_references}
+
+        return self.memoize_text_analysis(
+            "references", [self.normative_patterns, self.institutional_patterns], text, compute
+        )
+
+    def _scan_methods(self, text: str) -> List[str]:
+        """Métodos cuyos patrones aparecen en el texto (memoizados por documento)"""
+
+        def compute() -> List[str]:
+            text_lower = text.lower()
+            detected_methods = []
+
+            # Buscar patrones de cada método
+            for method_name, patterns in self.method_patterns.items():
+                for pattern in patterns:
+                    if re.search(pattern, text_lower, re.IGNORECASE):
+                        detected_methods.append(method_name)
+                        break
+            return detected_methods
+
+        return self.memoize_text_analysis("methods", self.method_patterns, text, compute)
+
     def _extract_empirical_support(
         self,
         text: str,
@@ -365,19 +406,9 @@ class SignalEvidenceExtractorVehicle(BaseVehicle):
     ) -> EmpiricalSupportSignal:
         """Extrae y analiza el soporte empírico en el texto"""
 
-        text_lower = text.lower()
-
-        # Buscar referencias normativas
-        normative_references = []
-        for pattern in self.normative_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            normative_references.extend(matches)
-
-        # Buscar referencias institucionales
-        institutional_references = []
-        for pattern in self.institutional_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            institutional_references.extend(matches)
+        references = self._scan_references(text)
+        normative_references = references["normative"]
+        institutional_references = references["institutional"]
 
         # Buscar document_references si existe
         document_references = []
@@ -415,15 +446,7 @@ class SignalEvidenceExtractorVehicle(BaseVehicle):
     ) -> MethodApplicationSignal:
         """Detecta qué método de evaluación se aplicó"""
 
-        text_lower = text.lower()
-        detected_methods = []
-
-        # Buscar patrones de cada método
-        for method_name, patterns in self.method_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    detected_methods.append(method_name)
-                    break
+        detected_methods = self._scan_methods(text)
 
         # Si no se detectó método específico, inferir del contexto
         if not detected_methods:
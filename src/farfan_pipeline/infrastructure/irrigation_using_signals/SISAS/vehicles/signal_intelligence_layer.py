@@ -16,6 +16,15 @@ from ..signal_types.types.epistemic import (
     SpecificityLevel
 )
 
+# Patrones de métodos
+INTELLIGENCE_METHOD_PATTERNS: Dict[str, List[str]] = {
+    "triangulation": [r"\bcruz", r"\btriangula", r"\bcompara", r"\bcontrast"],
+    "member_checking": [r"\bverifica", r"\bconfirma", r"\bconsult", r"\bentrevista"],
+    "document_analysis": [r"\ban[áa]lisis\s+documental", r"\brevisi[óo]n\s+normativa", r"\bestudio\s+jur[íi]dico"],
+    "statistical_analysis": [r"\bestad[íi]stica", r"\bporcentaje", r"\bmedia\s+de", r"\btasa\s+de"]
+}
+
+
 @dataclass
 class SignalIntelligenceLayerVehicle(BaseVehicle):
     """
@@ -84,7 +93,7 @@ class SignalIntelligenceLayerVehicle(BaseVehicle):
     negation_patterns: List[str] = field(default_factory=lambda: [
         r"\bno\b",
         r"\bnunca\b",
-        r"\bning[úu]n\b?",
+        r"\bning[úu]n[oa]?\b",
         r"\bjam[áa]s\b",
         r"\bnada\b",
     ])
@@ -184,6 +193,59 @@ class SignalIntelligenceLayerVehicle(BaseVehicle):
             return str(data)
         return ""
 
+    def _scan_determinacy_markers(self, text: str) -> Dict[str, List[str]]:
+        """Marcadores de determinación del texto (memoizados por documento)"""
+        pattern_sets = {
+            "affirmative": self.affirmative_patterns,
+            "ambiguity": self.ambiguity_patterns,
+            "negation": self.negation_patterns,
+            "conditional": self.conditional_patterns,
+        }
+
+        def compute() -> Dict[str, List[str]]:
+            text_lower = text.lower()
+            markers: Dict[str, List[str]] = {}
+            for marker_type, patterns in pattern_sets.items():
+                markers[marker_type] = []
+                for pattern in patterns:
+                    matches = re.findall(pattern, text_lower, re.IGNORECASE)
+                    markers[marker_type].extend(matches)
+            return markers
+
+        return self.memoize_text_analysis("determinacy", pattern_sets, text, compute)
+
+    def _scan_specificity_elements(self, text: str) -> List[str]:
+        """Tipos de indicador de especificidad presentes en el texto (memoizados por documento)"""
+
+        def compute() -> List[str]:
+            text_lower = text.lower()
+            found_elements = []
+            for element_type, patterns in self.specificity_indicators.items():
+                for pattern in patterns:
+                    if re.search(pattern, text_lower, re.IGNORECASE):
+                        found_elements.append(element_type)
+                        break
+            return found_elements
+
+        return self.memoize_text_analysis("specificity", self.specificity_indicators, text, compute)
+
+    def _scan_methods(self, text: str) -> List[str]:
+        """Métodos cuyos patrones aparecen en el texto (memoizados por documento)"""
+
+        def compute() -> List[str]:
+            text_lower = text.lower()
+            detected_methods = []
+
+            # Buscar patrones de cada método
+            for method_name, patterns in INTELLIGENCE_METHOD_PATTERNS.items():
+                for pattern in patterns:
+                    if re.search(pattern, text_lower, re.IGNORECASE):
+                        detected_methods.append(method_name)
+                        break
+            return detected_methods
+
+        return self.memoize_text_analysis("methods", INTELLIGENCE_METHOD_PATTERNS, text, compute)
+
     def _analyze_answer_determinacy(
         self,
         text: str,
@@ -193,28 +255,11 @@ class SignalIntelligenceLayerVehicle(BaseVehicle):
     ) -> AnswerDeterminacySignal:
         """Analiza el nivel de determinación de una respuesta"""
 
-        text_lower = text.lower()
-
-        # Buscar marcadores
-        affirmative_markers = []
-        for pattern in self.affirmative_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            affirmative_markers.extend(matches)
-
-        ambiguity_markers = []
-        for pattern in self.ambiguity_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            ambiguity_markers.extend(matches)
-
-        negation_markers = []
-        for pattern in self.negation_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            negation_markers.extend(matches)
-
-        conditional_markers = []
-        for pattern in self.conditional_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            conditional_markers.extend(matches)
+        markers = self._scan_determinacy_markers(text)
+        affirmative_markers = markers["affirmative"]
+        ambiguity_markers = markers["ambiguity"]
+        negation_markers = markers["negation"]
+        conditional_markers = markers["conditional"]
 
         # Determinar nivel de determinación
         if negation_markers:
@@ -252,20 +297,15 @@ class SignalIntelligenceLayerVehicle(BaseVehicle):
     ) -> AnswerSpecificitySignal:
         """Analiza el nivel de especificidad de una respuesta"""
 
-        text_lower = text.lower()
-
         # Elementos esperados para alta especificidad
         expected_elements = ["formal_instrument", "mandatory_scope", "institutional_owner"]
 
         # Buscar elementos encontrados
-        found_elements = []
-        for element_type, patterns in self.specificity_indicators.items():
-            if element_type in expected_elements:
-                for pattern in patterns:
-                    if re.search(pattern, text_lower, re.IGNORECASE):
-                        if element_type not in found_elements:
-                            found_elements.append(element_type)
-                        break
+        found_elements = [
+            element_type
+            for element_type in self._scan_specificity_elements(text)
+            if element_type in expected_elements
+        ]
 
         # Elementos faltantes
         missing_elements = [e for e in expected_elements if e not in found_elements]
@@ -304,23 +344,7 @@ class SignalIntelligenceLayerVehicle(BaseVehicle):
     ) -> MethodApplicationSignal:
         """Detecta aplicación de método con análisis enriquecido"""
 
-        # Patrones de métodos
-        method_patterns = {
-            "triangulation": [r"\bcruz", r"\btriangula", r"\bcompara", r"\bcontrast"],
-            "member_checking": [r"\bverifica", r"\bconfirma", r"\bconsult", r"\bentrevista"],
-            "document_analysis": [r"\ban[áa]lisis\s+documental", r"\brevisi[óo]n\s+normativa", r"\bestudio\s+jur[íi]dico"],
-            "statistical_analysis": [r"\bestad[íi]stica", r"\bporcentaje", r"\bmedia\s+de", r"\btasa\s+de"]
-        }
-
-        text_lower = text.lower()
-        detected_methods = []
-
-        # Buscar patrones de cada método
-        for method_name, patterns in method_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    detected_methods.append(method_name)
-                    break
+        detected_methods = self._scan_methods(text)
 
         # Si no se detectó método específico, inferir del contexto
         if not detected_methods:
@@ -0,0 +1,686 @@
+"""
+Parsed-Document Store: open and parse each plan PDF exactly once.
+
+Phase 0 validation, Phase 1 ingestion (SP0 language sample, SP1 text, table
+islands, header/footer exorcism, document genome) and the methods layer
+(derek_beach.PDFProcessor, financiero_viabilidad_tablas) all need the same
+information from the same PDF: per-page text, text blocks with bounding
+boxes, detected tables and document metadata. Each used to open and parse
+the file on its own, which dominates Phase 0-1 time on 300-600 page PDMs.
+
+The store parses a PDF once per content hash and persists the result as
+compact artifacts in the user cache directory (FARFAN_PARSED_DOCUMENT_DIR,
+else $FARFAN_CACHE_DIR/parsed_documents, else
+$XDG_CACHE_HOME/farfan/parsed_documents with ~/.cache as the default):
+
+    <sha256>.layout.fpd   metadata, per-page text and blocks (built on first open)
+    <sha256>.tables.fpd   per-page tables (built on first table access)
+
+Table detection costs ~100 ms per page, so it is a separate layer that
+text-only consumers never pay for. Builds are serialized per document and
+layer only, so different plans parse concurrently.
+
+The store keeps the most recently opened documents (``max_open_documents``)
+and forgets older ones; the orchestrator also releases a plan's document when
+the plan finishes. Forgotten documents stay valid for callers that still hold
+them and unmap when the last reference goes.
+
+Building a layer is page-sharded: page ranges are spread over a process
+pool, each worker opens its own document handle, and the segments are merged
+back in page order, so the artifact is byte-identical to a serial parse.
+Small documents (fewer than ``workers * MIN_PAGES_PER_WORKER`` pages) are
+parsed serially. Worker count: ``ParsedDocumentStore(workers=...)``, else
+FARFAN_PDF_WORKERS, else the CPU count capped at DEFAULT_MAX_WORKERS. The
+pool's start method comes from process_pools.pool_context: fork only from a
+single-threaded process, else a forkserver (spawn where unavailable).
+
+Artifact layout: struct header | JSON index | zlib-compressed segments
+    header:  magic (8s), format version (I), JSON index length (I)
+    index:   sha256, layer, parser (parser version + PyMuPDF version),
+             page_count, metadata, segments [[offset, length, crc32], ...]
+Offsets are relative to the end of the JSON index. Artifacts are
+memory-mapped and segments are decompressed one page at a time, so reading
+page 400 does not decode pages 0-399. A segment that fails its CRC check is
+re-parsed from the source PDF. An artifact written by another parser
+version or PyMuPDF release is rebuilt, since either can change the text,
+blocks or tables it holds.
+
+Usage:
+    from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
+
+    document = open_parsed_document(pdf_path, sha256=canonical_input.pdf_sha256)
+    document.page_count
+    document.page_text(0)
+    document.page_tables(12)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from farfan_pipeline.infrastructure.process_pools import pool_context
+
+try:
+    import fitz
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_MAGIC = b"FARFANPD"
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_HEADER = struct.Struct("<8sII")
+# Bump when the extraction below changes what a layer contains
+PARSER_VERSION = 1
+
+LAYOUT_LAYER = "layout"
+TABLES_LAYER = "tables"
+
+# A worker must have at least this many pages to be worth its process start-up
+MIN_PAGES_PER_WORKER = 16
+# Shards per worker, so one table-heavy page range does not stall the pool
+SHARDS_PER_WORKER = 4
+# Default worker cap when neither the caller nor FARFAN_PDF_WORKERS sets one
+DEFAULT_MAX_WORKERS = 4
+# Documents kept open by a store; older ones are forgotten (LRU)
+DEFAULT_MAX_OPEN_DOCUMENTS = 8
+
+
+def parser_fingerprint() -> str:
+    """Parser and PyMuPDF versions that produce (and must match) an artifact."""
+    pymupdf = fitz.VersionBind if PYMUPDF_AVAILABLE else "unavailable"
+    return f"{PARSER_VERSION}/pymupdf-{pymupdf}"
+
+
+class ParsedDocumentError(RuntimeError):
+    """The PDF cannot be opened or parsed."""
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """A text or image block as reported by PyMuPDF's get_text("blocks")."""
+
+    bbox: tuple[float, float, float, float]
+    text: str
+    block_no: int
+    block_type: int  # 0 = text, 1 = image
+
+
+@dataclass(frozen=True)
+class ParsedTable:
+    """A table detected on a page by PyMuPDF's find_tables()."""
+
+    page_number: int  # 1-based
+    bbox: tuple[float, float, float, float]
+    rows: list[list[str | None]]
+
+
+# ============================================================================
+# ARTIFACT FILES
+# ============================================================================
+
+
+class _ArtifactFile:
+    """Memory-mapped artifact: parsed index plus lazily decoded segments."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, format_version, index_length = ARTIFACT_HEADER.unpack_from(self._mapping, 0)
+            if magic != ARTIFACT_MAGIC or format_version != ARTIFACT_FORMAT_VERSION:
+                raise ValueError(f"unsupported artifact format {magic!r} v{format_version}")
+            index_end = ARTIFACT_HEADER.size + index_length
+            self.index: dict[str, Any] = json.loads(
+                self._mapping[ARTIFACT_HEADER.size : index_end].decode("utf-8")
+            )
+            self._body = memoryview(self._mapping)[index_end:]
+        except Exception:
+            self._mapping.close()
+            raise
+
+    def segment(self, number: int) -> bytes:
+        """Decompressed segment; raises ValueError if it fails its CRC."""
+        offset, length, crc = self.index["segments"][number]
+        data = self._body[offset : offset + length]
+        if zlib.crc32(data) != crc:
+            raise ValueError(f"segment {number} failed its CRC check")
+        return zlib.decompress(data)
+
+    def close(self) -> None:
+        self._body.release()
+        self._mapping.close()
+
+
+def _write_artifact(path: Path, index: dict[str, Any], segments: list[bytes]) -> bool:
+    """Compress segments and atomically write the artifact; False if it cannot be written."""
+    compressed = [zlib.compress(segment, 6) for segment in segments]
+    entries = []
+    offset = 0
+    for data in compressed:
+        entries.append([offset, len(data), zlib.crc32(data)])
+        offset += len(data)
+    index_bytes = json.dumps({**index, "segments": entries}, ensure_ascii=False).encode("utf-8")
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT_VERSION, len(index_bytes)))
+            f.write(index_bytes)
+            for data in compressed:
+                f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Parsed-document artifact not written ({path}): {e}")
+        return False
+    return True
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+
+def _require_pymupdf() -> None:
+    if not PYMUPDF_AVAILABLE:
+        raise ImportError(
+            "PyMuPDF (fitz) required to parse PDFs. Install with: pip install PyMuPDF"
+        )
+
+
+def _open_pdf(pdf_path: Path) -> Any:
+    _require_pymupdf()
+    try:
+        return fitz.open(pdf_path)
+    except Exception as e:
+        raise ParsedDocumentError(f"Failed to open PDF {pdf_path}: {e}") from e
+
+
+def _layout_segments(page: Any) -> tuple[bytes, bytes]:
+    """(text, blocks) segments of one page."""
+    blocks = [
+        [round(x0, 2), round(y0, 2), round(x1, 2), round(y1, 2), text, block_no, block_type]
+        for x0, y0, x1, y1, text, block_no, block_type in page.get_text("blocks")
+    ]
+    return (
+        page.get_text().encode("utf-8", "surrogatepass"),
+        json.dumps(blocks, ensure_ascii=False).encode("utf-8"),
+    )
+
+
+def _tables_segment(page: Any) -> bytes:
+    """Tables segment of one page; pages where detection fails have no tables."""
+    tables = []
+    if hasattr(page, "find_tables"):
+        try:
+            for table in page.find_tables().tables:
+                tables.append({"bbox": [round(v, 2) for v in table.bbox], "rows": table.extract()})
+        except Exception as e:
+            logger.debug(f"Table detection failed on page {page.number + 1}: {e}")
+    return json.dumps(tables, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_pages(doc: Any, layer: str, start: int, stop: int) -> list[bytes]:
+    """Segments of pages [start, stop) of an open document."""
+    segments: list[bytes] = []
+    for page_number in range(start, stop):
+        page = doc[page_number]
+        if layer == TABLES_LAYER:
+            segments.append(_tables_segment(page))
+        else:
+            segments.extend(_layout_segments(page))
+    return segments
+
+
+def _parse_page_range(pdf_path: str, layer: str, start: int, stop: int) -> list[bytes]:
+    """Segments of pages [start, stop) from a worker-owned document handle."""
+    with _open_pdf(Path(pdf_path)) as doc:
+        return _parse_pages(doc, layer, start, stop)
+
+
+def page_shards(page_count: int, workers: int) -> list[tuple[int, int]]:
+    """Contiguous [start, stop) page ranges covering the document in order."""
+    if page_count == 0:
+        return []
+    shard_count = min(page_count, max(1, workers) * SHARDS_PER_WORKER)
+    bounds = [page_count * i // shard_count for i in range(shard_count + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(shard_count) if bounds[i] < bounds[i + 1]]
+
+
+def _default_workers() -> int:
+    env_workers = os.environ.get("FARFAN_PDF_WORKERS")
+    if env_workers:
+        return max(1, int(env_workers))
+    return min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS)
+
+
+def file_sha256(path: Path) -> str:
+    """Hex sha256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ============================================================================
+# PARSED DOCUMENT
+# ============================================================================
+
+
+class ParsedDocument:
+    """
+    Read-only view of a parsed PDF backed by its artifacts.
+
+    Pages are numbered from 0, like fitz.Document indexing. Every accessor
+    decodes only the page it is asked for.
+    """
+
+    def __init__(self, store: ParsedDocumentStore, source_path: Path, sha256: str, layout: _ArtifactFile):
+        self.source_path = source_path
+        self.sha256 = sha256
+        self.page_count: int = layout.index["page_count"]
+        self.metadata: dict[str, Any] = layout.index.get("metadata", {})
+        # Characters per page, so length-only questions need not decode text
+        self.page_char_counts: list[int] = layout.index["page_char_counts"]
+        self._store = store
+        self._layout = layout
+        self._tables: _ArtifactFile | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    def _check_page(self, page: int) -> None:
+        if not 0 <= page < self.page_count:
+            raise IndexError(f"page {page} out of range for {self.page_count}-page document")
+
+    def _segment(self, artifact: _ArtifactFile, number: int, page: int, layer: str) -> bytes:
+        try:
+            return artifact.segment(number)
+        except ValueError as e:
+            # Damaged artifact: re-parse just this page from the source PDF
+            logger.warning(f"Parsed-document {layer} segment unreadable ({e}); re-parsing page {page}")
+            with _open_pdf(self.source_path) as doc:
+                if layer == TABLES_LAYER:
+                    return _tables_segment(doc[page])
+                return _layout_segments(doc[page])[number % 2]
+
+    def page_text(self, page: int) -> str:
+        """Plain text of a page (fitz Page.get_text())."""
+        self._check_page(page)
+        return self._segment(self._layout, 2 * page, page, LAYOUT_LAYER).decode(
+            "utf-8", "surrogatepass"
+        )
+
+    def page_blocks(self, page: int) -> list[TextBlock]:
+        """Blocks of a page with their bounding boxes (fitz get_text("blocks"))."""
+        self._check_page(page)
+        raw = json.loads(self._segment(self._layout, 2 * page + 1, page, LAYOUT_LAYER))
+        return [
+            TextBlock(bbox=(x0, y0, x1, y1), text=text, block_no=block_no, block_type=block_type)
+            for x0, y0, x1, y1, text, block_no, block_type in raw
+        ]
+
+    def page_tables(self, page: int) -> list[ParsedTable]:
+        """Tables detected on a page; the first call builds the document's table layer."""
+        self._check_page(page)
+        tables = self._tables_artifact()
+        raw = json.loads(self._segment(tables, page, page, TABLES_LAYER))
+        return [
+            ParsedTable(page_number=page + 1, bbox=tuple(table["bbox"]), rows=table["rows"])
+            for table in raw
+        ]
+
+    def iter_page_texts(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        """Texts of pages [start, stop), decoded one at a time."""
+        stop = self.page_count if stop is None else min(stop, self.page_count)
+        for page in range(start, stop):
+            yield self.page_text(page)
+
+    def text(self, separator: str = "") -> str:
+        """Whole-document text, pages joined by ``separator``."""
+        return separator.join(self.iter_page_texts())
+
+    def tables(self) -> list[ParsedTable]:
+        """Every detected table, in page order."""
+        return [table for page in range(self.page_count) for table in self.page_tables(page)]
+
+    def _tables_artifact(self) -> _ArtifactFile:
+        with self._lock:
+            if self._tables is None:
+                self._tables = self._store._load_layer(self.source_path, self.sha256, TABLES_LAYER)
+            return self._tables
+
+    def close(self) -> None:
+        with self._lock:
+            self._layout.close()
+            if self._tables is not None:
+                self._tables.close()
+                self._tables = None
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+
+class ParsedDocumentStore:
+    """
+    Parses PDFs once per content hash and serves them from on-disk artifacts.
+
+    Args:
+        root: Directory holding the artifacts.
+        workers: Processes used to build a layer (default: FARFAN_PDF_WORKERS
+            or the CPU count); 1 parses serially in-process.
+        max_open_documents: Documents kept open; the least recently opened
+            beyond it are forgotten.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        workers: int | None = None,
+        max_open_documents: int = DEFAULT_MAX_OPEN_DOCUMENTS,
+    ):
+        self.root = Path(root)
+        self.workers = max(1, workers or _default_workers())
+        self.max_open_documents = max(1, max_open_documents)
+        self._documents: OrderedDict[str, ParsedDocument] = OrderedDict()
+        # (resolved path, mtime_ns, size) -> sha256, so unchanged files are hashed once
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
+        # Guards the dicts and counters only; parsing runs under the per-key locks
+        self._lock = threading.RLock()
+        # (sha256, what) -> lock serializing the open or build of one document/layer
+        self._key_locks: weakref.WeakValueDictionary[tuple[str, str], threading.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+        self._documents_served = 0
+        self._artifact_hits = 0
+        self._pages_parsed = 0
+        self._parallel_parses = 0
+        self._layers_built: dict[str, int] = {LAYOUT_LAYER: 0, TABLES_LAYER: 0}
+
+    def artifact_path(self, sha256: str, layer: str) -> Path:
+        return self.root / f"{sha256}.{layer}.fpd"
+
+    def open(self, pdf_path: Path | str, sha256: str | None = None) -> ParsedDocument:
+        """
+        Parsed view of a PDF, parsing it only if no artifact exists for its hash.
+
+        Args:
+            pdf_path: Source PDF (needed to build missing artifacts).
+            sha256: Content hash if the caller already computed it.
+
+        Raises:
+            FileNotFoundError: The PDF does not exist and no artifact is known.
+            ImportError: PyMuPDF is needed to parse and is not installed.
+            ParsedDocumentError: The PDF cannot be opened or parsed.
+        """
+        pdf_path = Path(pdf_path)
+        sha256 = sha256 or self._hash_file(pdf_path)
+        document = self._cached_document(sha256)
+        if document is None:
+            with self._key_lock(sha256, "document"):
+                document = self._cached_document(sha256)
+                if document is None:
+                    layout = self._load_layer(pdf_path, sha256, LAYOUT_LAYER)
+                    document = ParsedDocument(self, pdf_path, sha256, layout)
+                    self._remember(sha256, document)
+        with self._lock:
+            self._documents_served += 1
+        return document
+
+    def release(self, sha256: str) -> bool:
+        """Forget an open document; holders of it may keep using it."""
+        with self._lock:
+            return self._documents.pop(sha256, None) is not None
+
+    def _cached_document(self, sha256: str) -> ParsedDocument | None:
+        with self._lock:
+            document = self._documents.get(sha256)
+            if document is not None:
+                self._documents.move_to_end(sha256)
+            return document
+
+    def _remember(self, sha256: str, document: ParsedDocument) -> None:
+        with self._lock:
+            self._documents[sha256] = document
+            while len(self._documents) > self.max_open_documents:
+                self._documents.popitem(last=False)
+
+    def _key_lock(self, sha256: str, what: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get((sha256, what))
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[(sha256, what)] = lock
+            return lock
+
+    def _hash_file(self, pdf_path: Path) -> str:
+        try:
+            stat = pdf_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}") from None
+        key = (str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            sha256 = self._file_hashes.get(key)
+        if sha256 is None:
+            sha256 = file_sha256(pdf_path)
+            with self._lock:
+                self._file_hashes[key] = sha256
+        return sha256
+
+    def _load_layer(self, pdf_path: Path, sha256: str, layer: str) -> _ArtifactFile:
+        """Open a layer's artifact, building it from the PDF if missing or unusable."""
+        path = self.artifact_path(sha256, layer)
+        with self._key_lock(sha256, layer):
+            artifact = self._open_artifact(path, sha256, layer)
+            if artifact is not None:
+                with self._lock:
+                    self._artifact_hits += 1
+                return artifact
+
+            index, segments = self._parse_layer(pdf_path, layer)
+            index["sha256"] = sha256
+            index["parser"] = parser_fingerprint()
+            if _write_artifact(path, index, segments):
+                artifact = self._open_artifact(path, sha256, layer)
+            if artifact is None:
+                # Read-only cache directory: serve from a private temporary file
+                fd, tmp_name = tempfile.mkstemp(suffix=f".{layer}.fpd")
+                os.close(fd)
+                tmp_path = Path(tmp_name)
+                _write_artifact(tmp_path, index, segments)
+                artifact = _ArtifactFile(tmp_path)
+                tmp_path.unlink(missing_ok=True)
+            with self._lock:
+                self._layers_built[layer] += 1
+            return artifact
+
+    @staticmethod
+    def _open_artifact(path: Path, sha256: str, layer: str) -> _ArtifactFile | None:
+        if not path.exists():
+            return None
+        try:
+            artifact = _ArtifactFile(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            logger.warning(f"Parsed-document artifact unreadable ({path}): {e}")
+            return None
+        if artifact.index.get("sha256") != sha256 or artifact.index.get("layer") != layer:
+            artifact.close()
+            logger.warning(f"Parsed-document artifact does not match its name: {path}")
+            return None
+        if PYMUPDF_AVAILABLE and artifact.index.get("parser") != parser_fingerprint():
+            # Without PyMuPDF nothing could be rebuilt, so any artifact is served
+            artifact.close()
+            logger.info(
+                f"Parsed-document artifact built by parser {artifact.index.get('parser')!r}, "
+                f"rebuilding with {parser_fingerprint()!r}: {path}"
+            )
+            return None
+        return artifact
+
+    def _parse_layer(self, pdf_path: Path, layer: str) -> tuple[dict[str, Any], list[bytes]]:
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        index: dict[str, Any] = {"layer": layer}
+        with _open_pdf(pdf_path) as doc:
+            index["page_count"] = page_count = len(doc)
+            if layer == LAYOUT_LAYER:
+                index["metadata"] = dict(doc.metadata or {})
+
+            workers = min(self.workers, page_count // MIN_PAGES_PER_WORKER)
+            try:
+                segments = None
+                if workers > 1:
+                    segments = self._parse_parallel(pdf_path, layer, page_count, workers)
+                if segments is None:
+                    # Serial parse reuses the handle opened for the page count
+                    workers = 1
+                    segments = _parse_pages(doc, layer, 0, page_count)
+            except (ImportError, ParsedDocumentError):
+                raise
+            except Exception as e:
+                raise ParsedDocumentError(f"Failed to parse PDF {pdf_path}: {e}") from e
+
+        if layer == LAYOUT_LAYER:
+            index["page_char_counts"] = [
+                len(text.decode("utf-8", "surrogatepass")) for text in segments[0::2]
+            ]
+        with self._lock:
+            self._pages_parsed += page_count
+        logger.info(
+            f"Parsed {layer} layer of {pdf_path.name}: {page_count} pages, {workers} worker(s)"
+        )
+        return index, segments
+
+    @staticmethod
+    def _pool_context() -> multiprocessing.context.BaseContext:
+        """Pool start method; a forkserver preloads this module so workers skip the import."""
+        return pool_context([__name__])
+
+    def _parse_parallel(
+        self, pdf_path: Path, layer: str, page_count: int, workers: int
+    ) -> list[bytes] | None:
+        """Page-sharded parse merged in page order; None if no pool can be started."""
+        shards = page_shards(page_count, workers)
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=self._pool_context())
+        except (OSError, ValueError, NotImplementedError) as e:
+            logger.warning(f"Page-parallel PDF parsing unavailable ({e}); parsing serially")
+            return None
+        with pool:
+            futures = [
+                pool.submit(_parse_page_range, str(pdf_path), layer, start, stop)
+                for start, stop in shards
+            ]
+            segments: list[bytes] = []
+            try:
+                for future in futures:
+                    segments.extend(future.result())
+            except BrokenProcessPool as e:
+                logger.warning(f"PDF parsing worker died ({e}); parsing serially")
+                return None
+        with self._lock:
+            self._parallel_parses += 1
+        return segments
+
+    def close(self) -> None:
+        """Close every open document."""
+        with self._lock:
+            for document in self._documents.values():
+                document.close()
+            self._documents.clear()
+
+    def get_metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "open_documents": len(self._documents),
+                "max_open_documents": self.max_open_documents,
+                "documents_served": self._documents_served,
+                "artifact_hits": self._artifact_hits,
+                "layout_layers_built": self._layers_built[LAYOUT_LAYER],
+                "table_layers_built": self._layers_built[TABLES_LAYER],
+                "pages_parsed": self._pages_parsed,
+                "workers": self.workers,
+                "parallel_parses": self._parallel_parses,
+            }
+
+
+# Process-wide store shared by every phase (lazy initialization)
+_parsed_document_store: ParsedDocumentStore | None = None
+_parsed_document_store_lock = threading.Lock()
+
+
+def _default_root() -> Path:
+    """Artifact directory in the user cache, never inside the repository."""
+    env_root = os.environ.get("FARFAN_PARSED_DOCUMENT_DIR")
+    if env_root:
+        return Path(env_root)
+    cache_dir = os.environ.get("FARFAN_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir) / "parsed_documents"
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "farfan" / "parsed_documents"
+
+
+def get_parsed_document_store() -> ParsedDocumentStore:
+    """Get or create the process-wide parsed-document store."""
+    global _parsed_document_store
+    with _parsed_document_store_lock:
+        if _parsed_document_store is None:
+            _parsed_document_store = ParsedDocumentStore(_default_root())
+        return _parsed_document_store
+
+
+def open_parsed_document(pdf_path: Path | str, sha256: str | None = None) -> ParsedDocument:
+    """Parsed view of a PDF from the process-wide store."""
+    return get_parsed_document_store().open(pdf_path, sha256=sha256)
+
+
+def release_parsed_document(sha256: str) -> bool:
+    """Forget a document in the process-wide store (no-op if there is no store)."""
+    with _parsed_document_store_lock:
+        store = _parsed_document_store
+    return store.release(sha256) if store is not None else False
+
+
+__all__ = [
+    "PYMUPDF_AVAILABLE",
+    "ParsedDocument",
+    "ParsedDocumentError",
+    "ParsedDocumentStore",
+    "ParsedTable",
+    "TextBlock",
+    "file_sha256",
+    "page_shards",
+    "parser_fingerprint",
+    "get_parsed_document_store",
+    "open_parsed_document",
+    "release_parsed_document",
+]
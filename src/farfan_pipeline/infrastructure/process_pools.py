@@ -0,0 +1,55 @@
+"""
+Start-method selection for worker process pools.
+
+Forking copies the parent's memory, including locks held by threads that do
+not exist in the child (logging handlers, SISAS background flushers, thread
+pools, BLAS). A fork from a multithreaded process can therefore deadlock the
+worker. Every process pool in the pipeline takes its context from here:
+
+    fork        only while the calling process runs a single thread
+    forkserver  otherwise, preloaded with the caller's modules so workers
+                skip re-importing them
+    spawn       where forkserver is unavailable (Windows)
+
+Workers started without fork receive their state pickled, so pool users pass
+shared state explicitly (task arguments or a pool initializer) instead of
+relying on inherited module globals.
+
+Usage:
+    from farfan_pipeline.infrastructure.process_pools import pool_context
+
+    with ProcessPoolExecutor(max_workers=4, mp_context=pool_context([__name__])) as pool:
+        ...
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Sequence
+from multiprocessing.context import BaseContext
+
+
+def pool_context(preload: Sequence[str] = ()) -> BaseContext:
+    """
+    Multiprocessing context for a new worker pool.
+
+    Args:
+        preload: Modules the forkserver imports once, before forking workers.
+
+    Returns:
+        The fork context in a single-threaded process, else forkserver
+        (spawn where unavailable).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        context = multiprocessing.get_context("forkserver")
+        if preload:
+            context.set_forkserver_preload(list(preload))
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+__all__ = ["pool_context"]
@@ -34,7 +34,7 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    import fitz
+    from farfan_pipeline.infrastructure.parsed_document_store import ParsedDocument
 
 # Core dependencies
 # NOTE: Tests should not fail on import - dependencies are checked at runtime
@@ -2990,12 +2990,12 @@ class ConfigLoader:
 
 
 class PDFProcessor:
-    """Advanced PDF processing and extraction"""
+    """Advanced PDF processing and extraction (backed by the shared parsed-document store)"""
 
     def __init__(self, config: ConfigLoader, retry_handler=None) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.config = config
-        self.document: fitz.Document | None = None
+        self.document: ParsedDocument | None = None
         self.text_content: str = ""
         self.tables: list[pd.DataFrame] = []
         self.metadata: dict[str, Any] = {}
@@ -3003,6 +3003,8 @@ class PDFProcessor:
 
     def load_document(self, pdf_path: Path) -> bool:
         """Load PDF document with retry logic"""
+        from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
+
         if self.retry_handler:
             try:
                 from farfan_pipeline.analysis.retry_handler import DependencyType
@@ -3013,10 +3015,8 @@ class PDFProcessor:
                     exceptions=(IOError, OSError, RuntimeError),
                 )
                 def load_with_retry():
-                    import fitz
-
-                    doc = fitz.open(pdf_path)
-                    self.logger.info(f"PDF cargado: {pdf_path.name} ({len(doc)} páginas)")
+                    doc = open_parsed_document(pdf_path)
+                    self.logger.info(f"PDF cargado: {pdf_path.name} ({doc.page_count} páginas)")
                     return doc
 
                 self.document = load_with_retry()
@@ -3028,11 +3028,9 @@ class PDFProcessor:
         else:
             # Fallback without retry
             try:
-                import fitz
-
-                self.document = fitz.open(pdf_path)
+                self.document = open_parsed_document(pdf_path)
                 self.metadata = self.document.metadata
-                self.logger.info(f"PDF cargado: {pdf_path.name} ({len(self.document)} páginas)")
+                self.logger.info(f"PDF cargado: {pdf_path.name} ({self.document.page_count} páginas)")
                 return True
             except Exception as e:
                 self.logger.error(f"Error cargando PDF: {e}")
@@ -3044,9 +3042,9 @@ class PDFProcessor:
             return ""
 
         text_parts = []
-        for page_num, page in enumerate(self.document, 1):
+        for page_num in range(1, self.document.page_count + 1):
             try:
-                text = page.get_text()
+                text = self.document.page_text(page_num - 1)
                 text_parts.append(text)
                 self.logger.debug(f"Texto extraído de página {page_num}")
             except Exception as e:
@@ -3065,23 +3063,21 @@ class PDFProcessor:
             self.config.get("patterns.table_headers", r"PROGRAMA|META|INDICADOR"), re.IGNORECASE
         )
 
-        for page_num, page in enumerate(self.document, 1):
+        for page_num in range(1, self.document.page_count + 1):
             try:
-                tabs = page.find_tables()
-                if tabs:
-                    for tab in tabs:
-                        try:
-                            df = pd.DataFrame(tab.extract())
-                            if not df.empty and len(df.columns) > 1:
-                                # Check if this is a relevant table
-                                header_text = " ".join(str(cell) for cell in df.iloc[0] if cell)
-                                if table_pattern.search(header_text):
-                                    self.tables.append(df)
-                                    self.logger.info(
-                                        f"Tabla extraída de página {page_num}: {df.shape}"
-                                    )
-                        except Exception as e:
-                            self.logger.warning(f"Error procesando tabla en página {page_num}: {e}")
+                for tab in self.document.page_tables(page_num - 1):
+                    try:
+                        df = pd.DataFrame(tab.rows)
+                        if not df.empty and len(df.columns) > 1:
+                            # Check if this is a relevant table
+                            header_text = " ".join(str(cell) for cell in df.iloc[0] if cell)
+                            if table_pattern.search(header_text):
+                                self.tables.append(df)
+                                self.logger.info(
+                                    f"Tabla extraída de página {page_num}: {df.shape}"
+                                )
+                    except Exception as e:
+                        self.logger.warning(f"Error procesando tabla en página {page_num}: {e}")
             except Exception as e:
                 self.logger.debug(f"Error extrayendo tablas de página {page_num}: {e}")
 
@@ -37,7 +37,9 @@ import hashlib
 import logging
 import pickle
 import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -46,6 +48,13 @@ from typing import Any
 
 import numpy as np
 
+from farfan_pipeline.methods.embedding_store import MemmapEmbeddingStore
+from farfan_pipeline.methods.embedding_vector_index import (
+    IVFVectorIndex,
+    VectorIndexABC,
+    create_vector_index,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,11 +69,18 @@ class CacheConfig:
         max_cache_size: Maximum number of cached embeddings
         enable_persistence: Enable persistent storage
         cache_dir: Directory for cache files
-        enable_mmap: Use memory-mapped files for large caches
+        enable_mmap: Persist into a memory-mapped MemmapEmbeddingStore
+            (legacy per-entry pickle files are imported once); when False,
+            one pickle file per embedding is written and loaded at startup
         similarity_threshold: Threshold for considering embeddings similar
         enable_compression: Compress cached embeddings
-        batch_size: Batch size for embedding computation
+        batch_size: Maximum texts per backend ``encode`` call (micro-batch size)
+        batch_max_latency_ms: How long the thread that opens a micro-batch
+            waits for concurrent callers to join it before encoding
         enable_prefetch: Enable async prefetch
+        vector_index: Similarity index backend ("exact" or "ivf")
+        ivf_nlist: Number of IVF lists (when vector_index == "ivf")
+        ivf_nprobe: IVF lists probed per query (when vector_index == "ivf")
     """
 
     max_cache_size: int = 10000
@@ -74,7 +90,11 @@ class CacheConfig:
     similarity_threshold: float = 0.95
     enable_compression: bool = True
     batch_size: int = 32
+    batch_max_latency_ms: float = 2.0
     enable_prefetch: bool = True
+    vector_index: str = "exact"
+    ivf_nlist: int = 64
+    ivf_nprobe: int = 8
 
 
 class EmbeddingBackend(Enum):
@@ -123,6 +143,9 @@ class CacheStats:
         total_embeddings: Total embeddings cached
         memory_usage_mb: Estimated memory usage
         avg_access_time_us: Average access time in microseconds
+        coalesced: Requests served by another thread's in-flight computation
+        backend_batches: Number of backend ``encode`` calls
+        encoded_texts: Texts sent to the backend
     """
 
     hits: int = 0
@@ -131,6 +154,9 @@ class CacheStats:
     total_embeddings: int = 0
     memory_usage_mb: float = 0.0
     avg_access_time_us: float = 0.0
+    coalesced: int = 0
+    backend_batches: int = 0
+    encoded_texts: int = 0
 
 
 # === EMBEDDING BACKEND INTERFACE ===
@@ -203,6 +229,130 @@ class SpacyEmbeddingBackend(EmbeddingBackendABC):
         return self._dimension
 
 
+# === BATCHED ENCODING ===
+
+
+class _InFlightEmbedding:
+    """Embedding being computed by one thread and awaited by others."""
+
+    __slots__ = ("done", "embedding", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.embedding: np.ndarray | None = None
+        self.error: BaseException | None = None
+
+    def result(self) -> np.ndarray:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.embedding
+
+
+class _MicroBatch:
+    """Texts accumulated from concurrent callers for one ``encode`` round."""
+
+    __slots__ = ("texts", "done", "result", "error")
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.done = threading.Event()
+        self.result: np.ndarray | None = None
+        self.error: BaseException | None = None
+
+
+class EmbeddingMicroBatcher:
+    """Coalesce concurrent ``encode`` requests into shared backend batches.
+
+    The first caller to arrive opens a batch and becomes its owner; callers
+    arriving while it is open append their texts to it. The owner encodes the
+    batch once it holds ``max_batch_size`` texts or ``max_latency_s`` has
+    elapsed, in chunks of at most ``max_batch_size``, and every caller slices
+    its own rows out of the float32 result. No background thread is used.
+    """
+
+    def __init__(
+        self,
+        encode: Any,
+        max_batch_size: int = 32,
+        max_latency_s: float = 0.002,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            encode: Callable mapping list[str] to an (n, dim) array
+            max_batch_size: Texts per encode call
+            max_latency_s: Maximum time an owner waits for the batch to fill
+        """
+        self._encode = encode
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_latency_s = max_latency_s
+        self._cond = threading.Condition()
+        self._open: _MicroBatch | None = None
+        self.batches = 0
+        self.encoded_texts = 0
+
+    def encode(self, texts: list[str], wait_for_peers: bool = True) -> np.ndarray:
+        """Encode ``texts``, possibly together with other threads' texts.
+
+        Args:
+            texts: Texts to encode
+            wait_for_peers: Hold an opened batch up to the latency budget;
+                pass False when no concurrent caller can join
+
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        with self._cond:
+            batch = self._open
+            owner = batch is None
+            if owner:
+                batch = self._open = _MicroBatch()
+            start = len(batch.texts)
+            batch.texts.extend(texts)
+            if len(batch.texts) >= self.max_batch_size:
+                self._open = None
+                self._cond.notify_all()
+            elif owner and wait_for_peers and self.max_latency_s > 0:
+                deadline = time.monotonic() + self.max_latency_s
+                while self._open is batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            if owner and self._open is batch:
+                self._open = None
+
+        if owner:
+            self._run(batch)
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.result[start : start + len(texts)]
+
+    def _run(self, batch: _MicroBatch) -> None:
+        try:
+            chunks = [
+                np.asarray(self._encode(batch.texts[i : i + self.max_batch_size]), dtype=np.float32)
+                for i in range(0, len(batch.texts), self.max_batch_size)
+            ]
+            batch.result = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+            with self._cond:
+                self.batches += len(chunks)
+                self.encoded_texts += len(batch.texts)
+        except BaseException as e:
+            batch.error = e
+        finally:
+            batch.done.set()
+
+    def reset_stats(self) -> None:
+        """Zero the batch counters."""
+        with self._cond:
+            self.batches = 0
+            self.encoded_texts = 0
+
+
 # === CORE CACHE ENGINE ===
 
 
@@ -239,9 +389,9 @@ class SOTAEmbeddingCache:
         self.config = config or CacheConfig()
         self.backend = backend
 
-        # In-memory cache (LRU)
+        # In-memory cache (LRU; first key is least recently used)
         self._cache: dict[str, CachedEmbedding] = {}
-        self._access_order: list[str] = []
+        self._access_order: OrderedDict[str, None] = OrderedDict()
 
         # Statistics
         self._stats = CacheStats()
@@ -249,17 +399,38 @@ class SOTAEmbeddingCache:
         # Lock for thread safety
         self._lock = threading.RLock()
 
+        # Spatial index for similarity search (mirrors self._cache)
+        self._similarity_index: VectorIndexABC = self._create_similarity_index()
+        self._index_training = False
+
         # Persistence
+        self._store: MemmapEmbeddingStore | None = None
         if self.config.enable_persistence:
             self.config.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._load_persistent_cache()
-
-        # Spatial index for similarity search
-        self._similarity_index: dict[str, np.ndarray] = {}
+            if self.config.enable_mmap:
+                # O(1) startup: vectors stay on disk until requested
+                self._store = MemmapEmbeddingStore(self.config.cache_dir / "mmap_store")
+                self._store.import_pickle_dir(self.config.cache_dir)
+            else:
+                self._load_persistent_cache()
+                self._train_index_if_due()
 
         # Prefetch queue
         self._prefetch_queue: list[str] = []
 
+        # Single-flight: hashes currently being computed by some thread
+        self._inflight: dict[str, _InFlightEmbedding] = {}
+        self._active_batch_calls = 0
+        self._batcher = (
+            EmbeddingMicroBatcher(
+                self.backend.encode,
+                max_batch_size=self.config.batch_size,
+                max_latency_s=self.config.batch_max_latency_ms / 1000.0,
+            )
+            if self.backend is not None
+            else None
+        )
+
     def get_embedding(
         self,
         text: str,
@@ -285,8 +456,6 @@ class SOTAEmbeddingCache:
             - Returns numpy array with embedding
             - Cache is updated with new embedding
         """
-        import time
-
         start_time = time.perf_counter()
 
         # Compute text hash for cache key
@@ -311,18 +480,44 @@ class SOTAEmbeddingCache:
 
                 return cached.embedding
 
-            # Cache miss
-            self._stats.misses += 1
-            self._stats.hit_rate = self._stats.hits / (self._stats.hits + self._stats.misses)
+            # Persistent hit: promote the memory-mapped row into the LRU
+            stored = self._store.get(text_hash) if self._store is not None else None
+            if stored is not None:
+                self._cache_embedding(text_hash, text, stored)
+                self._record_lookups(hits=1)
+            else:
+                # Another thread is computing this text: wait for it
+                pending = self._inflight.get(text_hash)
+                if pending is None:
+                    pending = self._inflight[text_hash] = _InFlightEmbedding()
+                    self._record_lookups(misses=1)
+                    leader = True
+                else:
+                    self._stats.coalesced += 1
+                    self._record_lookups(hits=1)
+                    leader = False
+
+        if stored is not None:
+            self._train_index_if_due()
+            return stored
+        if not leader:
+            return pending.result()
 
-        # Compute embedding
-        embedding = self._compute_embedding(text, nlp)
+        try:
+            embedding = self._compute_embedding(text, nlp)
+        except BaseException as e:
+            with self._lock:
+                self._resolve_inflight({text_hash: pending}, error=e)
+            raise
 
         # Cache the embedding
         with self._lock:
             self._cache_embedding(text_hash, text, embedding)
             if self.config.enable_persistence:
                 self._persist_embedding(text_hash, text, embedding)
+            pending.embedding = embedding
+            self._resolve_inflight({text_hash: pending})
+        self._train_index_if_due()
 
         return embedding
 
@@ -334,39 +529,101 @@ class SOTAEmbeddingCache:
         """
         Get embeddings for multiple texts efficiently.
 
-        Uses batch processing for uncached texts.
+        Each text is hashed once. Cached and persisted texts are served under
+        the cache lock; texts already being computed by another thread are
+        awaited instead of recomputed (single-flight); the remainder is encoded
+        through the micro-batcher, which shares backend ``encode`` calls with
+        concurrent callers. Every requested text counts as one hit or miss.
 
         Args:
             texts: List of texts to encode
             nlp: spaCy NLP object
 
         Returns:
-            Array of embeddings
+            float32 array of shape (len(texts), dim)
         """
-        # Separate cached and uncached
-        uncached_texts = []
-        uncached_indices = []
-        embeddings = np.zeros((len(texts), self._get_embedding_dim(nlp)))
+        if not texts:
+            return np.zeros((0, self._get_embedding_dim(nlp)), dtype=np.float32)
 
+        # Deduplicate: one slot per distinct hash, ``inverse`` maps back
+        slots: dict[str, int] = {}
+        unique_texts: list[str] = []
+        inverse = np.empty(len(texts), dtype=np.intp)
         for i, text in enumerate(texts):
             text_hash = self._compute_hash(text)
-            if text_hash in self._cache:
-                embeddings[i] = self._cache[text_hash].embedding
-            else:
-                uncached_texts.append(text)
-                uncached_indices.append(i)
-
-        # Batch compute uncached embeddings
-        if uncached_texts:
-            batch_embeddings = self._compute_embeddings_batch(uncached_texts, nlp)
-
-            # Cache and assign results
-            for text, embedding, idx in zip(uncached_texts, batch_embeddings, uncached_indices):
-                text_hash = self._compute_hash(text)
-                self._cache_embedding(text_hash, text, embedding)
-                embeddings[idx] = embedding
+            slot = slots.get(text_hash)
+            if slot is None:
+                slot = slots[text_hash] = len(unique_texts)
+                unique_texts.append(text)
+            inverse[i] = slot
+        hashes = list(slots)
+
+        vectors: list[np.ndarray | None] = [None] * len(hashes)
+        missing: list[int] = []
+        with self._lock:
+            self._active_batch_calls += 1
+            for slot, text_hash in enumerate(hashes):
+                cached = self._cache.get(text_hash)
+                if cached is not None:
+                    cached.access_count += 1
+                    self._update_access_order(text_hash)
+                    vectors[slot] = cached.embedding
+                else:
+                    missing.append(slot)
+
+            # Gather persisted rows in a single memory-mapped read
+            if missing and self._store is not None and len(self._store):
+                stored, found = self._store.gather([hashes[slot] for slot in missing])
+                for slot, row, hit in zip(missing, stored, found):
+                    if hit:
+                        self._cache_embedding(hashes[slot], unique_texts[slot], row)
+                        vectors[slot] = row
+                missing = [slot for slot, hit in zip(missing, found) if not hit]
+
+            # Single-flight: lead what nobody computes yet, wait for the rest
+            owned: dict[str, _InFlightEmbedding] = {}
+            awaited: list[tuple[int, _InFlightEmbedding]] = []
+            for slot in missing:
+                text_hash = hashes[slot]
+                pending = self._inflight.get(text_hash)
+                if pending is None:
+                    owned[text_hash] = self._inflight[text_hash] = _InFlightEmbedding()
+                else:
+                    awaited.append((slot, pending))
+            self._stats.coalesced += len(awaited)
+            self._record_lookups(hits=len(texts) - len(owned), misses=len(owned))
+            wait_for_peers = self._active_batch_calls > 1
 
-        return embeddings
+        try:
+            if owned:
+                owned_slots = [slots[text_hash] for text_hash in owned]
+                computed = self._encode_batch(
+                    [unique_texts[slot] for slot in owned_slots], nlp, wait_for_peers
+                )
+                with self._lock:
+                    for slot, text_hash, embedding in zip(owned_slots, owned, computed):
+                        self._cache_embedding(text_hash, unique_texts[slot], embedding)
+                        if self.config.enable_persistence:
+                            self._persist_embedding(text_hash, unique_texts[slot], embedding)
+                        owned[text_hash].embedding = embedding
+                        vectors[slot] = embedding
+                    self._resolve_inflight(owned)
+        except BaseException as e:
+            with self._lock:
+                self._resolve_inflight(owned, error=e)
+            raise
+        finally:
+            with self._lock:
+                self._active_batch_calls -= 1
+        self._train_index_if_due()
+
+        for slot, pending in awaited:
+            vectors[slot] = pending.result()
+
+        unique = np.asarray(vectors, dtype=np.float32)
+        if len(unique) == len(texts):
+            return unique
+        return unique[inverse]
 
     def find_similar(
         self,
@@ -392,17 +649,44 @@ class SOTAEmbeddingCache:
         # Get query embedding
         query_embedding = self.get_embedding(query, nlp)
 
-        # Compute similarities
-        similarities = []
-        for text_hash, cached in self._cache.items():
-            similarity = self._cosine_similarity(query_embedding, cached.embedding)
-            if similarity >= threshold:
-                similarities.append((text_hash, similarity))
+        # One vectorized query against the similarity index
+        with self._lock:
+            return self._similarity_index.search(query_embedding, n_results, threshold)
+
+    def similarity(
+        self,
+        source: str,
+        target: str,
+        nlp: Any | None = None,
+    ) -> float | None:
+        """
+        Cosine similarity between two texts using the index's normalized vectors.
+
+        Args:
+            source: Source text
+            target: Target text
+            nlp: spaCy NLP object
 
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        Returns:
+            Cosine similarity, or None if either embedding is a zero vector
+        """
+        source_emb = self.get_embedding(source, nlp)
+        target_emb = self.get_embedding(target, nlp)
 
-        return similarities[:n_results]
+        with self._lock:
+            # Copies: safe to use after the lock is released
+            source_unit = self._similarity_index.get_normalized(self._compute_hash(source))
+            target_unit = self._similarity_index.get_normalized(self._compute_hash(target))
+        if source_unit is None or target_unit is None:
+            # Evicted between lookup and read (tiny caches): fall back to raw vectors
+            norm_source = np.linalg.norm(source_emb)
+            norm_target = np.linalg.norm(target_emb)
+            if norm_source == 0 or norm_target == 0:
+                return None
+            return float(np.dot(source_emb, target_emb) / (norm_source * norm_target))
+        if not source_unit.any() or not target_unit.any():
+            return None
+        return float(np.dot(source_unit, target_unit))
 
     def invalidate(self, text: str) -> bool:
         """
@@ -417,26 +701,32 @@ class SOTAEmbeddingCache:
         text_hash = self._compute_hash(text)
 
         with self._lock:
+            removed = False
             if text_hash in self._cache:
                 del self._cache[text_hash]
-                if text_hash in self._access_order:
-                    self._access_order.remove(text_hash)
+                self._similarity_index.remove(text_hash)
+                self._access_order.pop(text_hash, None)
+                removed = True
 
-                # Remove from persistent storage
-                if self.config.enable_persistence:
-                    cache_file = self.config.cache_dir / f"{text_hash}.pkl"
-                    if cache_file.exists():
-                        cache_file.unlink()
+            # Remove from persistent storage
+            if self._store is not None:
+                removed = self._store.delete(text_hash) or removed
+            elif removed and self.config.enable_persistence:
+                cache_file = self.config.cache_dir / f"{text_hash}.pkl"
+                if cache_file.exists():
+                    cache_file.unlink()
 
-                return True
-            return False
+            return removed
 
     def clear(self) -> None:
         """Clear all cached embeddings."""
         with self._lock:
             self._cache.clear()
             self._access_order.clear()
+            self._similarity_index.clear()
             self._stats = CacheStats()
+            if self._batcher is not None:
+                self._batcher.reset_stats()
 
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
@@ -446,6 +736,9 @@ class SOTAEmbeddingCache:
             self._stats.memory_usage_mb = sum(c.embedding.nbytes for c in self._cache.values()) / (
                 1024 * 1024
             )
+            if self._batcher is not None:
+                self._stats.backend_batches = self._batcher.batches
+                self._stats.encoded_texts = self._batcher.encoded_texts
             return self._stats
 
     def warm_up(
@@ -558,12 +851,13 @@ class SOTAEmbeddingCache:
             embedding: Embedding to cache
         """
         # Check if cache is full
-        if len(self._cache) >= self.config.max_cache_size:
+        if text_hash not in self._cache and len(self._cache) >= self.config.max_cache_size:
             # Evict least recently used
             if self._access_order:
-                lru_hash = self._access_order.pop(0)
+                lru_hash, _ = self._access_order.popitem(last=False)
                 if lru_hash in self._cache:
                     del self._cache[lru_hash]
+                    self._similarity_index.remove(lru_hash)
 
         # Add to cache
         cached = CachedEmbedding(
@@ -575,7 +869,55 @@ class SOTAEmbeddingCache:
         )
 
         self._cache[text_hash] = cached
-        self._access_order.append(text_hash)
+        self._update_access_order(text_hash)
+        self._index_embedding(text_hash, embedding)
+
+    def _index_embedding(self, text_hash: str, embedding: np.ndarray) -> None:
+        """Add an embedding to the similarity index.
+
+        Embeddings whose dimension differs from the index (e.g. the 300-d zero
+        fallback next to a smaller spaCy model) stay cached but unindexed.
+        """
+        try:
+            self._similarity_index.add(text_hash, embedding)
+        except ValueError as e:
+            logger.warning("similarity index skipped %s: %s", text_hash, e)
+
+    def _create_similarity_index(self) -> VectorIndexABC:
+        """Create the similarity index backend selected in the config."""
+        if self.config.vector_index == "ivf":
+            # Trained by _train_index_if_due, outside the cache lock
+            return create_vector_index(
+                "ivf",
+                nlist=self.config.ivf_nlist,
+                nprobe=self.config.ivf_nprobe,
+                auto_train=False,
+            )
+        return create_vector_index(self.config.vector_index)
+
+    def _train_index_if_due(self) -> None:
+        """(Re)train the IVF quantizer when due, without holding the cache lock.
+
+        Only the snapshot and the final list assignment run under the lock;
+        the k-means iterations run on the snapshot while other threads keep
+        reading and inserting (new vectors are assigned by install_centroids).
+        """
+        index = self._similarity_index
+        if not isinstance(index, IVFVectorIndex):
+            return
+        with self._lock:
+            if self._index_training or not index.training_due:
+                return
+            self._index_training = True
+            vectors = index.training_vectors()
+        try:
+            centroids = index.fit_centroids(vectors)
+            with self._lock:
+                if index is self._similarity_index:
+                    index.install_centroids(centroids)
+        finally:
+            with self._lock:
+                self._index_training = False
 
     def _update_access_order(self, text_hash: str) -> None:
         """Update access order for LRU.
@@ -583,9 +925,44 @@ class SOTAEmbeddingCache:
         Args:
             text_hash: Hash of accessed text
         """
-        if text_hash in self._access_order:
-            self._access_order.remove(text_hash)
-        self._access_order.append(text_hash)
+        self._access_order[text_hash] = None
+        self._access_order.move_to_end(text_hash)
+
+    def _record_lookups(self, hits: int = 0, misses: int = 0) -> None:
+        """Account hits/misses and refresh the hit rate (caller holds the lock)."""
+        self._stats.hits += hits
+        self._stats.misses += misses
+        total = self._stats.hits + self._stats.misses
+        self._stats.hit_rate = self._stats.hits / total if total else 0.0
+
+    def _resolve_inflight(
+        self,
+        entries: dict[str, _InFlightEmbedding],
+        error: BaseException | None = None,
+    ) -> None:
+        """Publish in-flight results (or ``error``) and wake waiting threads."""
+        for text_hash, pending in entries.items():
+            if self._inflight.get(text_hash) is pending:
+                del self._inflight[text_hash]
+            if not pending.done.is_set():
+                if pending.embedding is None:
+                    pending.error = error or RuntimeError("embedding computation aborted")
+                pending.done.set()
+
+    def _encode_batch(
+        self,
+        texts: list[str],
+        nlp: Any | None,
+        wait_for_peers: bool,
+    ) -> np.ndarray:
+        """Encode uncached texts as float32 (micro-batched when a backend is set)."""
+        if self._batcher is None:
+            embeddings = np.asarray(self._compute_embeddings_batch(texts, nlp), dtype=np.float32)
+            with self._lock:
+                self._stats.backend_batches += 1
+                self._stats.encoded_texts += len(texts)
+            return embeddings
+        return self._batcher.encode(texts, wait_for_peers=wait_for_peers)
 
     def _cosine_similarity(
         self,
@@ -639,6 +1016,13 @@ class SOTAEmbeddingCache:
             text: Original text
             embedding: Embedding to persist
         """
+        if self._store is not None:
+            try:
+                self._store.put(text_hash, embedding, len(text))
+            except ValueError as e:
+                logger.warning("persist_failed for %s: %s", text_hash, e)
+            return
+
         cache_file = self.config.cache_dir / f"{text_hash}.pkl"
 
         try:
@@ -653,7 +1037,7 @@ class SOTAEmbeddingCache:
                 pickle.dump(data, f)
 
         except Exception as e:
-            logger.warning("persist_failed", hash=text_hash, error=str(e))
+            logger.warning("persist_failed for %s: %s", text_hash, e)
 
     def _load_persistent_cache(self) -> None:
         """Load cached embeddings from disk."""
@@ -680,16 +1064,14 @@ class SOTAEmbeddingCache:
                 )
 
                 self._cache[text_hash] = cached
-                self._access_order.append(text_hash)
+                self._access_order[text_hash] = None
+                self._index_embedding(text_hash, embedding)
                 loaded_count += 1
 
             except Exception as e:
-                logger.warning("load_failed", file=str(cache_file), error=str(e))
+                logger.warning("load_failed for %s: %s", cache_file, e)
 
-        logger.info(
-            "persistent_cache_loaded",
-            n_embeddings=loaded_count,
-        )
+        logger.info("persistent_cache_loaded: %d embeddings", loaded_count)
 
 
 # === GLOBAL CACHE INSTANCE ===
@@ -795,6 +1177,12 @@ def get_cached_similarity(
     Returns:
         Cosine similarity [0, 1]
     """
+    if enable_cache:
+        similarity = get_embedding_cache().similarity(source, target, nlp)
+        if similarity is None:
+            return 0.5
+        return max(0.0, min(1.0, similarity))
+
     source_emb = get_cached_embedding(source, nlp, enable_cache)
     target_emb = get_cached_embedding(target, nlp, enable_cache)
 
@@ -27,10 +27,12 @@ State-of-the-Art Components:
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -932,6 +934,8 @@ class PolicyAnalysisEmbedder:
     Thread-safe, production-grade, fully typed.
     """
 
+    _MAX_SEARCH_SESSIONS = 8
+
     def __init__(self, config: PolicyEmbeddingConfig, retry_handler=None) -> None:
         self.config = config
         self._logger = logging.getLogger(self.__class__.__name__)
@@ -979,6 +983,10 @@ class PolicyAnalysisEmbedder:
         # Cache
         self._embedding_cache: dict[str, NDArray[np.float32]] = {}
         self._chunk_cache: dict[str, list[SemanticChunk]] = {}
+        self._search_sessions: dict[str, DocumentSearchSession] = {}
+        # id(chunk list) -> session bound to that list (fast path, see create_search_session)
+        self._list_sessions: dict[int, DocumentSearchSession] = {}
+        self._search_sessions_lock = threading.Lock()
 
     def process_document(
         self,
@@ -1034,14 +1042,22 @@ class PolicyAnalysisEmbedder:
         """Apply a policy×dimension context to every chunk (in-place)."""
         for chunk in chunks:
             chunk["pdq_context"] = context
+        self.invalidate_search_sessions()
         return chunks
 
+    def invalidate_search_sessions(self) -> None:
+        """Drop every search session (after mutating chunk embeddings in place)."""
+        with self._search_sessions_lock:
+            self._search_sessions.clear()
+            self._list_sessions.clear()
+
     def semantic_search(
         self,
         query: str,
         document_chunks: list[SemanticChunk],
         pdq_filter: PDQIdentifier | None = None,
         use_reranking: bool = True,
+        session: DocumentSearchSession | None = None,
     ) -> list[tuple[SemanticChunk, float]]:
         """
         Advanced semantic search with P-D-Q filtering and reranking.
@@ -1052,53 +1068,100 @@ class PolicyAnalysisEmbedder:
         3. Cross-encoder reranking (precise)
         4. MMR diversification
 
+        Repeated searches over the same chunk list reuse its
+        DocumentSearchSession (normalized matrix + P-D-Q index).
+
         Args:
             query: Search query
             document_chunks: Pool of chunks to search
             pdq_filter: Optional P-D-Q context filter
             use_reranking: Enable cross-encoder reranking
+            session: Session from create_search_session(document_chunks);
+                skips the session lookup
 
         Returns:
             Ranked list of (chunk, score) tuples
         """
         if not document_chunks:
             return []
+        session = session or self.create_search_session(document_chunks)
+        return session.search(query, pdq_filter=pdq_filter, use_reranking=use_reranking)
 
-        # Bi-encoder retrieval: fast approximate search
-        chunk_embeddings = np.vstack([c["embedding"] for c in document_chunks])
-        query_embedding = self._embed_texts([query])[0]
-        similarities = cosine_similarity(query_embedding.reshape(1, -1), chunk_embeddings).ravel()
-
-        # Get top-k candidates
-        top_indices = np.argsort(-similarities)[: self.config.top_k_candidates]
-        candidates = [document_chunks[i] for i in top_indices]
-
-        # Apply P-D-Q filter if specified
-        if pdq_filter:
-            candidates = self._filter_by_pdq(candidates, pdq_filter)
-            self._logger.info("Filtered to %d chunks matching P-D-Q context", len(candidates))
-
-        if not candidates:
-            return []
+    def semantic_search_many(
+        self,
+        queries: list[str],
+        document_chunks: list[SemanticChunk],
+        pdq_filters: list[PDQIdentifier | None] | None = None,
+        use_reranking: bool = True,
+        session: DocumentSearchSession | None = None,
+    ) -> list[list[tuple[SemanticChunk, float]]]:
+        """
+        Batched semantic_search: one embedding call and one matrix product.
 
-        # Cross-encoder reranking for precision
-        if use_reranking:
-            reranked = self.cross_encoder.rerank(query, candidates, top_k=self.config.top_k_rerank)
-        else:
-            # Use bi-encoder scores
-            candidate_indices = [document_chunks.index(c) for c in candidates]
-            reranked = [
-                (candidates[i], float(similarities[candidate_indices[i]]))
-                for i in range(len(candidates))
-            ]
-            reranked.sort(key=lambda x: x[1], reverse=True)
-            reranked = reranked[: self.config.top_k_rerank]
+        Args:
+            queries: Search queries
+            document_chunks: Pool of chunks to search
+            pdq_filters: Optional P-D-Q filter per query (aligned with queries)
+            use_reranking: Enable cross-encoder reranking
+            session: Session from create_search_session(document_chunks);
+                skips the session lookup
 
-        # MMR diversification
-        if len(reranked) > 1:
-            reranked = self._apply_mmr(reranked)
+        Returns:
+            One ranked list of (chunk, score) tuples per query
+        """
+        if not document_chunks:
+            return [[] for _ in queries]
+        session = session or self.create_search_session(document_chunks)
+        return session.search_many(queries, pdq_filters=pdq_filters, use_reranking=use_reranking)
 
-        return reranked
+    def create_search_session(self, document_chunks: list[SemanticChunk]) -> DocumentSearchSession:
+        """
+        Get (or build) the search session for a document's chunk list.
+
+        Fast path: a list searched before is matched by identity and its
+        DocumentSearchSession.fingerprint_chunks, which compares the chunk,
+        embedding and P-D-Q context objects without hashing any data, so
+        adding, removing or replacing chunks, embeddings or contexts is
+        detected. Mutating an embedding array in place is not: call
+        invalidate_search_sessions afterwards. Callers searching one list
+        repeatedly can also keep the returned session and pass it to
+        semantic_search / semantic_search_many.
+
+        Fallback: sessions are keyed by DocumentSearchSession.digest_chunks,
+        a digest of every chunk's content, embedding and P-D-Q context; an
+        equal-content list gets the cached matrices bound to its own chunks.
+        The ``_MAX_SEARCH_SESSIONS`` most recently used sessions are kept.
+        """
+        list_id = id(document_chunks)
+        with self._search_sessions_lock:
+            session = self._list_sessions.get(list_id)
+        # The session holds the list, so its id cannot be recycled meanwhile
+        if session is not None and session.chunks is document_chunks and session.matches(
+            document_chunks
+        ):
+            return session
+
+        key = DocumentSearchSession.digest_chunks(document_chunks)
+        with self._search_sessions_lock:
+            session = self._search_sessions.pop(key, None)
+            if session is not None:
+                self._search_sessions[key] = session
+        if session is None:
+            # Built outside the lock: concurrent misses may build twice, last one wins
+            session = DocumentSearchSession(self, document_chunks, digest=key)
+            with self._search_sessions_lock:
+                self._search_sessions[key] = session
+                while len(self._search_sessions) > self._MAX_SEARCH_SESSIONS:
+                    self._search_sessions.pop(next(iter(self._search_sessions)))
+        elif session.chunks is not document_chunks or not session.matches(document_chunks):
+            session = session.rebind(document_chunks)
+
+        with self._search_sessions_lock:
+            self._list_sessions.pop(list_id, None)
+            self._list_sessions[list_id] = session
+            while len(self._list_sessions) > self._MAX_SEARCH_SESSIONS:
+                self._list_sessions.pop(next(iter(self._list_sessions)))
+        return session
 
     def evaluate_policy_numerical_consistency(
         self,
@@ -1571,10 +1634,13 @@ class PolicyAnalysisEmbedder:
 
     def get_diagnostics(self) -> dict[str, Any]:
         """Get system diagnostics and performance metrics."""
+        with self._search_sessions_lock:
+            search_session_count = len(self._search_sessions)
         return {
             "model": self.config.embedding_model,
             "embedding_cache_size": len(self._embedding_cache),
             "chunk_cache_size": len(self._chunk_cache),
+            "search_session_count": search_session_count,
             "total_chunks_processed": sum(len(chunks) for chunks in self._chunk_cache.values()),
             "config": {
                 "chunk_size": self.config.chunk_size,
@@ -1586,6 +1652,196 @@ class PolicyAnalysisEmbedder:
         }
 
 
+# ============================================================================
+# DOCUMENT SEARCH SESSION - Reusable per-document retrieval state
+# ============================================================================
+
+
+class DocumentSearchSession:
+    """
+    Retrieval state built once per document and reused across queries.
+
+    Holds the L2-normalized chunk embedding matrix (so bi-encoder scoring is a
+    single matrix product) and a P-D-Q index mapping (policy, dimension) to a
+    boolean chunk mask (so P-D-Q filtering is a mask lookup). Results match
+    PolicyAnalysisEmbedder.semantic_search: top-k bi-encoder candidates, then
+    P-D-Q filter, cross-encoder rerank or bi-encoder scores, then MMR.
+
+    A session is immutable once built and safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        embedder: PolicyAnalysisEmbedder,
+        document_chunks: list[SemanticChunk],
+        digest: str | None = None,
+    ) -> None:
+        self.embedder = embedder
+        self.chunks = document_chunks
+        self.digest = digest if digest is not None else self.digest_chunks(document_chunks)
+        self.fingerprint = self.fingerprint_chunks(document_chunks)
+        self._logger = embedder._logger
+
+        matrix = np.vstack([c["embedding"] for c in document_chunks]).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix: NDArray[np.float32] = matrix / norms
+
+        self._pdq_index: dict[tuple[str, str], NDArray[np.bool_]] = {}
+        for index, chunk in enumerate(document_chunks):
+            pdq_context = chunk.get("pdq_context") if isinstance(chunk, dict) else None
+            if not isinstance(pdq_context, dict):
+                continue
+            key = (pdq_context.get("policy"), pdq_context.get("dimension"))
+            if key[0] is None or key[1] is None:
+                continue
+            mask = self._pdq_index.get(key)
+            if mask is None:
+                mask = self._pdq_index[key] = np.zeros(len(document_chunks), dtype=bool)
+            mask[index] = True
+
+    @staticmethod
+    def fingerprint_chunks(document_chunks: list[SemanticChunk]) -> tuple[Any, ...]:
+        """
+        The chunk, embedding and P-D-Q context objects of a chunk list.
+
+        Held by the session, so none of them can be freed and its id reused
+        by a replacement while the session lives.
+        """
+        fingerprint: list[Any] = []
+        for chunk in document_chunks:
+            fingerprint.append(chunk)
+            if isinstance(chunk, dict):
+                fingerprint.append(chunk.get("embedding"))
+                fingerprint.append(chunk.get("pdq_context"))
+        return tuple(fingerprint)
+
+    def matches(self, document_chunks: list[SemanticChunk]) -> bool:
+        """Whether ``document_chunks`` still holds exactly the objects indexed (O(n), no hashing)."""
+        current = self.fingerprint_chunks(document_chunks)
+        return len(current) == len(self.fingerprint) and all(
+            a is b for a, b in zip(current, self.fingerprint)
+        )
+
+    @staticmethod
+    def digest_chunks(document_chunks: list[SemanticChunk]) -> str:
+        """Digest of the chunk state a session snapshots (content, embedding, P-D-Q)."""
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in document_chunks:
+            pdq_context = chunk.get("pdq_context") if isinstance(chunk, dict) else None
+            if isinstance(pdq_context, dict):
+                pdq_key = f"{pdq_context.get('policy')}|{pdq_context.get('dimension')}"
+            else:
+                pdq_key = ""
+            digest.update(str(chunk.get("content", "")).encode("utf-8"))
+            digest.update(b"\x00" + pdq_key.encode("utf-8") + b"\x00")
+            digest.update(np.ascontiguousarray(chunk["embedding"], dtype=np.float32).tobytes())
+        return digest.hexdigest()
+
+    def rebind(self, document_chunks: list[SemanticChunk]) -> DocumentSearchSession:
+        """Share this session's matrices with an equal-content chunk list."""
+        session = copy.copy(self)
+        session.chunks = document_chunks
+        session.fingerprint = self.fingerprint_chunks(document_chunks)
+        return session
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def pdq_mask(self, pdq_filter: PDQIdentifier) -> NDArray[np.bool_]:
+        """Boolean mask of chunks whose P-D-Q context matches ``pdq_filter``."""
+        policy = pdq_filter.get("policy") if isinstance(pdq_filter, dict) else None
+        dimension = pdq_filter.get("dimension") if isinstance(pdq_filter, dict) else None
+        if policy is None or dimension is None:
+            self._logger.error(
+                "ERR_CONTRACT_MISMATCH[fn=pdq_mask, key='pdq_filter', "
+                "needed=keys=('policy','dimension'), got=%s]",
+                type(pdq_filter).__name__,
+            )
+            return np.zeros(len(self.chunks), dtype=bool)
+        mask = self._pdq_index.get((policy, dimension))
+        return mask if mask is not None else np.zeros(len(self.chunks), dtype=bool)
+
+    def score(self, queries: list[str]) -> NDArray[np.float32]:
+        """Cosine similarity matrix of shape (len(queries), len(chunks))."""
+        query_matrix = self.embedder._embed_texts(queries).astype(np.float32)
+        norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (query_matrix / norms) @ self.matrix.T
+
+    def search(
+        self,
+        query: str,
+        pdq_filter: PDQIdentifier | None = None,
+        use_reranking: bool = True,
+    ) -> list[tuple[SemanticChunk, float]]:
+        """Single-query search (see PolicyAnalysisEmbedder.semantic_search)."""
+        return self.search_many([query], [pdq_filter], use_reranking)[0]
+
+    def search_many(
+        self,
+        queries: list[str],
+        pdq_filters: list[PDQIdentifier | None] | None = None,
+        use_reranking: bool = True,
+    ) -> list[list[tuple[SemanticChunk, float]]]:
+        """Embed all queries in one call and score them with one matrix product."""
+        if not queries:
+            return []
+        if pdq_filters is None:
+            pdq_filters = [None] * len(queries)
+        if len(pdq_filters) != len(queries):
+            raise ValueError(
+                f"pdq_filters has {len(pdq_filters)} entries for {len(queries)} queries"
+            )
+
+        similarities = self.score(queries)
+        return [
+            self._finalize(query, row, pdq_filter, use_reranking)
+            for query, row, pdq_filter in zip(queries, similarities, pdq_filters, strict=True)
+        ]
+
+    def _finalize(
+        self,
+        query: str,
+        similarities: NDArray[np.float32],
+        pdq_filter: PDQIdentifier | None,
+        use_reranking: bool,
+    ) -> list[tuple[SemanticChunk, float]]:
+        config = self.embedder.config
+
+        # Top-k candidates, best first
+        k = min(config.top_k_candidates, similarities.size)
+        if k <= 0:
+            return []
+        top = np.argpartition(-similarities, k - 1)[:k] if k < similarities.size else np.arange(k)
+        top = top[np.argsort(-similarities[top], kind="stable")]
+
+        # Apply P-D-Q filter if specified
+        if pdq_filter:
+            top = top[self.pdq_mask(pdq_filter)[top]]
+            self._logger.info("Filtered to %d chunks matching P-D-Q context", len(top))
+
+        if top.size == 0:
+            return []
+
+        if use_reranking:
+            candidates = [self.chunks[i] for i in top]
+            reranked = self.embedder.cross_encoder.rerank(
+                query, candidates, top_k=config.top_k_rerank
+            )
+        else:
+            # Bi-encoder scores (candidates are already sorted)
+            reranked = [
+                (self.chunks[i], float(similarities[i])) for i in top[: config.top_k_rerank]
+            ]
+
+        # MMR diversification
+        if len(reranked) > 1:
+            reranked = self.embedder._apply_mmr(reranked)
+
+        return reranked
+
+
 # ============================================================================
 # PRODUCTION FACTORY AND UTILITIES
 # ============================================================================
@@ -1719,6 +1975,18 @@ class EmbeddingPolicyProducer:
         """Advanced semantic search with reranking"""
         return self.embedder.semantic_search(query, document_chunks, pdq_filter, use_reranking)
 
+    def semantic_search_many(
+        self,
+        queries: list[str],
+        document_chunks: list[SemanticChunk],
+        pdq_filters: list[PDQIdentifier | None] | None = None,
+        use_reranking: bool = True,
+    ) -> list[list[tuple[SemanticChunk, float]]]:
+        """Batched semantic search (one embedding call for all queries)"""
+        return self.embedder.semantic_search_many(
+            queries, document_chunks, pdq_filters, use_reranking
+        )
+
     def get_search_result_chunk(self, result: tuple[SemanticChunk, float]) -> SemanticChunk:
         """Extract chunk from search result"""
         return result[0]
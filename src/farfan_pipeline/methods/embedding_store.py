@@ -0,0 +1,370 @@
+"""
+Memory-Mapped Persistent Store for the Embedding Cache.
+
+Replaces the one-pickle-per-embedding layout of SOTAEmbeddingCache with:
+
+- ``vectors-<gen>.f32``: raw float32 matrix of fixed dimension, opened with
+  ``np.memmap`` (vectors are paged in on demand, never unpickled)
+- ``index-<gen>.bin``: append-only log of fixed-size records
+  ``(hash, row, text_length, created_at)``; a row of 0xFFFFFFFF is a tombstone
+- ``meta.json``: dimension and current generation, replaced atomically
+
+New vectors are written in place at the end of the matrix (capacity doubles
+as needed). Deleted and overwritten rows become dead; once they exceed
+``compaction_ratio`` of the matrix the live rows are rewritten into a new
+generation and ``meta.json`` is switched over.
+
+Opening the store maps the vector file and reads the compact index with a
+single ``np.fromfile``; no vector is touched until it is requested.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_RECORD = np.dtype(
+    [("hash", "<u8"), ("row", "<u4"), ("text_length", "<u4"), ("created_at", "<f8")]
+)
+TOMBSTONE = 0xFFFFFFFF
+PICKLE_IMPORT_MARKER = ".pickle_imported"
+
+
+class MemmapEmbeddingStore:
+    """Fixed-dimension float32 embedding store backed by ``np.memmap``.
+
+    Keys are the 16-hex-char text hashes produced by SOTAEmbeddingCache,
+    stored in the index as 64-bit integers.
+    """
+
+    def __init__(
+        self,
+        store_dir: Path,
+        dimension: int | None = None,
+        initial_capacity: int = 1024,
+        compaction_ratio: float = 0.25,
+        min_compaction_rows: int = 1024,
+    ):
+        """Open (or create lazily) a store.
+
+        Args:
+            store_dir: Directory holding meta.json, vectors-*.f32 and index-*.bin
+            dimension: Vector dimension (taken from meta.json or the first put)
+            initial_capacity: Rows preallocated when the vector file is created
+            compaction_ratio: Dead-row fraction that triggers compaction
+            min_compaction_rows: Do not compact below this many dead rows
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.initial_capacity = max(1, initial_capacity)
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_rows = min_compaction_rows
+        self._lock = threading.RLock()
+
+        self.dimension = dimension
+        self.generation = 0
+        self._rows: dict[str, int] = {}
+        self._meta_by_hash: dict[str, tuple[int, float]] = {}
+        self._used_rows = 0
+        self._vectors: np.memmap | None = None
+        self._index_file = None
+
+        meta_path = self.store_dir / "meta.json"
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            self.dimension = meta["dimension"]
+            self.generation = meta["generation"]
+            self._open_generation()
+
+    # === PATHS ===
+
+    def _vectors_path(self, generation: int) -> Path:
+        return self.store_dir / f"vectors-{generation:06d}.f32"
+
+    def _index_path(self, generation: int) -> Path:
+        return self.store_dir / f"index-{generation:06d}.bin"
+
+    def _write_meta(self) -> None:
+        tmp = self.store_dir / "meta.json.tmp"
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "dtype": "float32",
+                    "dimension": self.dimension,
+                    "generation": self.generation,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.store_dir / "meta.json")
+
+    # === OPEN / GROW ===
+
+    def _open_generation(self) -> None:
+        vectors_path = self._vectors_path(self.generation)
+        index_path = self._index_path(self.generation)
+        if not vectors_path.exists():
+            self._allocate(vectors_path, self.initial_capacity)
+        self._map(vectors_path)
+
+        records = (
+            np.fromfile(index_path, dtype=INDEX_RECORD)
+            if index_path.exists()
+            else np.zeros(0, dtype=INDEX_RECORD)
+        )
+        # A torn trailing record is dropped by fromfile; truncate it away
+        expected = records.size * INDEX_RECORD.itemsize
+        if index_path.exists() and index_path.stat().st_size != expected:
+            with open(index_path, "r+b") as f:
+                f.truncate(expected)
+
+        rows: dict[str, int] = {}
+        meta: dict[str, tuple[int, float]] = {}
+        used = 0
+        for hash_value, row, text_length, created_at in records.tolist():
+            text_hash = f"{hash_value:016x}"
+            if row == TOMBSTONE:
+                rows.pop(text_hash, None)
+                meta.pop(text_hash, None)
+                continue
+            rows[text_hash] = row
+            meta[text_hash] = (text_length, created_at)
+            used = max(used, row + 1)
+        self._rows = rows
+        self._meta_by_hash = meta
+        self._used_rows = used
+        self._index_file = open(index_path, "ab")
+
+    def _allocate(self, path: Path, capacity: int) -> None:
+        with open(path, "ab") as f:
+            f.truncate(capacity * self.dimension * 4)
+
+    def _map(self, path: Path) -> None:
+        capacity = path.stat().st_size // (self.dimension * 4)
+        self._vectors = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension))
+
+    def _ensure_open(self, dimension: int) -> None:
+        if self.dimension is None:
+            self.dimension = dimension
+            self._write_meta()
+        if self._vectors is None:
+            self._open_generation()
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        self._vectors.flush()
+        path = self._vectors_path(self.generation)
+        self._vectors = None
+        self._allocate(path, max(needed, capacity * 2))
+        self._map(path)
+
+    # === PUBLIC API ===
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, text_hash: object) -> bool:
+        return text_hash in self._rows
+
+    def keys(self) -> list[str]:
+        """Hashes of all live vectors (insertion order)."""
+        return list(self._rows)
+
+    def put(self, text_hash: str, embedding: np.ndarray, text_length: int = 0) -> None:
+        """Append (or overwrite) the vector for ``text_hash``.
+
+        Raises:
+            ValueError: If the vector dimension differs from the store's
+        """
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        with self._lock:
+            self._ensure_open(vector.shape[0])
+            if vector.shape[0] != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension {vector.shape[0]} does not match store dimension {self.dimension}"
+                )
+            row = self._used_rows
+            self._ensure_capacity(row + 1)
+            self._vectors[row] = vector
+            created_at = time.time()
+            self._append_record(text_hash, row, text_length, created_at)
+            self._rows[text_hash] = row
+            self._meta_by_hash[text_hash] = (text_length, created_at)
+            self._used_rows = row + 1
+            self._maybe_compact()
+
+    def get(self, text_hash: str) -> np.ndarray | None:
+        """Zero-copy, read-only view of the stored vector (None if absent).
+
+        The view is shared with every other reader, so in-place edits raise
+        ``ValueError`` instead of silently corrupting the store; callers that
+        need to normalize must copy first.
+        """
+        with self._lock:
+            row = self._rows.get(text_hash)
+            if row is None:
+                return None
+            view = self._vectors[row]
+            view.flags.writeable = False
+            return view
+
+    def gather(self, text_hashes: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Gather many vectors with a single fancy-index read.
+
+        Returns:
+            (matrix, found) where ``matrix`` has one row per requested hash
+            (zeros where missing) and ``found`` is a boolean mask.
+        """
+        with self._lock:
+            rows = np.fromiter(
+                (self._rows.get(h, -1) for h in text_hashes), dtype=np.int64, count=len(text_hashes)
+            )
+            found = rows >= 0
+            if self._vectors is None:
+                return np.zeros((len(text_hashes), self.dimension or 0), dtype=np.float32), found
+            matrix = np.zeros((len(text_hashes), self.dimension), dtype=np.float32)
+            matrix[found] = self._vectors[rows[found]]
+            return matrix, found
+
+    def metadata(self, text_hash: str) -> dict[str, object] | None:
+        """text_length and created_at (ISO) recorded for ``text_hash``."""
+        entry = self._meta_by_hash.get(text_hash)
+        if entry is None:
+            return None
+        text_length, created_at = entry
+        return {
+            "text_length": text_length,
+            "created_at": datetime.fromtimestamp(created_at, UTC).isoformat(),
+        }
+
+    def delete(self, text_hash: str) -> bool:
+        """Tombstone ``text_hash``; returns True if it was present."""
+        with self._lock:
+            if text_hash not in self._rows:
+                return False
+            self._append_record(text_hash, TOMBSTONE, 0, time.time())
+            del self._rows[text_hash]
+            self._meta_by_hash.pop(text_hash, None)
+            self._maybe_compact()
+            return True
+
+    def flush(self) -> None:
+        """Flush vector pages and the index log to disk."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+            if self._index_file is not None:
+                self._index_file.flush()
+
+    def close(self) -> None:
+        """Flush and release the memory map and index file."""
+        with self._lock:
+            self.flush()
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+            self._vectors = None
+
+    @property
+    def dead_rows(self) -> int:
+        return self._used_rows - len(self._rows)
+
+    def compact(self) -> None:
+        """Rewrite live rows into a new generation and drop the old files."""
+        with self._lock:
+            if self._vectors is None:
+                return
+            hashes = list(self._rows)
+            live = np.fromiter((self._rows[h] for h in hashes), dtype=np.int64, count=len(hashes))
+            old_generation = self.generation
+            new_generation = old_generation + 1
+
+            vectors_path = self._vectors_path(new_generation)
+            self._allocate(vectors_path, max(self.initial_capacity, len(hashes) * 2))
+            capacity = vectors_path.stat().st_size // (self.dimension * 4)
+            new_vectors = np.memmap(
+                vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension)
+            )
+            new_vectors[: len(hashes)] = self._vectors[live]
+            new_vectors.flush()
+
+            records = np.zeros(len(hashes), dtype=INDEX_RECORD)
+            for new_row, text_hash in enumerate(hashes):
+                text_length, created_at = self._meta_by_hash[text_hash]
+                records[new_row] = (int(text_hash, 16), new_row, text_length, created_at)
+            records.tofile(self._index_path(new_generation))
+
+            self._index_file.close()
+            self._vectors = None
+            del new_vectors
+            self.generation = new_generation
+            self._write_meta()
+            for path in (self._vectors_path(old_generation), self._index_path(old_generation)):
+                path.unlink(missing_ok=True)
+            self._open_generation()
+            logger.info("embedding store compacted: %d live rows, generation %d", len(hashes), new_generation)
+
+    # === INTERNALS ===
+
+    def _append_record(self, text_hash: str, row: int, text_length: int, created_at: float) -> None:
+        record = np.array(
+            [(int(text_hash, 16), row, text_length, created_at)], dtype=INDEX_RECORD
+        )
+        self._index_file.write(record.tobytes())
+        self._index_file.flush()
+
+    def _maybe_compact(self) -> None:
+        dead = self.dead_rows
+        if dead >= self.min_compaction_rows and dead > self.compaction_ratio * self._used_rows:
+            self.compact()
+
+    # === LEGACY IMPORT ===
+
+    def import_pickle_dir(self, pickle_dir: Path) -> int:
+        """One-shot import of the legacy ``<hash>.pkl`` files.
+
+        A marker file is written afterwards so the directory is not rescanned
+        on later starts; the pickle files themselves are left untouched.
+
+        Returns:
+            Number of embeddings imported
+        """
+        pickle_dir = Path(pickle_dir)
+        marker = self.store_dir / PICKLE_IMPORT_MARKER
+        if marker.exists() or not pickle_dir.exists():
+            return 0
+
+        imported = 0
+        for cache_file in sorted(pickle_dir.glob("*.pkl")):
+            try:
+                with open(cache_file, "rb") as f:
+                    data = pickle.load(f)
+                text_hash = data["text_hash"]
+                if text_hash not in self:
+                    self.put(text_hash, data["embedding"], data.get("text_length", 0))
+                    imported += 1
+            except Exception as e:
+                logger.warning("legacy embedding import failed for %s: %s", cache_file, e)
+        self.flush()
+        marker.write_text(datetime.now(UTC).isoformat(), encoding="utf-8")
+        logger.info("imported %d legacy pickle embeddings into %s", imported, self.store_dir)
+        return imported
+
+
+__all__ = [
+    "MemmapEmbeddingStore",
+    "INDEX_RECORD",
+]
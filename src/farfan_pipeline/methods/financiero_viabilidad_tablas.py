@@ -410,7 +410,9 @@ class ExtractedTable:
     df: pd.DataFrame
     page_number: int
     table_type: str | None
-    extraction_method: Literal["img2table", "tabula", "pdfplumber"]  # img2table replaces camelot (AI/CV-based)
+    extraction_method: Literal[
+        "img2table", "pymupdf_find_tables", "tabula", "pdfplumber"
+    ]  # img2table replaces camelot (AI/CV-based)
     confidence_score: float
     is_fragmented: bool = False
     continuation_of: int | None = None
@@ -579,7 +581,38 @@ class PDETMunicipalPlanAnalyzer:
         except Exception as e:
             print(f" ⚠️ img2table: {str(e)[:80]}")
 
-        # Tabula (fallback for structured tables)
+        # Structured tables from the shared parsed-document artifact (find_tables runs
+        # once per PDF and is reused by Phase 1); Tabula only if the PDF cannot be parsed
+        try:
+            from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
+
+            for table in open_parsed_document(pdf_path_str).tables():
+                df = pd.DataFrame(table.rows)
+                if not df.empty and len(df) > 2:
+                    all_tables.append(
+                        ExtractedTable(
+                            df=self._clean_dataframe(df),
+                            page_number=table.page_number,
+                            table_type=None,
+                            extraction_method="pymupdf_find_tables",
+                            confidence_score=0.6,
+                        )
+                    )
+        except Exception as e:
+            print(f" ⚠️ PyMuPDF find_tables: {str(e)[:50]}")
+            self._extract_tables_tabula(pdf_path_str, all_tables)
+
+        unique_tables = self._deduplicate_tables(all_tables)
+        print(f"✅ {len(unique_tables)} tablas únicas extraídas\n")
+
+        reconstructed = await self._reconstruct_fragmented_tables(unique_tables)
+        print(f"🔗 {len(reconstructed)} tablas después de reconstitución\n")
+
+        classified = self._classify_tables(reconstructed)
+        return classified
+
+    def _extract_tables_tabula(self, pdf_path_str: str, all_tables: list[ExtractedTable]) -> None:
+        """Tabula fallback for structured tables."""
         try:
             tabula_tables = tabula.read_pdf(
                 pdf_path_str,
@@ -603,15 +636,6 @@ class PDETMunicipalPlanAnalyzer:
         except Exception as e:
             print(f" ⚠️ Tabula: {str(e)[:50]}")
 
-        unique_tables = self._deduplicate_tables(all_tables)
-        print(f"✅ {len(unique_tables)} tablas únicas extraídas\n")
-
-        reconstructed = await self._reconstruct_fragmented_tables(unique_tables)
-        print(f"🔗 {len(reconstructed)} tablas después de reconstitución\n")
-
-        classified = self._classify_tables(reconstructed)
-        return classified
-
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         if df.empty:
             return df
@@ -2580,15 +2604,12 @@ class PDETMunicipalPlanAnalyzer:
 
         text_parts = []
 
-        # Método 1: PyMuPDF (rápido y eficiente)
-        # Delegate to factory for I/O operation
-        from farfan_pipeline.analysis.factory import open_pdf_with_fitz, open_pdf_with_pdfplumber
+        # Método 1: PyMuPDF (rápido y eficiente), vía el artefacto compartido del documento
+        from farfan_pipeline.analysis.factory import open_pdf_with_pdfplumber
+        from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
 
         try:
-            doc = open_pdf_with_fitz(pdf_path)
-            for page in doc:
-                text_parts.append(page.get_text())
-            doc.close()
+            text_parts.extend(open_parsed_document(pdf_path).iter_page_texts())
         except Exception as e:
             print(f" ⚠️ PyMuPDF falló: {str(e)[:50]}")
 
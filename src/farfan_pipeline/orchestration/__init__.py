@@ -66,6 +66,7 @@ from farfan_pipeline.orchestration.orchestrator import (
     PhaseResult,
     ExecutionContext,
     PipelineResult,
+    SharedPipelineResources,
     UnifiedOrchestrator,
 
     # Phase 0 validation types
@@ -73,6 +74,14 @@ from farfan_pipeline.orchestration.orchestrator import (
     GateResult,
 )
 
+# Import multi-plan batch runner
+from farfan_pipeline.orchestration.batch_runner import (
+    BatchPipelineRunner,
+    BatchPlanOutcome,
+    BatchSummary,
+    discover_plans,
+)
+
 # Import compatibility classes
 from farfan_pipeline.orchestration.compatibility import (
     MethodExecutor,
@@ -130,6 +139,13 @@ __all__ = [
     "ExecutionContext",
     "PHASE_METADATA",
     "PipelineResult",
+    "SharedPipelineResources",
+
+    # Batch Mode
+    "BatchPipelineRunner",
+    "BatchPlanOutcome",
+    "BatchSummary",
+    "discover_plans",
 
     # State Machine
     "OrchestrationState",
@@ -0,0 +1,484 @@
+"""
+Multi-Plan Batch Runner for the F.A.R.F.A.N Pipeline.
+
+Evaluates many municipal development plans (PDFs) in one invocation:
+
+1. Bootstrap once: a template UnifiedOrchestrator builds the factory,
+   questionnaire, signal registry, SISAS and the Phase 0 wiring (method
+   registry, models) against the first plan, and exports them as
+   SharedPipelineResources. If that plan fails Phase 0 it is marked failed
+   and the next plan becomes the reference, up to ``max_reference_attempts``
+   plans. Failures that no other plan can fix (orchestrator construction,
+   boot checks, questionnaire, method registry, wiring) abort the batch.
+2. Pipeline every plan through Phases 0-9 on a bounded worker pool. Each plan
+   gets its own UnifiedOrchestrator (and therefore its own ExecutionContext,
+   state machine, dependency graph and trace) built on the shared resources;
+   Phase 0 only re-validates the plan's own PDF.
+3. Contain failures per plan: an exception or a failed phase marks that plan
+   as failed and the batch moves on.
+4. Report throughput: plans/hour, per-phase p50/p95 and peak RSS.
+
+Usage:
+    runner = BatchPipelineRunner(OrchestratorConfig(output_dir="out"), max_workers=4)
+    summary = runner.run(discover_plans(Path("plans/")))
+    print(summary.to_dict())
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from farfan_pipeline.orchestration.orchestrator import (
+    OrchestrationError,
+    OrchestrationInitializationError,
+    OrchestratorConfig,
+    PhaseID,
+    PhaseStatus,
+    SharedPipelineResources,
+    UnifiedOrchestrator,
+)
+
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover - not available on Windows
+    RESOURCE_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+BATCH_PHASES = "P00-P09"
+MANIFEST_SUFFIXES = (".txt", ".lst")
+MAX_REFERENCE_ATTEMPTS = 3
+
+# Phase 0 failures that do not depend on the reference plan: retrying the
+# bootstrap on another plan would fail the same way
+ENVIRONMENT_ERROR_CODES = frozenset(
+    {
+        "P0_GATE_1_FAILED",  # runtime config / artifacts dir
+        "P0_GATE_3_FAILED",  # boot checks
+        "P0_GATE_4_FAILED",  # determinism seeds
+        "P0_GATE_5_FAILED",  # questionnaire integrity
+        "P0_GATE_6_FAILED",  # method registry
+        "P0_GATE_7_FAILED",  # smoke tests
+        "P0_WIRING_VALIDATION_FAILED",
+    }
+)
+
+
+# =============================================================================
+# PLAN DISCOVERY
+# =============================================================================
+
+
+def discover_plans(source: Path) -> list[Path]:
+    """Resolve the plans to evaluate from a directory or a manifest file.
+
+    Args:
+        source: Directory of PDFs (non-recursive, sorted by name) or a
+            manifest (``.txt``/``.lst``) listing one PDF path per line.
+            Manifest paths are relative to the manifest's directory; blank
+            lines and ``#`` comments are ignored.
+
+    Returns:
+        Plan paths in evaluation order
+
+    Raises:
+        FileNotFoundError: If ``source`` does not exist
+        ValueError: If ``source`` is neither a directory nor a manifest
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Batch source not found: {source}")
+    if source.is_dir():
+        return sorted(p for p in source.iterdir() if p.is_file() and p.suffix.lower() == ".pdf")
+    if source.suffix.lower() in MANIFEST_SUFFIXES:
+        plans = []
+        for line in source.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if entry and not entry.startswith("#"):
+                path = Path(entry)
+                plans.append(path if path.is_absolute() else source.parent / path)
+        return plans
+    raise ValueError(f"Batch source must be a directory or a manifest file: {source}")
+
+
+def _plan_ids(plans: list[Path]) -> list[str]:
+    """Stable, unique plan ids derived from file stems."""
+    seen: dict[str, int] = {}
+    ids = []
+    for plan in plans:
+        stem = plan.stem
+        seen[stem] = seen.get(stem, 0) + 1
+        ids.append(stem if seen[stem] == 1 else f"{stem}-{seen[stem]}")
+    return ids
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+
+@dataclass
+class BatchPlanOutcome:
+    """Outcome of one plan in a batch (phase outputs are not retained)."""
+
+    plan_id: str
+    document_path: str
+    success: bool
+    duration_s: float
+    phase_timings: dict[str, float] = field(default_factory=dict)
+    failed_phases: list[str] = field(default_factory=list)
+    error: str | None = None
+    output_dir: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "plan_id": self.plan_id,
+            "document_path": self.document_path,
+            "success": self.success,
+            "duration_s": self.duration_s,
+            "phase_timings": dict(self.phase_timings),
+            "failed_phases": list(self.failed_phases),
+            "error": self.error,
+            "output_dir": self.output_dir,
+        }
+
+
+@dataclass
+class BatchSummary:
+    """Throughput summary of a batch run."""
+
+    plans_total: int
+    plans_succeeded: int
+    plans_failed: int
+    bootstrap_time_s: float
+    wall_clock_s: float
+    plans_per_hour: float
+    phase_percentiles: dict[str, dict[str, float]]
+    peak_rss_mb: float | None
+    max_workers: int
+    outcomes: list[BatchPlanOutcome] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "plans_total": self.plans_total,
+            "plans_succeeded": self.plans_succeeded,
+            "plans_failed": self.plans_failed,
+            "bootstrap_time_s": self.bootstrap_time_s,
+            "wall_clock_s": self.wall_clock_s,
+            "plans_per_hour": self.plans_per_hour,
+            "phase_percentiles": {k: dict(v) for k, v in self.phase_percentiles.items()},
+            "peak_rss_mb": self.peak_rss_mb,
+            "max_workers": self.max_workers,
+            "plans": [outcome.to_dict() for outcome in self.outcomes],
+        }
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile of ``values`` (q in [0, 100])."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB (None if unknown)."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+# =============================================================================
+# BATCH RUNNER
+# =============================================================================
+
+
+class BatchPipelineRunner:
+    """Run many plans through the pipeline on one shared bootstrap.
+
+    Args:
+        config: Base configuration; ``document_path``, ``municipality_name``,
+            ``output_dir`` and ``phases_to_execute`` are set per plan.
+        max_workers: Plans evaluated concurrently
+        phases: Phase range evaluated per plan (default P00-P09)
+        export_results: Write each plan's phase outputs to its output dir
+        shared_resources: Reuse an existing bootstrap instead of building one
+        on_plan_complete: Called with each BatchPlanOutcome as plans finish
+        max_reference_attempts: Plans tried as the bootstrap reference before
+            the batch is aborted
+    """
+
+    def __init__(
+        self,
+        config: OrchestratorConfig,
+        max_workers: int = 2,
+        phases: str = BATCH_PHASES,
+        export_results: bool = True,
+        shared_resources: SharedPipelineResources | None = None,
+        on_plan_complete: Callable[[BatchPlanOutcome], None] | None = None,
+        max_reference_attempts: int = MAX_REFERENCE_ATTEMPTS,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        if max_reference_attempts < 1:
+            raise ValueError("max_reference_attempts must be a positive integer")
+        self.config = config
+        self.max_workers = max_workers
+        self.phases = phases
+        self.export_results = export_results
+        self.shared_resources = shared_resources
+        self.on_plan_complete = on_plan_complete
+        self.max_reference_attempts = max_reference_attempts
+        self._template: UnifiedOrchestrator | None = None
+        self._callback_lock = threading.Lock()
+
+    def bootstrap(
+        self, reference_plan: Path, plan_id: str | None = None
+    ) -> SharedPipelineResources:
+        """Build the shared resources once, running Phase 0 on ``reference_plan``.
+
+        Raises:
+            OrchestrationInitializationError: If the Phase 0 bootstrap fails.
+                Its ``plan_specific`` context entry is False when the failure
+                does not depend on ``reference_plan``.
+        """
+        if self.shared_resources is not None:
+            return self.shared_resources
+
+        start = time.perf_counter()
+        try:
+            template = UnifiedOrchestrator(
+                replace(
+                    self.config,
+                    document_path=str(reference_plan),
+                    plan_id=plan_id,
+                    output_dir=str(Path(self.config.output_dir) / "_bootstrap"),
+                    phases_to_execute="P00-P00",
+                )
+            )
+        except Exception as e:
+            raise OrchestrationInitializationError(
+                f"Batch bootstrap failed: {type(e).__name__}: {e}",
+                reference_plan=str(reference_plan),
+                plan_specific=False,
+            ) from e
+        result = template.execute()
+        phase0 = result.phase_results.get(PhaseID.PHASE_0)
+        if not result.success or phase0 is None or phase0.status != PhaseStatus.COMPLETED:
+            error = phase0.error if phase0 is not None else None
+            template.cleanup()
+            raise OrchestrationInitializationError(
+                f"Batch bootstrap failed: {error or result.errors}",
+                reference_plan=str(reference_plan),
+                plan_specific=not (
+                    isinstance(error, OrchestrationError)
+                    and error.error_code in ENVIRONMENT_ERROR_CODES
+                ),
+            )
+
+        self._template = template
+        self.shared_resources = template.export_shared_resources(
+            bootstrap_time_s=time.perf_counter() - start
+        )
+        logger.info(
+            "batch_bootstrap_complete",
+            reference_plan=str(reference_plan),
+            bootstrap_time_s=round(self.shared_resources.bootstrap_time_s, 3),
+        )
+        return self.shared_resources
+
+    def run(self, plans: Iterable[Path]) -> BatchSummary:
+        """Evaluate ``plans`` and return the throughput summary.
+
+        The bootstrap is paid once before the pool starts; its time is
+        reported separately and excluded from plans/hour. A reference plan
+        whose Phase 0 fails is recorded as failed and the next plan is tried;
+        after ``max_reference_attempts`` failures, or a failure that does not
+        depend on the plan, the remaining plans are marked failed unrun.
+        """
+        plans = [Path(p) for p in plans]
+        if not plans:
+            return self._summarize([], 0.0)
+
+        plan_ids = _plan_ids(plans)
+        outcomes: list[BatchPlanOutcome | None] = [None] * len(plans)
+        shared = self.shared_resources
+        attempts = 0
+        abort_reason: str | None = None
+        for index, (plan_id, plan) in enumerate(zip(plan_ids, plans, strict=True)):
+            if shared is not None or abort_reason is not None:
+                break
+            bootstrap_start = time.perf_counter()
+            if not plan.is_file():
+                # A missing plan says nothing about the environment; it does
+                # not count as a reference attempt
+                error = f"FileNotFoundError: plan not found: {plan}"
+                plan_specific = True
+            else:
+                attempts += 1
+                try:
+                    shared = self.bootstrap(plan, plan_id=plan_id)
+                    continue
+                except OrchestrationInitializationError as e:
+                    error = f"{type(e).__name__}: {e}"
+                    plan_specific = e.context.get("plan_specific", True)
+            outcomes[index] = BatchPlanOutcome(
+                plan_id=plan_id,
+                document_path=str(plan),
+                success=False,
+                duration_s=time.perf_counter() - bootstrap_start,
+                failed_phases=[PhaseID.PHASE_0.value],
+                error=error,
+            )
+            logger.error("batch_bootstrap_plan_failed", plan_id=plan_id, error=error)
+            self._notify(outcomes[index])
+            if not plan_specific:
+                abort_reason = f"bootstrap failed independently of the plan ({error})"
+            elif attempts >= self.max_reference_attempts:
+                abort_reason = f"bootstrap failed on {attempts} reference plans (last: {error})"
+
+        if abort_reason is not None:
+            logger.error("batch_aborted", reason=abort_reason)
+            for index, outcome in enumerate(outcomes):
+                if outcome is None:
+                    outcomes[index] = BatchPlanOutcome(
+                        plan_id=plan_ids[index],
+                        document_path=str(plans[index]),
+                        success=False,
+                        duration_s=0.0,
+                        error=f"Batch aborted: {abort_reason}",
+                    )
+                    self._notify(outcomes[index])
+
+        start = time.perf_counter()
+        pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        if shared is not None and pending:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="farfan-plan"
+            ) as pool:
+                futures = {
+                    pool.submit(self._run_plan, plan_ids[index], plans[index], shared): index
+                    for index in pending
+                }
+                for future in as_completed(futures):
+                    outcome = future.result()
+                    outcomes[futures[future]] = outcome
+                    self._notify(outcome)
+
+        return self._summarize(outcomes, time.perf_counter() - start)
+
+    def _notify(self, outcome: BatchPlanOutcome) -> None:
+        if self.on_plan_complete is not None:
+            with self._callback_lock:
+                self.on_plan_complete(outcome)
+
+    def close(self) -> None:
+        """Release the shared factory built by ``bootstrap``."""
+        if self._template is not None:
+            self._template.cleanup()
+            self._template = None
+
+    def _run_plan(
+        self, plan_id: str, plan: Path, shared: SharedPipelineResources
+    ) -> BatchPlanOutcome:
+        """Run one plan in its own orchestrator; never raises."""
+        output_dir = Path(self.config.output_dir) / plan_id
+        start = time.perf_counter()
+        outcome = BatchPlanOutcome(
+            plan_id=plan_id,
+            document_path=str(plan),
+            success=False,
+            duration_s=0.0,
+            output_dir=str(output_dir),
+        )
+        try:
+            orchestrator = UnifiedOrchestrator(
+                replace(
+                    self.config,
+                    document_path=str(plan),
+                    plan_id=plan_id,
+                    municipality_name=plan_id,
+                    output_dir=str(output_dir),
+                    phases_to_execute=self.phases,
+                ),
+                shared_resources=shared,
+            )
+            result = orchestrator.execute()
+            outcome.phase_timings = {
+                phase_id.value: phase_result.execution_time_s
+                for phase_id, phase_result in result.phase_results.items()
+            }
+            outcome.failed_phases = [
+                phase_id.value
+                for phase_id, phase_result in result.phase_results.items()
+                if phase_result.status != PhaseStatus.COMPLETED
+            ]
+            blocked = result.metadata.get("scheduling", {}).get("blocked", [])
+            outcome.success = result.success and not outcome.failed_phases and not blocked
+            if not outcome.success:
+                outcome.error = "; ".join(result.errors) or (
+                    f"failed phases: {outcome.failed_phases}, blocked: {blocked}"
+                )
+            if self.export_results:
+                orchestrator.export_results()
+        except Exception as e:
+            outcome.success = False
+            outcome.error = f"{type(e).__name__}: {e}"
+            logger.error("batch_plan_failed", plan_id=plan_id, error=outcome.error)
+        outcome.duration_s = time.perf_counter() - start
+        return outcome
+
+    def _summarize(self, outcomes: list[BatchPlanOutcome], wall_clock_s: float) -> BatchSummary:
+        by_phase: dict[str, list[float]] = {}
+        for outcome in outcomes:
+            for phase_id, seconds in outcome.phase_timings.items():
+                by_phase.setdefault(phase_id, []).append(seconds)
+        percentiles = {
+            phase_id: {
+                "p50": _percentile(by_phase[phase_id], 50),
+                "p95": _percentile(by_phase[phase_id], 95),
+                "samples": len(by_phase[phase_id]),
+            }
+            for phase_id in sorted(by_phase)
+        }
+        succeeded = sum(1 for outcome in outcomes if outcome.success)
+        return BatchSummary(
+            plans_total=len(outcomes),
+            plans_succeeded=succeeded,
+            plans_failed=len(outcomes) - succeeded,
+            bootstrap_time_s=(
+                self.shared_resources.bootstrap_time_s if self.shared_resources else 0.0
+            ),
+            wall_clock_s=wall_clock_s,
+            plans_per_hour=len(outcomes) * 3600.0 / wall_clock_s if wall_clock_s > 0 else 0.0,
+            phase_percentiles=percentiles,
+            peak_rss_mb=peak_rss_mb(),
+            max_workers=self.max_workers,
+            outcomes=outcomes,
+        )
+
+
+__all__ = [
+    "BatchPipelineRunner",
+    "BatchPlanOutcome",
+    "BatchSummary",
+    "discover_plans",
+    "peak_rss_mb",
+]
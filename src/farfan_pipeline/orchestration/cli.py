@@ -18,6 +18,9 @@ Usage:
     # Run with environment configuration
     FARFAN_STRICT_MODE=false python -m farfan_pipeline.orchestration.cli
 
+    # Evaluate every plan in a directory, four plans at a time
+    python -m farfan_pipeline.orchestration.cli --batch plans/ --batch-workers 4
+
 Author: F.A.R.F.A.N Core Team
 Version: 1.0.0
 """
@@ -25,13 +28,21 @@ Version: 1.0.0
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import json
+import logging
 import sys
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from farfan_pipeline.orchestration.batch_runner import (
+    BatchPipelineRunner,
+    BatchPlanOutcome,
+    BatchSummary,
+    discover_plans,
+)
 from farfan_pipeline.orchestration.orchestrator import (
     UnifiedOrchestrator as PipelineOrchestrator,
     PhaseID,
@@ -77,6 +88,9 @@ Examples:
   # Non-deterministic execution
   %(prog)s --no-deterministic
 
+  # Batch mode: all PDFs in a directory (or a manifest, one path per line)
+  %(prog)s --batch plans/ --batch-workers 4 --json-output batch_summary.json
+
 Phase IDs:
   P00: Bootstrap & Validation
   P01: CPP Ingestion
@@ -204,6 +218,22 @@ Phase IDs:
         help="Final report format (default: json)",
     )
 
+    # Batch mode
+    batch_group = parser.add_argument_group("Batch Mode")
+    batch_group.add_argument(
+        "--batch",
+        type=Path,
+        metavar="PATH",
+        help="Evaluate many plans: a directory of PDFs or a manifest file (one PDF per line)",
+    )
+    batch_group.add_argument(
+        "--batch-workers",
+        type=int,
+        metavar="N",
+        default=2,
+        help="Plans evaluated concurrently in batch mode (default: 2)",
+    )
+
     return parser
 
 
@@ -271,6 +301,66 @@ def build_config_from_args(args: argparse.Namespace) -> OrchestratorConfig:
     return config
 
 
+def build_batch_config(args: argparse.Namespace) -> OrchestratorConfig:
+    """Build the base configuration shared by every plan of a batch.
+
+    Args:
+        args: Parsed CLI arguments
+
+    Returns:
+        OrchestratorConfig instance (per-plan fields are set by the runner)
+
+    Raises:
+        ConfigValidationError: If the config file has unknown keys, or
+            ``--no-deterministic`` is given (every plan is seeded by Phase 0)
+    """
+    if args.no_deterministic:
+        raise ConfigValidationError(
+            "--no-deterministic is not supported in batch mode: "
+            "Phase 0 seeds every plan deterministically"
+        )
+
+    if args.preset == "development":
+        config = get_development_config()
+    elif args.preset == "production":
+        config = get_production_config()
+    elif args.preset == "testing":
+        config = get_testing_config()
+    elif args.config:
+        with open(args.config, encoding="utf-8") as f:
+            config_data = json.load(f)
+        known = {f.name for f in dataclasses.fields(OrchestratorConfig)}
+        unknown = sorted(set(config_data) - known)
+        if unknown:
+            raise ConfigValidationError(f"Unknown keys in {args.config}: {', '.join(unknown)}")
+        config = OrchestratorConfig(**config_data)
+    else:
+        config = OrchestratorConfig()
+
+    if args.questionnaire:
+        config.questionnaire_path = str(args.questionnaire)
+    if args.executor_config:
+        config.methods_file = str(args.executor_config)
+    if args.output_dir:
+        config.output_dir = str(args.output_dir)
+
+    if args.strict:
+        config.strict_mode = True
+    elif args.no_strict:
+        config.strict_mode = False
+
+    return config
+
+
+def batch_log_level(args: argparse.Namespace) -> str | None:
+    """Log level requested by ``--quiet``/``--verbose``/``--log-level`` (None if unset)."""
+    if args.quiet:
+        return "ERROR"
+    if args.verbose:
+        return "DEBUG"
+    return args.log_level
+
+
 # =============================================================================
 # OUTPUT FORMATTING
 # =============================================================================
@@ -374,11 +464,104 @@ def print_execution_summary(context: Any) -> None:
     print("\n" + "=" * 70)
 
 
+def print_plan_outcome(outcome: BatchPlanOutcome) -> None:
+    """Print one line per finished plan in batch mode."""
+    status_symbol = "✓" if outcome.success else "✗"
+    line = f"{status_symbol} {outcome.plan_id}: {outcome.duration_s:8.2f}s"
+    if outcome.error:
+        line += f"  ({outcome.error})"
+    print(line, flush=True)
+
+
+def print_batch_summary(summary: BatchSummary) -> None:
+    """Print batch throughput summary to console.
+
+    Args:
+        summary: BatchSummary from BatchPipelineRunner.run
+    """
+    print("\n" + "=" * 70)
+    print("F.A.R.F.A.N BATCH EXECUTION SUMMARY")
+    print("=" * 70)
+    print(f"Plans:              {summary.plans_succeeded}/{summary.plans_total} succeeded")
+    print(f"Plans Failed:       {summary.plans_failed}")
+    print(f"Workers:            {summary.max_workers}")
+    print(f"Bootstrap Time:     {summary.bootstrap_time_s:.2f}s (once)")
+    print(f"Wall Clock:         {summary.wall_clock_s:.2f}s")
+    print(f"Throughput:         {summary.plans_per_hour:.1f} plans/hour")
+    if summary.peak_rss_mb is not None:
+        print(f"Peak RSS:           {summary.peak_rss_mb:.1f} MiB")
+    print("=" * 70)
+
+    print("\nPHASE LATENCY (p50 / p95):")
+    print("-" * 70)
+    for phase_id, stats in summary.phase_percentiles.items():
+        print(f"  {phase_id}: {stats['p50']:8.2f}s / {stats['p95']:8.2f}s  (n={stats['samples']})")
+
+    print("\n" + "=" * 70)
+
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
 
+def run_batch(args: argparse.Namespace) -> int:
+    """Execute batch mode: one bootstrap, many plans.
+
+    Args:
+        args: Parsed CLI arguments (``args.batch`` is set)
+
+    Returns:
+        Exit code (0 = every plan succeeded, 1 = otherwise)
+    """
+    try:
+        plans = discover_plans(args.batch)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Batch Error: {e}", file=sys.stderr)
+        return 1
+    if not plans:
+        print(f"❌ Batch Error: no plans found in {args.batch}", file=sys.stderr)
+        return 1
+
+    try:
+        config = build_batch_config(args)
+    except (ConfigValidationError, OSError, ValueError) as e:
+        print(f"❌ Configuration Error: {e}", file=sys.stderr)
+        return 1
+
+    log_level = batch_log_level(args)
+    if log_level is not None:
+        structlog.configure(
+            wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, log_level)),
+        )
+
+    print(f"Evaluating {len(plans)} plans with {args.batch_workers} workers")
+
+    runner = BatchPipelineRunner(
+        config,
+        max_workers=args.batch_workers,
+        phases=f"{args.start_phase}-{args.end_phase}",
+        on_plan_complete=print_plan_outcome,
+    )
+    try:
+        summary = runner.run(plans)
+    except Exception as e:
+        logger.error("batch_execution_failed", error=str(e), error_type=type(e).__name__)
+        print(f"\n❌ Batch Execution Failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        runner.close()
+
+    print_batch_summary(summary)
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Batch summary written to: {args.json_output}")
+
+    return 0 if summary.plans_failed == 0 else 1
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main CLI entry point.
 
@@ -391,6 +574,9 @@ def main(argv: list[str] | None = None) -> int:
     parser = create_parser()
     args = parser.parse_args(argv)
 
+    if args.batch:
+        return run_batch(args)
+
     # Build configuration
     try:
         config = build_config_from_args(args)
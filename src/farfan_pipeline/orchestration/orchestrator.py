@@ -50,6 +50,8 @@ from __future__ import annotations
 import json
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -164,6 +166,7 @@ class OrchestratorConfig:
     # Core settings
     municipality_name: str = "Unknown"
     document_path: str | None = None
+    plan_id: str | None = None  # Batch mode: unique plan id (defaults to the PDF stem)
     output_dir: str = "./output"
 
     # Execution settings
@@ -195,6 +198,10 @@ class OrchestratorConfig:
     retry_failed_phases: bool = True
     max_retries_per_phase: int = 3
 
+    # Failure handling: True marks every dependent of a failed phase
+    # PERMANENTLY_BLOCKED; False keeps running the later phases anyway
+    block_dependents_on_failure: bool = True
+
     # Signal settings
     emit_decision_signals: bool = True
 
@@ -203,6 +210,7 @@ class OrchestratorConfig:
         return {
             "municipality_name": self.municipality_name,
             "document_path": self.document_path,
+            "plan_id": self.plan_id,
             "output_dir": self.output_dir,
             "strict_mode": self.strict_mode,
             "phases_to_execute": self.phases_to_execute,
@@ -219,6 +227,7 @@ class OrchestratorConfig:
             "max_parallel_phases": self.max_parallel_phases,
             "retry_failed_phases": self.retry_failed_phases,
             "max_retries_per_phase": self.max_retries_per_phase,
+            "block_dependents_on_failure": self.block_dependents_on_failure,
             "emit_decision_signals": self.emit_decision_signals,
         }
 
@@ -743,7 +752,7 @@ class DependencyGraph:
         node = self.nodes[node_id]
 
         all_upstream_complete = all(
-            self.nodes[upstream].status == DependencyStatus.COMPLETED
+            self._upstream_settled(upstream, node_id)
             for upstream in node.upstream
             if upstream in self.nodes
         )
@@ -753,6 +762,20 @@ class DependencyGraph:
         elif not all_upstream_complete and node.status == DependencyStatus.READY:
             node.status = DependencyStatus.BLOCKED
 
+    def _upstream_settled(self, upstream_id: str, node_id: str) -> bool:
+        """Whether ``upstream_id`` no longer holds ``node_id`` back.
+
+        A soft edge only orders its nodes, so a failed soft upstream counts as
+        settled; a hard edge needs the upstream COMPLETED.
+        """
+        status = self.nodes[upstream_id].status
+        if status == DependencyStatus.COMPLETED:
+            return True
+        if status in {DependencyStatus.FAILED, DependencyStatus.PERMANENTLY_BLOCKED}:
+            edge = self._get_edge(upstream_id, node_id)
+            return edge is not None and edge.edge_type == "soft"
+        return False
+
     def _propagate_status_change(self, node_id: str, new_status: DependencyStatus) -> None:
         """Propagate status changes to downstream nodes."""
         for downstream_id in self._adjacency.get(node_id, set()):
@@ -765,6 +788,13 @@ class DependencyGraph:
                 edge = self._get_edge(node_id, downstream_id)
                 if edge and edge.edge_type == "hard":
                     self.update_node_status(downstream_id, DependencyStatus.PERMANENTLY_BLOCKED)
+                elif edge:
+                    self._update_node_readiness(downstream_id)
+
+    def refresh_readiness(self) -> None:
+        """Re-evaluate readiness of every node (roots become READY)."""
+        for node_id in self.nodes:
+            self._update_node_readiness(node_id)
 
     def get_ready_phases(self) -> list[str]:
         """Get all phases that are ready to start."""
@@ -1200,6 +1230,16 @@ PHASE_METADATA = {
 }
 
 
+# Preparation nodes: work a phase can do before its inputs exist (PDF parsing,
+# imports, template setup). They have no upstream, so they run alongside the
+# earlier phases; their edge to the phase is soft and they never fail it.
+PHASE_PREPARATIONS: dict[PhaseID, str] = {
+    PhaseID.PHASE_1: "P01_PREP",
+    PhaseID.PHASE_8: "P08_PREP",
+    PhaseID.PHASE_9: "P09_PREP",
+}
+
+
 @dataclass
 class PhaseResult:
     """Result of a single phase execution."""
@@ -1238,6 +1278,9 @@ class ExecutionContext:
     output_hashes: dict = field(default_factory=dict)
     seed: int | None = None
 
+    # CanonicalInput.document_id of this run; keys per-document caches
+    document_id: str | None = None
+
     total_violations: list = field(default_factory=list)
     signal_metrics: dict = field(default_factory=dict)
 
@@ -1274,6 +1317,26 @@ class PipelineResult:
     errors: list = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class SharedPipelineResources:
+    """Plan-invariant resources bootstrapped once and reused across runs.
+
+    Everything here is treated as read-only by the phases: the factory (and
+    the models and method registry it caches), the resolved questionnaire,
+    the signal registry, the SISAS dispatcher and the Phase 0 wiring. Batch
+    runs hand the same instance to one orchestrator per plan so each plan
+    gets its own ExecutionContext without paying for the bootstrap again.
+    """
+
+    factory: Any | None = None
+    questionnaire: Any | None = None
+    signal_registry: Any | None = None
+    sisas: Any | None = None
+    wiring: Any | None = None
+    questionnaire_sha256: str = ""
+    bootstrap_time_s: float = 0.0
+
+
 @dataclass(frozen=True)
 class ExecutionTrace:
     """Immutable trace of execution for debugging/analysis."""
@@ -1444,9 +1507,22 @@ class UnifiedOrchestrator:
         },
     )
 
-    def __init__(self, config: OrchestratorConfig):
-        """Initialize the unified orchestrator."""
+    def __init__(
+        self,
+        config: OrchestratorConfig,
+        shared_resources: SharedPipelineResources | None = None,
+    ):
+        """Initialize the unified orchestrator.
+
+        Args:
+            config: Orchestrator configuration
+            shared_resources: Resources bootstrapped by another orchestrator
+                (see ``export_shared_resources``). When given, the factory,
+                questionnaire, signal registry and SISAS initialization are
+                skipped and Phase 0 only validates this run's input document.
+        """
         self.config = config
+        self._shared_resources = shared_resources
         self.logger = structlog.get_logger(f"{__name__}.UnifiedOrchestrator")
 
         # Initialize core context
@@ -1476,13 +1552,27 @@ class UnifiedOrchestrator:
         self._completed_phases: dict[str, Any] = {}
         self._failed_phases: dict[str, list[Any]] = {}
         self._phase_retry_counts: dict[str, int] = {}
+        self._phase_preparations: dict[PhaseID, dict[str, Any]] = {}
+        self._scheduling_report: dict[str, Any] = {}
 
         # ==========================================================================
         # UNIFIED FACTORY INITIALIZATION
         # ==========================================================================
         # Initialize the unified factory for questionnaire loading, component creation,
         # and contract execution
-        if FACTORY_AVAILABLE:
+        if shared_resources is not None:
+            self.factory = shared_resources.factory
+            self.context.questionnaire = shared_resources.questionnaire
+            self.context.signal_registry = shared_resources.signal_registry
+            self.context.sisas = shared_resources.sisas
+            self.context.wiring = shared_resources.wiring
+            self.logger.info(
+                "Reusing shared pipeline resources",
+                questionnaire_available=self.context.questionnaire is not None,
+                signal_registry_available=self.context.signal_registry is not None,
+                wiring_available=self.context.wiring is not None,
+            )
+        elif FACTORY_AVAILABLE:
             # Determine project root using multiple fallback strategies for robustness
             # 1. Try to locate via factory config if provided
             # 2. Try relative path from output_dir (output_dir may be output/ or artifacts/)
@@ -1651,7 +1741,10 @@ class UnifiedOrchestrator:
                 phase_timings=self._phase_timings.copy(),
                 violations=(),
                 errors=(),
-                metadata={"event_count": len(self._trace)},
+                metadata={
+                    "event_count": len(self._trace),
+                    "scheduling": dict(self._scheduling_report),
+                },
             )
 
     def to_json(self, path: Path) -> None:
@@ -1788,12 +1881,31 @@ class UnifiedOrchestrator:
         )
         return cwd
 
-    def _build_default_dependency_graph(self) -> DependencyGraph:
-        """Build default dependency graph for all phases."""
+    def _build_default_dependency_graph(
+        self, phases: list[PhaseID] | None = None
+    ) -> DependencyGraph:
+        """
+        Build the dependency graph for the given phases (default: all).
+
+        Each phase depends on the previous selected phase, and phases listed
+        in PHASE_PREPARATIONS also depend on their preparation node (soft
+        edge). Phase-to-phase edges are hard, so a failed phase blocks the
+        phases after it; with ``config.block_dependents_on_failure`` off they
+        are soft and only order the phases.
+        Nodes are inserted in canonical order, which is a topological order of
+        the graph.
+        """
         graph = DependencyGraph()
-
-        # Add all phase nodes
-        for phase_id in PhaseID:
+        phase_list = list(PhaseID) if phases is None else sorted(phases, key=list(PhaseID).index)
+
+        for phase_id in phase_list:
+            prep_id = PHASE_PREPARATIONS.get(phase_id)
+            if prep_id:
+                graph.add_node(
+                    node_id=prep_id,
+                    phase_id=phase_id.value,
+                    metadata={"preparation_for": phase_id.value},
+                )
             graph.add_node(
                 node_id=phase_id.value,
                 phase_id=phase_id.value,
@@ -1801,16 +1913,21 @@ class UnifiedOrchestrator:
             )
 
         # Add sequential dependencies
-        phase_list = list(PhaseID)
+        chain_edge = "hard" if self.config.block_dependents_on_failure else "soft"
         for i in range(len(phase_list) - 1):
-            graph.add_edge(phase_list[i].value, phase_list[i + 1].value)
+            graph.add_edge(phase_list[i].value, phase_list[i + 1].value, edge_type=chain_edge)
+        for phase_id in phase_list:
+            prep_id = PHASE_PREPARATIONS.get(phase_id)
+            if prep_id:
+                graph.add_edge(prep_id, phase_id.value, edge_type="soft")
 
+        graph.refresh_readiness()
         return graph
 
     def execute(self) -> PipelineResult:
         """
         Main entry point for pipeline execution.
-        Orchestrates all 10 phases (0-9) in sequence.
+        Orchestrates all 10 phases (0-9) through the dependency graph.
         """
         self.logger.critical(
             "=" * 80 + "\n" + "F.A.R.F.A.N PIPELINE EXECUTION STARTED\n" + "=" * 80,
@@ -1834,12 +1951,12 @@ class UnifiedOrchestrator:
             )
 
             # Execute phases based on configuration
-            phases_to_execute = self._get_phases_to_execute()
-
-            for phase_id in phases_to_execute:
-                if self._should_execute_phase(phase_id):
-                    result = self._execute_single_phase(phase_id)
-                    self.context.add_phase_result(result)
+            phases_to_execute = [
+                phase_id
+                for phase_id in self._get_phases_to_execute()
+                if self._should_execute_phase(phase_id)
+            ]
+            self._execute_phase_graph(phases_to_execute)
 
             # Calculate total execution time
             total_time = time.time() - pipeline_start
@@ -1854,6 +1971,7 @@ class UnifiedOrchestrator:
                     "start_time": self.context.start_time.isoformat(),
                     "end_time": datetime.utcnow().isoformat(),
                     "phases_completed": len(self.context.phase_results),
+                    "scheduling": dict(self._scheduling_report),
                 },
                 errors=[],
             )
@@ -1893,6 +2011,42 @@ class UnifiedOrchestrator:
                 errors=[str(e)],
             )
 
+        finally:
+            self._release_extraction_cache()
+            self._release_parsed_document()
+
+    def _release_extraction_cache(self) -> None:
+        """Drop the plan's extraction cache once no phase can reuse it."""
+        document_id = self.context.document_id
+        if not document_id:
+            return
+        try:
+            from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+                release_document_extraction_cache,
+            )
+        except ImportError:
+            return
+        cache_metrics = release_document_extraction_cache(document_id)
+        if cache_metrics is not None:
+            self.context.signal_metrics["extraction_cache"] = cache_metrics
+            self.logger.info(
+                f"Extraction cache released: {cache_metrics['hits']} hits, "
+                f"{cache_metrics['misses']} misses, {cache_metrics['bytes_saved']} bytes saved"
+            )
+
+    def _release_parsed_document(self) -> None:
+        """Let the parsed-document store forget this plan's PDF."""
+        pdf_sha256 = self.context.input_hashes.get("pdf_sha256")
+        if not pdf_sha256:
+            return
+        try:
+            from farfan_pipeline.infrastructure.parsed_document_store import (
+                release_parsed_document,
+            )
+        except ImportError:
+            return
+        release_parsed_document(pdf_sha256)
+
     def _get_phases_to_execute(self) -> list[PhaseID]:
         """Get list of phases to execute based on configuration."""
         phases_to_execute = self.config.phases_to_execute
@@ -1924,8 +2078,15 @@ class UnifiedOrchestrator:
 
         return True
 
-    def _execute_single_phase(self, phase_id: PhaseID) -> PhaseResult:
-        """Execute a single phase with SISAS signal emission."""
+    def _execute_single_phase(self, phase_id: PhaseID, record_status: bool = True) -> PhaseResult:
+        """
+        Execute a single phase with SISAS signal emission.
+
+        Args:
+            phase_id: Phase to execute
+            record_status: Update the dependency graph node; the graph
+                scheduler passes False and records status itself
+        """
         self.logger.info(f"Executing phase: {phase_id.value}")
 
         start_time = time.time()
@@ -1937,13 +2098,15 @@ class UnifiedOrchestrator:
 
         try:
             self.context.validate_phase_prerequisite(phase_id)
-            self.dependency_graph.update_node_status(phase_id.value, DependencyStatus.RUNNING)
+            if record_status:
+                self.dependency_graph.update_node_status(phase_id.value, DependencyStatus.RUNNING)
 
             # Dispatch to appropriate phase method
             output = self._dispatch_phase_execution(phase_id)
 
             execution_time = time.time() - start_time
-            self.dependency_graph.update_node_status(phase_id.value, DependencyStatus.COMPLETED)
+            if record_status:
+                self.dependency_graph.update_node_status(phase_id.value, DependencyStatus.COMPLETED)
 
             # Emit PHASE_COMPLETE signal
             self._emit_phase_signal(
@@ -1972,17 +2135,19 @@ class UnifiedOrchestrator:
                 payload={"status": "failed", "error": str(e), "execution_time_s": execution_time},
             )
 
-            self.dependency_graph.update_node_status(phase_id.value, DependencyStatus.FAILED)
+            if record_status:
+                self.dependency_graph.update_node_status(phase_id.value, DependencyStatus.FAILED)
             self.logger.error(f"Phase {phase_id.value} failed: {e}")
 
             if self.config.retry_failed_phases:
                 retry_count = self._phase_retry_counts.get(phase_id.value, 0)
                 if retry_count < self.config.max_retries_per_phase:
                     self._phase_retry_counts[phase_id.value] = retry_count + 1
-                    self.dependency_graph.update_node_status(
-                        phase_id.value, DependencyStatus.PENDING_RETRY
-                    )
-                    return self._execute_single_phase(phase_id)
+                    if record_status:
+                        self.dependency_graph.update_node_status(
+                            phase_id.value, DependencyStatus.PENDING_RETRY
+                        )
+                    return self._execute_single_phase(phase_id, record_status)
 
             return PhaseResult(
                 phase_id=phase_id,
@@ -2013,6 +2178,227 @@ class UnifiedOrchestrator:
 
         return method()
 
+    # =========================================================================
+    # GRAPH-DRIVEN PHASE DISPATCH
+    # =========================================================================
+
+    def _execute_phase_graph(self, phases: list[PhaseID]) -> dict[str, Any]:
+        """
+        Execute phases through the dependency graph on a bounded thread pool.
+
+        Phases form a chain, so the work that overlaps is the preparation
+        nodes with the phases upstream of them: the Phase 1 side-extractions
+        (PDF text layout and table detection) run alongside Phase 0, and the
+        Phase 8-9 imports and constructors alongside Phases 1-7.
+
+        The PhaseScheduler picks the nodes to start (up to
+        ``max_parallel_phases``, or one at a time when parallel execution is
+        disabled or the strategy is SEQUENTIAL). Node bodies run on worker
+        threads, but all state changes happen here, in the calling thread,
+        and in canonical node order. A finished node is committed (graph
+        status, phase result, trace event) only after every node before it
+        has been committed. The canonical order is topological, so this never
+        holds back a node's own dependencies, and the graph transitions,
+        ``context.phase_results`` and the ExecutionTrace are identical from
+        run to run whatever the thread timing.
+
+        Returns:
+            Scheduling report with wall-clock time versus the sequential sum.
+        """
+        self.dependency_graph = self._build_default_dependency_graph(phases)
+        self.scheduler.dependency_graph = self.dependency_graph
+        order = list(self.dependency_graph.nodes)
+
+        max_parallel = 1
+        if self.config.enable_parallel_execution:
+            max_parallel = max(1, self.config.max_parallel_phases)
+
+        finished: dict[str, tuple[Any, float]] = {}
+        running: dict[Future, str] = {}
+        node_timings: dict[str, float] = {}
+        blocked: list[str] = []
+        peak_concurrency = 0
+        next_commit = 0
+        graph_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="phase") as pool:
+            while next_commit < len(order):
+                decision = self.scheduler.get_ready_phases(
+                    completed_phases=set(order[:next_commit]),
+                    failed_phases=set(self._failed_phases),
+                    active_phases=set(self._active_phases),
+                    max_parallel=max_parallel,
+                )
+                for node_id in decision.phases_to_start:
+                    self.dependency_graph.update_node_status(node_id, DependencyStatus.RUNNING)
+                    self._active_phases.add(node_id)
+                    self._trace_event("NODE_START", node_id=node_id)
+                    running[pool.submit(self._run_graph_node, node_id)] = node_id
+                peak_concurrency = max(peak_concurrency, len(self._active_phases))
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node_id = running.pop(future)
+                        self._active_phases.discard(node_id)
+                        finished[node_id] = future.result()
+
+                # Commit in canonical order
+                committed_any = False
+                while next_commit < len(order):
+                    node_id = order[next_commit]
+                    status = self.dependency_graph.nodes[node_id].status
+                    if node_id in finished:
+                        result, elapsed = finished.pop(node_id)
+                        node_timings[node_id] = elapsed
+                        self._commit_graph_node(node_id, result)
+                    elif status == DependencyStatus.PERMANENTLY_BLOCKED:
+                        blocked.append(node_id)
+                        self._trace_event("PHASE_BLOCKED", phase_id=node_id)
+                    else:
+                        break
+                    next_commit += 1
+                    committed_any = True
+
+                if not running and not committed_any and not decision.phases_to_start:
+                    raise SchedulingError(
+                        f"Dependency graph stalled at {order[next_commit]}",
+                        context={"graph_state": self.dependency_graph.get_state_snapshot()},
+                    )
+
+        wall_clock = time.perf_counter() - graph_start
+        sequential = sum(node_timings.values())
+        self._scheduling_report = {
+            "strategy": self.scheduler.mode.name,
+            "max_parallel": max_parallel,
+            "wall_clock_s": wall_clock,
+            "sequential_s": sequential,
+            "saved_s": max(0.0, sequential - wall_clock),
+            "speedup": sequential / wall_clock if wall_clock > 0 else 1.0,
+            "peak_concurrency": peak_concurrency,
+            "node_timings": node_timings,
+            "blocked": blocked,
+        }
+        self.logger.info(
+            "Phase graph executed",
+            wall_clock_s=round(wall_clock, 3),
+            sequential_s=round(sequential, 3),
+            saved_s=round(self._scheduling_report["saved_s"], 3),
+            peak_concurrency=peak_concurrency,
+        )
+        return self._scheduling_report
+
+    def _run_graph_node(self, node_id: str) -> tuple[Any, float]:
+        """
+        Worker-thread body of a graph node: (result, elapsed seconds).
+
+        The node runs inside the plan's extraction-cache scope, so extractors
+        and vehicles inside any phase share the document's cache.
+        """
+        start = time.perf_counter()
+        with self._document_extraction_scope():
+            if node_id in PHASE_PREPARATIONS.values():
+                result: Any = self._run_phase_preparation(node_id)
+            else:
+                result = self._execute_single_phase(PhaseID(node_id), record_status=False)
+        return result, time.perf_counter() - start
+
+    def _document_extraction_scope(self) -> AbstractContextManager[None]:
+        """Extraction-cache scope of the plan (a no-op before Phase 0 sets its id)."""
+        try:
+            from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+                document_extraction_scope,
+            )
+        except ImportError:
+            return nullcontext()
+        return document_extraction_scope(self.context.document_id)
+
+    def _commit_graph_node(self, node_id: str, result: Any) -> None:
+        """Record a finished node in the graph, context and trace."""
+        if not isinstance(result, PhaseResult):
+            # Preparation node: failures were already downgraded to warnings
+            self.dependency_graph.update_node_status(node_id, DependencyStatus.COMPLETED)
+            self._trace_event("PREPARATION_COMPLETE", node_id=node_id, prepared=sorted(result))
+            return
+
+        self.context.add_phase_result(result)
+        self._phase_timings[node_id] = result.execution_time_s
+        if result.status == PhaseStatus.COMPLETED:
+            self._completed_phases[node_id] = result.output
+            self.dependency_graph.update_node_status(node_id, DependencyStatus.COMPLETED)
+            self._trace_event(
+                "PHASE_COMPLETE", phase_id=node_id, execution_time_s=result.execution_time_s
+            )
+        else:
+            self._failed_phases.setdefault(node_id, []).append(result.error)
+            self.dependency_graph.update_node_status(node_id, DependencyStatus.FAILED)
+            self._trace_event("PHASE_FAILED", phase_id=node_id, error=str(result.error))
+
+    def _run_phase_preparation(self, node_id: str) -> dict[str, Any]:
+        """Run a preparation node; never raises (the phase falls back to inline setup)."""
+        phase_id = next(pid for pid, prep in PHASE_PREPARATIONS.items() if prep == node_id)
+        preparers = {
+            PhaseID.PHASE_1: self._prepare_phase_01,
+            PhaseID.PHASE_8: self._prepare_phase_08,
+            PhaseID.PHASE_9: self._prepare_phase_09,
+        }
+        try:
+            prepared = preparers[phase_id]()
+        except Exception as e:
+            self.logger.warning(f"Preparation {node_id} failed, phase will set up inline: {e}")
+            prepared = {}
+        self._phase_preparations[phase_id] = prepared
+        return prepared
+
+    def _prepare_phase_01(self) -> dict[str, Any]:
+        """Parse the plan PDF into the parsed-document store (no Phase 0 output needed).
+
+        SP0/SP1 and the table extractors open the same store artifacts, so
+        Phase 1 finds the text layout and tables already built.
+        """
+        if not self.config.document_path:
+            return {}
+        from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
+
+        document = open_parsed_document(self.config.document_path)
+        return {
+            "page_count": document.page_count,
+            "table_count": len(document.tables()),
+        }
+
+    def _prepare_phase_08(self) -> dict[str, Any]:
+        """Load the Phase 8 recommendation engine (no Phase 7 input needed)."""
+        from farfan_pipeline.phases.Phase_08.phase8_25_00_recommendation_bifurcator import (
+            UnifiedBifurcator,
+        )
+
+        return {"engine": UnifiedBifurcator()}
+
+    def _prepare_phase_09(self) -> dict[str, Any]:
+        """Import the Phase 9 assembly modules and set up the report generator."""
+        from farfan_pipeline.phases.Phase_09.phase9_10_00_report_assembly import (  # noqa: F401
+            ReportAssembler,
+        )
+        from farfan_pipeline.phases.Phase_09.phase9_10_00_report_generator import (
+            ReportGenerator,
+        )
+
+        prepared: dict[str, Any] = {
+            "report_generator": ReportGenerator(
+                output_dir=Path(self.config.output_dir) / "reports",
+                plan_name=self.config.municipality_name or "policy_analysis",
+                enable_charts=True,
+                enable_animations=True,
+            )
+        }
+        try:
+            from farfan_pipeline.phases.Phase_09.phase9_15_00_institutional_entity_annex import (  # noqa: F401
+                generate_institutional_annex,
+            )
+        except ImportError as e:
+            self.logger.debug(f"[P9-PREP] Institutional annex unavailable: {e}")
+        return prepared
+
     # =========================================================================
     # INTERVENTION 2: Orchestrator-Factory Alignment Methods
     # =========================================================================
@@ -2144,6 +2530,9 @@ class UnifiedOrchestrator:
             - wiring_components: Initialized WiringComponents
             - exit_gate_results: All 7 gate validations aligned with contract
         """
+        if self._shared_resources is not None and self._shared_resources.wiring is not None:
+            return self._execute_phase_00_with_shared_bootstrap()
+
         from pathlib import Path as PathLib
 
         from farfan_pipeline.phases.Phase_00.phase0_40_00_input_validation import (
@@ -2256,6 +2645,7 @@ class UnifiedOrchestrator:
             # Store hashes from VerifiedPipelineRunner
             exit_gates["GATE_2"]["pdf_sha256"] = runner.input_pdf_sha256
             exit_gates["GATE_2"]["questionnaire_sha256"] = runner.questionnaire_sha256
+            self.context.input_hashes["pdf_sha256"] = runner.input_pdf_sha256
 
             # ====================================================================
             # PART 3: Execute WiringBootstrap (produces WiringComponents)
@@ -2311,6 +2701,7 @@ class UnifiedOrchestrator:
                 self.logger.info("[P0] Orchestrator factory updated from bootstrap wiring")
 
             self.context.phase_outputs[PhaseID.PHASE_0] = canonical_input
+            self.context.document_id = getattr(canonical_input, "document_id", None)
 
             return {
                 "status": "completed",
@@ -2354,6 +2745,82 @@ class UnifiedOrchestrator:
                 context={"exit_gates": exit_gates},
             ) from e
 
+    def _execute_phase_00_with_shared_bootstrap(self) -> dict[str, Any]:
+        """
+        Execute the per-plan part of Phase 0 on top of a shared bootstrap.
+
+        Gates 1 and 3-7 (runtime config, boot checks, seeds, questionnaire
+        integrity, method registry, smoke tests) and the wiring bootstrap do
+        not depend on the input document, so they ran once when the shared
+        resources were built. Only input verification (GATE_2) is repeated:
+        the plan PDF is hashed, measured and wrapped in its own CanonicalInput,
+        which must satisfy the Phase 0 input and output contracts.
+
+        Returns:
+            Dict shaped like the full Phase 0 result, with ``bootstrap`` set
+            to ``"shared"``.
+
+        Raises:
+            PhaseExecutionError: If the plan PDF is missing, has no pages or
+                fails contract validation
+        """
+        from farfan_pipeline.phases.Phase_00.phase0_40_00_input_validation import (
+            Phase0Input,
+            validate_phase0_input,
+        )
+
+        shared = self._shared_resources
+        plan_pdf_path = Path(self.config.document_path) if self.config.document_path else None
+        if plan_pdf_path is None or not plan_pdf_path.is_file():
+            raise PhaseExecutionError(
+                message=f"Phase 0 input document not found: {plan_pdf_path}",
+                phase_id="P00",
+                bootstrap="shared",
+            )
+
+        try:
+            canonical_input = validate_phase0_input(
+                Phase0Input(
+                    pdf_path=plan_pdf_path,
+                    run_id=self.context.execution_id,
+                    questionnaire_path=Path(self.config.questionnaire_path),
+                ),
+                document_id=self.config.plan_id or plan_pdf_path.stem,
+                questionnaire_sha256=shared.questionnaire_sha256,
+            )
+        except Exception as e:
+            raise PhaseExecutionError(
+                message=f"Phase 0 input verification failed: {e}",
+                phase_id="P00",
+                bootstrap="shared",
+            ) from e
+
+        pdf_sha256 = canonical_input.pdf_sha256
+        self.context.document_id = canonical_input.document_id
+        self.context.input_hashes["pdf_sha256"] = pdf_sha256
+        self.context.wiring = shared.wiring
+        self.context.phase_outputs[PhaseID.PHASE_0] = canonical_input
+
+        return {
+            "status": "completed",
+            "bootstrap": "shared",
+            "canonical_input": str(canonical_input),
+            "exit_gates": {
+                "GATE_2": {
+                    "gate_id": 2,
+                    "gate_name": "input_verification",
+                    "status": "passed",
+                    "pdf_sha256": pdf_sha256,
+                    "questionnaire_sha256": shared.questionnaire_sha256,
+                }
+            },
+            "validation_passed": True,
+            "input_hashes": {
+                "pdf_sha256": pdf_sha256,
+                "questionnaire_sha256": shared.questionnaire_sha256,
+            },
+        }
+
     # =========================================================================
     # PHASE 1: CPP Ingestion (16 Subphases)
     # =========================================================================
@@ -2416,6 +2883,11 @@ class UnifiedOrchestrator:
         checkpoint_manager = None
         metrics_collector = None
 
+        # P01_PREP already parsed the PDF into the parsed-document store
+        prepared = self._phase_preparations.pop(PhaseID.PHASE_1, {})
+        if prepared:
+            subphase_results["pdf_preparse"] = {"status": "completed", **prepared}
+
         # Generate plan_id for this execution (used by both checkpoint and metrics)
         plan_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -2551,6 +3023,10 @@ class UnifiedOrchestrator:
                     canonical_input=canonical_input,
                     signal_registry=signal_registry,
                     structural_profile=structural_profile,
+                    max_workers=(
+                        self.config.max_workers if self.config.enable_parallel_execution else 1
+                    ),
+                    metrics_collector=metrics_collector,
                 )
 
             # Execute with or without metrics tracking
@@ -2735,6 +3211,22 @@ class UnifiedOrchestrator:
             # ====================================================================
             if metrics_collector is not None:
                 try:
+                    # Extraction cache shared with later phases for this document
+                    try:
+                        from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+                            peek_document_extraction_cache,
+                        )
+
+                        extraction_cache = peek_document_extraction_cache(
+                            canonical_input.document_id
+                        )
+                        if extraction_cache is not None:
+                            metrics_collector.record_cache_metrics(
+                                "extraction_cache", extraction_cache.get_metrics()
+                            )
+                    except ImportError:
+                        pass
+
                     metrics_collector.end_phase()
                     metrics = metrics_collector.get_metrics()
 
@@ -4581,6 +5073,7 @@ class UnifiedOrchestrator:
         self.logger.info("=" * 80)
 
         stage_results = {}
+        prepared = self._phase_preparations.pop(PhaseID.PHASE_8, {})
 
         try:
             # ====================================================================
@@ -4630,11 +5123,13 @@ class UnifiedOrchestrator:
 
             recommendations = {"MICRO": [], "MESO": [], "MACRO": []}
             try:
-                from farfan_pipeline.phases.Phase_08.phase8_25_00_recommendation_bifurcator import (
-                    UnifiedBifurcator,
-                )
+                engine = prepared.get("engine")
+                if engine is None:
+                    from farfan_pipeline.phases.Phase_08.phase8_25_00_recommendation_bifurcator import (
+                        UnifiedBifurcator,
+                    )
 
-                engine = UnifiedBifurcator()
+                    engine = UnifiedBifurcator()
 
                 # Get cluster data from Phase 6 and macro data from Phase 7
                 cluster_scores = self.context.get_phase_output(PhaseID.PHASE_6) or []
@@ -4817,6 +5312,7 @@ class UnifiedOrchestrator:
 
         step_results = {}
         exit_gates = {}
+        prepared = self._phase_preparations.pop(PhaseID.PHASE_9, {})
 
         try:
             # ====================================================================
@@ -4933,19 +5429,18 @@ class UnifiedOrchestrator:
 
             artifacts = {}
             try:
-                from pathlib import Path
-
-                from farfan_pipeline.phases.Phase_09.phase9_10_00_report_generator import (
-                    ReportGenerator,
-                )
+                generator = prepared.get("report_generator")
+                if generator is None:
+                    from farfan_pipeline.phases.Phase_09.phase9_10_00_report_generator import (
+                        ReportGenerator,
+                    )
 
-                output_dir = Path(self.config.output_dir) / "reports"
-                generator = ReportGenerator(
-                    output_dir=output_dir,
-                    plan_name=self.config.municipality_name or "policy_analysis",
-                    enable_charts=True,
-                    enable_animations=True,
-                )
+                    generator = ReportGenerator(
+                        output_dir=Path(self.config.output_dir) / "reports",
+                        plan_name=self.config.municipality_name or "policy_analysis",
+                        enable_charts=True,
+                        enable_animations=True,
+                    )
 
                 artifacts = generator.generate_all(
                     report=analysis_report,
@@ -5316,6 +5811,28 @@ class UnifiedOrchestrator:
             "dependency_graph_state": self.dependency_graph.get_state_snapshot(),
         }
 
+    def export_shared_resources(self, bootstrap_time_s: float = 0.0) -> SharedPipelineResources:
+        """Package this orchestrator's plan-invariant resources for reuse.
+
+        Call after Phase 0 has run so the wiring is included; other
+        orchestrators constructed with the result skip the bootstrap.
+        """
+        questionnaire_sha256 = ""
+        phase0 = self.context.phase_results.get(PhaseID.PHASE_0)
+        if phase0 is not None and isinstance(phase0.output, dict):
+            questionnaire_sha256 = phase0.output.get("input_hashes", {}).get(
+                "questionnaire_sha256", ""
+            )
+        return SharedPipelineResources(
+            factory=self.factory,
+            questionnaire=self.context.questionnaire,
+            signal_registry=getattr(self.context, "signal_registry", None),
+            sisas=self.context.sisas,
+            wiring=self.context.wiring,
+            questionnaire_sha256=questionnaire_sha256 or "",
+            bootstrap_time_s=bootstrap_time_s,
+        )
+
     def get_sisas_metrics(self) -> dict[str, Any]:
         """Get SISAS metrics from SDO and context."""
         if self.context.sisas is None:
@@ -5446,6 +5963,7 @@ __all__ = [
     "PhaseResult",
     "ExecutionContext",
     "PipelineResult",
+    "SharedPipelineResources",
     "UnifiedOrchestrator",
 ]
 
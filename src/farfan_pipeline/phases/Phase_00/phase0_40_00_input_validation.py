@@ -498,7 +498,7 @@ class Phase0ValidationContract(PhaseContract[Phase0Input, CanonicalInput]):
         # 4. Compute PDF hash and metadata
         pdf_sha256 = self._compute_sha256(input_data.pdf_path)
         pdf_size_bytes = input_data.pdf_path.stat().st_size
-        pdf_page_count = self._get_pdf_page_count(input_data.pdf_path)
+        pdf_page_count = self._get_pdf_page_count(input_data.pdf_path, sha256=pdf_sha256)
 
         # 5. Compute questionnaire manifest hash
         # NOTE: This validates the integrity of the MANIFEST file itself.
@@ -546,12 +546,16 @@ class Phase0ValidationContract(PhaseContract[Phase0Input, CanonicalInput]):
         return sha256_hash.hexdigest().lower()
 
     @staticmethod
-    def _get_pdf_page_count(pdf_path: Path) -> int:
+    def _get_pdf_page_count(pdf_path: Path, sha256: str | None = None) -> int:
         """
         Extract page count from PDF.
 
+        Opening the document through the parsed-document store parses it once
+        and persists the artifact that Phase 1 and the methods layer reuse.
+
         Args:
             pdf_path: Path to PDF file
+            sha256: Content hash if already computed (avoids re-hashing)
 
         Returns:
             Number of pages
@@ -560,13 +564,10 @@ class Phase0ValidationContract(PhaseContract[Phase0Input, CanonicalInput]):
             ImportError: If PyMuPDF is not available
             RuntimeError: If PDF cannot be opened
         """
-        try:
-            import fitz  # PyMuPDF
+        from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
 
-            doc = fitz.open(pdf_path)
-            page_count = len(doc)
-            doc.close()
-            return page_count
+        try:
+            return open_parsed_document(pdf_path, sha256=sha256).page_count
         except ImportError:
             raise ImportError(
                 "PyMuPDF (fitz) required for PDF page count extraction. "
@@ -706,15 +707,24 @@ def validate_call_signature(func: Callable, *args, **kwargs) -> bool:
     return True
 
 
-def validate_phase0_input(input_data: Phase0Input) -> CanonicalInput:
+def validate_phase0_input(
+    input_data: Phase0Input,
+    document_id: str | None = None,
+    questionnaire_sha256: str | None = None,
+) -> CanonicalInput:
     """
     Validate Phase0Input and convert to CanonicalInput.
 
     This is a convenience function that uses Phase0ValidationContract
-    to validate and transform Phase0Input into CanonicalInput.
+    to validate and transform Phase0Input into CanonicalInput: the input
+    contract is checked, the PDF is hashed and measured, and the resulting
+    CanonicalInput must satisfy the output contract.
 
     Args:
         input_data: Phase0Input to validate
+        document_id: Identity of the document (defaults to the PDF stem)
+        questionnaire_sha256: Questionnaire hash if already known (otherwise
+            computed from ``input_data.questionnaire_path``)
 
     Returns:
         CanonicalInput if validation passes
@@ -725,24 +735,44 @@ def validate_phase0_input(input_data: Phase0Input) -> CanonicalInput:
     contract = Phase0ValidationContract()
     result = contract.validate_input(input_data)
 
-    if not result.is_valid:
+    if not result.passed:
         raise ValueError(f"Phase0 input validation failed: {result.errors}")
 
-    # Create CanonicalInput from Phase0Input
-    return CanonicalInput(
+    pdf_path = input_data.pdf_path
+    if not pdf_path.is_file():
+        raise ValueError(f"Phase0 input validation failed: PDF not found: {pdf_path}")
+
+    questionnaire_path = input_data.questionnaire_path or Path()
+    if questionnaire_sha256 is None:
+        questionnaire_sha256 = (
+            contract._compute_sha256(questionnaire_path) if questionnaire_path.is_file() else ""
+        )
+
+    pdf_sha256 = contract._compute_sha256(pdf_path)
+    pdf_page_count = contract._get_pdf_page_count(pdf_path, sha256=pdf_sha256)
+    errors = [] if pdf_page_count > 0 else [f"PDF has no pages: {pdf_path}"]
+
+    canonical_input = CanonicalInput(
+        document_id=document_id or pdf_path.stem,
         run_id=input_data.run_id,
-        pdf_path=input_data.pdf_path,
-        questionnaire_path=input_data.questionnaire_path,
-        pdf_sha256=input_data.pdf_sha256 if hasattr(input_data, "pdf_sha256") else "",
-        questionnaire_sha256=(
-            input_data.questionnaire_sha256 if hasattr(input_data, "questionnaire_sha256") else ""
-        ),
-        pdf_page_count=input_data.pdf_page_count if hasattr(input_data, "pdf_page_count") else 1,
-        pdf_size_bytes=input_data.pdf_size_bytes if hasattr(input_data, "pdf_size_bytes") else 0,
-        validation_passed=True,
-        validation_errors=[],
+        pdf_path=pdf_path,
+        pdf_sha256=pdf_sha256,
+        pdf_size_bytes=pdf_path.stat().st_size,
+        pdf_page_count=pdf_page_count,
+        questionnaire_path=questionnaire_path,
+        questionnaire_sha256=questionnaire_sha256,
+        created_at=datetime.now(timezone.utc),
+        phase0_version=PHASE0_VERSION,
+        validation_passed=not errors,
+        validation_errors=errors,
     )
 
+    result = contract.validate_output(canonical_input)
+    if not result.passed:
+        raise ValueError(f"Phase0 output validation failed: {errors + result.errors}")
+
+    return canonical_input
+
 
 __all__ = [
     "Phase0Input",
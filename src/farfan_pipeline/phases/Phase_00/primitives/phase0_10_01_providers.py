@@ -155,11 +155,14 @@ class QuestionnaireResourceProvider:
         USO: ReportAssembler para enrichment de respuestas
         """
         canonical = self._require_initialized()
-        result = []
-        for q in canonical.micro_questions:
-            if q.get("question_id") == question_id:
-                result = list(q.get("patterns", []))
-                break
+        if hasattr(canonical, "patterns_for_question"):
+            result = list(canonical.patterns_for_question(question_id))
+        else:
+            result = []
+            for q in canonical.micro_questions:
+                if q.get("question_id") == question_id:
+                    result = list(q.get("patterns", []))
+                    break
         pattern_ids = [p.get("id", f"idx_{i}") for i, p in enumerate(result)]
         get_access_audit().record_access(
             level=AccessLevel.ORCHESTRATOR,
@@ -20,6 +20,7 @@ Version: 2.0.0 - Maximum Signal Aggregation
 
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
@@ -216,6 +217,43 @@ def get_signal_router() -> Optional["SignalQuestionIndex"]:
     return _signal_router
 
 
+# Global extractor scan engine singleton (lazy initialization)
+_extractor_scan_engine: Optional[Any] = None
+
+
+def get_extractor_scan_engine() -> Any:
+    """
+    Get or create the shared scan engine over the Phase 1 text extractors.
+
+    Extractors are built once (the institutional NER extractor alone compiles
+    ~470 entity patterns) and scan each text with one literal prefilter pass.
+
+    Returns:
+        MultiExtractorScanEngine instance
+    """
+    global _extractor_scan_engine
+    if _extractor_scan_engine is None:
+        from farfan_pipeline.infrastructure.extractors import (
+            CausalVerbExtractor,
+            FinancialChainExtractor,
+            InstitutionalNERExtractor,
+            MultiExtractorScanEngine,
+            NormativeReferenceExtractor,
+            QuantitativeTripletExtractor,
+            StructuralMarkerExtractor,
+        )
+
+        _extractor_scan_engine = MultiExtractorScanEngine([
+            QuantitativeTripletExtractor(),
+            NormativeReferenceExtractor(),
+            StructuralMarkerExtractor(),
+            FinancialChainExtractor(),
+            CausalVerbExtractor(),
+            InstitutionalNERExtractor(),
+        ])
+    return _extractor_scan_engine
+
+
 @dataclass
 class SignalEnrichmentContext:
     """
@@ -247,19 +285,28 @@ class SignalEnricher:
     Provides comprehensive signal-based analysis across all subphases.
     """
     
-    def __init__(self, questionnaire_path: Optional[Path] = None):
+    def __init__(
+        self,
+        questionnaire_path: Optional[Path] = None,
+        extraction_cache: Optional[Any] = None,
+    ):
         """
         Initialize signal enricher.
 
         Args:
             questionnaire_path: Path to questionnaire JSON for signal extraction
+            extraction_cache: Optional DocumentExtractionCache shared with the
+                later phases processing the same document
         """
         self.context = SignalEnrichmentContext()
         self.questionnaire_path = questionnaire_path
+        self.extraction_cache = extraction_cache
         self._initialized = False
         # Load question-specific patterns from questionnaire
         self._questionnaire_patterns: dict[str, list[tuple[str, str, float]]] = {}
         self._causal_patterns: list[tuple[str, str, float]] = DEFAULT_CAUSAL_PATTERNS
+        # Pattern-set digest per policy area, versioning memoized marker scans
+        self._marker_scan_versions: Dict[str, str] = {}
 
         if questionnaire_path and questionnaire_path.exists():
             try:
@@ -280,7 +327,14 @@ class SignalEnricher:
                 self._initialize_signal_registry(questionnaire_path)
             except Exception as e:
                 logger.warning(f"Signal registry initialization failed: {e}")
-    
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get the enricher without the document cache, which
+        # belongs to (and is released by) the process that opened it
+        state = self.__dict__.copy()
+        state["extraction_cache"] = None
+        return state
+
     def _initialize_signal_registry(self, questionnaire_path: Path) -> None:
         """Initialize signal registry from questionnaire."""
         if not SISAS_AVAILABLE:
@@ -427,6 +481,82 @@ class SignalEnricher:
         """Check if questionnaire patterns were successfully loaded."""
         return len(self._questionnaire_patterns) > 0
 
+    def scan_chunk(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the Phase 1 text extractors over one chunk in a single prefiltered pass.
+
+        With a document extraction cache, each extractor's result is memoized,
+        so every subphase (and later phase) asking about the same chunk text
+        reuses one extraction and the chunk is only prefiltered on a miss.
+
+        Args:
+            text: Chunk text
+            context: Optional extraction context (folded into the cache key)
+
+        Returns:
+            Dict of signal_type -> ExtractionResult; a failing extractor is
+            logged and left out.
+        """
+        engine = get_extractor_scan_engine()
+        chunk_scan = None
+
+        def run_extractor(extractor: Any) -> Any:
+            nonlocal chunk_scan
+            if chunk_scan is None:
+                chunk_scan = engine.scan(text)
+            return chunk_scan.run(extractor, context)
+
+        results: Dict[str, Any] = {}
+        for extractor in engine.extractors:
+            try:
+                if self.extraction_cache is not None:
+                    result = self.extraction_cache.extract(
+                        extractor, text, context, compute=lambda e=extractor: run_extractor(e)
+                    )
+                else:
+                    result = run_extractor(extractor)
+            except Exception as e:
+                logger.warning(f"Extractor {type(extractor).__name__} failed: {e}")
+                continue
+            results[result.signal_type] = result
+        return results
+
+    def _memoize_marker_scan(
+        self,
+        analysis_id: str,
+        text: str,
+        policy_area: str,
+        compute: Any,
+    ) -> Any:
+        """Run a marker scan through the document extraction cache, if any."""
+        if self.extraction_cache is None:
+            return compute()
+        return self.extraction_cache.memoize_analysis(
+            f"phase1.{analysis_id}", self._marker_scan_version(policy_area), text, compute
+        )
+
+    def _marker_scan_version(self, policy_area: str) -> str:
+        """Digest of the patterns a marker scan applies in one policy area."""
+        version = self._marker_scan_versions.get(policy_area)
+        if version is None:
+            signal_pack = (
+                self.context.signal_packs.get(policy_area) if self._initialized else None
+            )
+            payload = repr((
+                policy_area,
+                DEFAULT_CAUSAL_PATTERNS,
+                BASE_TEMPORAL_PATTERNS,
+                list(getattr(signal_pack, "patterns", None) or ()),
+                list(getattr(signal_pack, "verbs", None) or ()),
+            ))
+            version = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+            self._marker_scan_versions[policy_area] = version
+        return version
+
     def extract_and_route_signals(
         self,
         text: str,
@@ -449,51 +579,18 @@ class SignalEnricher:
                 - enriched_pack: Combined data for downstream phases
                 - metrics: Extraction and routing metrics
         """
-        # Import extractors with fallback for different environments
-        try:
-            from farfan_pipeline.infrastructure.extractors import (
-                QuantitativeTripletExtractor,
-                NormativeReferenceExtractor,
-                StructuralMarkerExtractor,
-                FinancialChainExtractor,
-                CausalVerbExtractor,
-                InstitutionalNERExtractor,
-            )
-        except ImportError:
-            from farfan_pipeline.infrastructure.extractors import (
-                QuantitativeTripletExtractor,
-                NormativeReferenceExtractor,
-                StructuralMarkerExtractor,
-                FinancialChainExtractor,
-                CausalVerbExtractor,
-                InstitutionalNERExtractor,
-            )
-        
         extraction_results = {}
         all_signal_types = []
-        
-        # Run all available extractors
-        extractors = [
-            QuantitativeTripletExtractor(),
-            NormativeReferenceExtractor(),
-            StructuralMarkerExtractor(),
-            FinancialChainExtractor(),
-            CausalVerbExtractor(),
-            InstitutionalNERExtractor(),
-        ]
-        
-        for extractor in extractors:
-            try:
-                result = extractor.extract(text, context)
-                extraction_results[result.signal_type] = {
-                    "matches": result.matches,
-                    "confidence": result.confidence,
-                    "metadata": result.metadata,
-                }
-                if result.matches:
-                    all_signal_types.append(result.signal_type)
-            except Exception as e:
-                logger.warning(f"Extractor {type(extractor).__name__} failed: {e}")
+        extractors = get_extractor_scan_engine().extractors
+
+        for signal_type, result in self.scan_chunk(text, context).items():
+            extraction_results[signal_type] = {
+                "matches": result.matches,
+                "confidence": result.confidence,
+                "metadata": result.metadata,
+            }
+            if result.matches:
+                all_signal_types.append(signal_type)
         
         # Route all detected signals
         routing_results = self.route_signals_batch(all_signal_types)
@@ -640,6 +737,12 @@ class SignalEnricher:
         Returns:
             List of causal markers with signal metadata
         """
+        return self._memoize_marker_scan(
+            "causal_markers", text, policy_area,
+            lambda: self._scan_causal_markers(text, policy_area),
+        )
+
+    def _scan_causal_markers(self, text: str, policy_area: str) -> List[Dict[str, Any]]:
         markers = []
         
         # Apply default patterns (use module-level constant)
@@ -782,6 +885,12 @@ class SignalEnricher:
         Returns:
             List of temporal markers with signal enrichment
         """
+        return self._memoize_marker_scan(
+            "temporal_markers", text, policy_area,
+            lambda: self._scan_temporal_markers(text, policy_area),
+        )
+
+    def _scan_temporal_markers(self, text: str, policy_area: str) -> List[Dict[str, Any]]:
         markers = []
         
         # Use module-level BASE_TEMPORAL_PATTERNS constant
@@ -917,14 +1026,26 @@ class SignalEnricher:
         }
 
 
-def create_signal_enricher(questionnaire_path: Optional[Path] = None) -> SignalEnricher:
+def create_signal_enricher(
+    questionnaire_path: Optional[Path] = None,
+    document_id: Optional[str] = None,
+) -> SignalEnricher:
     """
     Factory function to create signal enricher instance.
     
     Args:
         questionnaire_path: Optional path to questionnaire for signal extraction
+        document_id: Optional document identifier; when given, extraction
+            results are memoized in that document's shared extraction cache
     
     Returns:
         Configured SignalEnricher instance
     """
-    return SignalEnricher(questionnaire_path=questionnaire_path)
+    extraction_cache = None
+    if document_id:
+        from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+            get_document_extraction_cache,
+        )
+
+        extraction_cache = get_document_extraction_cache(document_id)
+    return SignalEnricher(questionnaire_path=questionnaire_path, extraction_cache=extraction_cache)
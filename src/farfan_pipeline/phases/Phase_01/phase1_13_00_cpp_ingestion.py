@@ -58,8 +58,12 @@ import hashlib
 import json
 import logging
 import re
+import time
 import unicodedata
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import lru_cache
@@ -83,9 +87,11 @@ from .phase1_03_00_models import (
 )
 
 # Remediation Imports (SPEC-001, SPEC-003, SPEC-004)
-from .primitives.truncation_audit import TruncationAudit
-from .primitives.streaming_extractor import StreamingPDFExtractor
+from .primitives.phase1_10_00_truncation_audit import TruncationAudit
+from .primitives.phase1_10_00_streaming_extractor import StreamingPDFExtractor
 from .phase1_05_00_thread_safe_results import ThreadSafeResults
+from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
+from farfan_pipeline.infrastructure.process_pools import pool_context
 from .PHASE_1_CONSTANTS import (
     PDF_EXTRACTION_CHAR_LIMIT,
     SEMANTIC_SCORE_MAX_EXPECTED,
@@ -317,6 +323,11 @@ SIGNAL_QUALITY_TIER_BOOSTS = {
     'SPARSE': 0.0
 }
 
+# Extractor scan signals consumed by the SP5/SP7 kernels (see SignalEnricher.scan_chunk)
+EXTRACTOR_CAUSAL_SIGNAL = 'CAUSAL_VERBS'
+EXTRACTOR_EVIDENCE_SIGNALS = ('QUANTITATIVE_TRIPLET', 'NORMATIVE_REFERENCE', 'FINANCIAL_CHAIN')
+MAX_EXTRACTOR_MATCHES_PER_SIGNAL = 2
+
 
 # ============================================================================
 # TABLE ISLAND EXTRACTION - Factory Injection Pattern
@@ -358,30 +369,23 @@ def _extract_tables_lightweight(pdf_path: str) -> list[dict]:
         logger.warning("PyMuPDF not available for table extraction")
         return []
     
-    import fitz
     tables = []
     
     try:
-        doc = fitz.open(pdf_path)
-        
-        for page_num, page in enumerate(doc):
-            # PyMuPDF 1.23+ has find_tables()
-            if hasattr(page, 'find_tables'):
-                page_tables = page.find_tables()
-                for tbl in page_tables:
-                    rows = tbl.extract()
-                    if rows and len(rows) > 1:
-                        table_type = _classify_table_type_lightweight(rows)
-                        tables.append({
-                            'df_rows': rows,
-                            'headers': rows[0] if rows else [],
-                            'page_number': page_num + 1,
-                            'table_type': table_type,
-                            'confidence_score': 0.7,
-                            'extraction_method': 'pymupdf_find_tables',
-                        })
-        
-        doc.close()
+        # Tables come from the shared parsed-document artifact (find_tables runs once per PDF)
+        for tbl in open_parsed_document(pdf_path).tables():
+            rows = tbl.rows
+            if rows and len(rows) > 1:
+                table_type = _classify_table_type_lightweight(rows)
+                tables.append({
+                    'df_rows': rows,
+                    'headers': rows[0] if rows else [],
+                    'page_number': tbl.page_number,
+                    'table_type': table_type,
+                    'confidence_score': 0.7,
+                    'extraction_method': 'pymupdf_find_tables',
+                })
+        
         logger.info(f"Extracted {len(tables)} tables via lightweight extractor")
         
     except Exception as e:
@@ -662,12 +666,9 @@ def exorcise_from_text(
         # Form feed separated
         pages = full_text.split('\f')
     elif pdf_path and PYMUPDF_AVAILABLE:
-        # Extract pages from PDF
-        import fitz
+        # Page texts from the shared parsed-document artifact
         try:
-            doc = fitz.open(pdf_path)
-            pages = [doc[i].get_text() for i in range(len(doc))]
-            doc.close()
+            pages = list(open_parsed_document(pdf_path).iter_page_texts())
         except Exception:
             pages = [full_text]
     else:
@@ -770,11 +771,9 @@ def extract_document_genome(
         logger.warning("PyMuPDF not available for genome extraction")
         return genome
     
-    import fitz
-    
     try:
-        doc = fitz.open(pdf_path)
-        genome.page_count = len(doc)
+        doc = open_parsed_document(pdf_path)
+        genome.page_count = doc.page_count
         
         # Compute document hash
         genome.document_hash = hashlib.sha256(pdf_path.encode()).hexdigest()[:16]
@@ -788,8 +787,8 @@ def extract_document_genome(
         # Extract sample texts
         sample_texts = {}
         for page_idx in sample_pages:
-            if 0 <= page_idx < len(doc):
-                sample_texts[page_idx] = doc[page_idx].get_text()
+            if 0 <= page_idx < doc.page_count:
+                sample_texts[page_idx] = doc.page_text(page_idx)
         
         # Detect year period
         all_sample_text = ' '.join(sample_texts.values())
@@ -820,43 +819,23 @@ def extract_document_genome(
             genome.strategic_line_term = max(term_counts, key=term_counts.get)
         
         # Detect table of contents
-        first_pages_text = ' '.join(
-            doc[i].get_text() for i in range(min(10, len(doc)))
-        ).lower()
+        first_pages_text = ' '.join(doc.iter_page_texts(0, 10)).lower()
         if 'contenido' in first_pages_text or 'índice' in first_pages_text:
             genome.has_table_of_contents = True
         
         # Detect table density per page
-        table_counts = []
-        for page_idx in range(len(doc)):
-            page = doc[page_idx]
-            if hasattr(page, 'find_tables'):
-                try:
-                    tables = page.find_tables()
-                    # TableFinder may not support len() directly, use .tables attribute
-                    if hasattr(tables, 'tables'):
-                        count = len(tables.tables)
-                    elif hasattr(tables, '__iter__'):
-                        count = sum(1 for _ in tables)
-                    else:
-                        count = 0
-                except Exception:
-                    count = 0
-            else:
-                # Fallback: detect table-like patterns in text
-                text = page.get_text()
-                count = len(re.findall(r'\|.*\|', text))
-            table_counts.append((page_idx, count))
+        table_counts = [
+            (page_idx, len(doc.page_tables(page_idx))) for page_idx in range(doc.page_count)
+        ]
         
         total_tables = sum(c for _, c in table_counts)
-        genome.table_density = total_tables / max(len(doc), 1)
+        genome.table_density = total_tables / max(doc.page_count, 1)
         
         # Identify high-table pages (>2 tables)
         genome.table_pages = [p for p, c in table_counts if c >= 2][:50]
         
         # Identify narrative pages (long paragraphs, few tables)
-        for page_idx in range(len(doc)):
-            text = doc[page_idx].get_text()
+        for page_idx, text in enumerate(doc.iter_page_texts()):
             para_count = len(re.findall(r'\n\s*\n', text))
             table_count = table_counts[page_idx][1] if page_idx < len(table_counts) else 0
             if para_count > 5 and table_count < 2:
@@ -865,8 +844,8 @@ def extract_document_genome(
         
         # Detect budget section (PPI, presupuesto keywords)
         budget_pages = []
-        for page_idx in range(len(doc)):
-            text = doc[page_idx].get_text().lower()
+        for page_idx, text in enumerate(doc.iter_page_texts()):
+            text = text.lower()
             if 'plan plurianual' in text or 'ppi' in text or 'presupuesto' in text:
                 budget_pages.append(page_idx)
         if budget_pages:
@@ -874,16 +853,16 @@ def extract_document_genome(
         
         # Detect indicator section
         indicator_pages = []
-        for page_idx in range(len(doc)):
-            text = doc[page_idx].get_text().lower()
+        for page_idx, text in enumerate(doc.iter_page_texts()):
+            text = text.lower()
             if 'indicador' in text and ('meta' in text or 'línea base' in text):
                 indicator_pages.append(page_idx)
         if indicator_pages:
             genome.indicator_section_range = (min(indicator_pages), max(indicator_pages))
         
         # Header fingerprint (for exorcism)
-        if len(doc) > 3:
-            first_page_start = doc[1].get_text()[:200]  # Skip cover page
+        if doc.page_count > 3:
+            first_page_start = doc.page_text(1)[:200]  # Skip cover page
             genome.header_fingerprint = first_page_start[:100]
         
         # Complexity score
@@ -904,8 +883,6 @@ def extract_document_genome(
         else:
             genome.recommended_chunk_size = 2000
         
-        doc.close()
-        
         logger.info(
             f"Document genome extracted: {genome.page_count} pages, "
             f"period={genome.year_period}, style={genome.section_numbering_style}, "
@@ -1185,6 +1162,53 @@ class Phase1FailureHandler:
         
         return all_valid
 
+# ============================================================================
+# CHUNK-PARALLEL SUBPHASES (SP5-SP10)
+# ============================================================================
+# Per-chunk kernels (_spN_chunk_*) only read the chunk and earlier subphase
+# outputs and return their result; the subphase applies results to the chunks
+# in chunk order, so serial, thread and process runs produce identical outputs
+# and identical _record_subphase hashes. Process workers get the kernel host,
+# chunk list and per-kernel arguments once, through the pool initializer.
+# ============================================================================
+
+# (kernel host, chunks, {kernel: extra args}) of a chunk-kernel worker process
+_CHUNK_WORKER_STATE: Optional[Tuple[Any, List[Any], Dict[str, Tuple[Any, ...]]]] = None
+
+PARALLEL_SUBPHASE_GROUP = (7, 8, 9)  # SP7/SP8/SP9 depend only on SP4-SP6 outputs
+
+
+def _extractor_match_text(text: str, match: Dict[str, Any]) -> str:
+    """Matched text of an extractor match (its text field, else its span)."""
+    if match.get('text'):
+        return str(match['text'])
+    span = match.get('text_span')
+    if span and len(span) == 2:
+        return text[span[0]:span[1]]
+    return ''
+
+
+def _timed_chunk_kernel(executor: Any, kernel: str, chunk: Any, extra: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """Run one per-chunk kernel, returning (result, seconds)."""
+    start = time.perf_counter()
+    result = getattr(executor, kernel)(chunk, *extra)
+    return result, time.perf_counter() - start
+
+
+def _init_chunk_worker(
+    executor: Any, chunks: List[Any], extras: Dict[str, Tuple[Any, ...]]
+) -> None:
+    """Process-pool initializer: keep the state every task of this pool reads."""
+    global _CHUNK_WORKER_STATE
+    _CHUNK_WORKER_STATE = (executor, chunks, extras)
+
+
+def _run_worker_chunk_kernel(kernel: str, index: int) -> Tuple[Any, float]:
+    """Process-pool entry point: run a kernel on one of the worker's chunks."""
+    executor, chunks, extras = _CHUNK_WORKER_STATE
+    return _timed_chunk_kernel(executor, kernel, chunks[index], extras[kernel])
+
+
 class Phase1CPPIngestionFullContract:
     """
     CRITICAL EXECUTION CONTRACT - WEIGHT: 10000
@@ -1200,6 +1224,9 @@ class Phase1CPPIngestionFullContract:
         self,
         signal_registry: Optional[Any] = None,
         structural_profile: PDMStructuralProfile | None = None,
+        max_workers: int = 1,
+        use_processes: bool = False,
+        metrics_collector: Optional[Any] = None,
     ):
         """Initialize Phase 1 executor with signal registry dependency injection.
         
@@ -1208,6 +1235,12 @@ class Phase1CPPIngestionFullContract:
                             If None, falls back to creating default packs (degraded mode)
             structural_profile: Constitutional PDMStructuralProfile (mandatory for SP2).
                                  Defaults to get_default_profile() if not provided.
+            max_workers: Workers for the chunk-parallel subphases SP5-SP10
+                         (1 = sequential). SP7, SP8 and SP9 share one fan-out.
+            use_processes: Run chunk kernels in worker processes instead of
+                           threads (falls back to threads if the pool cannot run).
+            metrics_collector: Optional Phase1MetricsCollector receiving
+                               per-subphase timings for SP5-SP10.
         """
         self.MANDATORY_SUBPHASES = list(range(16))  # SP0 through SP15
         self.execution_trace: List[Tuple[str, str, str]] = []
@@ -1221,6 +1254,9 @@ class Phase1CPPIngestionFullContract:
         self.structural_profile: PDMStructuralProfile = (
             structural_profile or get_default_profile()
         )
+        self.max_workers: int = max(1, max_workers)
+        self.use_processes: bool = use_processes
+        self.metrics_collector: Optional[Any] = metrics_collector
         
     def _deterministic_serialize(self, output: Any) -> str:
         """Deterministic serialization for hashing and traceability.
@@ -1459,7 +1495,9 @@ class Phase1CPPIngestionFullContract:
         # INITIALIZE SIGNAL ENRICHER with questionnaire
         if SIGNAL_ENRICHMENT_AVAILABLE and SignalEnricher is not None:
             try:
-                self.signal_enricher = create_signal_enricher(canonical_input.questionnaire_path)
+                self.signal_enricher = create_signal_enricher(
+                    canonical_input.questionnaire_path, document_id=self.document_id
+                )
                 logger.info(f"Signal enricher initialized: {self.signal_enricher._initialized}")
             except Exception as e:
                 logger.warning(f"Signal enricher initialization failed: {e}")
@@ -1517,31 +1555,48 @@ class Phase1CPPIngestionFullContract:
             self._record_subphase(4, pa_dim_chunks)
             
             # SP5: Causal Chain Extraction - WEIGHT: 970
-            causal_chains = self._execute_sp5_causal_extraction(pa_dim_chunks)
+            with self._track_subphase(5):
+                causal_chains = self._execute_sp5_causal_extraction(pa_dim_chunks)
             self._record_subphase(5, causal_chains)
             
             # SP6: Causal Integration - WEIGHT: 970
-            integrated_causal = self._execute_sp6_causal_integration(
-                pa_dim_chunks, causal_chains
-            )
+            with self._track_subphase(6):
+                integrated_causal = self._execute_sp6_causal_integration(
+                    pa_dim_chunks, causal_chains
+                )
             self._record_subphase(6, integrated_causal)
             
+            # SP7-SP9 are independent of each other: in parallel mode their
+            # per-chunk kernels share one fan-out; results are applied and
+            # recorded below in subphase order.
+            group_results = self._fan_out_sp7_to_sp9(pa_dim_chunks)
+            
             # SP7: Argumentative Analysis - WEIGHT: 960
-            arguments = self._execute_sp7_arguments(pa_dim_chunks, integrated_causal)
+            with self._track_subphase(7, group_results):
+                arguments = self._execute_sp7_arguments(
+                    pa_dim_chunks, integrated_causal, results=group_results.get(7)
+                )
             self._record_subphase(7, arguments)
             
             # SP8: Temporal Analysis - WEIGHT: 960
-            temporal = self._execute_sp8_temporal(pa_dim_chunks, integrated_causal)
+            with self._track_subphase(8, group_results):
+                temporal = self._execute_sp8_temporal(
+                    pa_dim_chunks, integrated_causal, results=group_results.get(8)
+                )
             self._record_subphase(8, temporal)
             
             # SP9: Discourse Analysis - WEIGHT: 950
-            discourse = self._execute_sp9_discourse(pa_dim_chunks, arguments)
+            with self._track_subphase(9, group_results):
+                discourse = self._execute_sp9_discourse(
+                    pa_dim_chunks, arguments, results=group_results.get(9)
+                )
             self._record_subphase(9, discourse)
             
             # SP10: Strategic Integration - WEIGHT: 990
-            strategic = self._execute_sp10_strategic(
-                pa_dim_chunks, integrated_causal, arguments, temporal, discourse
-            )
+            with self._track_subphase(10):
+                strategic = self._execute_sp10_strategic(
+                    pa_dim_chunks, integrated_causal, arguments, temporal, discourse
+                )
             self._record_subphase(10, strategic)
             
             # SP11: Smart Chunk Generation [CRITICAL: 60 CHUNKS] - WEIGHT: 10000
@@ -1673,6 +1728,134 @@ class Phase1CPPIngestionFullContract:
         else:
             logger.info(f"SP{sp_num} [WEIGHT={weight}] recorded: timestamp={timestamp}, hash={hash_value[:16]}...")
 
+    # --- CHUNK-PARALLEL EXECUTION (SP5-SP10) ---
+
+    def _map_chunk_kernels(
+        self, chunks: List[Chunk], jobs: List[Tuple[str, Tuple[Any, ...]]]
+    ) -> Dict[str, Tuple[List[Any], float]]:
+        """
+        Run each (kernel, extra_args) job over every chunk.
+
+        Returns:
+            kernel -> (per-chunk results in chunk order, summed kernel seconds)
+        """
+        calls = [(kernel, index, extra) for kernel, extra in jobs for index in range(len(chunks))]
+        if self.max_workers > 1 and len(calls) > 1:
+            outputs = self._map_parallel(chunks, dict(jobs), calls)
+        else:
+            outputs = [
+                _timed_chunk_kernel(self, kernel, chunks[index], extra)
+                for kernel, index, extra in calls
+            ]
+
+        merged: Dict[str, Tuple[List[Any], float]] = {}
+        for (kernel, _, _), (result, seconds) in zip(calls, outputs):
+            results, total = merged.get(kernel, ([], 0.0))
+            results.append(result)
+            merged[kernel] = (results, total + seconds)
+        return merged
+
+    def _map_parallel(
+        self,
+        chunks: List[Chunk],
+        extras: Dict[str, Tuple[Any, ...]],
+        calls: List[Tuple[str, int, Tuple[Any, ...]]],
+    ) -> List[Tuple[Any, float]]:
+        """Fan kernel calls out to a pool; outputs come back in call order."""
+        if self.use_processes:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=pool_context([__name__]),
+                    initializer=_init_chunk_worker,
+                    initargs=(self._chunk_kernel_host(), chunks, extras),
+                ) as pool:
+                    futures = [
+                        pool.submit(_run_worker_chunk_kernel, kernel, index)
+                        for kernel, index, _ in calls
+                    ]
+                    return [future.result() for future in futures]
+            except BrokenProcessPool as e:
+                logger.warning(f"Phase 1 chunk worker process died ({e}); retrying with threads")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="phase1-chunk") as pool:
+            futures = [
+                pool.submit(_timed_chunk_kernel, self, kernel, chunks[index], extra)
+                for kernel, index, extra in calls
+            ]
+            return [future.result() for future in futures]
+
+    def _chunk_kernel_host(self) -> "Phase1CPPIngestionFullContract":
+        """
+        Executor stand-in shipped to worker processes.
+
+        The chunk kernels read only the signal enricher, so the trace, results
+        and metrics collector (which hold locks) stay in this process.
+        """
+        host = object.__new__(type(self))
+        host.signal_enricher = self.signal_enricher
+        return host
+
+    def _fan_out_sp7_to_sp9(self, chunks: List[Chunk]) -> Dict[int, Any]:
+        """
+        Compute the SP7, SP8 and SP9 chunk kernels in one fan-out (parallel mode only).
+
+        Returns:
+            {sp_num: per-chunk results} plus "timings" ({sp_num: kernel seconds})
+            and "wall_seconds"; empty in sequential mode, where each subphase
+            maps its own kernel.
+        """
+        if self.max_workers <= 1:
+            return {}
+        kernels = {
+            7: "_sp7_chunk_arguments",
+            8: "_sp8_chunk_temporal",
+            9: "_sp9_chunk_discourse",
+        }
+        start = time.perf_counter()
+        merged = self._map_chunk_kernels(chunks, [(kernel, ()) for kernel in kernels.values()])
+        group_results: Dict[Any, Any] = {
+            sp_num: merged[kernel][0] for sp_num, kernel in kernels.items()
+        }
+        group_results["timings"] = {sp_num: merged[kernel][1] for sp_num, kernel in kernels.items()}
+        group_results["wall_seconds"] = time.perf_counter() - start
+        return group_results
+
+    def _track_subphase(self, sp_num: int, group_results: Optional[Dict[Any, Any]] = None):
+        """
+        Timing context for a subphase, recorded in the metrics collector (if any).
+
+        For SP7-SP9 in parallel mode the kernel time was spent in the shared
+        fan-out, so it is recorded as the subphase's summed kernel time, with
+        the fan-out wall time in metadata.
+        """
+        if self.metrics_collector is None:
+            return nullcontext()
+        if group_results and sp_num in group_results.get("timings", {}):
+            from .phase1_17_00_performance_metrics import SubphaseMetrics
+
+            now = datetime.now(timezone.utc).isoformat()
+            self.metrics_collector.record_subphase_metrics(
+                SubphaseMetrics(
+                    subphase_id=f"SP{sp_num}",
+                    start_time=now,
+                    end_time=now,
+                    duration_ms=group_results["timings"][sp_num] * 1000,
+                    memory_mb_start=0.0,
+                    memory_mb_peak=0.0,
+                    memory_mb_end=0.0,
+                    metadata={
+                        "parallel_group": "SP7-SP9",
+                        "timing": "summed_chunk_kernel_time",
+                        "group_wall_ms": group_results["wall_seconds"] * 1000,
+                        "max_workers": self.max_workers,
+                        "use_processes": self.use_processes,
+                    },
+                )
+            )
+            return nullcontext()
+        return self.metrics_collector.track_subphase(f"SP{sp_num}")
+
     # --- SUBPHASE IMPLEMENTATIONS ---
 
     def _execute_sp0_language_detection(self, canonical_input: CanonicalInput) -> LanguageData:
@@ -1686,11 +1869,9 @@ class Phase1CPPIngestionFullContract:
         sample_text = ""
         if PYMUPDF_AVAILABLE and canonical_input.pdf_path.exists():
             try:
-                doc = fitz.open(canonical_input.pdf_path)
+                doc = open_parsed_document(canonical_input.pdf_path, sha256=canonical_input.pdf_sha256)
                 # Sample first 3 pages for language detection
-                for page_num in range(min(3, len(doc))):
-                    sample_text += doc[page_num].get_text()
-                doc.close()
+                sample_text = "".join(doc.iter_page_texts(0, 3))
             except Exception as e:
                 logger.warning(f"SP0: PDF extraction failed: {e}, using fallback")
         
@@ -1746,7 +1927,9 @@ class Phase1CPPIngestionFullContract:
         if PYMUPDF_AVAILABLE and canonical_input.pdf_path.exists():
             try:
                 # SPEC-003: Streaming extraction with bounded memory
-                extractor = StreamingPDFExtractor(canonical_input.pdf_path)
+                extractor = StreamingPDFExtractor(
+                    canonical_input.pdf_path, sha256=canonical_input.pdf_sha256
+                )
                 # SPEC-001: Use named constant, not magic number
                 extracted_text, processed_chars, total_chars = extractor.extract_with_limit(
                     PDF_EXTRACTION_CHAR_LIMIT
@@ -2448,7 +2631,18 @@ class Phase1CPPIngestionFullContract:
         logger.info("SP5: Starting causal chain extraction (PRODUCTION)")
         
         causal_chains_list = []
+        results, _ = self._map_chunk_kernels(chunks, [("_sp5_chunk_causal", ())])["_sp5_chunk_causal"]
+        for chunk, (causal_graph, chain_entry) in zip(chunks, results):
+            chunk.causal_graph = causal_graph
+            if chain_entry is not None:
+                causal_chains_list.append(chain_entry)
+        
+        logger.info(f"SP5: Extracted causal chains from {len(causal_chains_list)} chunks (Beach={DEREK_BEACH_AVAILABLE})")
         
+        return CausalChains(chains=causal_chains_list)
+
+    def _sp5_chunk_causal(self, chunk: Chunk) -> Tuple[CausalGraph, Optional[Dict[str, Any]]]:
+        """SP5 kernel: causal graph of one chunk and its chain entry (None if no events)."""
         # Causal keywords for Spanish policy documents
         CAUSAL_KEYWORDS = [
             'porque', 'debido a', 'gracias a', 'mediante', 'a través de',
@@ -2457,90 +2651,110 @@ class Phase1CPPIngestionFullContract:
             'con el fin de', 'para lograr', 'para alcanzar'
         ]
         
-        for chunk in chunks:
-            chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
-            pa_id = chunk.policy_area_id
-            
-            # SIGNAL ENRICHMENT: Extract causal markers with signal-driven detection
-            signal_markers = []
-            if self.signal_enricher is not None:
-                signal_markers = self.signal_enricher.extract_causal_markers_with_signals(
-                    chunk_text, pa_id
-                )
-            
-            # Extract causal relations from chunk text
-            events = []
-            causes = []
-            effects = []
-            
-            # Process signal-detected markers first (higher confidence)
-            for marker in signal_markers:
-                event_data = {
-                    'text': marker['text'],
-                    'marker_type': marker['type'],
-                    'confidence': marker['confidence'],
-                    'source': marker['source'],
-                    'chunk_id': chunk.chunk_id,
-                    'signal_enhanced': True,
-                }
-                
-                if marker['type'] in ['CAUSE', 'CAUSE_LINK']:
-                    causes.append(event_data)
-                elif marker['type'] in ['EFFECT', 'EFFECT_LINK', 'CONSEQUENCE']:
-                    effects.append(event_data)
-                else:
-                    events.append(event_data)
-            
-            # Fallback to keyword-based extraction
-            for keyword in CAUSAL_KEYWORDS:
-                if keyword.lower() in chunk_text.lower():
-                    # Find surrounding context
-                    pattern = rf'([^.]*{re.escape(keyword)}[^.]*)'
-                    matches = re.findall(pattern, chunk_text, re.IGNORECASE)
-                    for match in matches[:3]:  # Limit to 3 per keyword
-                        event_data = {
-                            'text': match[:200],
-                            'keyword': keyword,
-                            'chunk_id': chunk.chunk_id,
-                            'signal_enhanced': False,
-                        }
-                        
-                        # Classify using REAL Beach test resolved via registry
-                        if BEACH_CLASSIFY is not None:
-                            necessity = 0.7 if keyword in ['debe', 'requiere', 'necesita'] else 0.4
-                            sufficiency = 0.7 if keyword in ['garantiza', 'asegura', 'produce'] else 0.4
-                            test_type = BEACH_CLASSIFY(necessity, sufficiency)
-                            event_data['test_type'] = test_type
-                            event_data['beach_method'] = 'PRODUCTION'
-                        else:
-                            event_data['test_type'] = 'UNAVAILABLE'
-                            event_data['beach_method'] = 'DEREK_BEACH_UNAVAILABLE'
-                        
-                        events.append(event_data)
-                        
-                        # Split into cause/effect
-                        parts = re.split(keyword, match, flags=re.IGNORECASE)
-                        if len(parts) >= 2:
-                            causes.append(parts[0].strip()[:100])
-                            effects.append(parts[1].strip()[:100])
-            
-            # Build CausalGraph for this chunk
-            chunk.causal_graph = CausalGraph(
-                events=events[:10],
-                causes=causes[:5],
-                effects=effects[:5]
+        chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
+        pa_id = chunk.policy_area_id
+        
+        # SIGNAL ENRICHMENT: Extract causal markers with signal-driven detection
+        signal_markers = []
+        if self.signal_enricher is not None:
+            signal_markers = self.signal_enricher.extract_causal_markers_with_signals(
+                chunk_text, pa_id
             )
-            
-            if events:
-                causal_chains_list.append({
-                    'chunk_id': chunk.chunk_id,
-                    'chain_count': len(events),
-                    'events': events[:5]
-                })
         
-        logger.info(f"SP5: Extracted causal chains from {len(causal_chains_list)} chunks (Beach={DEREK_BEACH_AVAILABLE})")
+        # EXTRACTOR SIGNALS: causal verb links from the shared chunk scan
+        causal_links = []
+        if self.signal_enricher is not None:
+            causal_result = self.signal_enricher.scan_chunk(chunk_text).get(EXTRACTOR_CAUSAL_SIGNAL)
+            if causal_result is not None:
+                causal_links = causal_result.matches
+        
+        # Extract causal relations from chunk text
+        events = []
+        causes = []
+        effects = []
+        
+        # Process signal-detected markers first (higher confidence)
+        for marker in signal_markers:
+            event_data = {
+                'text': marker['text'],
+                'marker_type': marker['type'],
+                'confidence': marker['confidence'],
+                'source': marker['source'],
+                'chunk_id': chunk.chunk_id,
+                'signal_enhanced': True,
+            }
+            
+            if marker['type'] in ['CAUSE', 'CAUSE_LINK']:
+                causes.append(event_data)
+            elif marker['type'] in ['EFFECT', 'EFFECT_LINK', 'CONSEQUENCE']:
+                effects.append(event_data)
+            else:
+                events.append(event_data)
+        
+        # Then extractor causal links (subject -> verb -> object)
+        for link in causal_links:
+            events.append({
+                'text': _extractor_match_text(chunk_text, link)[:200],
+                'marker_type': 'CAUSAL_VERB',
+                'verb': link.get('verb_lemma') or link.get('verb'),
+                'confidence': link.get('confidence'),
+                'source': f'extractor:{EXTRACTOR_CAUSAL_SIGNAL}',
+                'chunk_id': chunk.chunk_id,
+                'signal_enhanced': True,
+            })
+            if link.get('subject'):
+                causes.append(link['subject'][:100])
+            if link.get('object'):
+                effects.append(link['object'][:100])
+        
+        # Fallback to keyword-based extraction
+        for keyword in CAUSAL_KEYWORDS:
+            if keyword.lower() in chunk_text.lower():
+                # Find surrounding context
+                pattern = rf'([^.]*{re.escape(keyword)}[^.]*)'
+                matches = re.findall(pattern, chunk_text, re.IGNORECASE)
+                for match in matches[:3]:  # Limit to 3 per keyword
+                    event_data = {
+                        'text': match[:200],
+                        'keyword': keyword,
+                        'chunk_id': chunk.chunk_id,
+                        'signal_enhanced': False,
+                    }
+                    
+                    # Classify using REAL Beach test resolved via registry
+                    if BEACH_CLASSIFY is not None:
+                        necessity = 0.7 if keyword in ['debe', 'requiere', 'necesita'] else 0.4
+                        sufficiency = 0.7 if keyword in ['garantiza', 'asegura', 'produce'] else 0.4
+                        test_type = BEACH_CLASSIFY(necessity, sufficiency)
+                        event_data['test_type'] = test_type
+                        event_data['beach_method'] = 'PRODUCTION'
+                    else:
+                        event_data['test_type'] = 'UNAVAILABLE'
+                        event_data['beach_method'] = 'DEREK_BEACH_UNAVAILABLE'
+                    
+                    events.append(event_data)
+                    
+                    # Split into cause/effect
+                    parts = re.split(keyword, match, flags=re.IGNORECASE)
+                    if len(parts) >= 2:
+                        causes.append(parts[0].strip()[:100])
+                        effects.append(parts[1].strip()[:100])
+        
+        # Build CausalGraph for this chunk
+        causal_graph = CausalGraph(
+            events=events[:10],
+            causes=causes[:5],
+            effects=effects[:5]
+        )
         
-        return CausalChains(chains=causal_chains_list)
+        chain_entry = None
+        if events:
+            chain_entry = {
+                'chunk_id': chunk.chunk_id,
+                'chain_count': len(events),
+                'events': events[:5]
+            }
+        return causal_graph, chain_entry
 
     def _execute_sp6_causal_integration(self, chunks: List[Chunk], chains: CausalChains) -> IntegratedCausal:
         """
@@ -2646,7 +2860,12 @@ class Phase1CPPIngestionFullContract:
             }
         )
 
-    def _execute_sp7_arguments(self, chunks: List[Chunk], integrated: IntegratedCausal) -> Arguments:
+    def _execute_sp7_arguments(
+        self,
+        chunks: List[Chunk],
+        integrated: IntegratedCausal,
+        results: Optional[List[Dict[str, Any]]] = None,
+    ) -> Arguments:
         """
         SP7: Argumentative Analysis per FORCING ROUTE SECCIÓN 6.3.
         [EXEC-SP7-001] through [EXEC-SP7-003]
@@ -2654,8 +2873,20 @@ class Phase1CPPIngestionFullContract:
         """
         logger.info("SP7: Starting argumentative analysis")
         
+        if results is None:
+            results = self._map_chunk_kernels(chunks, [("_sp7_chunk_arguments", ())])["_sp7_chunk_arguments"][0]
+        
         arguments_map = {}
+        for chunk, chunk_arguments in zip(chunks, results):
+            chunk.arguments = chunk_arguments
+            arguments_map[chunk.chunk_id] = chunk_arguments
+        
+        logger.info(f"SP7: Analyzed arguments for {len(arguments_map)} chunks (Beach={DEREK_BEACH_AVAILABLE})")
         
+        return Arguments(arguments_map=arguments_map)
+
+    def _sp7_chunk_arguments(self, chunk: Chunk) -> Dict[str, Any]:
+        """SP7 kernel: argument structure and Beach test classification of one chunk."""
         # Argument type patterns
         ARGUMENT_PATTERNS = {
             'claim': [r'se afirma que', r'es evidente que', r'claramente', r'sin duda'],
@@ -2665,89 +2896,104 @@ class Phase1CPPIngestionFullContract:
             'rebuttal': [r'sin embargo', r'aunque', r'a pesar de', r'no obstante'],
         }
         
-        for chunk in chunks:
-            chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
-            chunk_text_lower = chunk_text.lower()
-            
-            chunk_arguments = {
-                'claims': [],
-                'evidence': [],
-                'warrants': [],
-                'qualifiers': [],
-                'rebuttals': [],
-                'test_classification': None
-            }
+        chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
+        chunk_text_lower = chunk_text.lower()
+        
+        chunk_arguments = {
+            'claims': [],
+            'evidence': [],
+            'warrants': [],
+            'qualifiers': [],
+            'rebuttals': [],
+            'test_classification': None
+        }
+        
+        # Extract arguments by type
+        for arg_type, patterns in ARGUMENT_PATTERNS.items():
+            for pattern in patterns:
+                matches = re.findall(rf'([^.]*{pattern}[^.]*)', chunk_text_lower)
+                for match in matches[:2]:
+                    arg_entry = {
+                        'text': match[:150],
+                        'pattern': pattern,
+                        'signal_score': None,
+                    }
+                    
+                    # SIGNAL ENRICHMENT: Score argument strength with signals
+                    if self.signal_enricher is not None:
+                        pa_id = chunk.policy_area_id
+                        signal_score = self.signal_enricher.score_argument_with_signals(
+                            match[:150], arg_type, pa_id
+                        )
+                        arg_entry['signal_score'] = signal_score['final_score']
+                        arg_entry['signal_confidence'] = signal_score['confidence']
+                        arg_entry['supporting_signals'] = signal_score.get('supporting_signals', [])
+                    
+                    chunk_arguments[arg_type + 's' if not arg_type.endswith('s') else arg_type].append(arg_entry)
+        
+        # EXTRACTOR SIGNALS: quantitative, normative and financial evidence from
+        # the shared chunk scan (already extracted for SP5)
+        if self.signal_enricher is not None:
+            extractor_signals = self.signal_enricher.scan_chunk(chunk_text)
+            for signal_type in EXTRACTOR_EVIDENCE_SIGNALS:
+                result = extractor_signals.get(signal_type)
+                if result is None:
+                    continue
+                for match in result.matches[:MAX_EXTRACTOR_MATCHES_PER_SIGNAL]:
+                    chunk_arguments['evidence'].append({
+                        'text': _extractor_match_text(chunk_text, match)[:150],
+                        'pattern': f'extractor:{signal_type}',
+                        'signal_score': None,
+                        'extractor_confidence': match.get('confidence'),
+                    })
+        
+        # Classify using REAL Beach test taxonomy from farfan_pipeline/methods
+        if BEACH_CLASSIFY is not None:
+            evidence_count = len(chunk_arguments['evidence'])
+            claim_count = len(chunk_arguments['claims'])
             
-            # Extract arguments by type
-            for arg_type, patterns in ARGUMENT_PATTERNS.items():
-                for pattern in patterns:
-                    matches = re.findall(rf'([^.]*{pattern}[^.]*)', chunk_text_lower)
-                    for match in matches[:2]:
-                        arg_entry = {
-                            'text': match[:150],
-                            'pattern': pattern,
-                            'signal_score': None,
-                        }
-                        
-                        # SIGNAL ENRICHMENT: Score argument strength with signals
-                        if self.signal_enricher is not None:
-                            pa_id = chunk.policy_area_id
-                            signal_score = self.signal_enricher.score_argument_with_signals(
-                                match[:150], arg_type, pa_id
-                            )
-                            arg_entry['signal_score'] = signal_score['final_score']
-                            arg_entry['signal_confidence'] = signal_score['confidence']
-                            arg_entry['supporting_signals'] = signal_score.get('supporting_signals', [])
-                        
-                        chunk_arguments[arg_type + 's' if not arg_type.endswith('s') else arg_type].append(arg_entry)
+            # SIGNAL ENHANCEMENT: Boost necessity/sufficiency with signal scores
+            signal_boost = 0.0
+            if self.signal_enricher is not None:
+                # Average signal scores from evidence
+                evidence_signal_scores = [
+                    ev.get('signal_score', 0.0) for ev in chunk_arguments['evidence']
+                    if ev.get('signal_score') is not None
+                ]
+                if evidence_signal_scores:
+                    signal_boost = sum(evidence_signal_scores) / len(evidence_signal_scores) * SIGNAL_BOOST_COEFFICIENT
             
-            # Classify using REAL Beach test taxonomy from farfan_pipeline/methods
-            if BEACH_CLASSIFY is not None:
-                evidence_count = len(chunk_arguments['evidence'])
-                claim_count = len(chunk_arguments['claims'])
-                
-                # SIGNAL ENHANCEMENT: Boost necessity/sufficiency with signal scores
-                signal_boost = 0.0
-                if self.signal_enricher is not None:
-                    # Average signal scores from evidence
-                    evidence_signal_scores = [
-                        ev.get('signal_score', 0.0) for ev in chunk_arguments['evidence']
-                        if ev.get('signal_score') is not None
-                    ]
-                    if evidence_signal_scores:
-                        signal_boost = sum(evidence_signal_scores) / len(evidence_signal_scores) * SIGNAL_BOOST_COEFFICIENT
-                
-                # Heuristic for necessity/sufficiency based on evidence strength
-                # This follows Beach & Pedersen 2019 calibration guidelines
-                necessity = min(0.9, 0.3 + (evidence_count * 0.15) + signal_boost)
-                sufficiency = min(0.9, 0.3 + (claim_count * 0.1) + (evidence_count * 0.1) + signal_boost * SIGNAL_BOOST_SUFFICIENCY_COEFFICIENT)
-                
-                # Use REAL BeachEvidentialTest.classify_test from derek_beach.py
-                test_type = BEACH_CLASSIFY(necessity, sufficiency)
-                chunk_arguments['test_classification'] = {
-                    'type': test_type,
-                    'necessity': necessity,
-                    'sufficiency': sufficiency,
-                    'method': 'BeachEvidentialTest_PRODUCTION'  # Mark as real implementation
-                }
-            else:
-                # No stub - just log that Beach test is unavailable
-                logger.warning(f"SP7: BeachEvidentialTest unavailable for chunk {chunk.chunk_id}")
-                chunk_arguments['test_classification'] = {
-                    'type': 'UNAVAILABLE',
-                    'necessity': None,
-                    'sufficiency': None,
-                    'method': 'DEREK_BEACH_UNAVAILABLE'
-                }
+            # Heuristic for necessity/sufficiency based on evidence strength
+            # This follows Beach & Pedersen 2019 calibration guidelines
+            necessity = min(0.9, 0.3 + (evidence_count * 0.15) + signal_boost)
+            sufficiency = min(0.9, 0.3 + (claim_count * 0.1) + (evidence_count * 0.1) + signal_boost * SIGNAL_BOOST_SUFFICIENCY_COEFFICIENT)
             
-            chunk.arguments = chunk_arguments
-            arguments_map[chunk.chunk_id] = chunk_arguments
-        
-        logger.info(f"SP7: Analyzed arguments for {len(arguments_map)} chunks (Beach={DEREK_BEACH_AVAILABLE})")
+            # Use REAL BeachEvidentialTest.classify_test from derek_beach.py
+            test_type = BEACH_CLASSIFY(necessity, sufficiency)
+            chunk_arguments['test_classification'] = {
+                'type': test_type,
+                'necessity': necessity,
+                'sufficiency': sufficiency,
+                'method': 'BeachEvidentialTest_PRODUCTION'  # Mark as real implementation
+            }
+        else:
+            # No stub - just log that Beach test is unavailable
+            logger.warning(f"SP7: BeachEvidentialTest unavailable for chunk {chunk.chunk_id}")
+            chunk_arguments['test_classification'] = {
+                'type': 'UNAVAILABLE',
+                'necessity': None,
+                'sufficiency': None,
+                'method': 'DEREK_BEACH_UNAVAILABLE'
+            }
         
-        return Arguments(arguments_map=arguments_map)
+        return chunk_arguments
 
-    def _execute_sp8_temporal(self, chunks: List[Chunk], integrated: IntegratedCausal) -> Temporal:
+    def _execute_sp8_temporal(
+        self,
+        chunks: List[Chunk],
+        integrated: IntegratedCausal,
+        results: Optional[List[Dict[str, Any]]] = None,
+    ) -> Temporal:
         """
         SP8: Temporal Analysis per FORCING ROUTE SECCIÓN 6.4.
         [EXEC-SP8-001] through [EXEC-SP8-003]
@@ -2755,8 +3001,30 @@ class Phase1CPPIngestionFullContract:
         """
         logger.info("SP8: Starting temporal analysis")
         
+        if results is None:
+            results = self._map_chunk_kernels(chunks, [("_sp8_chunk_temporal", ())])["_sp8_chunk_temporal"][0]
+        
         timeline = []
+        for chunk, temporal_markers in zip(chunks, results):
+            chunk.temporal_markers = temporal_markers
+            
+            # Add to timeline if has temporal content
+            if temporal_markers['years'] or temporal_markers['phases']:
+                timeline.append({
+                    'chunk_id': chunk.chunk_id,
+                    'years': temporal_markers['years'],
+                    'order': temporal_markers['temporal_order']
+                })
+        
+        # Sort timeline by temporal order
+        timeline.sort(key=lambda x: (min(x['years']) if x['years'] else 9999, x['order']))
         
+        logger.info(f"SP8: Extracted temporal markers from {len(timeline)} chunks with temporal content")
+        
+        return Temporal(timeline=timeline)
+
+    def _sp8_chunk_temporal(self, chunk: Chunk) -> Dict[str, Any]:
+        """SP8 kernel: temporal markers and verb-sequence order of one chunk."""
         # Temporal patterns for policy documents
         TEMPORAL_PATTERNS = [
             (r'\b(20\d{2})\b', 'year'),  # Years like 2020, 2024
@@ -2775,84 +3043,73 @@ class Phase1CPPIngestionFullContract:
             'evaluar': 9, 'ajustar': 10
         }
         
-        for chunk in chunks:
-            chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
-            pa_id = chunk.policy_area_id
-            
-            temporal_markers = {
-                'years': [],
-                'dates': [],
-                'horizons': [],
-                'phases': [],
-                'verb_sequence': [],
-                'temporal_order': 0,
-                'signal_enhanced_markers': []
-            }
-            
-            # SIGNAL ENRICHMENT: Extract temporal markers with signal patterns
-            if self.signal_enricher is not None:
-                signal_temporal_markers = self.signal_enricher.extract_temporal_markers_with_signals(
-                    chunk_text, pa_id
-                )
-                temporal_markers['signal_enhanced_markers'] = signal_temporal_markers
-                
-                # Merge signal markers into main categories
-                for marker in signal_temporal_markers:
-                    if marker['type'] == 'YEAR':
-                        try:
-                            year_val = int(re.search(r'20\d{2}', marker['text']).group(0))
-                            temporal_markers['years'].append(year_val)
-                        except (AttributeError, ValueError, TypeError):
-                            # If year extraction fails (e.g., no match or invalid int), skip this marker
-                            logging.debug(f"Failed to extract year from marker text: {marker['text']!r}")
-                    elif marker['type'] in ['DATE', 'MONTH_YEAR']:
-                        temporal_markers['dates'].append(marker['text'])
-                    elif marker['type'] == 'HORIZON':
-                        temporal_markers['horizons'].append(marker['text'])
-                    elif marker['type'] in ['PERIOD', 'SIGNAL_TEMPORAL']:
-                        temporal_markers['phases'].append(marker['text'])
-            
-            # Extract temporal markers with base patterns
-            for pattern, marker_type in TEMPORAL_PATTERNS:
-                matches = re.findall(pattern, chunk_text, re.IGNORECASE)
-                for match in matches:
-                    if marker_type == 'year':
-                        temporal_markers['years'].append(int(match) if match.isdigit() else match)
-                    elif marker_type == 'horizon':
-                        temporal_markers['horizons'].append(match)
-                    elif marker_type == 'phase':
-                        temporal_markers['phases'].append(match)
-                    else:
-                        temporal_markers['dates'].append(str(match))
-            
-            # Extract verb sequence for temporal ordering
-            chunk_lower = chunk_text.lower()
-            for verb, order in VERB_SEQUENCES.items():
-                if verb in chunk_lower:
-                    temporal_markers['verb_sequence'].append((verb, order))
-            
-            # Calculate temporal order score
-            if temporal_markers['verb_sequence']:
-                temporal_markers['temporal_order'] = min(v[1] for v in temporal_markers['verb_sequence'])
-            
-            chunk.temporal_markers = temporal_markers
+        chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
+        pa_id = chunk.policy_area_id
+        
+        temporal_markers = {
+            'years': [],
+            'dates': [],
+            'horizons': [],
+            'phases': [],
+            'verb_sequence': [],
+            'temporal_order': 0,
+            'signal_enhanced_markers': []
+        }
+        
+        # SIGNAL ENRICHMENT: Extract temporal markers with signal patterns
+        if self.signal_enricher is not None:
+            signal_temporal_markers = self.signal_enricher.extract_temporal_markers_with_signals(
+                chunk_text, pa_id
+            )
+            temporal_markers['signal_enhanced_markers'] = signal_temporal_markers
             
-            # Add to timeline if has temporal content
-            if temporal_markers['years'] or temporal_markers['phases']:
-                timeline.append({
-                    'chunk_id': chunk.chunk_id,
-                    'years': temporal_markers['years'],
-                    'order': temporal_markers['temporal_order']
-                })
+            # Merge signal markers into main categories
+            for marker in signal_temporal_markers:
+                if marker['type'] == 'YEAR':
+                    try:
+                        year_val = int(re.search(r'20\d{2}', marker['text']).group(0))
+                        temporal_markers['years'].append(year_val)
+                    except (AttributeError, ValueError, TypeError):
+                        # If year extraction fails (e.g., no match or invalid int), skip this marker
+                        logging.debug(f"Failed to extract year from marker text: {marker['text']!r}")
+                elif marker['type'] in ['DATE', 'MONTH_YEAR']:
+                    temporal_markers['dates'].append(marker['text'])
+                elif marker['type'] == 'HORIZON':
+                    temporal_markers['horizons'].append(marker['text'])
+                elif marker['type'] in ['PERIOD', 'SIGNAL_TEMPORAL']:
+                    temporal_markers['phases'].append(marker['text'])
+        
+        # Extract temporal markers with base patterns
+        for pattern, marker_type in TEMPORAL_PATTERNS:
+            matches = re.findall(pattern, chunk_text, re.IGNORECASE)
+            for match in matches:
+                if marker_type == 'year':
+                    temporal_markers['years'].append(int(match) if match.isdigit() else match)
+                elif marker_type == 'horizon':
+                    temporal_markers['horizons'].append(match)
+                elif marker_type == 'phase':
+                    temporal_markers['phases'].append(match)
+                else:
+                    temporal_markers['dates'].append(str(match))
         
-        # Sort timeline by temporal order
-        timeline.sort(key=lambda x: (min(x['years']) if x['years'] else 9999, x['order']))
+        # Extract verb sequence for temporal ordering
+        chunk_lower = chunk_text.lower()
+        for verb, order in VERB_SEQUENCES.items():
+            if verb in chunk_lower:
+                temporal_markers['verb_sequence'].append((verb, order))
         
-        logger.info(f"SP8: Extracted temporal markers from {len(timeline)} chunks with temporal content")
+        # Calculate temporal order score
+        if temporal_markers['verb_sequence']:
+            temporal_markers['temporal_order'] = min(v[1] for v in temporal_markers['verb_sequence'])
         
-        return Temporal(timeline=timeline)
+        return temporal_markers
 
-    def _execute_sp9_discourse(self, chunks: List[Chunk], arguments: Arguments) -> Discourse:
+    def _execute_sp9_discourse(
+        self,
+        chunks: List[Chunk],
+        arguments: Arguments,
+        results: Optional[List[Dict[str, Any]]] = None,
+    ) -> Discourse:
         """
         SP9: Discourse Analysis per FORCING ROUTE SECCIÓN 6.5.
         [EXEC-SP9-001] through [EXEC-SP9-003]
@@ -2860,8 +3117,21 @@ class Phase1CPPIngestionFullContract:
         """
         logger.info("SP9: Starting discourse analysis")
         
+        if results is None:
+            results = self._map_chunk_kernels(chunks, [("_sp9_chunk_discourse", ())])["_sp9_chunk_discourse"][0]
+        
         discourse_patterns = {}
+        for chunk, pattern in zip(chunks, results):
+            chunk.discourse_mode = pattern['mode']
+            chunk.rhetorical_strategies = pattern['rhetorical_strategies']
+            discourse_patterns[chunk.chunk_id] = pattern
+        
+        logger.info(f"SP9: Analyzed discourse for {len(discourse_patterns)} chunks")
         
+        return Discourse(patterns=discourse_patterns)
+
+    def _sp9_chunk_discourse(self, chunk: Chunk) -> Dict[str, Any]:
+        """SP9 kernel: dominant discourse mode and rhetorical strategies of one chunk."""
         # Discourse mode indicators
         DISCOURSE_MODES = {
             'narrative': ['se realizó', 'se llevó a cabo', 'se implementó', 'historia', 'antecedentes'],
@@ -2880,57 +3150,49 @@ class Phase1CPPIngestionFullContract:
             ('emphasis', r'(?:es importante|cabe destacar|es fundamental|resulta esencial)'),
         ]
         
-        for chunk in chunks:
-            chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
-            chunk_lower = chunk_text.lower()
-            pa_id = chunk.policy_area_id
-            
-            # Determine dominant discourse mode
-            mode_scores = {}
-            for mode, indicators in DISCOURSE_MODES.items():
-                score = sum(1 for ind in indicators if ind in chunk_lower)
-                mode_scores[mode] = score
-            
-            # SIGNAL ENRICHMENT: Boost discourse detection with signal patterns
-            if self.signal_enricher is not None and pa_id in self.signal_enricher.context.signal_packs:
-                signal_pack = self.signal_enricher.context.signal_packs[pa_id]
-                
-                # Check for signal patterns that indicate specific discourse modes
-                for pattern in signal_pack.patterns[:MAX_SIGNAL_PATTERNS_DISCOURSE]:
-                    pattern_lower = pattern.lower()
-                    try:
-                        if re.search(pattern, chunk_lower, re.IGNORECASE):
-                            # Classify pattern-based discourse hints
-                            if any(kw in pattern_lower for kw in ['debe', 'deberá', 'requiere', 'obligator']):
-                                mode_scores['injunctive'] = mode_scores.get('injunctive', 0) + DISCOURSE_SIGNAL_BOOST_INJUNCTIVE
-                            elif any(kw in pattern_lower for kw in ['por tanto', 'debido', 'porque']):
-                                mode_scores['argumentative'] = mode_scores.get('argumentative', 0) + DISCOURSE_SIGNAL_BOOST_ARGUMENTATIVE
-                            elif any(kw in pattern_lower for kw in ['define', 'consiste', 'significa']):
-                                mode_scores['expository'] = mode_scores.get('expository', 0) + DISCOURSE_SIGNAL_BOOST_EXPOSITORY
-                    except re.error:
-                        continue
-            
-            # Select mode with highest score, default to 'expository'
-            dominant_mode = max(mode_scores.keys(), key=lambda k: mode_scores[k]) if max(mode_scores.values()) > 0 else 'expository'
-            
-            # Extract rhetorical strategies
-            rhetorical_strategies = []
-            for strategy, pattern in RHETORICAL_PATTERNS:
-                if re.search(pattern, chunk_lower):
-                    rhetorical_strategies.append(strategy)
-            
-            chunk.discourse_mode = dominant_mode
-            chunk.rhetorical_strategies = rhetorical_strategies
-            
-            discourse_patterns[chunk.chunk_id] = {
-                'mode': dominant_mode,
-                'mode_scores': mode_scores,
-                'rhetorical_strategies': rhetorical_strategies
-            }
+        chunk_text = chunk.segmentation_metadata.get('text', '') if hasattr(chunk, 'segmentation_metadata') else ''
+        chunk_lower = chunk_text.lower()
+        pa_id = chunk.policy_area_id
         
-        logger.info(f"SP9: Analyzed discourse for {len(discourse_patterns)} chunks")
+        # Determine dominant discourse mode
+        mode_scores = {}
+        for mode, indicators in DISCOURSE_MODES.items():
+            score = sum(1 for ind in indicators if ind in chunk_lower)
+            mode_scores[mode] = score
         
-        return Discourse(patterns=discourse_patterns)
+        # SIGNAL ENRICHMENT: Boost discourse detection with signal patterns
+        if self.signal_enricher is not None and pa_id in self.signal_enricher.context.signal_packs:
+            signal_pack = self.signal_enricher.context.signal_packs[pa_id]
+            
+            # Check for signal patterns that indicate specific discourse modes
+            for pattern in signal_pack.patterns[:MAX_SIGNAL_PATTERNS_DISCOURSE]:
+                pattern_lower = pattern.lower()
+                try:
+                    if re.search(pattern, chunk_lower, re.IGNORECASE):
+                        # Classify pattern-based discourse hints
+                        if any(kw in pattern_lower for kw in ['debe', 'deberá', 'requiere', 'obligator']):
+                            mode_scores['injunctive'] = mode_scores.get('injunctive', 0) + DISCOURSE_SIGNAL_BOOST_INJUNCTIVE
+                        elif any(kw in pattern_lower for kw in ['por tanto', 'debido', 'porque']):
+                            mode_scores['argumentative'] = mode_scores.get('argumentative', 0) + DISCOURSE_SIGNAL_BOOST_ARGUMENTATIVE
+                        elif any(kw in pattern_lower for kw in ['define', 'consiste', 'significa']):
+                            mode_scores['expository'] = mode_scores.get('expository', 0) + DISCOURSE_SIGNAL_BOOST_EXPOSITORY
+                except re.error:
+                    continue
+        
+        # Select mode with highest score, default to 'expository'
+        dominant_mode = max(mode_scores.keys(), key=lambda k: mode_scores[k]) if max(mode_scores.values()) > 0 else 'expository'
+        
+        # Extract rhetorical strategies
+        rhetorical_strategies = []
+        for strategy, pattern in RHETORICAL_PATTERNS:
+            if re.search(pattern, chunk_lower):
+                rhetorical_strategies.append(strategy)
+        
+        return {
+            'mode': dominant_mode,
+            'mode_scores': mode_scores,
+            'rhetorical_strategies': rhetorical_strategies
+        }
 
     def _execute_sp10_strategic(self, chunks: List[Chunk], integrated: IntegratedCausal, arguments: Arguments, temporal: Temporal, discourse: Discourse) -> Strategic:
         """
@@ -2940,8 +3202,35 @@ class Phase1CPPIngestionFullContract:
         """
         logger.info("SP10: Starting strategic integration")
         
+        # Get cross-chunk link counts
+        cross_link_counts = {}
+        if integrated.global_graph and 'cross_chunk_links' in integrated.global_graph:
+            for link in integrated.global_graph['cross_chunk_links']:
+                cross_link_counts[link['source']] = cross_link_counts.get(link['source'], 0) + 1
+                cross_link_counts[link['target']] = cross_link_counts.get(link['target'], 0) + 1
+        
+        max_links = max(cross_link_counts.values()) if cross_link_counts else 1
+        
+        jobs = [("_sp10_chunk_priority", (arguments, cross_link_counts, max_links))]
+        results = self._map_chunk_kernels(chunks, jobs)["_sp10_chunk_priority"][0]
+        
         priorities = {}
+        for chunk, (rank, priority) in zip(chunks, results):
+            chunk.strategic_rank = rank
+            priorities[chunk.chunk_id] = priority
+        
+        logger.info(f"SP10: Calculated strategic priorities for {len(priorities)} chunks")
         
+        return Strategic(priorities=priorities)
+
+    def _sp10_chunk_priority(
+        self,
+        chunk: Chunk,
+        arguments: Arguments,
+        cross_link_counts: Dict[str, int],
+        max_links: int,
+    ) -> Tuple[int, Dict[str, Any]]:
+        """SP10 kernel: weighted strategic rank (0-100) and score components of one chunk."""
         # Weight factors for strategic importance
         WEIGHTS = {
             'causal_density': 0.25,      # More causal links = higher importance
@@ -2951,84 +3240,70 @@ class Phase1CPPIngestionFullContract:
             'cross_link_centrality': 0.25,    # More cross-chunk links = central
         }
         
-        # Get cross-chunk link counts
-        cross_link_counts = {}
-        if integrated.global_graph and 'cross_chunk_links' in integrated.global_graph:
-            for link in integrated.global_graph['cross_chunk_links']:
-                cross_link_counts[link['source']] = cross_link_counts.get(link['source'], 0) + 1
-                cross_link_counts[link['target']] = cross_link_counts.get(link['target'], 0) + 1
+        # Calculate component scores
         
-        max_links = max(cross_link_counts.values()) if cross_link_counts else 1
+        # Causal density
+        causal_count = len(chunk.causal_graph.events) if chunk.causal_graph else 0
+        causal_score = min(1.0, causal_count / 5)
         
-        for chunk in chunks:
-            # Calculate component scores
-            
-            # Causal density
-            causal_count = len(chunk.causal_graph.events) if chunk.causal_graph else 0
-            causal_score = min(1.0, causal_count / 5)
-            
-            # Temporal urgency (lower temporal order = more urgent)
-            temporal_order = chunk.temporal_markers.get('temporal_order', 5) if chunk.temporal_markers else 5
-            temporal_score = max(0, 1.0 - (temporal_order / 10))
-            
-            # Argument strength
-            arg_data = arguments.arguments_map.get(chunk.chunk_id, {})
-            evidence_count = len(arg_data.get('evidence', [])) if isinstance(arg_data, dict) else 0
-            argument_score = min(1.0, evidence_count / 3)
-            
-            # SIGNAL ENRICHMENT: Boost argument score with signal-based evidence
-            signal_boost = 0.0
-            if self.signal_enricher is not None and isinstance(arg_data, dict):
-                # Check for signal-enhanced evidence
-                for ev in arg_data.get('evidence', []):
-                    if isinstance(ev, dict) and ev.get('signal_score') is not None:
-                        signal_boost += ev['signal_score'] * 0.1  # Boost from signal-enhanced evidence
-                argument_score = min(1.0, argument_score + signal_boost)
-            
-            # Discourse actionability
-            actionable_modes = {'injunctive', 'performative', 'argumentative'}
-            discourse_score = 1.0 if chunk.discourse_mode in actionable_modes else 0.3
-            
-            # Cross-link centrality
-            link_count = cross_link_counts.get(chunk.chunk_id, 0)
-            centrality_score = link_count / max_links if max_links > 0 else 0
-            
-            # SIGNAL ENRICHMENT: Add signal quality boost to strategic priority
-            signal_quality_boost = 0.0
-            if self.signal_enricher is not None:
-                pa_id = chunk.policy_area_id
-                if pa_id in self.signal_enricher.context.quality_metrics:
-                    metrics = self.signal_enricher.context.quality_metrics[pa_id]
-                    # Boost based on signal quality tier using module constant
-                    signal_quality_boost = SIGNAL_QUALITY_TIER_BOOSTS.get(metrics.coverage_tier, 0.0)
-            
-            # Calculate weighted strategic priority
-            strategic_priority = (
-                WEIGHTS['causal_density'] * causal_score +
-                WEIGHTS['temporal_urgency'] * temporal_score +
-                WEIGHTS['argument_strength'] * argument_score +
-                WEIGHTS['discourse_actionability'] * discourse_score +
-                WEIGHTS['cross_link_centrality'] * centrality_score +
-                signal_quality_boost  # Additional boost from signal quality
-            )
-            
-            # Normalize to 0-100 scale
-            chunk.strategic_rank = int(strategic_priority * 100)
-            
-            priorities[chunk.chunk_id] = {
-                'rank': chunk.strategic_rank,
-                'components': {
-                    'causal': causal_score,
-                    'temporal': temporal_score,
-                    'argument': argument_score,
-                    'discourse': discourse_score,
-                    'centrality': centrality_score
-                }
-            }
+        # Temporal urgency (lower temporal order = more urgent)
+        temporal_order = chunk.temporal_markers.get('temporal_order', 5) if chunk.temporal_markers else 5
+        temporal_score = max(0, 1.0 - (temporal_order / 10))
         
-        logger.info(f"SP10: Calculated strategic priorities for {len(priorities)} chunks")
+        # Argument strength
+        arg_data = arguments.arguments_map.get(chunk.chunk_id, {})
+        evidence_count = len(arg_data.get('evidence', [])) if isinstance(arg_data, dict) else 0
+        argument_score = min(1.0, evidence_count / 3)
         
-        return Strategic(priorities=priorities)
+        # SIGNAL ENRICHMENT: Boost argument score with signal-based evidence
+        signal_boost = 0.0
+        if self.signal_enricher is not None and isinstance(arg_data, dict):
+            # Check for signal-enhanced evidence
+            for ev in arg_data.get('evidence', []):
+                if isinstance(ev, dict) and ev.get('signal_score') is not None:
+                    signal_boost += ev['signal_score'] * 0.1  # Boost from signal-enhanced evidence
+            argument_score = min(1.0, argument_score + signal_boost)
+        
+        # Discourse actionability
+        actionable_modes = {'injunctive', 'performative', 'argumentative'}
+        discourse_score = 1.0 if chunk.discourse_mode in actionable_modes else 0.3
+        
+        # Cross-link centrality
+        link_count = cross_link_counts.get(chunk.chunk_id, 0)
+        centrality_score = link_count / max_links if max_links > 0 else 0
+        
+        # SIGNAL ENRICHMENT: Add signal quality boost to strategic priority
+        signal_quality_boost = 0.0
+        if self.signal_enricher is not None:
+            pa_id = chunk.policy_area_id
+            if pa_id in self.signal_enricher.context.quality_metrics:
+                metrics = self.signal_enricher.context.quality_metrics[pa_id]
+                # Boost based on signal quality tier using module constant
+                signal_quality_boost = SIGNAL_QUALITY_TIER_BOOSTS.get(metrics.coverage_tier, 0.0)
+        
+        # Calculate weighted strategic priority
+        strategic_priority = (
+            WEIGHTS['causal_density'] * causal_score +
+            WEIGHTS['temporal_urgency'] * temporal_score +
+            WEIGHTS['argument_strength'] * argument_score +
+            WEIGHTS['discourse_actionability'] * discourse_score +
+            WEIGHTS['cross_link_centrality'] * centrality_score +
+            signal_quality_boost  # Additional boost from signal quality
+        )
+        
+        # Normalize to 0-100 scale
+        rank = int(strategic_priority * 100)
+        
+        return rank, {
+            'rank': rank,
+            'components': {
+                'causal': causal_score,
+                'temporal': temporal_score,
+                'argument': argument_score,
+                'discourse': discourse_score,
+                'centrality': centrality_score
+            }
+        }
 
     def _smartchunk_kwargs_filter(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -3808,6 +4083,9 @@ def execute_phase_1_with_full_contract(
     canonical_input: CanonicalInput,
     signal_registry: Optional[Any] = None,
     structural_profile: PDMStructuralProfile | None = None,
+    max_workers: int = 1,
+    use_processes: bool = False,
+    metrics_collector: Optional[Any] = None,
 ) -> CanonPolicyPackage:
     """
     EXECUTE PHASE 1 WITH COMPLETE CONTRACT ENFORCEMENT
@@ -3822,6 +4100,9 @@ def execute_phase_1_with_full_contract(
         canonical_input: Validated input with PDF and questionnaire metadata
         signal_registry: QuestionnaireSignalRegistry from Factory (injected via Orchestrator)
                         If None, Phase 1 runs in degraded mode with default signal packs
+        max_workers: Chunk-parallel workers for SP5-SP10 (1 = sequential)
+        use_processes: Use worker processes instead of threads
+        metrics_collector: Optional Phase1MetricsCollector receiving per-subphase timings
     
     Returns:
         CanonPolicyPackage with 60 chunks (PA×DIM coordinates)
@@ -3831,6 +4112,9 @@ def execute_phase_1_with_full_contract(
         executor = Phase1CPPIngestionFullContract(
             signal_registry=signal_registry,
             structural_profile=structural_profile,
+            max_workers=max_workers,
+            use_processes=use_processes,
+            metrics_collector=metrics_collector,
         )
         
         # Log policy compliance
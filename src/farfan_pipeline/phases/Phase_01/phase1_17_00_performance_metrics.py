@@ -88,6 +88,8 @@ class Phase1Metrics:
         total_duration_ms: Total execution duration in milliseconds
         subphase_metrics: List of individual subphase metrics
         aggregate_stats: Computed aggregate statistics
+        cache_metrics: Counters reported by caches used during the phase
+            (e.g. the document extraction cache), keyed by cache name
         metadata: Additional execution metadata
     """
 
@@ -98,6 +100,7 @@ class Phase1Metrics:
     total_duration_ms: float = 0.0
     subphase_metrics: List[SubphaseMetrics] = field(default_factory=list)
     aggregate_stats: Dict[str, Any] = field(default_factory=dict)
+    cache_metrics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -110,6 +113,7 @@ class Phase1Metrics:
             "total_duration_ms": self.total_duration_ms,
             "subphase_metrics": [m.to_dict() for m in self.subphase_metrics],
             "aggregate_stats": self.aggregate_stats,
+            "cache_metrics": self.cache_metrics,
             "metadata": self.metadata,
         }
 
@@ -233,6 +237,16 @@ class Phase1MetricsCollector:
         with self._lock:
             self._metrics.subphase_metrics.append(metrics)
 
+    def record_cache_metrics(self, cache_name: str, metrics: Dict[str, Any]) -> None:
+        """Record the counters of a cache used during Phase 1.
+
+        Args:
+            cache_name: Cache identifier (e.g., "extraction_cache")
+            metrics: Counters as returned by the cache's get_metrics()
+        """
+        with self._lock:
+            self._metrics.cache_metrics[cache_name] = dict(metrics)
+
     def get_metrics(self) -> Phase1Metrics:
         """Get the current metrics snapshot.
 
@@ -7,12 +7,17 @@ Lifecycle State: ACTIVE
 
 SPEC-001: Enforces character limit with audit trail.
 SPEC-003: Streaming extraction minimizes memory footprint.
+
+Page texts are read from the shared parsed-document artifact, so the PDF is
+parsed once per content hash no matter how many extractions run over it.
 """
 
 import logging
 from collections.abc import Generator
 from pathlib import Path
 
+from farfan_pipeline.infrastructure.parsed_document_store import open_parsed_document
+
 from ..PHASE_1_CONSTANTS import PDF_EXTRACTION_CHAR_LIMIT, PHASE1_LOGGER_NAME
 
 try:
@@ -30,12 +35,13 @@ class StreamingPDFExtractor:
     Extracts text from PDFs in a streaming fashion to minimize memory usage.
 
     Resource Management:
-        All PDF document handles are guaranteed to be closed via try/finally blocks,
-        even when exceptions occur during iteration.
+        The PDF is never held open: pages are decoded one at a time from the
+        memory-mapped parsed-document artifact owned by the shared store.
     """
 
-    def __init__(self, pdf_path: Path) -> None:
+    def __init__(self, pdf_path: Path, sha256: str | None = None) -> None:
         self.pdf_path = pdf_path
+        self.sha256 = sha256
 
     def extract_text_stream(self) -> Generator[str, None, None]:
         """
@@ -51,14 +57,8 @@ class StreamingPDFExtractor:
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {self.pdf_path}")
 
-        doc = None
         try:
-            doc = fitz.open(self.pdf_path)
-            try:
-                for page in doc:
-                    yield page.get_text()
-            finally:
-                doc.close()
+            yield from open_parsed_document(self.pdf_path, sha256=self.sha256).iter_page_texts()
         except Exception:
             logger.exception(f"Error during streaming PDF extraction from {self.pdf_path}")
             raise
@@ -83,10 +83,8 @@ class StreamingPDFExtractor:
             FileNotFoundError: If PDF file does not exist.
 
         Note:
-            DESIGN TRADE-OFF (see docs/TRADE_OFFS.md):
-            After truncation, iteration continues to count total_length for audit accuracy.
-            This is a deliberate trade-off:  audit completeness vs. early termination.
-            For extremely large PDFs (>10M chars), consider sampling-based estimation.
+            The total_length audit comes from the artifact's per-page character
+            counts, so pages past the limit are never decoded.
         """
         if not PYMUPDF_AVAILABLE:
             raise RuntimeError("PyMuPDF (fitz) is not installed. Cannot extract PDF text.")
@@ -96,30 +94,19 @@ class StreamingPDFExtractor:
 
         text_builder: list[str] = []
         current_length = 0
-        total_length = 0
-        truncated = False
 
-        doc = None
         try:
-            doc = fitz.open(self.pdf_path)
-            try:
-                for page in doc:
-                    page_text = page.get_text()
-                    page_len = len(page_text)
-                    total_length += page_len
-
-                    if not truncated:
-                        if current_length + page_len <= char_limit:
-                            text_builder.append(page_text)
-                            current_length += page_len
-                        else:
-                            remaining = char_limit - current_length
-                            text_builder.append(page_text[:remaining])
-                            current_length += remaining
-                            truncated = True
-                    # After truncation:  continue counting total_length only
-            finally:
-                doc.close()
+            doc = open_parsed_document(self.pdf_path, sha256=self.sha256)
+            total_length = sum(doc.page_char_counts)
+            for page, page_len in enumerate(doc.page_char_counts):
+                if current_length + page_len <= char_limit:
+                    text_builder.append(doc.page_text(page))
+                    current_length += page_len
+                else:
+                    remaining = char_limit - current_length
+                    text_builder.append(doc.page_text(page)[:remaining])
+                    current_length += remaining
+                    break
 
             return "".join(text_builder), current_length, total_length
 
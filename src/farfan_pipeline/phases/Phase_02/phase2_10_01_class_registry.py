@@ -3,6 +3,17 @@
 Module: phase2_10_01_class_registry
 PHASE_LABEL: Phase 2
 Sequence: X
+
+Two modes:
+- Eager (default): every module in ``_CLASS_PATHS`` is imported up front
+- Lazy (``build_class_registry(lazy=True)`` or ``FARFAN_LAZY_CLASS_REGISTRY=1``):
+  each entry is a proxy class that imports its module on first attribute
+  access, call or isinstance check. Availability is decided from a prebuilt
+  dependency manifest (class path -> third-party modules it imports) and
+  ``importlib.util.find_spec``, so building the registry imports nothing
+
+Manifest build step:
+    python scripts/generation/build_class_registry_manifest.py
 """
 from __future__ import annotations
 
@@ -16,16 +27,27 @@ __stage__ = 10
 __order__ = 1
 __author__ = "F.A.R.F.A.N Core Team"
 __created__ = "2026-01-10"
-__modified__ = "2026-01-10"
+__modified__ = "2026-10-16"
 __criticality__ = "CRITICAL"
 __execution_pattern__ = "On-Demand"
 
+import ast
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
 from importlib import import_module
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+logger = logging.getLogger(__name__)
+
 
 class ClassRegistryError(RuntimeError):
     """Raised when one or more classes cannot be loaded."""
@@ -119,12 +141,138 @@ _CLASS_PATHS: Mapping[str, str] = {
 }
 
 
-def build_class_registry() -> dict[str, type[object]]:
+# Third-party modules whose absence skips a class instead of failing the registry.
+OPTIONAL_DEPENDENCIES: tuple[str, ...] = (
+    "torch",
+    "tensorflow",
+    "pyarrow",
+    "img2table",
+    "sentence_transformers",
+    "transformers",
+    "spacy",
+    "pymc",
+    "arviz",
+    "dowhy",
+    "econml",
+)
+
+LAZY_REGISTRY_ENV_VAR = "FARFAN_LAZY_CLASS_REGISTRY"
+DEPENDENCY_MANIFEST_PATH = (
+    Path(__file__).resolve().parent / "registries" / "class_registry_manifest.json"
+)
+_SRC_ROOT = Path(__file__).resolve().parents[3]
+
+_resolve_lock = threading.RLock()
+
+
+class _LazyClassMeta(type):
+    """Metaclass of lazy registry proxies.
+
+    A proxy is itself a class (so ``isinstance(proxy, type)`` holds for wiring
+    checks) whose attribute lookups, calls and isinstance/issubclass checks are
+    forwarded to the real class, imported on first use.
+    """
+
+    _OWN_ATTRIBUTES = frozenset(
+        {
+            "__name__",
+            "__qualname__",
+            "__module__",
+            "__lazy_path__",
+            "__lazy_target__",
+            "_lazy_resolve",
+        }
+    )
+
+    def __getattribute__(cls, name: str) -> Any:
+        if name in _LazyClassMeta._OWN_ATTRIBUTES:
+            return type.__getattribute__(cls, name)
+        if name == "__signature__":
+            # inspect.signature would otherwise report the metaclass __call__
+            return inspect.signature(cls._lazy_resolve())
+        return getattr(cls._lazy_resolve(), name)
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        return cls._lazy_resolve()(*args, **kwargs)
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        return isinstance(instance, cls._lazy_resolve())
+
+    def __subclasscheck__(cls, subclass: type) -> bool:
+        return issubclass(subclass, cls._lazy_resolve())
+
+    def __repr__(cls) -> str:
+        state = "resolved" if cls.__lazy_target__ is not None else "unresolved"
+        return f"<lazy class '{cls.__lazy_path__}' ({state})>"
+
+    def _lazy_resolve(cls) -> type:
+        """Import and return the real class (once; thread-safe).
+
+        Raises:
+            ClassRegistryError: If the module cannot be imported or the
+                attribute is missing or not a class
+        """
+        target = cls.__lazy_target__
+        if target is not None:
+            return target
+        with _resolve_lock:
+            target = cls.__lazy_target__
+            if target is None:
+                target = _import_class(cls.__lazy_path__)
+                type.__setattr__(cls, "__lazy_target__", target)
+        return target
+
+
+def _import_class(path: str) -> type:
+    module_name, _, class_name = path.rpartition(".")
+    cause: Exception | None = None
+    try:
+        attr = getattr(import_module(module_name), class_name)
+    except ImportError as exc:
+        reason, cause = f"import error: {exc}", exc
+    except AttributeError as exc:
+        reason, cause = "attribute missing", exc
+    else:
+        if isinstance(attr, type):
+            return attr
+        reason = f"attribute is not a class: {type(attr).__name__}"
+    raise ClassRegistryError(f"Failed to load orchestrator class {path} ({reason})") from cause
+
+
+def _lazy_class(path: str) -> type[object]:
+    module_name, _, class_name = path.rpartition(".")
+    return _LazyClassMeta(
+        class_name,
+        (),
+        {
+            "__module__": module_name,
+            "__qualname__": class_name,
+            "__lazy_path__": path,
+            "__lazy_target__": None,
+        },
+    )
+
+
+def _lazy_mode_from_env() -> bool:
+    return os.environ.get(LAZY_REGISTRY_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def build_class_registry(lazy: bool | None = None) -> dict[str, type[object]]:
     """Return a mapping of class names to loaded types, validating availability.
 
     Classes that depend on optional dependencies (e.g., torch) are skipped
     gracefully if those dependencies are not available.
+
+    Args:
+        lazy: Return import-on-first-use proxies checked against the dependency
+              manifest instead of importing every module. None reads
+              ``FARFAN_LAZY_CLASS_REGISTRY`` (default: eager)
     """
+    if lazy is None:
+        lazy = _lazy_mode_from_env()
+    if lazy:
+        return _build_lazy_class_registry()
+
     resolved: dict[str, type[object]] = {}
     missing: dict[str, str] = {}
     skipped_optional: dict[str, str] = {}
@@ -139,20 +287,7 @@ def build_class_registry() -> dict[str, type[object]]:
         except ImportError as exc:
             exc_str = str(exc)
             # Check if this is an optional dependency error
-            optional_deps = [
-                "torch",
-                "tensorflow",
-                "pyarrow",
-                "img2table",
-                "sentence_transformers",
-                "transformers",
-                "spacy",
-                "pymc",
-                "arviz",
-                "dowhy",
-                "econml",
-            ]
-            if any(opt_dep in exc_str for opt_dep in optional_deps):
+            if any(opt_dep in exc_str for opt_dep in OPTIONAL_DEPENDENCIES):
                 # Mark as skipped optional rather than missing
                 skipped_optional[name] = f"{path} (optional dependency: {exc})"
             else:
@@ -168,11 +303,51 @@ def build_class_registry() -> dict[str, type[object]]:
             else:
                 resolved[name] = attr
 
+    return _finish_registry(resolved, missing, skipped_optional)
+
+
+def _build_lazy_class_registry() -> dict[str, type[object]]:
+    """Lazy counterpart of ``build_class_registry``: decides availability without importing."""
+    manifest = load_dependency_manifest()
+    unlisted = {name: path for name, path in _CLASS_PATHS.items() if path not in manifest}
+    if unlisted:
+        logger.warning(
+            f"Class registry manifest is missing {len(unlisted)} class paths; "
+            "scanning their sources. Regenerate it with "
+            "scripts/generation/build_class_registry_manifest.py"
+        )
+        manifest = {**manifest, **generate_dependency_manifest(unlisted)}
+
+    resolved: dict[str, type[object]] = {}
+    missing: dict[str, str] = {}
+    skipped_optional: dict[str, str] = {}
+    proxies: dict[str, type[object]] = {}
+
+    for name, path in _CLASS_PATHS.items():
+        if "." not in path:
+            missing[name] = path
+            continue
+        unavailable = [dep for dep in manifest[path] if not _dependency_available(dep)]
+        if any(dep in OPTIONAL_DEPENDENCIES for dep in unavailable):
+            skipped_optional[name] = f"{path} (optional dependency: {', '.join(unavailable)})"
+        elif unavailable:
+            missing[name] = f"{path} (missing dependency: {', '.join(unavailable)})"
+        else:
+            # Aliases of one class path share one proxy, as they share one class
+            if path not in proxies:
+                proxies[path] = _lazy_class(path)
+            resolved[name] = proxies[path]
+
+    return _finish_registry(resolved, missing, skipped_optional)
+
+
+def _finish_registry(
+    resolved: dict[str, type[object]],
+    missing: dict[str, str],
+    skipped_optional: dict[str, str],
+) -> dict[str, type[object]]:
     # Log skipped optional dependencies
     if skipped_optional:
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.info(
             f"Skipped {len(skipped_optional)} optional classes due to missing dependencies: "
             f"{', '.join(skipped_optional.keys())}"
@@ -184,6 +359,211 @@ def build_class_registry() -> dict[str, type[object]]:
     return resolved
 
 
+_dependency_available_cache: dict[str, bool] = {}
+
+
+def _dependency_available(top_level: str) -> bool:
+    """Whether a top-level module is importable, found without importing it."""
+    available = _dependency_available_cache.get(top_level)
+    if available is None:
+        try:
+            available = importlib.util.find_spec(top_level) is not None
+        except (ImportError, ValueError):
+            available = False
+        _dependency_available_cache[top_level] = available
+    return available
+
+
+# =============================================================================
+# DEPENDENCY MANIFEST
+# =============================================================================
+
+
+def load_dependency_manifest(path: Path | str = DEPENDENCY_MANIFEST_PATH) -> dict[str, list[str]]:
+    """Class path -> required third-party top-level modules, from the shipped manifest.
+
+    Returns an empty mapping when the manifest does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["classes"]
+
+
+def generate_dependency_manifest(
+    class_paths: Mapping[str, str] | None = None,
+) -> dict[str, list[str]]:
+    """Scan module sources for the third-party modules each class path needs.
+
+    Only unconditional module-level imports count: imports guarded by
+    ``try/except``, ``if`` blocks (including ``TYPE_CHECKING``) or made inside
+    functions and classes are optional by construction. First-party modules
+    under ``farfan_pipeline`` (and the parent packages they execute) are
+    followed transitively; nothing is imported.
+    """
+    class_paths = _CLASS_PATHS if class_paths is None else class_paths
+    module_deps: dict[str, set[str]] = {}
+    manifest: dict[str, list[str]] = {}
+    for path in sorted(set(class_paths.values())):
+        module_name = path.rpartition(".")[0]
+        manifest[path] = sorted(_transitive_dependencies(module_name, module_deps))
+    return manifest
+
+
+def write_dependency_manifest(path: Path | str = DEPENDENCY_MANIFEST_PATH) -> dict[str, list[str]]:
+    """Regenerate the dependency manifest for ``_CLASS_PATHS`` and write it to ``path``."""
+    manifest = generate_dependency_manifest()
+    payload = {
+        "description": "Class path -> third-party top-level modules imported unconditionally "
+        "at module level (transitively through farfan_pipeline)",
+        "generator": "scripts/generation/build_class_registry_manifest.py",
+        "optional_dependencies": list(OPTIONAL_DEPENDENCIES),
+        "classes": manifest,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=False)
+        f.write("\n")
+    return manifest
+
+
+def _module_source(module_name: str) -> Path | None:
+    base = _SRC_ROOT.joinpath(*module_name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _transitive_dependencies(module_name: str, cache: dict[str, set[str]]) -> set[str]:
+    """Third-party top-level modules required to import ``module_name``."""
+    stack = [module_name]
+    # Importing a module first executes every parent package's __init__
+    parts = module_name.split(".")
+    stack.extend(".".join(parts[:i]) for i in range(1, len(parts)))
+    seen: set[str] = set()
+    external: set[str] = set()
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        if name not in cache:
+            cache[name] = _scan_module_imports(name)
+        for imported in cache[name]:
+            top_level = imported.partition(".")[0]
+            if top_level == "farfan_pipeline":
+                stack.append(imported)
+                imported_parts = imported.split(".")
+                stack.extend(".".join(imported_parts[:i]) for i in range(1, len(imported_parts)))
+            else:
+                external.add(top_level)
+    return external
+
+
+_IMPORT_GUARDS = frozenset({"ImportError", "ModuleNotFoundError", "Exception", "BaseException"})
+
+
+def _scan_module_imports(module_name: str) -> set[str]:
+    """Names of modules that importing ``module_name`` requires.
+
+    First-party names are returned in full (to be followed); third-party
+    names only matter by their top-level package. Imports in ``try`` blocks
+    guarding ImportError are optional, so they are dropped; their handlers
+    are scanned instead when the block imports a first-party module that does
+    not exist (a legacy-path fallback that always runs), and a handler that
+    re-imports a module from the block requires it.
+    """
+    source = _module_source(module_name)
+    if source is None:
+        return set()
+    tree = ast.parse(source.read_text(encoding="utf-8"), filename=str(source))
+    package = module_name if source.name == "__init__.py" else module_name.rpartition(".")[0]
+
+    dependencies: set[str] = set()
+    _collect_imports(tree.body, package, dependencies, guarded=False)
+    return dependencies
+
+
+def _collect_imports(
+    body: list[ast.stmt], package: str, dependencies: set[str], guarded: bool
+) -> bool:
+    """Add the imports ``body`` executes to ``dependencies``.
+
+    Returns whether ``body`` imports a first-party module that does not exist.
+    """
+    unresolved = False
+    for node in body:
+        if isinstance(node, ast.Try):
+            catches_import = any(_handler_catches_import(handler) for handler in node.handlers)
+            fails = _collect_imports(node.body, package, dependencies, guarded or catches_import)
+            if catches_import:
+                attempted: set[str] = set()
+                _collect_imports(node.body, package, attempted, guarded)
+                for handler in node.handlers:
+                    fallback: set[str] = set()
+                    _collect_imports(handler.body, package, fallback, guarded)
+                    if fails:
+                        dependencies |= fallback
+                    else:
+                        # A handler retrying the module the block failed on fails the same way
+                        dependencies |= fallback & attempted
+            else:
+                unresolved |= fails
+            unresolved |= _collect_imports(node.finalbody, package, dependencies, guarded)
+            continue
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".")
+                base_parts = base_parts[: len(base_parts) - (node.level - 1)]
+                base = ".".join(base_parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            names = [base]
+            # "from package import submodule" executes the submodule too
+            if base.partition(".")[0] == "farfan_pipeline":
+                names.extend(
+                    f"{base}.{alias.name}"
+                    for alias in node.names
+                    if _module_source(f"{base}.{alias.name}") is not None
+                )
+        else:
+            # Imports under if blocks (TYPE_CHECKING included), functions and classes
+            # are conditional
+            continue
+
+        for name in names:
+            top_level = name.partition(".")[0]
+            if top_level == "farfan_pipeline":
+                if _module_source(name) is None and not _is_namespace_package(name):
+                    unresolved = True
+                elif not guarded and _module_source(name) is not None:
+                    dependencies.add(name)
+            elif (
+                not guarded
+                and top_level
+                and top_level != "__future__"
+                and top_level not in sys.stdlib_module_names
+            ):
+                dependencies.add(name)
+    return unresolved
+
+
+def _handler_catches_import(handler: ast.ExceptHandler) -> bool:
+    if handler.type is None:
+        return True
+    names = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    return any(isinstance(name, ast.Name) and name.id in _IMPORT_GUARDS for name in names)
+
+
+def _is_namespace_package(module_name: str) -> bool:
+    return _SRC_ROOT.joinpath(*module_name.split(".")).is_dir()
+
+
 def get_class_paths() -> Mapping[str, str]:
     """Expose the raw class path mapping for diagnostics."""
     return _CLASS_PATHS
@@ -6,10 +6,14 @@ PHASE_COMPONENT: Distributed Cache
 PHASE_ROLE: High-performance caching layer for method results and class instances
 
 Design Philosophy:
-- Content-addressable caching via SHA-256(method + args)
+- Content-addressable caching via BLAKE2b over a canonical, type-tagged
+  encoding of (method, args, kwargs); arguments without a stable encoding are
+  never cached (no ``default=str`` collisions)
 - TTL-based automatic eviction
 - Fallback-first design (no Redis dependency required)
-- Thread-safe LRU cache with statistics
+- Thread-safe LRU cache with statistics (IntelligentCache, in-process)
+- Cross-process LRU/TTL cache on a local SQLite file (SharedSQLiteCache),
+  shared by process pools and concurrent pipeline workers on one host
 - Zero-overhead for cache misses
 
 Performance Impact:
@@ -41,15 +45,21 @@ __execution_pattern__ = "On-Demand"
 
 
 
+import dataclasses
 import hashlib
-import json
+import inspect
 import logging
+import os
+import pickle
+import sqlite3
 import threading
 import time
 from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
+from enum import Enum
 from functools import wraps
+from pathlib import Path, PurePath
 from typing import Any, Generic, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -57,6 +67,121 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# =============================================================================
+# KEY DERIVATION
+# =============================================================================
+
+
+class UncacheableKeyError(TypeError):
+    """Raised when a call has no stable, process-independent key."""
+
+
+def _qualified_name(obj_type: type) -> bytes:
+    return f"{obj_type.__module__}.{obj_type.__qualname__}".encode()
+
+
+def _encode_canonical(value: Any, out: list[bytes]) -> None:
+    """Append a type-tagged, order-independent encoding of ``value`` to ``out``.
+
+    Supported: None, bool, int, float, str, bytes, tuple, list, dict, set,
+    frozenset, Enum, Path, dataclasses, NumPy arrays/scalars and any object
+    exposing ``__cache_key__()``. Anything else raises UncacheableKeyError:
+    ``str(obj)`` is neither unique nor stable across processes.
+    """
+    if value is None:
+        out.append(b"N")
+    elif value is True:
+        out.append(b"T")
+    elif value is False:
+        out.append(b"F")
+    elif isinstance(value, Enum):
+        out.append(b"e" + _qualified_name(type(value)) + b":")
+        _encode_canonical(value.value, out)
+    elif hasattr(value, "__cache_key__"):
+        out.append(b"k" + _qualified_name(type(value)) + b":")
+        _encode_canonical(value.__cache_key__(), out)
+    elif isinstance(value, int):
+        out.append(b"i%d;" % value)
+    elif isinstance(value, float):
+        out.append(b"f" + value.hex().encode() + b";")
+    elif isinstance(value, str):
+        data = value.encode("utf-8", "surrogatepass")
+        out.append(b"s%d:" % len(data) + data)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        out.append(b"b%d:" % len(data) + data)
+    elif isinstance(value, (tuple, list)):
+        out.append(b"(" if isinstance(value, tuple) else b"[")
+        for item in value:
+            _encode_canonical(item, out)
+        out.append(b")")
+    elif isinstance(value, dict):
+        pairs = []
+        for key, item in value.items():
+            key_parts: list[bytes] = []
+            _encode_canonical(key, key_parts)
+            item_parts: list[bytes] = []
+            _encode_canonical(item, item_parts)
+            pairs.append((b"".join(key_parts), b"".join(item_parts)))
+        out.append(b"{%d:" % len(pairs))
+        for key_bytes, item_bytes in sorted(pairs):
+            out.append(key_bytes)
+            out.append(item_bytes)
+        out.append(b"}")
+    elif isinstance(value, (set, frozenset)):
+        members = []
+        for item in value:
+            parts: list[bytes] = []
+            _encode_canonical(item, parts)
+            members.append(b"".join(parts))
+        out.append(b"<%d:" % len(members))
+        out.extend(sorted(members))
+        out.append(b">")
+    elif isinstance(value, PurePath):
+        out.append(b"p")
+        _encode_canonical(str(value), out)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        out.append(b"d" + _qualified_name(type(value)) + b":")
+        _encode_canonical(
+            tuple((f.name, getattr(value, f.name)) for f in dataclasses.fields(value)), out
+        )
+    elif type(value).__module__ == "numpy" and hasattr(value, "dtype"):
+        if hasattr(value, "shape") and getattr(value, "ndim", 0) > 0:
+            array = value if value.flags["C_CONTIGUOUS"] else value.copy(order="C")
+            out.append(b"a" + array.dtype.str.encode() + repr(array.shape).encode() + b":")
+            out.append(array.tobytes())
+        else:
+            out.append(b"n" + value.dtype.str.encode() + b":")
+            _encode_canonical(value.item(), out)
+    else:
+        raise UncacheableKeyError(
+            f"No stable cache key for {type(value).__qualname__}; "
+            "define __cache_key__() to make it cacheable"
+        )
+
+
+def compute_cache_key(
+    method_name: str,
+    args: tuple = (),
+    kwargs: dict | None = None,
+) -> str:
+    """
+    Stable content-addressable key for a method call.
+
+    Identical across processes and interpreter runs (no ``hash()``, ``id()``
+    or ``str()`` of arbitrary objects is involved).
+
+    Returns:
+        32-character hex string (BLAKE2b-128)
+
+    Raises:
+        UncacheableKeyError: If an argument has no canonical encoding
+    """
+    parts: list[bytes] = []
+    _encode_canonical((method_name, tuple(args), kwargs or {}), parts)
+    return hashlib.blake2b(b"".join(parts), digest_size=16).hexdigest()
+
+
 @dataclass
 class CacheEntry(Generic[T]):
     """Cache entry with TTL and access tracking."""
@@ -93,6 +218,7 @@ class CacheStatistics:
     evictions: int = 0
     expirations: int = 0
     total_queries: int = 0
+    cross_process_hits: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -101,6 +227,13 @@ class CacheStatistics:
             return 0.0
         return self.hits / self.total_queries
 
+    @property
+    def cross_process_hit_rate(self) -> float:
+        """Fraction of queries answered by a value another process stored."""
+        if self.total_queries == 0:
+            return 0.0
+        return self.cross_process_hits / self.total_queries
+
     @property
     def miss_rate(self) -> float:
         """Calculate cache miss rate."""
@@ -156,9 +289,7 @@ class IntelligentCache:
         kwargs: dict | None = None,
     ) -> str:
         """
-        Compute content-addressable cache key.
-
-        Key = SHA-256(method_name + canonical_args)
+        Compute content-addressable cache key (see compute_cache_key).
 
         Args:
             method_name: Name of method being cached
@@ -166,20 +297,12 @@ class IntelligentCache:
             kwargs: Keyword arguments
 
         Returns:
-            64-character hex string (SHA-256)
-        """
-        kwargs = kwargs or {}
-
-        # Canonical representation
-        canonical = {
-            "method": method_name,
-            "args": args,
-            "kwargs": sorted(kwargs.items()),
-        }
+            32-character hex string (BLAKE2b-128)
 
-        # Serialize and hash
-        serialized = json.dumps(canonical, sort_keys=True, default=str)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        Raises:
+            UncacheableKeyError: If an argument has no canonical encoding
+        """
+        return compute_cache_key(method_name, args, kwargs)
 
     def get(
         self,
@@ -257,7 +380,7 @@ class IntelligentCache:
             ttl: TTL in seconds (None = use default)
 
         Returns:
-            Cache key (SHA-256 hex)
+            Cache key (BLAKE2b hex)
         """
         key = self._compute_key(method_name, args, kwargs)
         ttl = ttl if ttl is not None else self._default_ttl
@@ -290,6 +413,29 @@ class IntelligentCache:
 
             return key
 
+    def put_if_absent(
+        self,
+        method_name: str,
+        value: Any,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        ttl: float | None = None,
+    ) -> tuple[bool, Any]:
+        """
+        Atomically store ``value`` unless a live entry already exists.
+
+        Returns:
+            (stored, current_value): ``stored`` is False when another caller
+            won, in which case ``current_value`` is the value it stored
+        """
+        key = self._compute_key(method_name, args, kwargs)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and not entry.is_expired():
+                return False, entry.value
+            self.put(method_name, value, args, kwargs, ttl=ttl)
+            return True, value
+
     def invalidate(
         self,
         method_name: str,
@@ -355,12 +501,463 @@ class IntelligentCache:
             return len(expired_keys)
 
 
+class SharedSQLiteCache:
+    """
+    Cross-process LRU/TTL cache stored in a local SQLite database.
+
+    Every process (and thread) opens its own connection to the same file; the
+    database runs in WAL mode so readers never block the single writer. Values
+    are pickled. Interface-compatible with IntelligentCache, so cached_method
+    and cache_class_instance can target it.
+
+    Features:
+    - Size-bounded LRU (``max_size`` entries, by last access). Hits do not
+      write: each process batches its access-time updates and applies them
+      every ``touch_flush_interval`` hits and before any eviction, so the
+      LRU order lags other processes' most recent hits by at most one batch
+    - Per-entry TTL (``expires_at``; 0 = never)
+    - Atomic put_if_absent across processes (``BEGIN IMMEDIATE``)
+    - Per-process statistics plus aggregated statistics across all processes
+      (get_shared_statistics), including hits on values written by another
+      process
+    - Picklable: a ProcessPoolExecutor worker reopens the same database
+    """
+
+    _SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            method TEXT NOT NULL,
+            value BLOB NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            last_accessed REAL NOT NULL,
+            access_count INTEGER NOT NULL DEFAULT 0,
+            writer_pid INTEGER NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS entries_lru ON entries(last_accessed)",
+        "CREATE INDEX IF NOT EXISTS entries_expiry ON entries(expires_at)",
+        """CREATE TABLE IF NOT EXISTS stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )""",
+    )
+    _STAT_FIELDS = (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "total_queries",
+        "cross_process_hits",
+    )
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int = 10000,
+        default_ttl: float = 3600.0,
+        enable_stats: bool = True,
+        busy_timeout: float = 30.0,
+        stats_flush_interval: int = 64,
+        touch_flush_interval: int = 64,
+    ):
+        """
+        Initialize (or attach to) a shared cache.
+
+        Args:
+            path: SQLite database file shared by all participating processes
+            max_size: Maximum number of entries (LRU eviction)
+            default_ttl: Default TTL in seconds (0 = no expiration)
+            enable_stats: Enable statistics collection
+            busy_timeout: Seconds to wait for another process's write lock
+            stats_flush_interval: Operations between flushes of this
+                process's counters into the shared stats table
+            touch_flush_interval: Hits between writes of this process's
+                batched last-access updates
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._enable_stats = enable_stats
+        self._busy_timeout = busy_timeout
+        self._stats_flush_interval = max(1, stats_flush_interval)
+        self._touch_flush_interval = max(1, touch_flush_interval)
+        self._init_process_state()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with self._transaction(conn):
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+
+        logger.info(
+            f"SharedSQLiteCache initialized: path={self.path}, max_size={max_size}, "
+            f"default_ttl={default_ttl}s"
+        )
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _init_process_state(self) -> None:
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._stats = CacheStatistics()
+        self._pending: dict[str, int] = dict.fromkeys(self._STAT_FIELDS, 0)
+        self._pending_ops = 0
+        # key -> (last access time, hits) not yet written to the database
+        self._pending_touches: dict[str, tuple[float, int]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "max_size": self._max_size,
+            "default_ttl": self._default_ttl,
+            "enable_stats": self._enable_stats,
+            "busy_timeout": self._busy_timeout,
+            "stats_flush_interval": self._stats_flush_interval,
+            "touch_flush_interval": self._touch_flush_interval,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self._max_size = state["max_size"]
+        self._default_ttl = state["default_ttl"]
+        self._enable_stats = state["enable_stats"]
+        self._busy_timeout = state["busy_timeout"]
+        self._stats_flush_interval = state["stats_flush_interval"]
+        self._touch_flush_interval = state["touch_flush_interval"]
+        self._init_process_state()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # Forked child: never reuse the parent's connections
+            self._init_process_state()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self._busy_timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    class _Transaction:
+        def __init__(self, conn: sqlite3.Connection):
+            self.conn = conn
+
+        def __enter__(self) -> sqlite3.Connection:
+            self.conn.execute("BEGIN IMMEDIATE")
+            return self.conn
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+    def _transaction(self, conn: sqlite3.Connection) -> SharedSQLiteCache._Transaction:
+        return self._Transaction(conn)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def _count(self, conn: sqlite3.Connection | None = None, **deltas: int) -> None:
+        """Record stat deltas locally; periodically flush them to the shared table."""
+        if not self._enable_stats:
+            return
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+                self._pending[name] += delta
+            self._pending_ops += 1
+            due = self._pending_ops >= self._stats_flush_interval
+        if due:
+            self.flush_statistics(conn)
+
+    def flush_statistics(self, conn: sqlite3.Connection | None = None) -> None:
+        """Add this process's pending counters to the shared stats table."""
+        with self._lock:
+            pending = {name: value for name, value in self._pending.items() if value}
+            self._pending = dict.fromkeys(self._STAT_FIELDS, 0)
+            self._pending_ops = 0
+        if not pending:
+            return
+        conn = conn or self._connection()
+        conn.executemany(
+            "INSERT INTO stats(name, value) VALUES(?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            list(pending.items()),
+        )
+
+    def get_statistics(self) -> CacheStatistics:
+        """Statistics of this process only."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def _touch(self, conn: sqlite3.Connection, key: str, now: float) -> None:
+        """Record a hit for the LRU order; written in batches."""
+        with self._lock:
+            _, hits = self._pending_touches.get(key, (0.0, 0))
+            self._pending_touches[key] = (now, hits + 1)
+            due = len(self._pending_touches) >= self._touch_flush_interval
+        if due:
+            self.flush_touches(conn)
+
+    def flush_touches(self, conn: sqlite3.Connection | None = None) -> None:
+        """Write this process's batched last-access updates."""
+        with self._lock:
+            touches = self._pending_touches
+            self._pending_touches = {}
+        if not touches:
+            return
+        conn = conn or self._connection()
+        conn.executemany(
+            "UPDATE entries SET last_accessed = MAX(last_accessed, ?), "
+            "access_count = access_count + ? WHERE key = ?",
+            [(accessed, hits, key) for key, (accessed, hits) in touches.items()],
+        )
+
+    def get_shared_statistics(self) -> CacheStatistics:
+        """Statistics aggregated over every process using this database."""
+        conn = self._connection()
+        self.flush_statistics(conn)
+        rows = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+        return CacheStatistics(**{name: rows.get(name, 0) for name in self._STAT_FIELDS})
+
+    # ------------------------------------------------------------------
+    # Cache operations
+    # ------------------------------------------------------------------
+
+    def _compute_key(
+        self,
+        method_name: str,
+        args: tuple = (),
+        kwargs: dict | None = None,
+    ) -> str:
+        """Compute content-addressable cache key (see compute_cache_key)."""
+        return compute_cache_key(method_name, args, kwargs)
+
+    def get(
+        self,
+        method_name: str,
+        args: tuple = (),
+        kwargs: dict | None = None,
+    ) -> Any | None:
+        """
+        Retrieve value from the shared cache.
+
+        Returns None if the key is missing, expired or cannot be unpickled.
+        """
+        key = self._compute_key(method_name, args, kwargs)
+        conn = self._connection()
+        now = time.time()
+
+        row = conn.execute(
+            "SELECT value, expires_at, writer_pid FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self._count(conn, total_queries=1, misses=1)
+            return None
+
+        value_blob, expires_at, writer_pid = row
+        if 0 < expires_at <= now:
+            conn.execute("DELETE FROM entries WHERE key = ? AND expires_at = ?", (key, expires_at))
+            self._count(conn, total_queries=1, misses=1, expirations=1)
+            logger.debug(f"Shared cache entry expired: {method_name}")
+            return None
+
+        try:
+            value = pickle.loads(value_blob)
+        except Exception as e:
+            logger.warning(f"Shared cache entry unreadable ({method_name}): {e}")
+            self._count(conn, total_queries=1, misses=1)
+            return None
+
+        self._touch(conn, key, now)
+        self._count(
+            conn,
+            total_queries=1,
+            hits=1,
+            cross_process_hits=int(writer_pid != os.getpid()),
+        )
+        logger.debug(f"Shared cache HIT: {method_name}")
+        return value
+
+    def _insert(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        method_name: str,
+        blob: bytes,
+        ttl: float,
+    ) -> None:
+        now = time.time()
+        conn.execute(
+            "INSERT INTO entries(key, method, value, created_at, expires_at, last_accessed, "
+            "access_count, writer_pid) VALUES(?, ?, ?, ?, ?, ?, 0, ?) "
+            "ON CONFLICT(key) DO UPDATE SET method = excluded.method, value = excluded.value, "
+            "created_at = excluded.created_at, expires_at = excluded.expires_at, "
+            "last_accessed = excluded.last_accessed, access_count = 0, "
+            "writer_pid = excluded.writer_pid",
+            (key, method_name, blob, now, now + ttl if ttl > 0 else 0.0, now, os.getpid()),
+        )
+        (size,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        overflow = size - self._max_size
+        if overflow > 0:
+            # Evict by up-to-date access times (within the write transaction)
+            self.flush_touches(conn)
+            conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY last_accessed LIMIT ?)",
+                (overflow,),
+            )
+            self._count(conn, evictions=overflow)
+
+    def _serialize(self, method_name: str, value: Any) -> bytes | None:
+        try:
+            return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Shared cache skip ({method_name}): value not picklable: {e}")
+            return None
+
+    def put(
+        self,
+        method_name: str,
+        value: Any,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        ttl: float | None = None,
+    ) -> str:
+        """
+        Store value in the shared cache (unpicklable values are skipped).
+
+        Returns:
+            Cache key (BLAKE2b hex)
+        """
+        key = self._compute_key(method_name, args, kwargs)
+        ttl = ttl if ttl is not None else self._default_ttl
+        blob = self._serialize(method_name, value)
+        if blob is None:
+            return key
+
+        conn = self._connection()
+        with self._transaction(conn):
+            self._insert(conn, key, method_name, blob, ttl)
+        logger.debug(f"Shared cache PUT: {method_name} (ttl={ttl}s)")
+        return key
+
+    def put_if_absent(
+        self,
+        method_name: str,
+        value: Any,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        ttl: float | None = None,
+    ) -> tuple[bool, Any]:
+        """
+        Atomically store ``value`` unless a live entry already exists.
+
+        The check and the insert run in one ``BEGIN IMMEDIATE`` transaction,
+        so exactly one of several racing processes stores its value.
+
+        Returns:
+            (stored, current_value): ``stored`` is False when another caller
+            won, in which case ``current_value`` is the value it stored
+        """
+        key = self._compute_key(method_name, args, kwargs)
+        ttl = ttl if ttl is not None else self._default_ttl
+        blob = self._serialize(method_name, value)
+        if blob is None:
+            return False, value
+
+        conn = self._connection()
+        with self._transaction(conn):
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and not (0 < row[1] <= time.time()):
+                try:
+                    return False, pickle.loads(row[0])
+                except Exception:
+                    pass
+            self._insert(conn, key, method_name, blob, ttl)
+        return True, value
+
+    def invalidate(
+        self,
+        method_name: str,
+        args: tuple = (),
+        kwargs: dict | None = None,
+    ) -> bool:
+        """
+        Invalidate specific cache entry (for every process).
+
+        Returns:
+            True if entry was found and removed
+        """
+        key = self._compute_key(method_name, args, kwargs)
+        cursor = self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        cursor = self._connection().execute("DELETE FROM entries")
+        logger.info(f"Shared cache cleared: {cursor.rowcount} entries removed")
+
+    def get_size(self) -> int:
+        """Get current cache size."""
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._connection()
+        cursor = conn.execute(
+            "DELETE FROM entries WHERE expires_at > 0 AND expires_at <= ?", (time.time(),)
+        )
+        removed = cursor.rowcount
+        if removed:
+            self._count(conn, expirations=removed)
+            logger.info(f"Shared cache cleanup: {removed} expired entries removed")
+        return removed
+
+    def close(self) -> None:
+        """Flush statistics and access times, and close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._pid == os.getpid():
+            self.flush_touches(conn)
+            self.flush_statistics(conn)
+            conn.close()
+            self._local.conn = None
+
+
+CacheBackend = IntelligentCache | SharedSQLiteCache
+
+
 # Global cache instance (singleton)
-_global_cache: IntelligentCache | None = None
+_global_cache: CacheBackend | None = None
 _cache_lock = threading.Lock()
 
 
-def get_global_cache() -> IntelligentCache:
+def configure_global_cache(cache: CacheBackend | None) -> None:
+    """
+    Replace the global cache used by undecorated-instance decorators.
+
+    Pass a SharedSQLiteCache to share cached_method results across processes;
+    None restores the default in-process IntelligentCache on next use.
+    """
+    global _global_cache
+
+    with _cache_lock:
+        _global_cache = cache
+
+
+def get_global_cache() -> CacheBackend:
     """Get or create global cache instance (singleton)."""
     global _global_cache
 
@@ -378,7 +975,8 @@ def get_global_cache() -> IntelligentCache:
 
 def cached_method(
     ttl: float | None = None,
-    cache_instance: IntelligentCache | None = None,
+    cache_instance: CacheBackend | None = None,
+    instance_key: Callable[[Any], Any] | None = None,
 ) -> Callable:
     """
     Decorator for caching method results.
@@ -388,37 +986,83 @@ def cached_method(
         def expensive_computation(self, x: int, y: int) -> int:
             return x + y
 
+    For methods (first parameter ``self`` or ``cls``) calls are keyed by the
+    receiver's qualified class name plus the remaining arguments. An
+    instance receiver must be identified by ``instance_key`` (receiver ->
+    canonical value) or by the class's ``__cache_key__()``; either is added
+    to the key. Calls on instances with neither run uncached, since their
+    results may depend on instance state. A ``cls`` receiver is keyed by
+    its class name alone.
+
+    Calls whose arguments have no stable key (see compute_cache_key) run
+    uncached. On a miss the result is stored with put_if_absent, so racing
+    threads or processes all return the first stored value.
+
     Args:
         ttl: TTL in seconds (None = use cache default)
-        cache_instance: Cache to use (None = global cache)
+        cache_instance: Cache to use (None = global cache, resolved per call)
+        instance_key: Optional receiver -> key-value function for methods
 
     Returns:
         Decorated function
     """
 
     def decorator(func: Callable) -> Callable:
-        cache = cache_instance or get_global_cache()
+        parameters = list(inspect.signature(func).parameters)
+        is_method = bool(parameters) and parameters[0] in ("self", "cls")
+
+        def resolve_cache() -> CacheBackend:
+            return cache_instance or get_global_cache()
+
+        def call_key(args: tuple) -> tuple[str, tuple]:
+            if not is_method or not args:
+                return func.__name__, args
+            receiver, rest = args[0], args[1:]
+            owner = receiver if isinstance(receiver, type) else type(receiver)
+            name = f"{owner.__module__}.{owner.__qualname__}.{func.__name__}"
+            if instance_key is not None:
+                return name, (instance_key(receiver), *rest)
+            if isinstance(receiver, type):
+                return name, rest
+            if hasattr(receiver, "__cache_key__"):
+                return name, (receiver, *rest)
+            raise UncacheableKeyError(
+                f"{owner.__qualname__} instances have no cache key "
+                f"(pass instance_key or define __cache_key__)"
+            )
 
         @wraps(func)
         def wrapper(*args, **kwargs):
+            cache = resolve_cache()
+
             # Try cache lookup
-            cached = cache.get(func.__name__, args, kwargs)
+            try:
+                method_name, key_args = call_key(args)
+                cached = cache.get(method_name, key_args, kwargs)
+            except UncacheableKeyError as e:
+                logger.debug(f"Uncacheable call to {func.__qualname__}: {e}")
+                return func(*args, **kwargs)
             if cached is not None:
                 return cached
 
             # Cache miss - compute result
             result = func(*args, **kwargs)
 
-            # Store in cache
-            cache.put(func.__name__, result, args, kwargs, ttl=ttl)
+            # Store in cache (first writer wins)
+            _, result = cache.put_if_absent(method_name, result, key_args, kwargs, ttl=ttl)
 
             return result
 
         # Add cache control methods
-        wrapper.invalidate_cache = lambda *args, **kwargs: cache.invalidate(
-            func.__name__, args, kwargs
-        )
-        wrapper.clear_cache = lambda: cache.clear()
+        def invalidate_cache(*args, **kwargs):
+            try:
+                method_name, key_args = call_key(args)
+            except UncacheableKeyError:
+                return False
+            return resolve_cache().invalidate(method_name, key_args, kwargs)
+
+        wrapper.invalidate_cache = invalidate_cache
+        wrapper.clear_cache = lambda: resolve_cache().clear()
 
         return wrapper
 
@@ -427,7 +1071,7 @@ def cached_method(
 
 def cache_class_instance(
     ttl: float = 3600.0,
-    cache_instance: IntelligentCache | None = None,
+    cache_instance: CacheBackend | None = None,
 ) -> Callable:
     """
     Decorator for caching class instantiation.
@@ -453,7 +1097,12 @@ def cache_class_instance(
 
         def cached_new(cls, *args, **kwargs):
             # Try cache lookup
-            cached = cache.get(cls.__name__, args, kwargs)
+            try:
+                cached = cache.get(cls.__name__, args, kwargs)
+            except UncacheableKeyError:
+                if original_new is object.__new__:
+                    return object.__new__(cls)
+                return original_new(cls, *args, **kwargs)
             if cached is not None:
                 logger.debug(f"Class instance cache HIT: {cls.__name__}")
                 return cached
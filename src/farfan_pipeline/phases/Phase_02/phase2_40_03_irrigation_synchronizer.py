@@ -30,10 +30,9 @@ import uuid
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import Any, Protocol
 
-if TYPE_CHECKING:
-    from farfan_pipeline.phases.Phase_02.phase2_50_01_task_planner import ExecutableTask
+from farfan_pipeline.phases.Phase_02.phase2_50_01_task_planner import ExecutableTask
 from farfan_pipeline.phases.Phase_02.phase2_40_02_schema_validation import (
     validate_phase6_schema_compatibility,
 )
@@ -345,6 +344,8 @@ class IrrigationSynchronizer:
         self.executor_contracts = contracts
         self.enable_join_table = enable_join_table and SYNCHRONIZER_AVAILABLE
         self.join_table: list[ExecutorChunkBinding] | None = None
+        # ExecutableTasks of the last chunk-matrix plan (the plan itself holds Task records)
+        self.executable_tasks: tuple[ExecutableTask, ...] = ()
 
         # SISAS Event System Integration
         self.event_store = event_store if event_store is not None else (
@@ -1605,6 +1606,7 @@ class IrrigationSynchronizer:
             tasks, plan_id = self._assemble_execution_plan(
                 tasks, questions, self.correlation_id
             )
+            self.executable_tasks = tuple(tasks)
 
             logger.info(
                 json.dumps(
@@ -61,18 +61,28 @@ __stage__ = 50
 __order__ = 0
 __author__ = "F.A.R.F.A.N Core Team"
 __created__ = "2026-01-10"
-__modified__ = "2026-01-10"
+__modified__ = "2026-10-16"
 __criticality__ = "CRITICAL"
 __execution_pattern__ = "On-Demand"
 
 import asyncio
 import hashlib
+import heapq
+import itertools
 import json
 import logging
 import os
 import threading
+import time
 from collections.abc import Callable
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -80,8 +90,10 @@ from functools import wraps
 from pathlib import Path
 from typing import Any, Final, Protocol, TypeAlias, runtime_checkable
 
+from farfan_pipeline.infrastructure.process_pools import pool_context
 from farfan_pipeline.phases.Phase_02.phase2_50_01_task_planner import ExecutableTask
 from farfan_pipeline.phases.Phase_02.phase2_40_03_irrigation_synchronizer import ExecutionPlan
+from farfan_pipeline.phases.Phase_02.phase2_95_05_execution_predictor import PredictiveProfiler
 
 # SISAS Event System Integration
 try:
@@ -121,6 +133,9 @@ CausationId: TypeAlias = str
 EventId: TypeAlias = str
 TaskId: TypeAlias = str
 
+# Scheduling modes of ParallelTaskExecutor
+SCHEDULING_MODES: Final = ("levels", "dag")
+
 # === DATA STRUCTURES ===
 
 
@@ -318,6 +333,55 @@ class QuestionContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def _chunk_text_index(preprocessed_document: Any) -> dict[str, str]:
+    """Chunk text by chunk_id, for a CPP given as an object or a dict."""
+    if preprocessed_document is None:
+        return {}
+    if isinstance(preprocessed_document, dict):
+        chunks = preprocessed_document.get("chunks")
+    else:
+        chunks = getattr(preprocessed_document, "chunks", None)
+
+    index: dict[str, str] = {}
+    for chunk in chunks or []:
+        if isinstance(chunk, dict):
+            chunk_id, text = chunk.get("chunk_id"), chunk.get("text")
+        else:
+            chunk_id, text = getattr(chunk, "chunk_id", None), getattr(chunk, "text", None)
+        if chunk_id and isinstance(text, str):
+            index[chunk_id] = text
+    return index
+
+
+def _question_context_for_task(
+    task: ExecutableTask, question: dict[str, Any], chunk_texts: dict[str, str]
+) -> QuestionContext:
+    """
+    Build the QuestionContext of a task.
+
+    Planner tasks (ExecutableTask) carry neither question/chunk text nor a
+    correlation id attribute; these come from the questionnaire, the CPP
+    chunks and the task metadata unless the task provides them itself.
+    """
+    return QuestionContext(
+        question_id=task.question_id,
+        question_global=task.question_global,
+        question_text=getattr(task, "question_text", None) or question.get("text", ""),
+        policy_area_id=task.policy_area_id,
+        dimension_id=task.dimension_id,
+        chunk_id=task.chunk_id,
+        chunk_text=getattr(task, "chunk_text", None) or chunk_texts.get(task.chunk_id, ""),
+        patterns=task.patterns,
+        signals=task.signals,
+        expected_elements=task.expected_elements,
+        method_sets=question.get("method_sets", []),
+        correlation_id=(
+            getattr(task, "correlation_id", None) or task.metadata.get("correlation_id", "")
+        ),
+        metadata=task.metadata,
+    )
+
+
 # === EXCEPTION TAXONOMY ===
 
 
@@ -527,10 +591,13 @@ class ParallelTaskExecutor:
         - Configurable worker count (default: CPU count)
         - Integration with CheckpointManager
         - Failed tasks don't block other tasks in same level
+        - Optional DAG scheduling: a task starts as soon as the upstream
+          tasks it consumes have finished, longest critical path first
 
     Requirements Implemented:
         PE-01: Tasks within same epistemic level execute in parallel
         PE-02: Tasks at level N+1 wait for all level N tasks to complete
+               (scheduling="dag": only for the level N tasks they consume)
         PE-03: Max workers configurable (default: os.cpu_count())
         PE-04: Failed tasks don't block other independent tasks
         PE-05: Results aggregated in original task order
@@ -550,6 +617,9 @@ class ParallelTaskExecutor:
         calibration_registry: Any = None,  # FASE 4.2
         pdm_profile: Any = None,  # FASE 4.2
         event_store: Any | None = None,  # SISAS EventStore
+        scheduling: str = "levels",
+        execution_profiler: PredictiveProfiler | None = None,
+        method_executor: Any | None = None,
     ) -> None:
         """
         Initialize ParallelTaskExecutor.
@@ -563,15 +633,26 @@ class ParallelTaskExecutor:
             max_workers: Maximum parallel workers (default: CPU count)
             checkpoint_manager: Optional checkpoint manager for recovery
             checkpoint_batch_size: Tasks between checkpoints (default: 10)
-            use_processes: Use ProcessPoolExecutor instead of ThreadPoolExecutor
+            use_processes: Use worker processes (initialized once per plan run,
+                tasks dispatched by id) instead of threads
             calibration_registry: FASE 4.2 - Epistemic calibration registry
             pdm_profile: FASE 4.2 - PDM structural profile
             event_store: Optional SISAS EventStore for event-driven irrigation
+            scheduling: "levels" (barrier between epistemic levels) or "dag"
+                (dependency-driven, critical path first)
+            execution_profiler: Source of historical task durations for DAG
+                priorities (default: a fresh PredictiveProfiler in DAG mode)
+            method_executor: Optional method dispensary handed to every
+                DynamicContractExecutor (see DynamicContractExecutor)
         """
         if signal_registry is None:
             raise ValueError(
                 "SignalRegistry is required for Phase 2.2. " "Must be initialized in Phase 0."
             )
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(
+                f"Unknown scheduling mode {scheduling!r}; expected one of {SCHEDULING_MODES}"
+            )
 
         self.questionnaire_monolith = questionnaire_monolith
         self.preprocessed_document = preprocessed_document
@@ -584,6 +665,11 @@ class ParallelTaskExecutor:
         self.use_processes = use_processes
         self.calibration_registry = calibration_registry  # FASE 4.2
         self.pdm_profile = pdm_profile  # FASE 4.2
+        self.scheduling = scheduling
+        self.execution_profiler = execution_profiler
+        if self.execution_profiler is None and scheduling == "dag":
+            self.execution_profiler = PredictiveProfiler()
+        self.method_executor = method_executor
         
         # SISAS Event System Integration
         # IMPORTANT: If event_store is None, a new EventStore instance is created.
@@ -595,8 +681,9 @@ class ParallelTaskExecutor:
         )
         self._event_emission_enabled = SISAS_EVENTS_AVAILABLE and self.event_store is not None
 
-        # Build question lookup index
+        # Build question and chunk text lookup indexes
         self._question_index = self._build_question_index()
+        self._chunk_texts = _chunk_text_index(preprocessed_document)
 
         # Thread-safe executor cache
         self._executor_cache: dict[str, DynamicContractExecutor] = {}
@@ -605,6 +692,9 @@ class ParallelTaskExecutor:
         # Calibration cache for resolved calibrations (FASE 4.2)
         self._calibration_cache: dict[str, dict[str, Any]] = {}
 
+        # Profiling contracts per question (DAG priorities and duration learning)
+        self._profiling_contracts: dict[str, dict[str, Any]] = {}
+
     def _build_question_index(self) -> dict[str, dict[str, Any]]:
         """Build index of questions by question_id."""
         index: dict[str, dict[str, Any]] = {}
@@ -629,9 +719,15 @@ class ParallelTaskExecutor:
 
         return index
 
+    @traced_operation("execution.plan.parallel")
     def execute_plan_parallel(self, plan: ExecutionPlan) -> list[TaskResult]:
         """
-        Execute an ExecutionPlan with parallelism within epistemic levels.
+        Execute an ExecutionPlan in parallel.
+
+        With ``scheduling="levels"`` every epistemic level runs to completion
+        before the next one starts (PE-02). With ``scheduling="dag"`` each
+        task is released as soon as the upstream tasks it consumes have
+        finished, critical path first (see ``_execute_dag``).
 
         Args:
             plan: The execution plan containing tasks grouped by level.
@@ -650,6 +746,7 @@ class ParallelTaskExecutor:
                 "plan_id": plan_id,
                 "task_count": len(plan.tasks),
                 "execution_mode": "parallel",
+                "scheduling": self.scheduling,
                 "max_workers": self.max_workers,
             },
             correlation_id=correlation_id,
@@ -679,64 +776,73 @@ class ParallelTaskExecutor:
                 "plan_id": plan_id,
                 "task_count": len(plan.tasks),
                 "levels": sorted(levels.keys()),
+                "scheduling": self.scheduling,
                 "max_workers": self.max_workers,
                 "already_completed": len(completed_ids),
             },
         )
 
-        # Execute levels in order
-        for level in sorted(levels.keys()):
-            level_tasks = [t for t in levels[level] if t.task_id not in completed_ids]
+        def record_result(result: TaskResult) -> None:
+            nonlocal tasks_since_checkpoint
+            all_results[result.task_id] = result
 
-            if not level_tasks:
-                logger.debug(f"Skipping level {level} - all tasks already completed")
-                continue
+            # Emit event for each task result
+            if result.success:
+                completed_ids.add(result.task_id)
+                self._record_duration(result)
+                self._emit_event(
+                    event_type=EventType.SIGNAL_GENERATED if SISAS_EVENTS_AVAILABLE else "signal_generated",
+                    source_component="parallel_task_executor",
+                    payload_data={
+                        "task_id": result.task_id,
+                        "question_id": result.question_id,
+                        "policy_area_id": result.policy_area_id,
+                        "success": True,
+                        "execution_time_ms": result.execution_time_ms,
+                    },
+                    correlation_id=correlation_id,
+                    causation_id=plan_start_event_id,
+                )
+            else:
+                self._emit_event(
+                    event_type=EventType.IRRIGATION_FAILED if SISAS_EVENTS_AVAILABLE else "irrigation_failed",
+                    source_component="parallel_task_executor",
+                    payload_data={
+                        "task_id": result.task_id,
+                        "question_id": result.question_id,
+                        "error": result.error or "Unknown error",
+                    },
+                    correlation_id=correlation_id,
+                    causation_id=plan_start_event_id,
+                )
 
-            logger.info(
-                f"Executing level {level}",
-                extra={"task_count": len(level_tasks), "max_workers": self.max_workers},
-            )
+            tasks_since_checkpoint += 1
 
-            level_results = self._execute_level(level_tasks)
+            # Checkpoint periodically
+            if self.checkpoint_manager and tasks_since_checkpoint >= self.checkpoint_batch_size:
+                self.checkpoint_manager.save_checkpoint(plan_id, list(completed_ids))
+                tasks_since_checkpoint = 0
 
-            for result in level_results:
-                all_results[result.task_id] = result
-                
-                # Emit event for each task result
-                if result.success:
-                    completed_ids.add(result.task_id)
-                    self._emit_event(
-                        event_type=EventType.SIGNAL_GENERATED if SISAS_EVENTS_AVAILABLE else "signal_generated",
-                        source_component="parallel_task_executor",
-                        payload_data={
-                            "task_id": result.task_id,
-                            "question_id": result.question_id,
-                            "policy_area_id": result.policy_area_id,
-                            "success": True,
-                            "execution_time_ms": result.execution_time_ms,
-                        },
-                        correlation_id=correlation_id,
-                        causation_id=plan_start_event_id,
-                    )
-                else:
-                    self._emit_event(
-                        event_type=EventType.IRRIGATION_FAILED if SISAS_EVENTS_AVAILABLE else "irrigation_failed",
-                        source_component="parallel_task_executor",
-                        payload_data={
-                            "task_id": result.task_id,
-                            "question_id": result.question_id,
-                            "error": result.error or "Unknown error",
-                        },
-                        correlation_id=correlation_id,
-                        causation_id=plan_start_event_id,
+        pending_tasks = [t for t in plan.tasks if t.task_id not in completed_ids]
+        with self._task_pool(pending_tasks) as pool:
+            if self.scheduling == "dag":
+                self._execute_dag(plan.tasks, set(completed_ids), record_result, pool)
+            else:
+                # Execute levels in order
+                for level in sorted(levels.keys()):
+                    level_tasks = [t for t in levels[level] if t.task_id not in completed_ids]
+
+                    if not level_tasks:
+                        logger.debug(f"Skipping level {level} - all tasks already completed")
+                        continue
+
+                    logger.info(
+                        f"Executing level {level}",
+                        extra={"task_count": len(level_tasks), "max_workers": self.max_workers},
                     )
-                    
-                tasks_since_checkpoint += 1
 
-                # Checkpoint periodically
-                if self.checkpoint_manager and tasks_since_checkpoint >= self.checkpoint_batch_size:
-                    self.checkpoint_manager.save_checkpoint(plan_id, list(completed_ids))
-                    tasks_since_checkpoint = 0
+                    for result in self._execute_level(level_tasks, pool):
+                        record_result(result)
 
         # Final checkpoint and cleanup
         if self.checkpoint_manager:
@@ -807,8 +913,7 @@ class ParallelTaskExecutor:
             causation_id=causation_id,
         )
 
-    @traced_operation("execution.plan.parallel")
-    def execute_plan_parallel(self, plan: ExecutionPlan) -> list[TaskResult]:
+    def _group_by_level(self, tasks: list[ExecutableTask]) -> dict[int, list[ExecutableTask]]:
         """
         Group tasks by their epistemic level (N1=1, N2=2, etc.).
 
@@ -977,48 +1082,358 @@ class ParallelTaskExecutor:
         params = calibration.get("calibration_parameters", {})
         return params.get(parameter_name, default)
 
-    def _execute_level(self, tasks: list[ExecutableTask]) -> list[TaskResult]:
+    def _execute_level(
+        self,
+        tasks: list[ExecutableTask],
+        pool: ThreadPoolExecutor | ProcessPoolExecutor | None = None,
+    ) -> list[TaskResult]:
         """
         Execute all tasks in a level in parallel.
 
         Args:
             tasks: List of tasks at the same epistemic level.
+            pool: Pool from ``_task_pool`` (a temporary one is created if None).
 
         Returns:
             List of TaskResult objects (unordered).
         """
-        results: list[TaskResult] = []
+        if pool is None:
+            with self._task_pool(tasks) as pool:
+                return self._execute_level(tasks, pool)
+
+        future_to_task = {self._submit_task(pool, task): task for task in tasks}
+        return [
+            self._collect_result(future, future_to_task[future])
+            for future in as_completed(future_to_task)
+        ]
+
+    @contextmanager
+    def _task_pool(self, tasks: list[ExecutableTask]):
+        """
+        Worker pool shared by every level (or the whole DAG) of one plan run.
+
+        Thread mode shares this executor directly. Process mode starts the
+        workers once, with the start method process_pools.pool_context picks:
+        ``fork`` only while this process runs a single thread (forking a
+        multithreaded process can deadlock the workers on inherited locks),
+        otherwise forkserver or spawn. Forked workers inherit the
+        questionnaire, document, signal registry and task table from the
+        parent; other workers get them pickled once through the pool
+        initializer. Tasks are then dispatched by id and each worker keeps
+        its own warm executor and calibration caches for the rest of the run.
+        """
+        if not self.use_processes:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                yield pool
+            return
+
+        token = f"{os.getpid()}-{id(self)}-{next(_WORKER_TOKENS)}"
+        task_table = {task.task_id: task for task in tasks}
+        context = pool_context([__name__])
+        if context.get_start_method() == "fork":
+            _FORK_SHARED_STATE[token] = (self, task_table)
+            initargs: tuple[Any, ...] = (token,)
+        else:
+            initargs = (token, self._worker_payload(task_table))
 
-        # Choose executor type
-        ExecutorClass = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_process_worker,
+                initargs=initargs,
+            ) as pool:
+                yield pool
+        finally:
+            _FORK_SHARED_STATE.pop(token, None)
+
+    def _worker_payload(self, task_table: dict[str, ExecutableTask]) -> dict[str, Any]:
+        """Constructor inputs for a worker-local executor (non-fork start methods)."""
+        return {
+            "executor_class": type(self),
+            "executor_kwargs": {
+                "questionnaire_monolith": self.questionnaire_monolith,
+                "preprocessed_document": self.preprocessed_document,
+                "signal_registry": self.signal_registry,
+                "calibration_orchestrator": self.calibration_orchestrator,
+                "validation_orchestrator": self.validation_orchestrator,
+                "max_workers": 1,
+                "calibration_registry": self.calibration_registry,
+                "pdm_profile": self.pdm_profile,
+                "method_executor": self.method_executor,
+            },
+            "tasks": task_table,
+        }
 
-        with ExecutorClass(max_workers=self.max_workers) as executor:
-            future_to_task = {
-                executor.submit(self._execute_task_safe, task): task for task in tasks
-            }
+    def _submit_task(
+        self, pool: ThreadPoolExecutor | ProcessPoolExecutor, task: ExecutableTask
+    ) -> Future:
+        """Submit a task: the object itself to threads, only its id to processes."""
+        if isinstance(pool, ProcessPoolExecutor):
+            return pool.submit(_execute_task_in_worker, task.task_id)
+        return pool.submit(self._execute_task_safe, task)
 
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Task {task.task_id} failed with unexpected error: {e}")
-                    # Create failure result
-                    result = TaskResult(
-                        task_id=task.task_id,
-                        question_id=task.question_id,
-                        question_global=task.question_global,
-                        policy_area_id=task.policy_area_id,
-                        dimension_id=task.dimension_id,
-                        chunk_id=task.chunk_id,
-                        success=False,
-                        output={},
-                        error=str(e),
+    def _collect_result(self, future: Future, task: ExecutableTask) -> TaskResult:
+        """TaskResult of a finished future (expanding compact worker results)."""
+        try:
+            result = future.result()
+        except Exception as e:
+            return self._failure_result(task, e)
+        if isinstance(result, tuple):
+            return _expand_worker_result(task, result)
+        return result
+
+    def _failure_result(self, task: ExecutableTask, error: Exception) -> TaskResult:
+        """Build the failure TaskResult for a task whose future raised."""
+        logger.error(f"Task {task.task_id} failed with unexpected error: {error}")
+        return TaskResult(
+            task_id=task.task_id,
+            question_id=task.question_id,
+            question_global=task.question_global,
+            policy_area_id=task.policy_area_id,
+            dimension_id=task.dimension_id,
+            chunk_id=task.chunk_id,
+            success=False,
+            output={},
+            error=str(error),
+        )
+
+    # =========================================================================
+    # DAG SCHEDULING: dependency-driven execution, critical path first
+    # =========================================================================
+
+    def _build_task_graph(
+        self,
+        tasks: list[ExecutableTask],
+        completed_ids: set[str],
+    ) -> tuple[dict[str, set[str]], dict[str, list[str]]]:
+        """
+        Derive upstream/downstream edges between the pending tasks of a plan.
+
+        A task's upstream set is ``metadata["depends_on"]`` when given.
+        Otherwise it is inferred from the nearest lower epistemic level in the
+        plan: the tasks there with the same (question_id, chunk_id), else the
+        same question_id, else the whole level (the PE-02 barrier, restricted
+        to one level). Edges to tasks in ``completed_ids`` or outside the plan
+        are dropped, since those are already satisfied.
+
+        Args:
+            tasks: All tasks of the plan, in plan order.
+            completed_ids: Task ids already completed (checkpoint resume).
+
+        Returns:
+            (upstream, downstream) adjacency keyed by task_id, for pending tasks.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle.
+        """
+        task_ids = {task.task_id for task in tasks}
+        levels = self._group_by_level(tasks)
+        sorted_levels = sorted(levels)
+        by_chunk: dict[tuple[int, str, str], list[str]] = {}
+        by_question: dict[tuple[int, str], list[str]] = {}
+        for level, level_tasks in levels.items():
+            for task in level_tasks:
+                by_chunk.setdefault((level, task.question_id, task.chunk_id), []).append(task.task_id)
+                by_question.setdefault((level, task.question_id), []).append(task.task_id)
+
+        pending = [task for task in tasks if task.task_id not in completed_ids]
+        upstream: dict[str, set[str]] = {}
+        downstream: dict[str, list[str]] = {task.task_id: [] for task in pending}
+        for task in pending:
+            explicit = (getattr(task, "metadata", None) or {}).get("depends_on")
+            if explicit is not None:
+                dependencies = list(explicit)
+                unknown = [d for d in dependencies if d not in task_ids]
+                if unknown:
+                    logger.warning(
+                        f"Task {task.task_id} depends on tasks outside the plan: {unknown}"
+                    )
+            else:
+                level = self._parse_level(task)
+                lower = [candidate for candidate in sorted_levels if candidate < level]
+                if lower:
+                    below = lower[-1]
+                    dependencies = (
+                        by_chunk.get((below, task.question_id, task.chunk_id))
+                        or by_question.get((below, task.question_id))
+                        or [t.task_id for t in levels[below]]
                     )
-                    results.append(result)
+                else:
+                    dependencies = []
 
-        return results
+            upstream[task.task_id] = {
+                d for d in dependencies if d in downstream and d != task.task_id
+            }
+            for dependency in upstream[task.task_id]:
+                downstream[dependency].append(task.task_id)
+
+        # Kahn's algorithm: every pending task must be reachable from the roots
+        remaining = {task_id: len(deps) for task_id, deps in upstream.items()}
+        frontier = [task_id for task_id, count in remaining.items() if count == 0]
+        visited = 0
+        while frontier:
+            task_id = frontier.pop()
+            visited += 1
+            for child in downstream[task_id]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    frontier.append(child)
+        if visited != len(upstream):
+            cyclic = sorted(task_id for task_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Task dependencies contain a cycle among: {cyclic[:10]}")
+
+        return upstream, downstream
+
+    def _critical_path_priorities(
+        self,
+        tasks: list[ExecutableTask],
+        upstream: dict[str, set[str]],
+        downstream: dict[str, list[str]],
+    ) -> dict[str, float]:
+        """
+        Length (ms) of the longest path from each task to the end of the plan.
+
+        Each node is weighted by its estimated duration, so the task that
+        heads the longest remaining chain has the highest priority.
+        """
+        durations = {
+            task.task_id: self._estimate_duration_ms(task)
+            for task in tasks
+            if task.task_id in upstream
+        }
+
+        # Reverse topological order: a task is finalised once all its children are
+        priorities: dict[str, float] = {}
+        pending_children = {task_id: len(children) for task_id, children in downstream.items()}
+        frontier = [task_id for task_id, count in pending_children.items() if count == 0]
+        while frontier:
+            task_id = frontier.pop()
+            priorities[task_id] = durations[task_id] + max(
+                (priorities[child] for child in downstream[task_id]), default=0.0
+            )
+            for parent in upstream[task_id]:
+                pending_children[parent] -= 1
+                if pending_children[parent] == 0:
+                    frontier.append(parent)
+        return priorities
+
+    def _profiling_contract(self, question_id: str) -> dict[str, Any]:
+        """Contract view of a question in the shape PredictiveProfiler expects."""
+        contract = self._profiling_contracts.get(question_id)
+        if contract is None:
+            question = self._question_index.get(question_id, {})
+            methods = [
+                {
+                    "class_name": method.get("class", ""),
+                    "method_name": method.get("function", ""),
+                    "level": method.get("level", ""),
+                    "confidence_score": method.get("confidence_score", 0.5),
+                }
+                for method in question.get("method_sets", [])
+                if isinstance(method, dict)
+            ]
+            contract = {
+                "identity": {
+                    "contract_id": question_id,
+                    "contract_type": question.get("contract_type", "TYPE_A"),
+                },
+                "method_binding": {"execution_phases": {"methods": {"methods": methods}}},
+            }
+            self._profiling_contracts[question_id] = contract
+        return contract
+
+    def _estimate_duration_ms(self, task: ExecutableTask) -> float:
+        """Predicted task duration from historical executions (PredictiveProfiler)."""
+        if self.execution_profiler is None:
+            return 1.0
+        try:
+            prediction = self.execution_profiler.predict(self._profiling_contract(task.question_id))
+        except Exception as e:
+            logger.debug(f"Duration prediction failed for {task.task_id}: {e}")
+            return 1.0
+        # Never zero, so that chain length still breaks ties between estimates
+        return max(prediction.predicted_time_ms, 1.0)
+
+    def _record_duration(self, result: TaskResult) -> None:
+        """Feed an observed duration back into the profiler's history."""
+        if self.execution_profiler is None or result.execution_time_ms is None:
+            return
+        try:
+            self.execution_profiler.record_execution(
+                self._profiling_contract(result.question_id),
+                execution_time_ms=result.execution_time_ms,
+                memory_mb=0.0,
+            )
+        except Exception as e:
+            logger.debug(f"Could not record duration for {result.task_id}: {e}")
+
+    def _execute_dag(
+        self,
+        tasks: list[ExecutableTask],
+        completed_ids: set[str],
+        on_result: Callable[[TaskResult], None],
+        pool: ThreadPoolExecutor | ProcessPoolExecutor | None = None,
+    ) -> None:
+        """
+        Execute pending tasks as their dependencies finish.
+
+        Ready tasks wait in a max-heap keyed by critical-path length and at
+        most ``max_workers`` tasks are in flight, so a free worker always
+        takes the task heading the longest remaining chain. A task is
+        released when all its upstream tasks have finished, successfully or
+        not (PE-04: failures don't block other tasks).
+
+        Args:
+            tasks: All tasks of the plan, in plan order.
+            completed_ids: Task ids already completed (checkpoint resume).
+            on_result: Called in the scheduling thread for every result.
+            pool: Pool from ``_task_pool`` (a temporary one is created if None).
+        """
+        upstream, downstream = self._build_task_graph(tasks, completed_ids)
+        if not upstream:
+            return
+        if pool is None:
+            with self._task_pool(tasks) as pool:
+                return self._execute_dag(tasks, completed_ids, on_result, pool)
+        priorities = self._critical_path_priorities(tasks, upstream, downstream)
+        task_by_id = {task.task_id: task for task in tasks}
+        order = {task.task_id: index for index, task in enumerate(tasks)}
+
+        remaining = {task_id: len(deps) for task_id, deps in upstream.items()}
+        ready: list[tuple[float, int, str]] = [
+            (-priorities[task_id], order[task_id], task_id)
+            for task_id, count in remaining.items()
+            if count == 0
+        ]
+        heapq.heapify(ready)
+
+        logger.info(
+            "Executing task DAG",
+            extra={
+                "task_count": len(upstream),
+                "roots": len(ready),
+                "critical_path_ms": max(priorities.values()),
+                "max_workers": self.max_workers,
+            },
+        )
+
+        running: dict[Future, ExecutableTask] = {}
+        while ready or running:
+            while ready and len(running) < self.max_workers:
+                _, _, task_id = heapq.heappop(ready)
+                task = task_by_id[task_id]
+                running[self._submit_task(pool, task)] = task
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: order[running[f].task_id]):
+                task = running.pop(future)
+                on_result(self._collect_result(future, task))
+
+                for child in downstream[task.task_id]:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        heapq.heappush(ready, (-priorities[child], order[child], child))
 
     def _execute_task_safe(self, task: ExecutableTask) -> TaskResult:
         """
@@ -1039,21 +1454,7 @@ class ParallelTaskExecutor:
                 raise ValueError(f"Question not found in monolith: {task.question_id}")
 
             # Build question context
-            question_context = QuestionContext(
-                question_id=task.question_id,
-                question_global=task.question_global,
-                question_text=task.question_text,
-                policy_area_id=task.policy_area_id,
-                dimension_id=task.dimension_id,
-                chunk_id=task.chunk_id,
-                chunk_text=task.chunk_text,
-                patterns=task.patterns,
-                signals=task.signals,
-                expected_elements=task.expected_elements,
-                method_sets=question.get("method_sets", []),
-                correlation_id=task.correlation_id,
-                metadata=task.metadata,
-            )
+            question_context = _question_context_for_task(task, question, self._chunk_texts)
 
             # Get or create executor (thread-safe)
             with self._cache_lock:
@@ -1062,6 +1463,7 @@ class ParallelTaskExecutor:
                         question_id=task.question_id,
                         calibration_orchestrator=self.calibration_orchestrator,
                         validation_orchestrator=self.validation_orchestrator,
+                        method_executor=self.method_executor,
                     )
                 executor = self._executor_cache[task.question_id]
 
@@ -1084,7 +1486,7 @@ class ParallelTaskExecutor:
                 execution_time_ms=execution_time_ms,
                 metadata={
                     "base_slot": output.get("base_slot"),
-                    "correlation_id": task.correlation_id,
+                    "correlation_id": question_context.correlation_id,
                 },
             )
 
@@ -1115,6 +1517,77 @@ class ParallelTaskExecutor:
             )
 
 
+# === GAP 2b: PROCESS-POOL WORKERS ===
+
+# Parent-side state that forked workers inherit, keyed by pool token. Only
+# read in the children; the parent drops its entry when the pool shuts down.
+_FORK_SHARED_STATE: dict[str, tuple[ParallelTaskExecutor, dict[str, ExecutableTask]]] = {}
+_WORKER_TOKENS = itertools.count()
+
+# Worker-process globals, set once by _init_process_worker
+_worker_executor: ParallelTaskExecutor | None = None
+_worker_tasks: dict[str, ExecutableTask] = {}
+
+
+def _init_process_worker(token: str, payload: dict[str, Any] | None = None) -> None:
+    """
+    Pool initializer: bind the worker to its executor and task table.
+
+    Under fork the parent's executor (questionnaire index, document, signal
+    registry) is inherited by reference; otherwise a worker-local executor
+    is built once from ``payload``. Its executor and calibration caches are
+    private to the worker and stay warm across all tasks it runs.
+    """
+    global _worker_executor, _worker_tasks
+    if payload is None:
+        executor, tasks = _FORK_SHARED_STATE[token]
+    else:
+        executor = payload["executor_class"](**payload["executor_kwargs"])
+        tasks = payload["tasks"]
+    # Lifecycle events are emitted by the parent only
+    executor._event_emission_enabled = False
+    _worker_executor = executor
+    _worker_tasks = tasks
+
+
+def _execute_task_in_worker(task_id: str) -> tuple[Any, ...]:
+    """Run one task in a worker process and return its compact result."""
+    if _worker_executor is None:
+        raise ExecutionError(
+            error_code="WORKER_NOT_INITIALIZED",
+            message="Process worker not initialized",
+            task_id=task_id,
+        )
+    result = _worker_executor._execute_task_safe(_worker_tasks[task_id])
+    # Identity fields are rebuilt from the parent's task; only outcomes travel back
+    return (
+        result.task_id,
+        result.success,
+        result.output,
+        result.error,
+        result.execution_time_ms,
+        result.metadata,
+    )
+
+
+def _expand_worker_result(task: ExecutableTask, compact: tuple[Any, ...]) -> TaskResult:
+    """Rebuild a TaskResult from a worker's compact tuple."""
+    task_id, success, output, error, execution_time_ms, metadata = compact
+    return TaskResult(
+        task_id=task_id,
+        question_id=task.question_id,
+        question_global=task.question_global,
+        policy_area_id=task.policy_area_id,
+        dimension_id=task.dimension_id,
+        chunk_id=task.chunk_id,
+        success=success,
+        output=output,
+        error=error,
+        execution_time_ms=execution_time_ms,
+        metadata=metadata,
+    )
+
+
 # === MINOR IMPROVEMENT 5: DRY-RUN EXECUTOR ===
 
 
@@ -1345,6 +1818,7 @@ class DynamicContractExecutor:
         question_id: str,
         calibration_orchestrator: Any | None = None,
         validation_orchestrator: Any | None = None,
+        method_executor: Any | None = None,
     ) -> None:
         """
         Initialize DynamicContractExecutor for a specific question.
@@ -1353,10 +1827,14 @@ class DynamicContractExecutor:
             question_id: Question identifier (e.g., "Q001", "Q150")
             calibration_orchestrator: Optional calibration support
             validation_orchestrator: Optional validation tracking
+            method_executor: Optional method dispensary exposing
+                ``execute(class_name=..., method_name=..., **payload)``;
+                when given, the question's method_sets are dispatched to it
         """
         self.question_id = question_id
         self.calibration_orchestrator = calibration_orchestrator
         self.validation_orchestrator = validation_orchestrator
+        self.method_executor = method_executor
 
         # Derive and cache base_slot
         self.base_slot = self._derive_base_slot(question_id)
@@ -1517,16 +1995,46 @@ class DynamicContractExecutor:
         Current Implementation:
         - Simplified execution for canonical Phase 2 pipeline
         - Full MethodRegistry integration available via orchestrator
+        - With a method_executor, each {"class", "function"} entry of the
+          question's method_sets is dispatched in order with the method
+          context as payload, and its wall time is reported in
+          "method_timings" (plain dicts, so they survive process workers)
         - See: farfan_pipeline/orchestration/method_registry.py
         - See: farfan_pipeline/phases/Phase_02/calibration_policy.py
         """
-        # Simplified execution - full integration via orchestrator's MethodRegistry
-        return {
+        result: dict[str, Any] = {
             "method_outputs": {},
             "patterns_matched": len(question_context.patterns),
             "signals_resolved": len(question_context.signals),
             "expected_elements": question_context.expected_elements,
         }
+        if self.method_executor is None:
+            # Simplified execution - full integration via orchestrator's MethodRegistry
+            return result
+
+        method_timings: list[dict[str, Any]] = []
+        for method in question_context.method_sets:
+            # Legacy method-set labels (e.g. "N1-EMP") name no method to dispatch
+            if not isinstance(method, dict):
+                continue
+            class_name = method.get("class", "")
+            method_name = method.get("function", "")
+            start = time.perf_counter()
+            output = self.method_executor.execute(
+                class_name=class_name,
+                method_name=method_name,
+                **method_context,
+            )
+            method_timings.append(
+                {
+                    "class_name": class_name,
+                    "method_name": method_name,
+                    "execution_time_ms": (time.perf_counter() - start) * 1000,
+                }
+            )
+            result["method_outputs"][f"{class_name}.{method_name}"] = output
+        result["method_timings"] = method_timings
+        return result
 
 
 # === TASK EXECUTOR ===
@@ -1574,6 +2082,7 @@ class TaskExecutor:
         calibration_registry: Any = None,  # FASE 4.2: EpistemicCalibrationRegistry
         pdm_profile: Any = None,  # FASE 4.2: MockPDMProfile
         event_store: Any | None = None,  # SISAS EventStore
+        method_executor: Any | None = None,
     ) -> None:
         """
         Initialize TaskExecutor.
@@ -1587,6 +2096,8 @@ class TaskExecutor:
             calibration_registry: FASE 4.2 - Epistemic calibration registry for N1/N2/N3
             pdm_profile: FASE 4.2 - PDM structural profile for dynamic adjustments
             event_store: Optional SISAS EventStore for event-driven irrigation
+            method_executor: Optional method dispensary handed to every
+                DynamicContractExecutor (see DynamicContractExecutor)
 
         Raises:
             ValueError: If signal_registry is None
@@ -1604,6 +2115,7 @@ class TaskExecutor:
         self.validation_orchestrator = validation_orchestrator
         self.calibration_registry = calibration_registry  # FASE 4.2
         self.pdm_profile = pdm_profile  # FASE 4.2
+        self.method_executor = method_executor
 
         # SISAS Event System Integration
         # IMPORTANT: If event_store is None, a new EventStore instance is created.
@@ -1615,8 +2127,9 @@ class TaskExecutor:
         )
         self._event_emission_enabled = SISAS_EVENTS_AVAILABLE and self.event_store is not None
 
-        # Build question lookup index
+        # Build question and chunk text lookup indexes
         self._question_index = self._build_question_index()
+        self._chunk_texts = _chunk_text_index(preprocessed_document)
 
         # Executor cache
         self._executor_cache: dict[str, DynamicContractExecutor] = {}
@@ -1849,7 +2362,7 @@ class TaskExecutor:
             execution_time_ms=execution_time_ms,
             metadata={
                 "base_slot": output.get("base_slot"),
-                "correlation_id": task.correlation_id,
+                "correlation_id": question_context.correlation_id,
             },
         )
 
@@ -1862,21 +2375,7 @@ class TaskExecutor:
 
     def _build_question_context(self, task: ExecutableTask, question: dict) -> QuestionContext:
         """Build QuestionContext from task and question."""
-        return QuestionContext(
-            question_id=task.question_id,
-            question_global=task.question_global,
-            question_text=task.question_text,
-            policy_area_id=task.policy_area_id,
-            dimension_id=task.dimension_id,
-            chunk_id=task.chunk_id,
-            chunk_text=task.chunk_text,
-            patterns=task.patterns,
-            signals=task.signals,
-            expected_elements=task.expected_elements,
-            method_sets=question.get("method_sets", []),
-            correlation_id=task.correlation_id,
-            metadata=task.metadata,
-        )
+        return _question_context_for_task(task, question, self._chunk_texts)
 
     def _get_executor(self, question_id: str) -> DynamicContractExecutor:
         """Get or create executor for question_id (with caching)."""
@@ -1885,6 +2384,7 @@ class TaskExecutor:
                 question_id=question_id,
                 calibration_orchestrator=self.calibration_orchestrator,
                 validation_orchestrator=self.validation_orchestrator,
+                method_executor=self.method_executor,
             )
         return self._executor_cache[question_id]
 
@@ -2064,6 +2564,7 @@ def execute_tasks_parallel(
     checkpoint_batch_size: int = 10,
     calibration_registry: Any = None,  # FASE 4.2
     pdm_profile: Any = None,  # FASE 4.2
+    scheduling: str = "levels",
 ) -> list[TaskResult]:
     """
     Public API for executing tasks in parallel with checkpointing.
@@ -2082,6 +2583,7 @@ def execute_tasks_parallel(
         checkpoint_batch_size: Tasks between checkpoints (default: 10)
         calibration_registry: FASE 4.2 - Epistemic calibration registry
         pdm_profile: FASE 4.2 - PDM structural profile
+        scheduling: "levels" (level barriers) or "dag" (dependency-driven)
 
     Returns:
         List of TaskResult objects in original task order.
@@ -2106,6 +2608,9 @@ def execute_tasks_parallel(
         max_workers=max_workers,
         checkpoint_manager=checkpoint_manager,
         checkpoint_batch_size=checkpoint_batch_size,
+        calibration_registry=calibration_registry,
+        pdm_profile=pdm_profile,
+        scheduling=scheduling,
     )
     return executor.execute_plan_parallel(execution_plan)
 
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
@@ -75,6 +77,15 @@ except ImportError:
         def create_default_policy():
             return CalibrationPolicy()
 
+from farfan_pipeline.phases.Phase_02.phase2_60_06_contract_bundle import (
+    DEFAULT_CONTRACTS_DIR,
+    ContractBundle,
+    open_contract_bundle,
+)
+
+# Seconds before a failed bundle open/build is attempted again
+CONTRACT_BUNDLE_RETRY_S = 30.0
+
 if TYPE_CHECKING:
     # MethodExecutor imported from compatibility layer
     from farfan_pipeline.orchestration.compatibility import MethodExecutor
@@ -97,6 +108,10 @@ class BaseExecutorWithContract(ABC):
     """
 
     _contract_cache: dict[str, dict[str, Any]] = {}
+    # Process-wide compiled contract bundle (see phase2_60_06_contract_bundle)
+    _contract_bundle: ContractBundle | None = None
+    _contract_bundle_lock = threading.Lock()
+    _contract_bundle_retry_at: float = 0.0
     _schema_validators: dict[str, Draft7Validator] = {}
     _factory_contracts_verified: bool = False
     _factory_verification_errors: list[str] = []
@@ -638,7 +653,7 @@ class BaseExecutorWithContract(ABC):
 
         # === V4 CONTRACTS ONLY - generated_contracts/ ===
         # All contracts must be v4 format from this directory
-        v4_contracts_dir = PROJECT_ROOT / "src" / "farfan_pipeline" / "phases" / "Phase_two" / "generated_contracts"
+        v4_contracts_dir = DEFAULT_CONTRACTS_DIR
 
         # v4 contract filename format: {q_id}_{policy_area_id}_contract_v4.json
         if not policy_area_id:
@@ -649,14 +664,19 @@ class BaseExecutorWithContract(ABC):
 
         contract_path = v4_contracts_dir / f"{q_id}_{policy_area_id}_contract_v4.json"
 
-        if not contract_path.exists():
-            raise FileNotFoundError(
-                f"Contract not found for {base_slot} / {q_id} / {policy_area_id}. "
-                f"Expected path: {contract_path}. "
-                f"Ensure v4 contract exists in generated_contracts/ directory."
-            )
+        # Compiled bundle first: no per-file read or schema validation
+        bundle = cls._get_contract_bundle()
+        contract = bundle.get(q_id, policy_area_id) if bundle is not None else None
 
-        contract = json.loads(contract_path.read_text(encoding="utf-8"))
+        if contract is None:
+            if not contract_path.exists():
+                raise FileNotFoundError(
+                    f"Contract not found for {base_slot} / {q_id} / {policy_area_id}. "
+                    f"Expected path: {contract_path}. "
+                    f"Ensure v4 contract exists in generated_contracts/ directory."
+                )
+
+            contract = json.loads(contract_path.read_text(encoding="utf-8"))
 
         # Validate v4 structure
         if "identity" not in contract:
@@ -684,6 +704,29 @@ class BaseExecutorWithContract(ABC):
         cls._contract_cache[cache_key] = contract
         return contract
 
+    @classmethod
+    def _get_contract_bundle(cls) -> ContractBundle | None:
+        """Get the process-wide contract bundle, building or refreshing it if stale.
+
+        Only one thread builds the bundle; the others wait and share it. A
+        failed open or build is retried after CONTRACT_BUNDLE_RETRY_S.
+
+        Returns:
+            The bundle, or None if it cannot be opened or built (contracts are
+            then read from their JSON files)
+        """
+        base = BaseExecutorWithContract
+        if base._contract_bundle is not None:
+            return base._contract_bundle
+        with base._contract_bundle_lock:
+            if base._contract_bundle is None and time.monotonic() >= base._contract_bundle_retry_at:
+                try:
+                    base._contract_bundle = open_contract_bundle()
+                except Exception as exc:
+                    logger.warning(f"Contract bundle unavailable, reading contract files: {exc}")
+                    base._contract_bundle_retry_at = time.monotonic() + CONTRACT_BUNDLE_RETRY_S
+            return base._contract_bundle
+
     def _validate_signal_requirements(
         self,
         signal_pack: Any,
@@ -1084,11 +1127,16 @@ class BaseExecutorWithContract(ABC):
         
         Batch loads Q001.v3.json through Q300.v3.json with validation and caching.
         Leverages existing _load_contract() infrastructure for consistency.
+
+        For version "v4" the Q###_PA##_contract_v4.json files are read from the
+        compiled contract bundle (rebuilt only for changed files), and schema
+        validation uses the outcome recorded when each contract was compiled.
         
         Args:
             contracts_dir: Directory containing specialized contracts.
                           Defaults to PROJECT_ROOT/../executor_contracts/specialized/
-            version: Contract version to load ("v2" or "v3")
+                          (generated_contracts/ for v4)
+            version: Contract version to load ("v2", "v3" or "v4")
             validate_schema: Whether to validate contracts against JSON schema
         
         Returns:
@@ -1106,6 +1154,9 @@ class BaseExecutorWithContract(ABC):
             'Q001'
         """
         from pathlib import Path
+
+        if version == "v4":
+            return cls._load_all_contracts_from_bundle(contracts_dir, validate_schema)
         
         if contracts_dir is None:
             contracts_dir = str(PROJECT_ROOT / ".." / "executor_contracts" / "specialized")
@@ -1144,6 +1195,51 @@ class BaseExecutorWithContract(ABC):
         
         return contracts
 
+    @classmethod
+    def _load_all_contracts_from_bundle(
+        cls,
+        contracts_dir: str | None = None,
+        validate_schema: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Load every v4 contract from the compiled bundle.
+
+        Args:
+            contracts_dir: Directory with the v4 contract files (default: generated_contracts/)
+            validate_schema: Whether to fail on contracts whose recorded schema validation failed
+
+        Returns:
+            Contract dicts ordered by question and policy area
+
+        Raises:
+            FileNotFoundError: If the contracts directory does not exist
+            ValueError: If validate_schema is set and any contract failed schema validation
+        """
+        if contracts_dir is None:
+            bundle = cls._get_contract_bundle()
+            if bundle is None:
+                raise FileNotFoundError("Contract bundle could not be opened or built")
+            owned = False
+        else:
+            bundle = open_contract_bundle(contracts_dir)
+            owned = True
+
+        try:
+            if validate_schema:
+                invalid = bundle.invalid_contracts()
+                if invalid:
+                    failures = [f"{cid}: {errors[0] if errors else 'invalid'}" for cid, errors in invalid.items()]
+                    error_msg = (
+                        f"{len(failures)} contracts failed schema validation:\n"
+                        + "\n".join(failures[:10])
+                    )
+                    if len(failures) > 10:
+                        error_msg += f"\n... and {len(failures) - 10} more"
+                    raise ValueError(error_msg)
+            return bundle.load_all()
+        finally:
+            if owned:
+                bundle.close()
+
     @classmethod
     def _load_contract_from_file(
         cls,
@@ -1238,8 +1334,15 @@ class BaseExecutorWithContract(ABC):
         """Clear the contract cache.
         
         Useful for testing or when contracts are updated on disk.
+        The contract bundle is reopened (and refreshed if stale) on next use.
         """
         cls._contract_cache.clear()
+        base = BaseExecutorWithContract
+        with base._contract_bundle_lock:
+            if base._contract_bundle is not None:
+                base._contract_bundle.close()
+            base._contract_bundle = None
+            base._contract_bundle_retry_at = 0.0
 
     @classmethod
     def get_cached_contract_count(cls) -> int:
@@ -2940,7 +3043,7 @@ class DynamicContractExecutor(BaseExecutorWithContract):
             FileNotFoundError: If contract not found
         """
         # Try v4 contracts first (generated_contracts/)
-        v4_contracts_dir = PROJECT_ROOT / "src" / "farfan_pipeline" / "phases" / "Phase_two" / "generated_contracts"
+        v4_contracts_dir = DEFAULT_CONTRACTS_DIR
         
         contract_path = None
         
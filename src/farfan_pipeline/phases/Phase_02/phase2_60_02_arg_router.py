@@ -10,6 +10,10 @@ This module provides ExtendedArgRouter (and legacy ArgRouter for compatibility):
 - **kwargs support for forward compatibility
 - Full observability and metrics
 - Base routing and validation utilities
+- Compiled call adapters: once a (class, method, payload key-shape) passes
+  strict validation, later calls with that shape use a specialized adapter
+  with precomputed isinstance checks, falling back to strict routing (and its
+  exact errors) whenever a check fails
 
 Design Principles:
 - Explicit route definitions for high-traffic methods
@@ -39,7 +43,7 @@ import logging
 import os
 import random
 import threading
-from collections.abc import Iterable, Mapping, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -81,6 +85,9 @@ else:
 # Sentinel value for missing arguments
 MISSING: object = object()
 
+# Upper bound on compiled call adapters per router (distinct payload key-shapes)
+MAX_COMPILED_ADAPTERS = 4096
+
 
 # ============================================================================
 # Base Exceptions and Data Classes
@@ -168,10 +175,15 @@ class ArgRouter:
         This base class is provided for backward compatibility.
     """
 
-    def __init__(self, class_registry: Mapping[str, type]) -> None:
+    def __init__(
+        self, class_registry: Mapping[str, type], *, compile_adapters: bool = True
+    ) -> None:
         self._class_registry = dict(class_registry)
         self._spec_cache: dict[tuple[str, str], MethodSpec] = {}
         self._lock = threading.RLock()
+        # (class_name, method_name, payload keys in order) -> compiled call adapter
+        self._compile_adapters = compile_adapters
+        self._adapters: dict[tuple[str, str, tuple[str, ...]], Callable[..., Any]] = {}
 
     def describe(self, class_name: str, method_name: str) -> MethodSpec:
         """Return the cached method specification, building it if necessary."""
@@ -188,6 +200,24 @@ class ArgRouter:
         payload: MutableMapping[str, Any],
     ) -> tuple[tuple[Any, ...], dict[str, Any]]:
         """Validate and split a payload into positional and keyword arguments."""
+        shape = (class_name, method_name, tuple(payload))
+        adapter = self._adapters.get(shape)
+        if adapter is not None:
+            routed = adapter(payload)
+            if routed is not None:
+                return routed
+        routed = self._route_strict(class_name, method_name, payload)
+        if adapter is None and self._compile_adapters:
+            self._store_adapter(shape, self._compile_adapter(class_name, method_name, shape[2]))
+        return routed
+
+    def _route_strict(
+        self,
+        class_name: str,
+        method_name: str,
+        payload: MutableMapping[str, Any],
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Fully validated routing; the reference behaviour compiled adapters reproduce."""
         spec = self.describe(class_name, method_name)
         provided_keys = set(payload.keys())
         required = set(spec.required_arguments)
@@ -270,6 +300,133 @@ class ArgRouter:
         spec = self.describe(class_name, method_name)
         return spec.accepted_arguments
 
+    def _store_adapter(
+        self, shape: tuple[str, str, tuple[str, ...]], adapter: Callable[..., Any]
+    ) -> None:
+        if self._compile_adapters and len(self._adapters) < MAX_COMPILED_ADAPTERS:
+            self._adapters[shape] = adapter
+
+    def _compile_adapter(
+        self, class_name: str, method_name: str, keys: tuple[str, ...]
+    ) -> Callable[..., Any]:
+        """Build the call adapter for a payload key-shape that passed strict routing.
+
+        The shape fixes which parameters are present, so the key checks and the
+        positional/keyword split are resolved here once; only the per-value
+        annotation checks remain, as isinstance tuples where possible. The
+        adapter returns None when a check fails, so the caller re-routes
+        strictly and raises the usual ArgumentValidationError.
+        """
+        spec = self.describe(class_name, method_name)
+        present = set(keys)
+        positional = tuple(p.name for p in spec.positional if p.name in present)
+        keyword = [p.name for p in spec.keyword_only if p.name in present]
+        if spec.has_var_keyword:
+            accepted = set(spec.accepted_arguments)
+            keyword.extend(key for key in keys if key not in accepted)
+        keyword_names = tuple(keyword)
+
+        isinstance_checks = []
+        predicate_checks = []
+        for param in (*spec.positional, *spec.keyword_only):
+            if param.name not in present:
+                continue
+            check = self._compile_annotation_check(param.annotation)
+            if isinstance(check, tuple):
+                isinstance_checks.append((param.name, check))
+            elif check is not None:
+                predicate_checks.append((param.name, check))
+        type_checks = tuple(isinstance_checks)
+        predicates = tuple(predicate_checks)
+
+        def adapter(
+            payload: Mapping[str, Any],
+        ) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+            for name, types in type_checks:
+                if not isinstance(payload[name], types):
+                    return None
+            for name, predicate in predicates:
+                if not predicate(payload[name]):
+                    return None
+            return (
+                tuple([payload[name] for name in positional]),
+                {name: payload[name] for name in keyword_names},
+            )
+
+        return adapter
+
+    @staticmethod
+    def _compile_annotation_check(annotation: Any) -> tuple[type, ...] | Callable[[Any], bool] | None:
+        """Precompile ``_matches_annotation(value, annotation)``.
+
+        Returns None when every value matches, a tuple of types when the check
+        is a plain isinstance, and otherwise a predicate with the same result.
+        """
+        if annotation in (inspect._empty, Any):
+            return None
+        origin = get_origin(annotation)
+        if origin is None:
+            return (annotation,) if isinstance(annotation, type) else None
+        args = get_args(annotation)
+        compile_check = ArgRouter._compile_annotation_check
+        as_predicate = ArgRouter._as_predicate
+
+        if origin is Union:
+            checks = [compile_check(arg) for arg in args]
+            if any(check is None for check in checks):
+                return None
+            types = tuple(t for check in checks if isinstance(check, tuple) for t in check)
+            if all(isinstance(check, tuple) for check in checks):
+                return types
+            predicates = tuple(check for check in checks if not isinstance(check, tuple))
+            return lambda value: isinstance(value, types) or any(p(value) for p in predicates)
+
+        if origin is tuple:
+            if not args:
+                return (tuple,)
+            if len(args) == 2 and args[1] is Ellipsis:
+                item = compile_check(args[0])
+                if item is None:
+                    return (tuple,)
+                item_ok = as_predicate(item)
+                return lambda value: isinstance(value, tuple) and all(item_ok(v) for v in value)
+            items = tuple(as_predicate(compile_check(arg)) for arg in args)
+            size = len(items)
+            return lambda value: (
+                isinstance(value, tuple)
+                and len(value) == size
+                and all(ok(v) for ok, v in zip(items, value, strict=False))
+            )
+
+        if origin in (list, set):
+            container = origin
+            item = compile_check(args[0]) if args else None
+            if item is None:
+                return (container,)
+            item_ok = as_predicate(item)
+            return lambda value: isinstance(value, container) and all(item_ok(v) for v in value)
+
+        if origin is dict:
+            if len(args) != 2:
+                return (dict,)
+            key_check, value_check = (compile_check(arg) for arg in args)
+            if key_check is None and value_check is None:
+                return (dict,)
+            key_ok, value_ok = as_predicate(key_check), as_predicate(value_check)
+            return lambda value: isinstance(value, dict) and all(
+                key_ok(k) and value_ok(v) for k, v in value.items()
+            )
+
+        return None
+
+    @staticmethod
+    def _as_predicate(check: tuple[type, ...] | Callable[[Any], bool] | None) -> Callable[[Any], bool]:
+        if check is None:
+            return lambda value: True
+        if isinstance(check, tuple):
+            return lambda value: isinstance(value, check)
+        return check
+
     def _build_spec(self, class_name: str, method_name: str) -> MethodSpec:
         try:
             cls = self._class_registry[class_name]
@@ -523,14 +680,18 @@ class ExtendedArgRouter(ArgRouter):
     30. _parse_implementation_timeline
     """
 
-    def __init__(self, class_registry: Mapping[str, type]) -> None:
+    def __init__(
+        self, class_registry: Mapping[str, type], *, compile_adapters: bool = True
+    ) -> None:
         """
         Initialize extended router.
 
         Args:
             class_registry: Mapping of class names to class types
+            compile_adapters: Reuse compiled call adapters for payload shapes
+                that already passed strict validation (False: always strict)
         """
-        super().__init__(class_registry)
+        super().__init__(class_registry, compile_adapters=compile_adapters)
         self._special_routes = self._build_special_routes()
         self._metrics = RoutingMetrics()
         self._metrics_lock = threading.Lock()
@@ -754,6 +915,9 @@ class ExtendedArgRouter(ArgRouter):
         3. Prevents silent parameter drops
         4. Tracks metrics
 
+        Payload shapes that already passed strict validation are routed by
+        their compiled adapter; any failing check falls back to steps 1-4.
+
         Args:
             class_name: Target class name
             method_name: Target method name
@@ -765,15 +929,52 @@ class ExtendedArgRouter(ArgRouter):
         Raises:
             ArgumentValidationError: On validation failure
         """
+        special = method_name in self._special_routes
+        shape = (class_name, method_name, tuple(payload))
+        adapter = self._adapters.get(shape)
+        if adapter is not None:
+            routed = adapter(payload)
+            if routed is not None:
+                with self._metrics_lock:
+                    self._metrics.total_routes += 1
+                    if special:
+                        self._metrics.special_routes_hit += 1
+                    else:
+                        self._metrics.default_routes_hit += 1
+                return routed
+
         with self._metrics_lock:
             self._metrics.total_routes += 1
 
-        # Check for special route
-        if method_name in self._special_routes:
-            return self._route_special(class_name, method_name, payload)
+        if special:
+            # Check for special route
+            routed = self._route_special(class_name, method_name, payload)
+        else:
+            # Use default routing with enhanced validation
+            routed = self._route_default_strict(class_name, method_name, payload)
+
+        if adapter is None and self._compile_adapters:
+            self._store_adapter(
+                shape,
+                self._route_special_adapter
+                if special
+                else self._compile_adapter(class_name, method_name, shape[2]),
+            )
+            logger.debug(
+                "route_adapter_compiled",
+                class_name=class_name,
+                method=method_name,
+                special=special,
+                keys=list(shape[2]),
+            )
+        return routed
 
-        # Use default routing with enhanced validation
-        return self._route_default_strict(class_name, method_name, payload)
+    @staticmethod
+    def _route_special_adapter(
+        payload: Mapping[str, Any],
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Special routes validate key names only, so a proven shape needs no checks."""
+        return (), dict(payload)
 
     def _route_special(
         self,
@@ -907,7 +1108,7 @@ class ExtendedArgRouter(ArgRouter):
 
         # Delegate to base implementation
         try:
-            result = super().route(class_name, method_name, payload)
+            result = self._route_strict(class_name, method_name, payload)
             logger.debug(
                 "default_route_applied",
                 class_name=class_name,
@@ -1042,15 +1243,22 @@ class VersionedArgRouter(ExtendedArgRouter):
         "v2": ArgSchemaV2,
     }
 
-    def __init__(self, class_registry: Mapping[str, type], default_schema: str = "v2") -> None:
+    def __init__(
+        self,
+        class_registry: Mapping[str, type],
+        default_schema: str = "v2",
+        *,
+        compile_adapters: bool = True,
+    ) -> None:
         """
         Initialize versioned router.
 
         Args:
             class_registry: Mapping of class names to class types.
             default_schema: Default schema version to use.
+            compile_adapters: Reuse compiled call adapters for proven payload shapes.
         """
-        super().__init__(class_registry)
+        super().__init__(class_registry, compile_adapters=compile_adapters)
         self.default_schema = default_schema
 
         if default_schema not in self.SCHEMA_VERSIONS:
@@ -0,0 +1,516 @@
+"""
+Precompiled Executor-Contract Bundle
+
+PHASE_LABEL: Phase 2
+PHASE_COMPONENT: Contract Bundle
+PHASE_ROLE: Compiles generated_contracts/ into one indexed, content-hashed file
+            that executors open read-only and query lazily
+
+Design:
+- One SQLite file in the user cache (``$FARFAN_CACHE_DIR/contract_bundles``,
+  else ``$XDG_CACHE_HOME/farfan/contract_bundles``) holds every
+  ``Q###_PA##_contract_v4.json`` as a row indexed by (question_id, policy_area_id),
+  with the SHA-256 of the source file and the schema version that validated it
+- Builds write a temporary copy and ``os.replace`` it into place, so readers
+  and concurrent builders never see a half-written bundle
+- Rebuilds are incremental: files whose size/mtime are unchanged are not read,
+  files whose content hash is unchanged are not re-validated, and validation is
+  repeated only for changed contracts or when the schema itself changes
+- Readers open the bundle read-only with SQLite memory mapping and parse a
+  contract only when it is fetched, so a process start no longer reads and
+  validates 300 JSON files
+- The bundle hash (over every contract hash plus the schema hash) identifies
+  the exact contract set an executor ran with
+
+Build step:
+    python scripts/generation/build_contract_bundle.py
+
+Author: F.A.R.F.A.N Pipeline - Performance Engineering
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+# =============================================================================
+# METADATA
+# =============================================================================
+
+__version__ = "1.0.0"
+__phase__ = 2
+__stage__ = 60
+__order__ = 6
+__author__ = "F.A.R.F.A.N Core Team"
+__created__ = "2026-10-16"
+__modified__ = "2026-10-16"
+__criticality__ = "MEDIUM"
+__execution_pattern__ = "On-Demand"
+
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+try:
+    from jsonschema import Draft7Validator  # type: ignore
+
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    Draft7Validator = None  # type: ignore[misc,assignment]
+    JSONSCHEMA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PHASE_TWO_DIR = Path(__file__).resolve().parent
+DEFAULT_CONTRACTS_DIR = PHASE_TWO_DIR / "generated_contracts"
+DEFAULT_SCHEMA_PATH = PHASE_TWO_DIR.parents[1] / "json_schemas" / "executor_contract.v4.schema.json"
+BUNDLE_FILENAME = "contracts.bundle.sqlite"
+BUNDLE_CACHE_SUBDIR = "contract_bundles"
+BUNDLE_FORMAT_VERSION = "1"
+CONTRACT_FILE_PATTERN = re.compile(r"^(Q\d{3})_(PA\d{2})_contract_v4\.json$")
+
+# Contracts are a few hundred KB each; map the whole bundle
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+MAX_RECORDED_ERRORS = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contracts (
+    file_name TEXT PRIMARY KEY,
+    question_id TEXT NOT NULL,
+    policy_area_id TEXT NOT NULL,
+    contract_id TEXT NOT NULL,
+    base_slot TEXT,
+    content_sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    schema_version TEXT,
+    schema_valid INTEGER,
+    schema_errors TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_contracts_key ON contracts(question_id, policy_area_id);
+CREATE TABLE IF NOT EXISTS bundle_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def default_bundle_path(contracts_dir: Path | str | None = None) -> Path:
+    """Bundle location for a contracts directory.
+
+    ``$FARFAN_CACHE_DIR/contract_bundles`` if set, else
+    ``$XDG_CACHE_HOME/farfan/contract_bundles`` (``~/.cache`` by default).
+    The file name embeds a digest of the contracts directory so checkouts do
+    not collide.
+    """
+    cache_dir = os.environ.get("FARFAN_CACHE_DIR")
+    if cache_dir:
+        directory = Path(cache_dir) / BUNDLE_CACHE_SUBDIR
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        directory = base / "farfan" / BUNDLE_CACHE_SUBDIR
+    contracts_dir = Path(contracts_dir or DEFAULT_CONTRACTS_DIR).resolve()
+    dir_digest = hashlib.sha256(str(contracts_dir).encode("utf-8")).hexdigest()[:16]
+    return directory / f"{Path(BUNDLE_FILENAME).stem}-{dir_digest}.sqlite"
+
+
+def _schema_version(schema_path: Path) -> tuple[str, str, Any]:
+    """Return (schema_version, schema_sha256, schema) for a JSON schema file.
+
+    The version is the schema file stem plus a short content hash, so editing
+    the schema invalidates every recorded validation.
+    """
+    raw = schema_path.read_bytes()
+    sha256 = hashlib.sha256(raw).hexdigest()
+    stem = schema_path.name.removesuffix(".schema.json").removesuffix(".json")
+    return f"{stem}@{sha256[:12]}", sha256, json.loads(raw)
+
+
+def _scan_contracts(contracts_dir: Path) -> list[tuple[Path, str, str]]:
+    """(path, question_id, policy_area_id) for every v4 contract, sorted by file name."""
+    found = []
+    for path in sorted(contracts_dir.glob("Q*_PA*_contract_v4.json")):
+        match = CONTRACT_FILE_PATTERN.match(path.name)
+        if match:
+            found.append((path, match.group(1), match.group(2)))
+    return found
+
+
+def build_contract_bundle(
+    contracts_dir: Path | str | None = None,
+    bundle_path: Path | str | None = None,
+    schema_path: Path | str | None = DEFAULT_SCHEMA_PATH,
+    validate: bool = True,
+) -> dict[str, Any]:
+    """Compile (or incrementally refresh) the contract bundle.
+
+    Args:
+        contracts_dir: Directory holding ``Q###_PA##_contract_v4.json`` files
+        bundle_path: Bundle file (default: ``default_bundle_path(contracts_dir)``)
+        schema_path: JSON schema contracts are validated against; None disables validation
+        validate: Whether to validate new or changed contracts
+
+    Returns:
+        Build statistics: contracts, compiled (new or changed), unchanged,
+        validated, schema_invalid, removed, bundle_sha256, schema_version, seconds
+
+    Raises:
+        FileNotFoundError: If the contracts directory does not exist
+        ValueError: If a contract file is not valid JSON
+    """
+    start = time.perf_counter()
+    contracts_dir = Path(contracts_dir or DEFAULT_CONTRACTS_DIR)
+    if not contracts_dir.is_dir():
+        raise FileNotFoundError(f"Contracts directory not found: {contracts_dir}")
+    bundle_path = Path(bundle_path or default_bundle_path(contracts_dir))
+
+    validator = None
+    schema_version = None
+    schema_sha256 = ""
+    if validate and schema_path is not None and Path(schema_path).exists():
+        schema_version, schema_sha256, schema = _schema_version(Path(schema_path))
+        if JSONSCHEMA_AVAILABLE:
+            validator = Draft7Validator(schema)
+        else:
+            logger.warning(
+                "jsonschema not installed; contracts are bundled without schema validation"
+            )
+            schema_version = None
+    elif validate and schema_path is not None:
+        logger.warning(f"Contract schema not found: {schema_path}; bundling without validation")
+
+    stats = {
+        "contracts": 0,
+        "compiled": 0,
+        "unchanged": 0,
+        "validated": 0,
+        "schema_invalid": 0,
+        "removed": 0,
+    }
+
+    # Refresh a private copy and swap it in: open readers keep the old file,
+    # and concurrent builders each replace the bundle with a complete one
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{bundle_path.name}.", suffix=".tmp", dir=bundle_path.parent
+    )
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        if bundle_path.exists():
+            shutil.copyfile(bundle_path, tmp_path)
+        stats, bundle_sha256 = _refresh_bundle(
+            tmp_path, contracts_dir, validator, schema_version, schema_sha256, stats
+        )
+        os.replace(tmp_path, bundle_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    stats["bundle_sha256"] = bundle_sha256
+    stats["schema_version"] = schema_version
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    if stats["compiled"] or stats["removed"]:
+        logger.info(
+            f"Contract bundle {bundle_path.name}: {stats['compiled']} compiled, "
+            f"{stats['unchanged']} unchanged, {stats['removed']} removed "
+            f"({stats['schema_invalid']} schema-invalid)"
+        )
+    return stats
+
+
+def _refresh_bundle(
+    bundle_path: Path,
+    contracts_dir: Path,
+    validator: Any,
+    schema_version: str | None,
+    schema_sha256: str,
+    stats: dict[str, Any],
+) -> tuple[dict[str, Any], str]:
+    """Bring the bundle file at ``bundle_path`` up to date with ``contracts_dir``.
+
+    Returns:
+        (stats, bundle_sha256)
+    """
+    conn = sqlite3.connect(str(bundle_path))
+    try:
+        conn.executescript(_SCHEMA)
+        known = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT file_name, size, mtime_ns, content_sha256, schema_version FROM contracts"
+            )
+        }
+        seen = set()
+        with conn:
+            for path, question_id, policy_area_id in _scan_contracts(contracts_dir):
+                seen.add(path.name)
+                stat = path.stat()
+                previous = known.get(path.name)
+                # Validation is current when it ran against this schema, or none was requested
+                validation_current = validator is None or (
+                    previous is not None and previous[3] == schema_version
+                )
+                if (
+                    previous is not None
+                    and previous[:2] == (stat.st_size, stat.st_mtime_ns)
+                    and validation_current
+                ):
+                    stats["unchanged"] += 1
+                    continue
+
+                raw = path.read_bytes()
+                sha256 = hashlib.sha256(raw).hexdigest()
+                if previous is not None and previous[2] == sha256 and validation_current:
+                    # Touched but identical: keep the compiled row, refresh its stat
+                    conn.execute(
+                        "UPDATE contracts SET size = ?, mtime_ns = ? WHERE file_name = ?",
+                        (stat.st_size, stat.st_mtime_ns, path.name),
+                    )
+                    stats["unchanged"] += 1
+                    continue
+
+                try:
+                    contract = json.loads(raw)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSON in contract file {path}: {exc}") from exc
+
+                schema_valid = None
+                errors: list[str] = []
+                if validator is not None:
+                    schema_errors = sorted(validator.iter_errors(contract), key=lambda e: list(e.path))
+                    errors = [
+                        f"{err.message} at {'.'.join(str(p) for p in err.path)}"
+                        for err in schema_errors[:MAX_RECORDED_ERRORS]
+                    ]
+                    schema_valid = int(not schema_errors)
+                    stats["validated"] += 1
+
+                identity = contract.get("identity", {}) if isinstance(contract, dict) else {}
+                conn.execute(
+                    "INSERT OR REPLACE INTO contracts(file_name, question_id, policy_area_id, "
+                    "contract_id, base_slot, content_sha256, size, mtime_ns, schema_version, "
+                    "schema_valid, schema_errors, payload) "
+                    "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        path.name,
+                        question_id,
+                        policy_area_id,
+                        identity.get("contract_id", f"{question_id}_{policy_area_id}"),
+                        identity.get("base_slot"),
+                        sha256,
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        schema_version if validator is not None else None,
+                        schema_valid,
+                        json.dumps(errors, ensure_ascii=False),
+                        json.dumps(contract, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+                    ),
+                )
+                stats["compiled"] += 1
+
+            removed = [name for name in known if name not in seen]
+            conn.executemany("DELETE FROM contracts WHERE file_name = ?", [(n,) for n in removed])
+            stats["removed"] = len(removed)
+
+            stats["contracts"] = conn.execute("SELECT COUNT(*) FROM contracts").fetchone()[0]
+            stats["schema_invalid"] = conn.execute(
+                "SELECT COUNT(*) FROM contracts WHERE schema_valid = 0"
+            ).fetchone()[0]
+
+            digest = hashlib.sha256(schema_sha256.encode())
+            for file_name, sha256 in conn.execute(
+                "SELECT file_name, content_sha256 FROM contracts ORDER BY file_name"
+            ):
+                digest.update(f"{file_name}:{sha256}\n".encode())
+            bundle_sha256 = digest.hexdigest()
+
+            if stats["compiled"] or stats["removed"]:
+                built_at = datetime.now(timezone.utc).isoformat()
+            else:
+                row = conn.execute(
+                    "SELECT value FROM bundle_meta WHERE key = 'built_at'"
+                ).fetchone()
+                built_at = row[0] if row else datetime.now(timezone.utc).isoformat()
+            meta = {
+                "format_version": BUNDLE_FORMAT_VERSION,
+                "bundle_sha256": bundle_sha256,
+                "schema_sha256": schema_sha256,
+                "schema_version": schema_version or "",
+                "contract_count": str(stats["contracts"]),
+                "contracts_dir": str(contracts_dir.resolve()),
+                "built_at": built_at,
+            }
+            conn.executemany(
+                "INSERT OR REPLACE INTO bundle_meta(key, value) VALUES(?, ?)", meta.items()
+            )
+    finally:
+        conn.close()
+    return stats, bundle_sha256
+
+
+class ContractBundle:
+    """Read-only, memory-mapped view of a compiled contract bundle.
+
+    Contracts are parsed only when fetched; every fetch returns a fresh dict,
+    so callers may annotate it without affecting other readers.
+
+    Args:
+        bundle_path: Compiled bundle file
+        mmap_size: Bytes of the bundle SQLite may memory-map
+
+    Raises:
+        FileNotFoundError: If the bundle does not exist
+        ValueError: If the bundle was written by an incompatible format version
+    """
+
+    def __init__(self, bundle_path: Path | str, mmap_size: int = DEFAULT_MMAP_SIZE) -> None:
+        self.bundle_path = Path(bundle_path)
+        if not self.bundle_path.exists():
+            raise FileNotFoundError(f"Contract bundle not found: {self.bundle_path}")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"{self.bundle_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self.meta = dict(self._conn.execute("SELECT key, value FROM bundle_meta"))
+        if self.meta.get("format_version") != BUNDLE_FORMAT_VERSION:
+            self._conn.close()
+            raise ValueError(
+                f"Contract bundle {self.bundle_path} has format "
+                f"{self.meta.get('format_version')!r}, expected {BUNDLE_FORMAT_VERSION!r}"
+            )
+
+    @property
+    def bundle_sha256(self) -> str:
+        return self.meta["bundle_sha256"]
+
+    def __len__(self) -> int:
+        return int(self.meta.get("contract_count", 0))
+
+    def get(self, question_id: str, policy_area_id: str) -> dict[str, Any] | None:
+        """Contract for (question_id, policy_area_id), or None if not bundled."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM contracts WHERE question_id = ? AND policy_area_id = ?",
+                (question_id, policy_area_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def keys(self) -> list[tuple[str, str]]:
+        """(question_id, policy_area_id) of every bundled contract, in file order."""
+        with self._lock:
+            return list(
+                self._conn.execute(
+                    "SELECT question_id, policy_area_id FROM contracts ORDER BY file_name"
+                )
+            )
+
+    def load_all(self) -> list[dict[str, Any]]:
+        """Every bundled contract, ordered by question and policy area."""
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM contracts ORDER BY file_name").fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def validation(self, question_id: str, policy_area_id: str) -> dict[str, Any] | None:
+        """Recorded validation outcome and content hash of one contract."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT contract_id, content_sha256, schema_version, schema_valid, schema_errors "
+                "FROM contracts WHERE question_id = ? AND policy_area_id = ?",
+                (question_id, policy_area_id),
+            ).fetchone()
+        if row is None:
+            return None
+        contract_id, sha256, schema_version, schema_valid, errors = row
+        return {
+            "contract_id": contract_id,
+            "content_sha256": sha256,
+            "schema_version": schema_version,
+            "schema_valid": None if schema_valid is None else bool(schema_valid),
+            "schema_errors": json.loads(errors),
+        }
+
+    def invalid_contracts(self) -> dict[str, list[str]]:
+        """contract_id -> recorded schema errors, for contracts that failed validation."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT contract_id, schema_errors FROM contracts "
+                "WHERE schema_valid = 0 ORDER BY file_name"
+            ).fetchall()
+        return {contract_id: json.loads(errors) for contract_id, errors in rows}
+
+    def is_current(self, contracts_dir: Path | str | None = None) -> bool:
+        """Whether the bundle matches the contract files on disk (by size and mtime).
+
+        Only stats the files; a touched-but-identical file reads as stale
+        until the next build refreshes its recorded mtime.
+
+        Args:
+            contracts_dir: Directory to compare against (default: the one the
+                bundle was built from)
+        """
+        contracts_dir = Path(contracts_dir or self.meta.get("contracts_dir", DEFAULT_CONTRACTS_DIR))
+        with self._lock:
+            recorded = {
+                name: (size, mtime_ns)
+                for name, size, mtime_ns in self._conn.execute(
+                    "SELECT file_name, size, mtime_ns FROM contracts"
+                )
+            }
+        on_disk = {}
+        for path, _, _ in _scan_contracts(contracts_dir):
+            stat = path.stat()
+            on_disk[path.name] = (stat.st_size, stat.st_mtime_ns)
+        return on_disk == recorded
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_contract_bundle(
+    contracts_dir: Path | str | None = None,
+    bundle_path: Path | str | None = None,
+    rebuild: bool = True,
+) -> ContractBundle:
+    """Open the bundle for a contracts directory, (re)building it when stale.
+
+    Args:
+        contracts_dir: Directory holding the v4 contract files
+        bundle_path: Bundle file (default: ``default_bundle_path(contracts_dir)``)
+        rebuild: Build or refresh the bundle when missing or out of date;
+                 if False a stale bundle is returned as is
+
+    Raises:
+        FileNotFoundError: If there is no bundle and rebuild is False
+    """
+    contracts_dir = Path(contracts_dir or DEFAULT_CONTRACTS_DIR)
+    bundle_path = Path(bundle_path or default_bundle_path(contracts_dir))
+    if bundle_path.exists():
+        try:
+            bundle = ContractBundle(bundle_path)
+        except (ValueError, sqlite3.Error) as exc:
+            if not rebuild:
+                raise
+            logger.warning(f"Rebuilding unreadable contract bundle {bundle_path}: {exc}")
+            bundle_path.unlink(missing_ok=True)
+        else:
+            if not rebuild or bundle.is_current(contracts_dir):
+                return bundle
+            bundle.close()
+    elif not rebuild:
+        raise FileNotFoundError(f"Contract bundle not found: {bundle_path}")
+    build_contract_bundle(contracts_dir, bundle_path)
+    return ContractBundle(bundle_path)
+
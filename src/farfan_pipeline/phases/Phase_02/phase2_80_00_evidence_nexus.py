@@ -56,7 +56,7 @@ import math
 import re
 import statistics
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
@@ -68,6 +68,14 @@ from typing import (
     TypeAlias,
 )
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
 try:
     import structlog
 
@@ -616,6 +624,192 @@ class SynthesizedAnswer:
 # =============================================================================
 
 
+# Relation codes in the index's edge-type array (only these two propagate belief)
+_RELATION_OTHER = 0
+_RELATION_SUPPORTS = 1
+_RELATION_CONTRADICTS = 2
+
+# Vectorized propagation pays off for graphs at least this large whose levels
+# hold on average at least this many nodes; deep, narrow graphs use the loop
+VECTORIZED_PROPAGATION_MIN_NODES = 256
+VECTORIZED_PROPAGATION_MIN_LEVEL_WIDTH = 32
+
+
+class _EvidenceGraphIndex:
+    """
+    Integer-indexed adjacency of an EvidenceGraph.
+
+    Nodes get dense integer ids in insertion order. Per-node successor and
+    predecessor lists serve the incremental topological order (Pearce-Kelly):
+    ``order[n]`` is a position such that every edge goes from a lower to a
+    higher position, so inserting u->v with order[u] < order[v] needs no
+    search, and otherwise only nodes positioned between v and u are visited.
+    Edge endpoints, weights and relation codes are kept as flat arrays,
+    from which CSR (compressed sparse row) arrays are built on demand.
+    """
+
+    __slots__ = (
+        "_csr",
+        "edge_kind",
+        "edge_source",
+        "edge_target",
+        "edge_weight",
+        "ids",
+        "index",
+        "order",
+        "predecessors",
+        "successors",
+    )
+
+    def __init__(self) -> None:
+        self.ids: list[EvidenceID] = []
+        self.index: dict[EvidenceID, int] = {}
+        self.successors: list[list[int]] = []
+        self.predecessors: list[list[int]] = []
+        self.order: list[int] = []
+        self.edge_source: list[int] = []
+        self.edge_target: list[int] = []
+        self.edge_weight: list[float] = []
+        self.edge_kind: list[int] = []
+        self._csr: dict[str, Any] | None = None
+
+    def add_node(self, node_id: EvidenceID) -> int:
+        n = len(self.ids)
+        self.ids.append(node_id)
+        self.index[node_id] = n
+        self.successors.append([])
+        self.predecessors.append([])
+        self.order.append(n)
+        return n
+
+    def reorder_for_edge(self, u: int, v: int) -> bool:
+        """
+        Make room for edge u->v in the topological order.
+
+        Returns:
+            False (order untouched) if v reaches u, i.e. the edge would close a cycle
+        """
+        if u == v:
+            return False
+        order = self.order
+        lower, upper = order[v], order[u]
+        if lower > upper:
+            return True
+
+        # Forward search from v, bounded to positions below u
+        forward: list[int] = []
+        seen = {v}
+        stack = [v]
+        while stack:
+            n = stack.pop()
+            forward.append(n)
+            for w in self.successors[n]:
+                if w == u:
+                    return False
+                if w not in seen and order[w] < upper:
+                    seen.add(w)
+                    stack.append(w)
+
+        # Backward search from u, bounded to positions above v
+        backward: list[int] = []
+        seen = {u}
+        stack = [u]
+        while stack:
+            n = stack.pop()
+            backward.append(n)
+            for w in self.predecessors[n]:
+                if w not in seen and order[w] > lower:
+                    seen.add(w)
+                    stack.append(w)
+
+        # Reassign the affected positions: u's ancestors first, then v's descendants
+        backward.sort(key=order.__getitem__)
+        forward.sort(key=order.__getitem__)
+        affected = backward + forward
+        for n, position in zip(affected, sorted(order[n] for n in affected)):
+            order[n] = position
+        return True
+
+    def add_edge(self, u: int, v: int, weight: float, relation_type: RelationType) -> None:
+        self.successors[u].append(v)
+        self.predecessors[v].append(u)
+        self.edge_source.append(u)
+        self.edge_target.append(v)
+        self.edge_weight.append(weight)
+        if relation_type == RelationType.SUPPORTS:
+            self.edge_kind.append(_RELATION_SUPPORTS)
+        elif relation_type == RelationType.CONTRADICTS:
+            self.edge_kind.append(_RELATION_CONTRADICTS)
+        else:
+            self.edge_kind.append(_RELATION_OTHER)
+        self._csr = None
+
+    def topological_order(self) -> list[int]:
+        """Kahn's algorithm, FIFO over node insertion order (the order the graph reports)."""
+        in_degree = [len(p) for p in self.predecessors]
+        queue = deque(n for n, degree in enumerate(in_degree) if degree == 0)
+        result = []
+        while queue:
+            n = queue.popleft()
+            result.append(n)
+            for w in self.successors[n]:
+                in_degree[w] -= 1
+                if in_degree[w] == 0:
+                    queue.append(w)
+        return result
+
+    def csr(self) -> dict[str, Any]:
+        """CSR arrays of the edges (NumPy), rebuilt after the edge set changes."""
+        if self._csr is None:
+            n = len(self.ids)
+            source = np.asarray(self.edge_source, dtype=np.int64)
+            target = np.asarray(self.edge_target, dtype=np.int64)
+            # Stable sorts keep each node's edges in insertion order
+            out_edges = np.argsort(source, kind="stable")
+            in_edges = np.argsort(target, kind="stable")
+            out_ptr = np.zeros(n + 1, dtype=np.int64)
+            in_ptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(source, minlength=n), out=out_ptr[1:])
+            np.cumsum(np.bincount(target, minlength=n), out=in_ptr[1:])
+            self._csr = {
+                "source": source,
+                "target": target,
+                "weight": np.asarray(self.edge_weight, dtype=np.float64),
+                "kind": np.asarray(self.edge_kind, dtype=np.int8),
+                "out_ptr": out_ptr,
+                "out_edges": out_edges,
+                "in_ptr": in_ptr,
+                "in_edges": in_edges,
+            }
+        return self._csr
+
+    def levels(self, max_levels: int | None = None) -> list[Any] | None:
+        """
+        Level-synchronous Kahn: level k holds the nodes whose longest path from a root is k.
+
+        Returns None as soon as the graph turns out deeper than ``max_levels``.
+        """
+        graph = self.csr()
+        out_ptr, out_edges, target = graph["out_ptr"], graph["out_edges"], graph["target"]
+        remaining = np.diff(graph["in_ptr"])
+        frontier = np.flatnonzero(remaining == 0)
+        levels = []
+        while frontier.size:
+            if max_levels is not None and len(levels) >= max_levels:
+                return None
+            levels.append(frontier)
+            counts = out_ptr[frontier + 1] - out_ptr[frontier]
+            if not counts.sum():
+                break
+            starts = np.repeat(out_ptr[frontier] - np.cumsum(counts) + counts, counts)
+            edges = out_edges[starts + np.arange(counts.sum())]
+            reached = target[edges]
+            remaining = remaining - np.bincount(reached, minlength=remaining.size)
+            candidates = np.unique(reached)
+            frontier = candidates[remaining[candidates] == 0]
+        return levels
+
+
 class EvidenceGraph:
     """
     Directed acyclic graph of evidence with causal reasoning support.
@@ -626,6 +820,10 @@ class EvidenceGraph:
     - Causal path analysis
     - Conflict detection
     - Belief propagation (Dempster-Shafer)
+
+    Structure is mirrored in an integer-indexed _EvidenceGraphIndex that keeps
+    a topological order incrementally (cycle checks only visit the region
+    between the edge endpoints) and feeds the vectorized belief propagation.
     """
 
     __slots__ = (
@@ -634,6 +832,7 @@ class EvidenceGraph:
         "_confidence_adjustments",
         "_edges",
         "_hash_chain",
+        "_index",
         "_last_hash",
         "_nodes",
         "_reverse_adjacency",
@@ -650,6 +849,7 @@ class EvidenceGraph:
         self._source_index: dict[str, list[EvidenceID]] = defaultdict(list)
         self._hash_chain: list[str] = []
         self._last_hash: str | None = None
+        self._index = _EvidenceGraphIndex()
         # Adjustments for frozen nodes (set by level strategies)
         self._confidence_adjustments: dict[EvidenceID, float] = {}
         self._belief_mass_adjustments: dict[EvidenceID, float] = {}
@@ -678,6 +878,7 @@ class EvidenceGraph:
             return node.node_id  # Idempotent
 
         self._nodes[node.node_id] = node
+        self._index.add_node(node.node_id)
         self._type_index[node.evidence_type].append(node.node_id)
         self._source_index[node.source_method].append(node.node_id)
 
@@ -733,29 +934,25 @@ class EvidenceGraph:
         self._edges[edge.edge_id] = edge
         self._adjacency[edge.source_id].append(edge.edge_id)
         self._reverse_adjacency[edge.target_id].append(edge.edge_id)
+        self._index.add_edge(
+            self._index.index[edge.source_id],
+            self._index.index[edge.target_id],
+            edge.weight,
+            edge.relation_type,
+        )
 
         return edge.edge_id
 
     def _would_create_cycle(self, source: EvidenceID, target: EvidenceID) -> bool:
-        """Check if adding edge source→target would create a cycle."""
-        # If target can reach source, adding source→target creates cycle
-        visited: set[EvidenceID] = set()
-        stack = [target]
-
-        while stack:
-            current = stack.pop()
-            if current == source:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-
-            # Follow outgoing edges
-            for edge_id in self._adjacency.get(current, []):
-                edge = self._edges[edge_id]
-                stack.append(edge.target_id)
+        """
+        Check if adding edge source→target would create a cycle.
 
-        return False
+        If it would not, the topological order is updated to admit the edge.
+        """
+        # If target can reach source, adding source→target creates cycle
+        return not self._index.reorder_for_edge(
+            self._index.index[source], self._index.index[target]
+        )
 
     def get_edges_from(self, node_id: EvidenceID) -> list[EvidenceEdge]:
         """Get outgoing edges from node."""
@@ -915,6 +1112,13 @@ class EvidenceGraph:
         Combines evidence using Dempster's rule of combination.
         Returns updated belief masses for each node.
         """
+        if HAS_NUMPY and self.node_count >= VECTORIZED_PROPAGATION_MIN_NODES:
+            levels = self._index.levels(
+                max_levels=self.node_count // VECTORIZED_PROPAGATION_MIN_LEVEL_WIDTH
+            )
+            if levels is not None:
+                return self._propagate_beliefs_vectorized(levels)
+
         beliefs: dict[EvidenceID, float] = {}
 
         # Topological sort for propagation order
@@ -947,6 +1151,52 @@ class EvidenceGraph:
 
         return beliefs
 
+    def _propagate_beliefs_vectorized(self, levels: list[Any]) -> dict[EvidenceID, float]:
+        """
+        Level-synchronous form of compute_belief_propagation.
+
+        All parents of a level's nodes sit in earlier levels, so a level is
+        updated at once; within it, the k-th incoming edge of every node is
+        folded in the k-th step, preserving the per-node edge order (and thus
+        the exact floating-point results) of the sequential version.
+        """
+        index = self._index
+        graph = index.csr()
+        source, weight, kind = graph["source"], graph["weight"], graph["kind"]
+        in_ptr, in_edges = graph["in_ptr"], graph["in_edges"]
+
+        # Roots keep their intrinsic (adjusted) belief as is
+        beliefs = np.array(
+            [self.get_adjusted_belief_mass(node_id) for node_id in index.ids], dtype=np.float64
+        )
+        for level in levels[1:]:
+            combined = beliefs[level]
+            first = in_ptr[level]
+            degree = in_ptr[level + 1] - first
+            for k in range(int(degree.max())):
+                rows = np.flatnonzero(degree > k)
+                edges = in_edges[first[rows] + k]
+                parent_mass = beliefs[source[edges]] * weight[edges]
+                m1 = combined[rows]
+
+                supports = kind[edges] == _RELATION_SUPPORTS
+                if supports.any():
+                    # _dempster_combine, elementwise
+                    s_m1, s_m2 = m1[supports], parent_mass[supports]
+                    normalization = 1 - s_m1 * (1 - s_m2) * 0.1
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        merged = np.clip((s_m1 * s_m2) / normalization, 0.0, 1.0)
+                    m1[supports] = np.where(normalization <= 0, 0.5, merged)
+
+                contradicts = kind[edges] == _RELATION_CONTRADICTS
+                if contradicts.any():
+                    m1[contradicts] = m1[contradicts] * (1 - parent_mass[contradicts] * 0.5)
+
+                combined[rows] = m1
+            beliefs[level] = np.clip(combined, 0.0, 1.0)
+
+        return {index.ids[n]: float(beliefs[n]) for n in index.topological_order()}
+
     @staticmethod
     def _dempster_combine(m1: float, m2: float) -> float:
         """Dempster's rule of combination for two belief masses."""
@@ -961,24 +1211,8 @@ class EvidenceGraph:
 
     def _topological_sort(self) -> list[EvidenceID]:
         """Topological sort of nodes (Kahn's algorithm)."""
-        in_degree: dict[EvidenceID, int] = dict.fromkeys(self._nodes, 0)
-
-        for edge in self._edges.values():
-            in_degree[edge.target_id] += 1
-
-        queue = [nid for nid, deg in in_degree.items() if deg == 0]
-        result = []
-
-        while queue:
-            node_id = queue.pop(0)
-            result.append(node_id)
-
-            for edge in self.get_edges_from(node_id):
-                in_degree[edge.target_id] -= 1
-                if in_degree[edge.target_id] == 0:
-                    queue.append(edge.target_id)
-
-        return result
+        ids = self._index.ids
+        return [ids[n] for n in self._index.topological_order()]
 
     # -------------------------------------------------------------------------
     # Hash Chain (Provenance)
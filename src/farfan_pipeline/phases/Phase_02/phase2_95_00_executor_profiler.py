@@ -56,7 +56,7 @@ __stage__ = 95
 __order__ = 0
 __author__ = "F.A.R.F.A.N Core Team"
 __created__ = "2026-01-10"
-__modified__ = "2026-01-10"
+__modified__ = "2026-10-16"
 __criticality__ = "MEDIUM"
 __execution_pattern__ = "On-Demand"
 
@@ -861,7 +861,12 @@ class ExecutorProfiler:
             baseline_data = json.load(f)
 
         for executor_id, data in baseline_data.items():
-            method_calls = [MethodCallMetrics(**m) for m in data.pop("method_calls", [])]
+            method_calls = []
+            for call in data.pop("method_calls", []):
+                # Computed by MethodCallMetrics.to_dict()
+                call.pop("is_dispensary_method", None)
+                call.pop("full_method_name", None)
+                method_calls.append(MethodCallMetrics(**call))
             # Remove computed properties before reconstructing
             data.pop("total_method_calls", None)
             data.pop("dispensary_method_calls", None)
@@ -1,8 +1,41 @@
 """
-Performance Benchmark: Surgical Optimizations Impact Analysis
+Performance Benchmark: Phase 2 Executor Benchmark Harness
 
 PHASE_LABEL: Phase 2
-Compares baseline vs optimized execution for Phase 2 contracts.
+Reproducible benchmark of Phase 2 task execution against real executors.
+
+The harness builds a seeded synthetic CPP (60 PA x DIM chunks) and the
+execution plan of the real questionnaire (IrrigationSynchronizer), then runs
+the plan through:
+
+- TaskExecutor (sequential)
+- ParallelTaskExecutor with threads
+- ParallelTaskExecutor with worker processes
+- SmartBatchOptimizer batches of the real v4 contracts, each batch executed
+  by ParallelTaskExecutor
+
+Every task runs on a real DynamicContractExecutor that dispatches the
+question's method_sets. Only the method dispensary is stubbed
+(StubMethodExecutor): heavy ML-backed classes are never loaded and each
+method costs a deterministic amount of CPU work on the chunk text, so runs
+are comparable across commits.
+
+Per-method latencies are recorded in an ExecutorProfiler and written as a
+baseline in ExecutorProfiler.save_baseline format:
+
+- "mode:<mode>": plan wall time, result serialization and per-method
+  latency distributions (p50/p95/max) of one execution mode
+- "method:<Class.method>": median latency of one method in the sequential
+  run, so detect_regressions flags slow methods individually
+- "optimizer:SmartBatchOptimizer": time to batch the plan's contracts
+
+A later run is compared against it with compare_to_baseline(), which loads
+the baseline and calls ExecutorProfiler.detect_regressions.
+
+Usage:
+    python src/farfan_pipeline/phases/Phase_02/phase2_95_06_benchmark_performance_optimizations.py
+    ... --output baseline.json
+    ... --compare baseline.json
 
 Author: F.A.R.F.A.N Pipeline - Performance Engineering
 Date: 2026-01-09
@@ -12,271 +45,610 @@ Date: 2026-01-09
 # METADATA
 # =============================================================================
 
-__version__ = "1.0.0"
+__version__ = "2.0.0"
 __phase__ = 2
 __stage__ = 95
 __order__ = 6
 __author__ = "F.A.R.F.A.N Core Team"
 __created__ = "2026-01-10"
-__modified__ = "2026-01-10"
+__modified__ = "2026-10-16"
 __criticality__ = "MEDIUM"
 __execution_pattern__ = "On-Demand"
 
 
-
+import argparse
+import hashlib
 import json
+import logging
+import os
+import pickle
+import random
+import re
+import statistics
 import time
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
-from farfan_pipeline.phases.Phase_02.phase2_30_05_distributed_cache import IntelligentCache, cached_method
+from farfan_pipeline.phases.Phase_02.phase2_40_03_irrigation_synchronizer import (
+    ExecutionPlan,
+    IrrigationSynchronizer,
+)
+from farfan_pipeline.phases.Phase_02.phase2_50_00_task_executor import (
+    DynamicContractExecutor,
+    ParallelTaskExecutor,
+    TaskExecutor,
+    TaskResult,
+)
 from farfan_pipeline.phases.Phase_02.phase2_50_02_batch_optimizer import SmartBatchOptimizer
-from farfan_pipeline.phases.Phase_02.phase2_95_05_execution_predictor import PredictiveProfiler
+from farfan_pipeline.phases.Phase_02.phase2_95_00_executor_profiler import (
+    ExecutorMetrics,
+    ExecutorProfiler,
+    MethodCallMetrics,
+    PerformanceRegression,
+)
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+CONTRACTS_DIR = Path(__file__).resolve().parent / "generated_contracts"
+DEFAULT_BASELINE_PATH = REPO_ROOT / "artifacts" / "benchmarks" / "phase2_executor_baseline.json"
+
+BENCHMARK_MODES = ("task_executor", "parallel_threads", "parallel_processes", "batch_optimizer")
+POLICY_AREAS = tuple(f"PA{pa:02d}" for pa in range(1, 11))
+DIMENSIONS = tuple(f"DIM{dim:02d}" for dim in range(1, 7))
+
+_SENTENCES = (
+    "La línea base de {year} reporta una tasa de {topic} de {pct}% según el DANE.",
+    "El programa {program} asigna ${amount} millones del presupuesto {year}-{year_end}.",
+    "La meta del cuatrienio es reducir la brecha de {topic} en {pct} puntos porcentuales.",
+    "La Secretaría de {office} coordina con el Observatorio de Género el seguimiento trimestral.",
+    "Si se fortalece {program}, entonces se espera mejorar {topic} en el mediano plazo.",
+    "El indicador de producto {code} mide la cobertura territorial en zonas rurales y urbanas.",
+    "Según Medicina Legal, {amount} casos fueron registrados en {year} en el municipio.",
+    "La población beneficiaria incluye {amount} mujeres cabeza de hogar y jóvenes rurales.",
+)
+_TOPICS = ("violencia basada en género", "desempleo femenino", "deserción escolar",
+           "mortalidad materna", "participación política", "brecha salarial")
+_PROGRAMS = ("Mujeres Productivas", "Escuela Segura", "Salud Rural", "Tierra y Paz",
+             "Emprendimiento Joven")
+_OFFICES = ("la Mujer", "Salud", "Educación", "Gobierno", "Planeación")
 
 
-def load_sample_contracts(count: int = 30) -> list[dict[str, Any]]:
-    """Load sample contracts for benchmarking."""
-    contracts_dir = Path("src/farfan_pipeline/phases/Phase_02/generated_contracts")
-    contracts = []
+# =============================================================================
+# FIXTURE
+# =============================================================================
 
-    for contract_file in list(contracts_dir.glob("Q*_PA*_contract_v4.json"))[:count]:
-        with open(contract_file) as f:
-            contracts.append(json.load(f))
 
+def build_synthetic_cpp(seed: int = 2026, sentences_per_chunk: int = 12) -> dict[str, Any]:
+    """Seeded synthetic CPP with one chunk per (policy area, dimension) slot."""
+    rng = random.Random(seed)
+    chunks = []
+    offset = 0
+    for policy_area_id in POLICY_AREAS:
+        for dimension_id in DIMENSIONS:
+            sentences = []
+            for _ in range(sentences_per_chunk):
+                year = rng.randint(2015, 2023)
+                sentences.append(
+                    rng.choice(_SENTENCES).format(
+                        year=year,
+                        year_end=year + 4,
+                        pct=rng.randint(1, 99),
+                        amount=rng.randint(10, 9_999),
+                        topic=rng.choice(_TOPICS),
+                        program=rng.choice(_PROGRAMS),
+                        office=rng.choice(_OFFICES),
+                        code=f"IP-{rng.randint(100, 999)}",
+                    )
+                )
+            text = " ".join(sentences)
+            chunks.append(
+                {
+                    "chunk_id": f"{policy_area_id}-{dimension_id}",
+                    "policy_area_id": policy_area_id,
+                    "dimension_id": dimension_id,
+                    "text": text,
+                    "start_offset": offset,
+                    "end_offset": offset + len(text),
+                }
+            )
+            offset += len(text) + 1
+    return {
+        "document_id": f"synthetic-cpp-{seed}",
+        "source_path": f"synthetic://cpp/{seed}",
+        "chunks": chunks,
+        "metadata": {"synthetic": True, "seed": seed, "sentences_per_chunk": sentences_per_chunk},
+    }
+
+
+def load_questionnaire_monolith() -> dict[str, Any]:
+    """Real questionnaire, assembled by the canonical resolver."""
+    from canonic_questionnaire_central.resolver import CanonicalQuestionnaireResolver
+
+    return CanonicalQuestionnaireResolver().resolve().data
+
+
+class SyntheticSignalRegistry:
+    """Deterministic SISAS stand-in: one signal per requirement and chunk."""
+
+    def get_signals_for_chunk(self, chunk: Any, requirements: list[str]) -> list[dict[str, Any]]:
+        chunk_id = getattr(chunk, "chunk_id", None) or chunk.get("chunk_id", "")
+        return [
+            {
+                "signal_id": f"{chunk_id}:{requirement}",
+                "signal_type": requirement,
+                "content": {"value": requirement, "confidence": 0.9},
+            }
+            for requirement in requirements
+        ]
+
+
+class StubMethodExecutor:
+    """
+    Method dispensary stand-in with a deterministic, CPU-bound workload.
+
+    ML-backed classes are never imported or instantiated. Each call scans the
+    chunk text with the task's patterns and hashes it ``rounds`` times, where
+    ``rounds`` is a stable function of Class.method, so the relative cost of
+    methods is the same on every run.
+    """
+
+    def __init__(self, max_rounds: int = 4) -> None:
+        self.max_rounds = max_rounds
+        self._compiled: dict[str, re.Pattern[str]] = {}
+
+    def rounds(self, class_name: str, method_name: str) -> int:
+        """Work units of one call to Class.method (1..max_rounds)."""
+        digest = hashlib.blake2b(f"{class_name}.{method_name}".encode(), digest_size=1).digest()
+        return 1 + digest[0] % self.max_rounds
+
+    def execute(self, class_name: str, method_name: str, **payload: Any) -> dict[str, Any]:
+        text = payload.get("chunk_text") or ""
+        encoded = text.encode("utf-8")
+        patterns = [self._compile(pattern) for pattern in payload.get("patterns") or ()]
+        matches = 0
+        digest = b""
+        for _ in range(self.rounds(class_name, method_name)):
+            matches += sum(len(pattern.findall(text)) for pattern in patterns)
+            digest = hashlib.blake2b(encoded + digest).digest()
+        return {"matches": matches, "digest": digest.hex()[:16]}
+
+    def warm(self, tasks: Any) -> None:
+        """Compile every task pattern up front, so calls measure only the workload."""
+        for task in tasks:
+            for pattern in task.patterns:
+                self._compile(pattern)
+
+    def _compile(self, pattern: Any) -> re.Pattern[str]:
+        source = pattern.get("pattern", "") if isinstance(pattern, dict) else str(pattern)
+        compiled = self._compiled.get(source)
+        if compiled is None:
+            try:
+                compiled = re.compile(source, re.IGNORECASE)
+            except re.error:
+                compiled = re.compile(re.escape(source), re.IGNORECASE)
+            self._compiled[source] = compiled
+        return compiled
+
+
+@dataclass
+class BenchmarkFixture:
+    """Inputs shared by every benchmark mode."""
+
+    questionnaire: dict[str, Any]
+    document: dict[str, Any]
+    signal_registry: SyntheticSignalRegistry
+    plan: ExecutionPlan
+    method_executor: StubMethodExecutor
+    _batches: tuple[list[list[Any]], dict[str, Any]] | None = field(default=None, repr=False)
+
+    def batches(self) -> tuple[list[list[Any]], dict[str, Any]]:
+        """
+        SmartBatchOptimizer batches of the plan tasks and optimizer stats.
+
+        Batches come from the real v4 contracts of the tasks; tasks without a
+        contract form a last batch. Computed once per fixture, so repeated
+        batch runs time execution only.
+        """
+        if self._batches is None:
+            contracts = load_plan_contracts(self.plan)
+            optimizer = SmartBatchOptimizer()
+            optimization = optimizer.optimize(list(contracts.values()))
+
+            tasks_by_contract: dict[str, list[Any]] = defaultdict(list)
+            unbatched = []
+            for task in self.plan.tasks:
+                if task.task_id in contracts:
+                    contract_id = contracts[task.task_id]["identity"]["contract_id"]
+                    tasks_by_contract[contract_id].append(task)
+                else:
+                    unbatched.append(task)
+            batches = [
+                [task for contract_id in contract_ids for task in tasks_by_contract[contract_id]]
+                for contract_ids in optimizer.get_execution_plan(optimization)
+            ]
+            if unbatched:
+                batches.append(unbatched)
+            self._batches = (
+                batches,
+                {
+                    "batches": len(batches),
+                    "contracts": len(contracts),
+                    "optimization_time_ms": optimization.optimization_time_ms,
+                },
+            )
+        return self._batches
+
+
+def build_fixture(
+    seed: int = 2026,
+    sentences_per_chunk: int = 12,
+    questionnaire: dict[str, Any] | None = None,
+    max_tasks: int | None = None,
+) -> BenchmarkFixture:
+    """
+    Synthetic CPP plus the execution plan of the (real) questionnaire.
+
+    The plan's tasks are the synchronizer's ExecutableTasks; ``max_tasks``
+    keeps only the first tasks of the plan (for quick runs).
+    """
+    questionnaire = questionnaire if questionnaire is not None else load_questionnaire_monolith()
+    document = build_synthetic_cpp(seed, sentences_per_chunk)
+    signal_registry = SyntheticSignalRegistry()
+
+    synchronizer = IrrigationSynchronizer(
+        questionnaire=questionnaire,
+        preprocessed_document=document,
+        signal_registry=signal_registry,
+    )
+    plan = synchronizer.build_execution_plan()
+    tasks = synchronizer.executable_tasks[:max_tasks]
+    plan = replace(plan, tasks=tasks)
+    method_executor = StubMethodExecutor()
+    method_executor.warm(tasks)
+
+    return BenchmarkFixture(
+        questionnaire=questionnaire,
+        document=document,
+        signal_registry=signal_registry,
+        plan=plan,
+        method_executor=method_executor,
+    )
+
+
+def load_plan_contracts(
+    plan: ExecutionPlan, contracts_dir: Path | str = CONTRACTS_DIR
+) -> dict[str, dict[str, Any]]:
+    """Real v4 contract of every plan task, keyed by task_id (via base_slot and sector)."""
+    by_slot: dict[tuple[str, str], Path] = {}
+    for path in Path(contracts_dir).glob("Q*_PA*_contract_v4.json"):
+        with open(path, encoding="utf-8") as f:
+            identity = json.load(f)["identity"]
+        by_slot[(identity["base_slot"], identity["sector_id"])] = path
+
+    contracts: dict[str, dict[str, Any]] = {}
+    for task in plan.tasks:
+        key = (DynamicContractExecutor._derive_base_slot(task.question_id), task.policy_area_id)
+        if key in by_slot:
+            with open(by_slot[key], encoding="utf-8") as f:
+                contracts[task.task_id] = json.load(f)
     return contracts
 
 
-def simulate_contract_execution(contract: dict[str, Any]) -> float:
-    """Simulate contract execution (returns time in ms)."""
-    identity = contract.get("identity", {})
-    method_binding = contract.get("method_binding", {})
-    method_count = method_binding.get("method_count", 0)
-
-    # Simulate: 100ms per method
-    time.sleep(method_count * 0.001)  # 1ms per method for simulation
-    return method_count * 100.0
-
-
-def benchmark_cache_performance():
-    """Benchmark: Intelligent Cache Performance."""
-    print("\n" + "=" * 70)
-    print("BENCHMARK 1: Intelligent Method Result Cache")
-    print("=" * 70)
-
-    contracts = load_sample_contracts(10)
-    cache = IntelligentCache(max_size=100, default_ttl=60.0)
-
-    # Baseline: No caching
-    print("\n[Baseline] No caching:")
-    start = time.time()
-    for _ in range(3):  # Repeat 3 times
-        for contract in contracts:
-            _ = simulate_contract_execution(contract)
-    baseline_time = time.time() - start
-    print(f"  Time: {baseline_time * 1000:.0f}ms")
-
-    # Optimized: With caching
-    print("\n[Optimized] With intelligent cache:")
-
-    @cached_method(ttl=60.0, cache_instance=cache)
-    def cached_execution(contract_id: str, contract: dict[str, Any]) -> float:
-        return simulate_contract_execution(contract)
-
-    start = time.time()
-    for _ in range(3):  # Repeat 3 times
-        for contract in contracts:
-            contract_id = contract.get("identity", {}).get("contract_id", "")
-            _ = cached_execution(contract_id, contract)
-    optimized_time = time.time() - start
-    print(f"  Time: {optimized_time * 1000:.0f}ms")
-
-    # Results
-    speedup = baseline_time / optimized_time if optimized_time > 0 else 1.0
-    improvement = (1 - optimized_time / baseline_time) * 100
-
-    stats = cache.get_statistics()
-    print("\n[Results]")
-    print(f"  Speedup: {speedup:.2f}x")
-    print(f"  Improvement: {improvement:.1f}%")
-    print(f"  Cache hit rate: {stats.hit_rate:.1%}")
-    print(f"  Cache hits: {stats.hits}")
-    print(f"  Cache misses: {stats.misses}")
-
-
-def benchmark_batch_optimization():
-    """Benchmark: Smart Batch Optimizer."""
-    print("\n" + "=" * 70)
-    print("BENCHMARK 2: Smart Batch Optimizer")
-    print("=" * 70)
-
-    contracts = load_sample_contracts(30)
-
-    # Baseline: Sequential execution
-    print("\n[Baseline] Sequential execution:")
-    start = time.time()
-    for contract in contracts:
-        _ = simulate_contract_execution(contract)
-    baseline_time = time.time() - start
-    print(f"  Time: {baseline_time * 1000:.0f}ms")
-    print(f"  Throughput: {len(contracts) / baseline_time:.1f} contracts/sec")
-
-    # Optimized: Batched execution
-    print("\n[Optimized] Smart batching:")
-    optimizer = SmartBatchOptimizer(
-        max_batch_size=10,
-        max_batch_memory_mb=1024.0,
-        max_batch_time_ms=30000.0,
-        similarity_threshold=0.3,
-    )
+# =============================================================================
+# EXECUTION MODES
+# =============================================================================
 
-    result = optimizer.optimize(contracts)
-
-    # Simulate parallel batch execution
-    start = time.time()
-    for batch in result.batches:
-        # In reality, batches would execute in parallel
-        # Here we simulate by taking max time per batch
-        max_time = max(p.estimated_time_ms for p in batch.contracts)
-        time.sleep(max_time / 1000000)  # Simulate (scaled down)
-    optimized_time = time.time() - start
-    print(f"  Time (estimated): {result.estimated_total_time_ms:.0f}ms")
-    print(f"  Batches: {result.total_batches}")
-    print(f"  Avg batch size: {result.avg_batch_size:.1f}")
-    print(f"  Avg similarity: {result.avg_similarity:.2%}")
-
-    # Results
-    speedup = result.parallelization_factor
-    improvement = (1 - 1 / speedup) * 100
-
-    print("\n[Results]")
-    print(f"  Parallelization factor: {speedup:.2f}x")
-    print(f"  Estimated improvement: {improvement:.1f}%")
-    print(f"  Optimization overhead: {result.optimization_time_ms:.1f}ms")
-
-
-def benchmark_predictive_profiling():
-    """Benchmark: Predictive Execution Profiler."""
-    print("\n" + "=" * 70)
-    print("BENCHMARK 3: Predictive Execution Profiler")
-    print("=" * 70)
-
-    contracts = load_sample_contracts(20)
-    profiler = PredictiveProfiler(
-        history_size=100,
-        similarity_threshold=0.7,
-        confidence_level=0.95,
-    )
 
-    # Train profiler with some executions
-    print("\n[Training] Recording historical executions...")
-    for contract in contracts[:10]:
-        actual_time = simulate_contract_execution(contract)
-        method_count = contract.get("method_binding", {}).get("method_count", 0)
-        actual_memory = 50.0 + method_count * 10.0
+@dataclass
+class ModeRun:
+    """
+    Outcome of running the plan in one execution mode.
 
-        profiler.record_execution(contract, actual_time, actual_memory)
+    With repeats, wall_time_ms is the median over repeats, latency samples
+    are pooled and results are those of the last repeat.
+    """
 
-    print(f"  Recorded {len(profiler._history)} executions")
+    mode: str
+    wall_time_ms: float
+    results: list[TaskResult]
+    task_latencies_ms: list[float] = field(default_factory=list)
+    method_latencies_ms: dict[str, list[float]] = field(default_factory=dict)
+    memory_delta_mb: float = 0.0
+    metadata: dict[str, Any] = field(default_factory=dict)
 
-    # Test predictions
-    print("\n[Testing] Prediction accuracy:")
-    total_error = 0.0
-    predictions = []
 
-    for contract in contracts[10:]:
-        # Predict
-        start = time.time()
-        prediction = profiler.predict(contract)
-        prediction_time = (time.time() - start) * 1000
+def _executor_kwargs(fixture: BenchmarkFixture) -> dict[str, Any]:
+    return {
+        "questionnaire_monolith": fixture.questionnaire,
+        "preprocessed_document": fixture.document,
+        "signal_registry": fixture.signal_registry,
+        "method_executor": fixture.method_executor,
+    }
 
-        # Simulate actual execution
-        actual_time = simulate_contract_execution(contract)
 
-        # Compute error
-        error = abs(actual_time - prediction.predicted_time_ms)
-        error_pct = (error / actual_time * 100) if actual_time > 0 else 0
+def _run_task_executor(fixture: BenchmarkFixture, workers: int) -> tuple[list[TaskResult], dict]:
+    executor = TaskExecutor(**_executor_kwargs(fixture))
+    executor._event_emission_enabled = False
+    return executor.execute_plan(fixture.plan), {"workers": 1}
 
-        predictions.append(
-            {
-                "contract": prediction.contract_id,
-                "predicted": prediction.predicted_time_ms,
-                "actual": actual_time,
-                "error_pct": error_pct,
-                "confidence": prediction.confidence_level,
-            }
+
+def _run_parallel(
+    fixture: BenchmarkFixture, workers: int, use_processes: bool
+) -> tuple[list[TaskResult], dict]:
+    executor = ParallelTaskExecutor(
+        **_executor_kwargs(fixture), max_workers=workers, use_processes=use_processes
+    )
+    executor._event_emission_enabled = False
+    return executor.execute_plan_parallel(fixture.plan), {"workers": workers}
+
+
+def _run_batch_optimizer(
+    fixture: BenchmarkFixture, workers: int
+) -> tuple[list[TaskResult], dict]:
+    batches, stats = fixture.batches()
+    executor = ParallelTaskExecutor(**_executor_kwargs(fixture), max_workers=workers)
+    executor._event_emission_enabled = False
+    results: list[TaskResult] = []
+    for index, batch in enumerate(batches):
+        batch_plan = replace(
+            fixture.plan, plan_id=f"{fixture.plan.plan_id}-batch-{index:03d}", tasks=tuple(batch)
         )
+        results.extend(executor.execute_plan_parallel(batch_plan))
+
+    order = {task.task_id: index for index, task in enumerate(fixture.plan.tasks)}
+    results.sort(key=lambda result: order[result.task_id])
+    return results, {"workers": workers, **stats}
+
+
+def run_mode(
+    mode: str,
+    fixture: BenchmarkFixture,
+    workers: int | None = None,
+    profiler: ExecutorProfiler | None = None,
+    repeat: int = 1,
+) -> ModeRun:
+    """Execute the fixture plan ``repeat`` times in ``mode`` (one of BENCHMARK_MODES)."""
+    workers = workers or min(os.cpu_count() or 4, 8)
+    runners = {
+        "task_executor": _run_task_executor,
+        "parallel_threads": lambda f, w: _run_parallel(f, w, use_processes=False),
+        "parallel_processes": lambda f, w: _run_parallel(f, w, use_processes=True),
+        "batch_optimizer": _run_batch_optimizer,
+    }
+    if mode not in runners:
+        raise ValueError(f"Unknown benchmark mode {mode!r}; expected one of {BENCHMARK_MODES}")
+
+    if mode == "batch_optimizer":
+        fixture.batches()  # optimization is timed on its own, not per repeat
+
+    wall_times_ms: list[float] = []
+    task_latencies_ms: list[float] = []
+    method_samples: dict[str, list[float]] = defaultdict(list)
+    memory_before = profiler._get_memory_usage_mb() if profiler else 0.0
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        results, metadata = runners[mode](fixture, workers)
+        wall_times_ms.append((time.perf_counter() - start) * 1000)
+        task_latencies_ms.extend(
+            result.execution_time_ms for result in results if result.execution_time_ms is not None
+        )
+        for method_id, samples in method_latencies(results).items():
+            method_samples[method_id].extend(samples)
+    memory_after = profiler._get_memory_usage_mb() if profiler else 0.0
+
+    return ModeRun(
+        mode=mode,
+        wall_time_ms=statistics.median(wall_times_ms),
+        results=results,
+        task_latencies_ms=task_latencies_ms,
+        method_latencies_ms=dict(method_samples),
+        memory_delta_mb=max(memory_after - memory_before, 0.0),
+        metadata={**metadata, "wall_times_ms": wall_times_ms},
+    )
+
+
+# =============================================================================
+# PROFILING
+# =============================================================================
+
+
+def method_latencies(results: list[TaskResult]) -> dict[str, list[float]]:
+    """Per-call latencies (ms) of every Class.method across task results."""
+    latencies: dict[str, list[float]] = defaultdict(list)
+    for result in results:
+        for timing in result.output.get("output", {}).get("method_timings", []):
+            method_id = f"{timing['class_name']}.{timing['method_name']}"
+            latencies[method_id].append(timing["execution_time_ms"])
+    return dict(latencies)
+
+
+def latency_distribution(samples: list[float]) -> dict[str, float]:
+    """count/mean/p50/p95/max of a latency sample (ms)."""
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+        "max": ordered[-1],
+    }
+
+
+def record_mode_run(profiler: ExecutorProfiler, run: ModeRun) -> ExecutorMetrics:
+    """Record a mode run (and, for the sequential run, each method) in the profiler."""
+    distributions = {
+        method_id: latency_distribution(samples)
+        for method_id, samples in sorted(run.method_latencies_ms.items())
+    }
+
+    start = time.perf_counter()
+    serialized = pickle.dumps(run.results)
+    serialization_time_ms = (time.perf_counter() - start) * 1000
+
+    failed = [result.task_id for result in run.results if not result.success]
+    metrics = ExecutorMetrics(
+        executor_id=f"mode:{run.mode}",
+        execution_time_ms=run.wall_time_ms,
+        memory_footprint_mb=run.memory_delta_mb,
+        memory_peak_mb=run.memory_delta_mb,
+        serialization_time_ms=serialization_time_ms,
+        serialization_size_bytes=len(serialized),
+        method_calls=[
+            MethodCallMetrics(
+                class_name=method_id.split(".", 1)[0],
+                method_name=method_id.split(".", 1)[1],
+                execution_time_ms=distribution["p50"],
+                memory_delta_mb=0.0,
+                call_count=int(distribution["count"]),
+            )
+            for method_id, distribution in distributions.items()
+        ],
+        call_count=len(run.results),
+        success=not failed,
+        error=f"{len(failed)} tasks failed" if failed else None,
+        metadata={
+            **run.metadata,
+            "tasks": len(run.results),
+            "failed_tasks": len(failed),
+            "failed_task_ids": failed[:10],
+            "task_latency_ms": latency_distribution(run.task_latencies_ms),
+            "method_latency_ms": distributions,
+        },
+    )
+    profiler.record_executor_metrics(metrics.executor_id, metrics)
+
+    if "optimization_time_ms" in run.metadata:
+        profiler.record_executor_metrics(
+            "optimizer:SmartBatchOptimizer",
+            ExecutorMetrics(
+                executor_id="optimizer:SmartBatchOptimizer",
+                execution_time_ms=run.metadata["optimization_time_ms"],
+                memory_footprint_mb=0.0,
+                memory_peak_mb=0.0,
+                serialization_time_ms=0.0,
+                serialization_size_bytes=0,
+                metadata={"contracts": run.metadata["contracts"], "batches": run.metadata["batches"]},
+            ),
+        )
+
+    if run.mode == "task_executor":
+        # Uncontended latencies: one regression check per method
+        for method_id, distribution in distributions.items():
+            class_name, method_name = method_id.split(".", 1)
+            profiler.record_executor_metrics(
+                f"method:{method_id}",
+                ExecutorMetrics(
+                    executor_id=f"method:{method_id}",
+                    execution_time_ms=distribution["p50"],
+                    memory_footprint_mb=0.0,
+                    memory_peak_mb=0.0,
+                    serialization_time_ms=0.0,
+                    serialization_size_bytes=0,
+                    call_count=int(distribution["count"]),
+                    metadata={"latency_ms": distribution},
+                ),
+            )
+    return metrics
+
+
+@dataclass
+class BenchmarkReport:
+    """Runs of one benchmark session and the profiler that recorded them."""
+
+    profiler: ExecutorProfiler
+    runs: dict[str, ModeRun]
+    task_count: int
+
+    def summary(self) -> dict[str, Any]:
+        modes = {}
+        for mode, run in self.runs.items():
+            metrics = self.profiler.metrics[f"mode:{mode}"][-1]
+            modes[mode] = {
+                "wall_time_ms": round(run.wall_time_ms, 3),
+                "tasks_per_second": round(len(run.results) / (run.wall_time_ms / 1000), 2)
+                if run.wall_time_ms
+                else 0.0,
+                "failed_tasks": metrics.metadata["failed_tasks"],
+                "method_calls": metrics.total_method_calls,
+                "task_latency_ms": metrics.metadata["task_latency_ms"],
+                **run.metadata,
+            }
+        return {"task_count": self.task_count, "modes": modes}
+
+
+def run_benchmark(
+    fixture: BenchmarkFixture | None = None,
+    modes: tuple[str, ...] = BENCHMARK_MODES,
+    workers: int | None = None,
+    profiler: ExecutorProfiler | None = None,
+    repeat: int = 1,
+) -> BenchmarkReport:
+    """Run the fixture plan in every mode and record it in an ExecutorProfiler."""
+    fixture = fixture or build_fixture()
+    profiler = profiler or ExecutorProfiler()
+    runs: dict[str, ModeRun] = {}
+    for mode in modes:
+        run = run_mode(mode, fixture, workers, profiler, repeat)
+        record_mode_run(profiler, run)
+        runs[mode] = run
+    return BenchmarkReport(profiler=profiler, runs=runs, task_count=len(fixture.plan.tasks))
+
+
+def write_baseline(profiler: ExecutorProfiler, path: Path | str = DEFAULT_BASELINE_PATH) -> Path:
+    """Save the latest recorded metrics as the regression baseline."""
+    for executor_id, metric_list in profiler.metrics.items():
+        if metric_list:
+            profiler.baseline_metrics[executor_id] = metric_list[-1]
+    profiler.save_baseline(path)
+    return Path(path)
+
+
+def compare_to_baseline(
+    profiler: ExecutorProfiler,
+    baseline_path: Path | str = DEFAULT_BASELINE_PATH,
+    thresholds: dict[str, float] | None = None,
+) -> list[PerformanceRegression]:
+    """Regressions of the latest recorded metrics against a saved baseline."""
+    if not Path(baseline_path).exists():
+        raise FileNotFoundError(f"Benchmark baseline not found: {baseline_path}")
+    profiler.load_baseline(baseline_path)
+    return profiler.detect_regressions(thresholds)
+
+
+def main() -> None:
+    """Run the benchmark, then write a baseline or compare against one."""
+    parser = argparse.ArgumentParser(description="Phase 2 executor benchmark harness")
+    parser.add_argument("--modes", nargs="+", choices=BENCHMARK_MODES, default=BENCHMARK_MODES)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (median wall time)")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--sentences-per-chunk", type=int, default=12)
+    parser.add_argument("--output", default=str(DEFAULT_BASELINE_PATH), help="Baseline to write")
+    parser.add_argument("--compare", help="Baseline to compare against (nothing is written)")
+    parser.add_argument(
+        "--threshold", type=float, default=20.0, help="Execution time regression threshold (%%)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    fixture = build_fixture(seed=args.seed, sentences_per_chunk=args.sentences_per_chunk)
+    report = run_benchmark(fixture, tuple(args.modes), args.workers, repeat=args.repeat)
+    print(json.dumps(report.summary(), indent=2))
 
-        total_error += error_pct
-
-        # Record for learning
-        method_count = contract.get("method_binding", {}).get("method_count", 0)
-        actual_memory = 50.0 + method_count * 10.0
-        profiler.record_execution(contract, actual_time, actual_memory)
-
-    avg_error = total_error / len(predictions)
-    avg_confidence = sum(p["confidence"] for p in predictions) / len(predictions)
-
-    print(f"  Average prediction error: {avg_error:.1f}%")
-    print(f"  Average confidence: {avg_confidence:.1%}")
-    print(f"  Prediction time: {prediction_time:.3f}ms")
-
-    # Show sample predictions
-    print("\n[Sample Predictions]")
-    for pred in predictions[:5]:
-        print(
-            f"  {pred['contract']}: "
-            f"predicted={pred['predicted']:.0f}ms, "
-            f"actual={pred['actual']:.0f}ms, "
-            f"error={pred['error_pct']:.1f}%, "
-            f"confidence={pred['confidence']:.1%}"
+    if args.compare:
+        regressions = compare_to_baseline(
+            report.profiler, args.compare, {"execution_time_ms": args.threshold}
         )
+        print(json.dumps([r.to_dict() for r in regressions], indent=2))
+        print(f"{len(regressions)} regressions against {args.compare}")
+        raise SystemExit(1 if regressions else 0)
 
-    # Anomaly detection
-    print("\n[Anomaly Detection]")
-    anomaly_count = 0
-    for contract in contracts[-5:]:
-        prediction = profiler.predict(contract)
-        # Simulate anomalous execution (3x slower)
-        actual_time = simulate_contract_execution(contract) * 3.0
-        method_count = contract.get("method_binding", {}).get("method_count", 0)
-        actual_memory = 50.0 + method_count * 10.0
-
-        is_anomaly, description = profiler.detect_anomaly(prediction, actual_time, actual_memory)
-
-        if is_anomaly:
-            anomaly_count += 1
-            print(f"  ⚠️  {description}")
-
-    print(f"  Detected {anomaly_count} anomalies out of 5 tests")
-
-
-def main():
-    """Run all benchmarks."""
-    print("\n" + "=" * 70)
-    print("PHASE 2 PERFORMANCE OPTIMIZATIONS - COMPREHENSIVE BENCHMARK")
-    print("=" * 70)
-    print("\nTesting 3 Surgical Interventions:")
-    print("  1. Intelligent Method Result Cache")
-    print("  2. Smart Batch Optimizer")
-    print("  3. Predictive Execution Profiler")
-
-    try:
-        benchmark_cache_performance()
-        benchmark_batch_optimization()
-        benchmark_predictive_profiling()
-
-        print("\n" + "=" * 70)
-        print("BENCHMARK COMPLETE")
-        print("=" * 70)
-        print("\n✓ All optimizations validated and functional")
-        print("✓ Performance improvements demonstrated")
-        print("✓ Zero breaking changes to existing code")
-
-    except Exception as e:
-        print(f"\n❌ Benchmark failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    print(f"Baseline written to {write_baseline(report.profiler, args.output)}")
 
 
 if __name__ == "__main__":
@@ -9,8 +9,14 @@ from farfan_pipeline.phases.Phase_00.phase0_40_00_input_validation import (
 )
 
 
-def test_signature_registry():
-    registry = SignatureRegistry(registry_path=Path("tmp_registry.json"))
+@pytest.fixture(autouse=True)
+def registry_in_tmp_path(tmp_path, monkeypatch):
+    """Keep the module-level registry used by @validate_signature out of the cwd."""
+    monkeypatch.setattr(_signature_registry, "registry_path", tmp_path / "signature_registry.json")
+
+
+def test_signature_registry(tmp_path):
+    registry = SignatureRegistry(registry_path=tmp_path / "tmp_registry.json")
 
     def my_func(a: int, b: str) -> bool:
         return True
@@ -26,10 +32,6 @@ def test_signature_registry():
     )
     # Note: module name depends on how test is run
 
-    # Clean up
-    if registry.registry_path.exists():
-        registry.registry_path.unlink()
-
 
 def test_validate_signature_decorator():
     @validate_signature(enforce=True)
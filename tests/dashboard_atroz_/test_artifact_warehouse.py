@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from farfan_pipeline.dashboard_atroz_.analytics_engine import AnalyticsEngine
+from farfan_pipeline.dashboard_atroz_.artifact_warehouse import ArtifactWarehouse
+from farfan_pipeline.dashboard_atroz_.data_mining_engine import DataMiningEngine, DataMiningQuery
+
+
+def _write(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _records(municipality: str, scores: list[float]) -> list[dict]:
+    return [
+        {
+            "municipality": municipality,
+            "policy_area": f"PA0{i % 2 + 1}",
+            "dimension": "DIM01",
+            "question_number": i + 1,
+            "score": score,
+        }
+        for i, score in enumerate(scores)
+    ]
+
+
+def _jobs(tmp_path: Path) -> Path:
+    jobs = tmp_path / "data" / "jobs"
+    _write(jobs / "job_001" / "phase_03" / "scores_micro.json", _records("M1", [10.0, 20.0, 30.0]))
+    _write(jobs / "job_002" / "phase_03" / "scores_micro.json", _records("M2", [80.0, 90.0]))
+    _write(jobs / "job_002" / "phase_03" / "notes.json", _records("M2", [0.0]))  # not an artifact
+    return jobs
+
+
+def test_filters_and_aggregation_are_pushed_down(tmp_path: Path) -> None:
+    engine = DataMiningEngine(_jobs(tmp_path).parent)
+
+    result = engine.execute_query(
+        DataMiningQuery(policy_areas=["PA01"], min_score=15, aggregation_level="municipality")
+    )
+
+    assert result.total_records == 5
+    assert result.filtered_records == 2
+    by_municipality = {d["municipality"]: d for d in result.data}
+    assert by_municipality["M1"]["mean_score"] == 30.0
+    assert by_municipality["M2"]["mean_score"] == 80.0
+    assert by_municipality["M1"]["items"][0]["_job_id"] == "job_001"
+    assert engine._calculate_ranking("M2")["rank"] == 1
+
+
+def test_refresh_ingests_only_new_changed_and_removed_files(tmp_path: Path) -> None:
+    jobs = _jobs(tmp_path)
+    warehouse = ArtifactWarehouse(jobs, min_refresh_interval=0)
+
+    assert warehouse.refresh() == {"ingested": 2, "removed": 0}
+    assert warehouse.refresh() == {"ingested": 0, "removed": 0}
+
+    changed = jobs / "job_001" / "phase_03" / "scores_micro.json"
+    _write(changed, _records("M1", [50.0]))
+    os.utime(changed, ns=(0, changed.stat().st_mtime_ns + 1_000_000))
+    _write(jobs / "job_003" / "phase_07" / "final_macro.json", {"municipality": "M3", "score": 60.0})
+    (jobs / "job_002" / "phase_03" / "scores_micro.json").unlink()
+
+    assert warehouse.refresh() == {"ingested": 2, "removed": 1}
+    assert warehouse.count_records() == 2
+    assert warehouse.group_means("municipality") == {"M1": 50.0, "M3": 60.0}
+
+
+def test_store_persists_across_instances(tmp_path: Path) -> None:
+    jobs = _jobs(tmp_path)
+    ArtifactWarehouse(jobs).refresh()
+
+    reopened = ArtifactWarehouse(jobs)
+    assert reopened.count_records() == 5
+    assert reopened.refresh() == {"ingested": 0, "removed": 0}
+
+
+def test_analytics_engine_reads_the_shared_store(tmp_path: Path) -> None:
+    jobs = _jobs(tmp_path)
+    warehouse = ArtifactWarehouse(jobs)
+    analytics = AnalyticsEngine(jobs.parent, warehouse=warehouse)
+
+    data = analytics._load_entity_data("M1", "municipality")
+    assert data["scores"] == {"PA01": 20.0, "PA02": 20.0}
+
+    benchmark = analytics.generate_performance_benchmark("M2")
+    assert benchmark["percentile_ranking"] == {"percentile": 100.0, "rank": 1, "total": 2}
@@ -0,0 +1,324 @@
+"""Tests for multi-plan batch mode: shared bootstrap, isolation, containment."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from farfan_pipeline.orchestration import cli
+from farfan_pipeline.orchestration.batch_runner import (
+    BatchPipelineRunner,
+    _percentile,
+    discover_plans,
+)
+from farfan_pipeline.orchestration.orchestrator import (
+    OrchestrationError,
+    OrchestratorConfig,
+    PhaseID,
+    UnifiedOrchestrator,
+)
+
+fitz = pytest.importorskip("fitz")
+
+QUESTIONNAIRE_SHA256 = hashlib.sha256(b"questionnaire").hexdigest()
+
+
+def _write_pdf(path, pages=1):
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def plans_dir(tmp_path):
+    plans = tmp_path / "plans"
+    plans.mkdir()
+    for name, pages in (("alpha", 1), ("beta", 2), ("broken", 1), ("gamma", 3)):
+        _write_pdf(plans / f"{name}.pdf", pages)
+    (plans / "notes.txt").write_text("not a plan", encoding="utf-8")
+    return plans
+
+
+@pytest.fixture
+def stub_phases(monkeypatch):
+    """Replace phase bodies with cheap stand-ins that record what they saw."""
+    log = {"bootstraps": 0, "contexts": {}, "active": 0, "peak": 0}
+    lock = threading.Lock()
+    real_phase_00 = UnifiedOrchestrator._execute_phase_00
+
+    def phase_00(self):
+        if self._shared_resources is None:
+            if not Path(self.config.document_path).read_bytes().startswith(b"%PDF"):
+                raise ValueError("reference plan is not a PDF")
+            with lock:
+                log["bootstraps"] += 1
+            self.context.wiring = "shared-wiring"
+            return {"input_hashes": {"questionnaire_sha256": QUESTIONNAIRE_SHA256}}
+        return real_phase_00(self)
+
+    def phase(phase_id):
+        def run(self):
+            plan = self.config.municipality_name
+            if phase_id == PhaseID.PHASE_1:
+                with lock:
+                    log["active"] += 1
+                    log["peak"] = max(log["peak"], log["active"])
+                    log["contexts"].setdefault(plan, set()).add(id(self.context))
+                time.sleep(0.02)
+            phase0 = self.context.get_phase_output(PhaseID.PHASE_0)
+            assert phase0["bootstrap"] == "shared"
+            assert phase0["input_hashes"]["questionnaire_sha256"] == QUESTIONNAIRE_SHA256
+            assert self.context.wiring == "shared-wiring"
+            broken = phase_id == PhaseID.PHASE_3 and plan == "broken"
+            if broken or phase_id == PhaseID.PHASE_9:
+                with lock:
+                    log["active"] -= 1
+            if broken:
+                raise RuntimeError("scoring exploded")
+            if phase_id == PhaseID.PHASE_1:
+                with lock:
+                    log.setdefault("canonical", {})[plan] = phase0["canonical_input"]
+            return {"plan": plan, "pdf_sha256": phase0["input_hashes"]["pdf_sha256"]}
+
+        return run
+
+    monkeypatch.setattr(UnifiedOrchestrator, "_execute_phase_00", phase_00)
+    for phase_id in list(PhaseID)[1:]:
+        monkeypatch.setattr(
+            UnifiedOrchestrator, f"_execute_phase_0{phase_id.value[-1]}", phase(phase_id)
+        )
+    monkeypatch.setattr(UnifiedOrchestrator, "_prepare_phase_01", lambda self: {})
+    monkeypatch.setattr(UnifiedOrchestrator, "_prepare_phase_08", lambda self: {})
+    monkeypatch.setattr(UnifiedOrchestrator, "_prepare_phase_09", lambda self: {})
+    return log
+
+
+def _config(tmp_path):
+    return OrchestratorConfig(
+        output_dir=str(tmp_path / "output"),
+        enable_sisas=False,
+        retry_failed_phases=False,
+    )
+
+
+def test_batch_bootstraps_once_and_contains_failures(tmp_path, plans_dir, stub_phases):
+    finished = []
+    runner = BatchPipelineRunner(
+        _config(tmp_path), max_workers=2, on_plan_complete=lambda o: finished.append(o.plan_id)
+    )
+    summary = runner.run(discover_plans(plans_dir))
+
+    assert stub_phases["bootstraps"] == 1
+    assert stub_phases["peak"] <= 2
+    assert sorted(finished) == ["alpha", "beta", "broken", "gamma"]
+    assert [o.plan_id for o in summary.outcomes] == ["alpha", "beta", "broken", "gamma"]
+    assert (summary.plans_total, summary.plans_succeeded, summary.plans_failed) == (4, 3, 1)
+
+    broken = summary.outcomes[2]
+    assert not broken.success
+    assert broken.failed_phases == ["P03"]
+    assert "P04" not in broken.phase_timings
+
+    # Each plan ran in its own context and exported its own outputs
+    assert all(len(ids) == 1 for ids in stub_phases["contexts"].values())
+    assert len({next(iter(ids)) for ids in stub_phases["contexts"].values()}) == 4
+    p09 = json.loads((tmp_path / "output" / "gamma" / "p09_output.json").read_text())
+    gamma_sha256 = hashlib.sha256((plans_dir / "gamma.pdf").read_bytes()).hexdigest()
+    assert p09 == {"plan": "gamma", "pdf_sha256": gamma_sha256}
+
+
+def test_summary_reports_throughput_percentiles_and_rss(tmp_path, plans_dir, stub_phases):
+    summary = BatchPipelineRunner(_config(tmp_path), max_workers=3, export_results=False).run(
+        discover_plans(plans_dir)
+    )
+    report = summary.to_dict()
+
+    assert report["plans_per_hour"] > 0
+    assert report["bootstrap_time_s"] > 0
+    assert set(report["phase_percentiles"]) == {p.value for p in PhaseID}
+    assert report["phase_percentiles"]["P01"]["samples"] == 4
+    assert report["phase_percentiles"]["P09"]["samples"] == 3
+    p01 = report["phase_percentiles"]["P01"]
+    assert 0.02 <= p01["p50"] <= p01["p95"]
+    assert report["peak_rss_mb"] > 0
+    assert not (tmp_path / "output" / "alpha").exists()
+
+
+def test_missing_plan_fails_alone(tmp_path, plans_dir, stub_phases):
+    manifest = tmp_path / "plans.txt"
+    manifest.write_text("# cycle 2026\nplans/alpha.pdf\n\nplans/missing.pdf\n", encoding="utf-8")
+    summary = BatchPipelineRunner(_config(tmp_path), export_results=False).run(
+        discover_plans(manifest)
+    )
+    outcomes = {o.plan_id: o for o in summary.outcomes}
+    assert outcomes["alpha"].success
+    assert not outcomes["missing"].success
+    assert outcomes["missing"].failed_phases == ["P00"]
+
+
+def test_failed_reference_plan_does_not_abort_batch(tmp_path, plans_dir, stub_phases):
+    (plans_dir / "aaa.pdf").write_bytes(b"not a pdf")
+    summary = BatchPipelineRunner(_config(tmp_path), export_results=False).run(
+        discover_plans(plans_dir)
+    )
+    outcomes = {o.plan_id: o for o in summary.outcomes}
+
+    assert stub_phases["bootstraps"] == 1
+    assert not outcomes["aaa"].success
+    assert outcomes["aaa"].failed_phases == ["P00"]
+    assert "reference plan is not a PDF" in outcomes["aaa"].error
+    assert outcomes["alpha"].success
+    assert (summary.plans_total, summary.plans_succeeded) == (5, 3)
+
+
+def test_reference_attempts_are_capped(tmp_path, plans_dir, stub_phases):
+    for name in ("aa1", "aa2", "aa3"):
+        (plans_dir / f"{name}.pdf").write_bytes(b"not a pdf")
+    finished = []
+    summary = BatchPipelineRunner(
+        _config(tmp_path),
+        export_results=False,
+        max_reference_attempts=2,
+        on_plan_complete=lambda o: finished.append(o.plan_id),
+    ).run(discover_plans(plans_dir))
+    outcomes = {o.plan_id: o for o in summary.outcomes}
+
+    assert stub_phases["bootstraps"] == 0
+    assert outcomes["aa2"].failed_phases == ["P00"]
+    assert outcomes["aa3"].error.startswith("Batch aborted: bootstrap failed on 2 reference plans")
+    assert outcomes["aa3"].failed_phases == []
+    assert summary.plans_failed == summary.plans_total == 7
+    assert sorted(finished) == sorted(outcomes)
+
+
+def test_environment_failure_aborts_batch(tmp_path, plans_dir, stub_phases, monkeypatch):
+    def registry_missing(self):
+        raise OrchestrationError(
+            message="Phase 0 exit gate 6 (method_registry) failed: registry not found",
+            error_code="P0_GATE_6_FAILED",
+        )
+
+    monkeypatch.setattr(UnifiedOrchestrator, "_execute_phase_00", registry_missing)
+    summary = BatchPipelineRunner(_config(tmp_path), export_results=False).run(
+        discover_plans(plans_dir)
+    )
+
+    assert summary.outcomes[0].failed_phases == ["P00"]
+    assert all(
+        o.error.startswith("Batch aborted: bootstrap failed independently of the plan")
+        for o in summary.outcomes[1:]
+    )
+    assert summary.plans_succeeded == 0
+
+
+def test_missing_reference_plan_is_not_an_attempt(tmp_path, plans_dir, stub_phases):
+    manifest = tmp_path / "plans.txt"
+    manifest.write_text("plans/gone1.pdf\nplans/gone2.pdf\nplans/alpha.pdf\n", encoding="utf-8")
+    summary = BatchPipelineRunner(
+        _config(tmp_path), export_results=False, max_reference_attempts=1
+    ).run(discover_plans(manifest))
+    outcomes = {o.plan_id: o for o in summary.outcomes}
+
+    assert "plan not found" in outcomes["gone1"].error
+    assert outcomes["alpha"].success
+
+
+def test_unreadable_plan_fails_phase_0_after_bootstrap(tmp_path, plans_dir, stub_phases):
+    (plans_dir / "zzz.pdf").write_bytes(b"%PDF-1.7 truncated")
+    summary = BatchPipelineRunner(_config(tmp_path), export_results=False).run(
+        discover_plans(plans_dir)
+    )
+    outcomes = {o.plan_id: o for o in summary.outcomes}
+
+    assert not outcomes["zzz"].success
+    assert outcomes["zzz"].failed_phases == ["P00"]
+    assert "P01" not in outcomes["zzz"].phase_timings
+    assert summary.plans_succeeded == 3
+
+
+def test_duplicate_stems_get_their_own_document_id(tmp_path, plans_dir, stub_phases):
+    other = tmp_path / "other"
+    other.mkdir()
+    _write_pdf(other / "alpha.pdf", 2)
+    manifest = tmp_path / "plans.txt"
+    manifest.write_text("plans/alpha.pdf\nother/alpha.pdf\n", encoding="utf-8")
+    summary = BatchPipelineRunner(_config(tmp_path), export_results=False).run(
+        discover_plans(manifest)
+    )
+
+    assert [o.plan_id for o in summary.outcomes] == ["alpha", "alpha-2"]
+    assert "document_id='alpha'" in stub_phases["canonical"]["alpha"]
+    assert "document_id='alpha-2'" in stub_phases["canonical"]["alpha-2"]
+
+
+def test_discover_plans_and_percentiles(tmp_path, plans_dir):
+    assert [p.name for p in discover_plans(plans_dir)] == [
+        "alpha.pdf",
+        "beta.pdf",
+        "broken.pdf",
+        "gamma.pdf",
+    ]
+    with pytest.raises(ValueError):
+        discover_plans(plans_dir / "alpha.pdf")
+    with pytest.raises(FileNotFoundError):
+        discover_plans(tmp_path / "nowhere")
+    assert _percentile([4.0, 1.0, 3.0, 2.0], 50) == pytest.approx(2.5)
+    assert _percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+
+
+def test_cli_batch_mode_writes_summary(tmp_path, plans_dir, stub_phases, capsys):
+    summary_path = tmp_path / "summary.json"
+    exit_code = cli.main(
+        [
+            "--batch",
+            str(plans_dir),
+            "--batch-workers",
+            "2",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--json-output",
+            str(summary_path),
+        ]
+    )
+
+    assert exit_code == 1  # one plan failed
+    summary = json.loads(summary_path.read_text())
+    assert summary["plans_succeeded"] == 3
+    assert summary["max_workers"] == 2
+    assert "plans/hour" in capsys.readouterr().out
+
+
+def test_cli_batch_mode_honours_config_file_and_log_level(tmp_path, plans_dir, stub_phases):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"output_dir": str(tmp_path / "from-config"), "enable_sisas": False}),
+        encoding="utf-8",
+    )
+    args = cli.create_parser().parse_args(["--batch", str(plans_dir), "--config", str(config_path)])
+    config = cli.build_batch_config(args)
+
+    assert config.output_dir == str(tmp_path / "from-config")
+    assert config.enable_sisas is False
+    assert cli.batch_log_level(args) is None
+    assert cli.batch_log_level(cli.create_parser().parse_args(["--quiet"])) == "ERROR"
+    assert cli.batch_log_level(cli.create_parser().parse_args(["--log-level", "WARNING"])) == (
+        "WARNING"
+    )
+
+
+def test_cli_batch_mode_rejects_unsupported_options(tmp_path, plans_dir, capsys):
+    bad_config = tmp_path / "config.json"
+    bad_config.write_text(json.dumps({"no_such_option": 1}), encoding="utf-8")
+
+    assert cli.main(["--batch", str(plans_dir), "--config", str(bad_config)]) == 1
+    assert "no_such_option" in capsys.readouterr().err
+    assert cli.main(["--batch", str(plans_dir), "--no-deterministic"]) == 1
+    assert "--no-deterministic" in capsys.readouterr().err
@@ -0,0 +1,175 @@
+"""Tests for graph-driven, concurrent phase dispatch in UnifiedOrchestrator."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+import pytest
+
+from farfan_pipeline.orchestration.orchestrator import (
+    PHASE_PREPARATIONS,
+    DependencyStatus,
+    OrchestratorConfig,
+    PhaseID,
+    PhaseStatus,
+    UnifiedOrchestrator,
+)
+
+
+@pytest.fixture
+def make_orchestrator(tmp_path):
+    def factory(phase_delay=0.0, prep_delay=0.0, jitter=0.0, failing=(), **config):
+        orchestrator = UnifiedOrchestrator(
+            OrchestratorConfig(
+                output_dir=str(tmp_path / "output"),
+                enable_sisas=False,
+                retry_failed_phases=False,
+                **config,
+            )
+        )
+        lock = threading.Lock()
+        orchestrator.calls = []
+        orchestrator.concurrent = 0
+        orchestrator.max_concurrent = 0
+
+        def track(node_id, delay):
+            with lock:
+                orchestrator.calls.append(node_id)
+                orchestrator.concurrent += 1
+                orchestrator.max_concurrent = max(orchestrator.max_concurrent, orchestrator.concurrent)
+            time.sleep(delay + random.uniform(0, jitter))
+            with lock:
+                orchestrator.concurrent -= 1
+
+        def dispatch(phase_id):
+            track(phase_id.value, phase_delay)
+            if phase_id.value in failing:
+                raise RuntimeError(f"{phase_id.value} broke")
+            return {"phase": phase_id.value}
+
+        def prepare(phase):
+            def run():
+                track(PHASE_PREPARATIONS[phase], prep_delay)
+                if PHASE_PREPARATIONS[phase] in failing:
+                    raise RuntimeError("prep broke")
+                return {"ready": True}
+
+            return run
+
+        orchestrator._dispatch_phase_execution = dispatch
+        orchestrator._prepare_phase_01 = prepare(PhaseID.PHASE_1)
+        orchestrator._prepare_phase_08 = prepare(PhaseID.PHASE_8)
+        orchestrator._prepare_phase_09 = prepare(PhaseID.PHASE_9)
+        return orchestrator
+
+    return factory
+
+
+def test_preparations_overlap_upstream_phases_and_savings_are_reported(make_orchestrator):
+    orchestrator = make_orchestrator(phase_delay=0.02, prep_delay=0.15)
+    result = orchestrator.execute()
+
+    assert [p.value for p in result.phase_results] == [p.value for p in PhaseID]
+    assert all(r.status == PhaseStatus.COMPLETED for r in result.phase_results.values())
+    assert orchestrator.max_concurrent >= 2
+
+    report = result.metadata["scheduling"]
+    assert report["peak_concurrency"] >= 2
+    assert set(report["node_timings"]) == {p.value for p in PhaseID} | set(PHASE_PREPARATIONS.values())
+    assert report["sequential_s"] == pytest.approx(sum(report["node_timings"].values()))
+    assert report["saved_s"] > 0.1
+    assert report["speedup"] > 1.0
+
+
+def test_trace_and_transitions_are_deterministic(make_orchestrator):
+    def run():
+        orchestrator = make_orchestrator(jitter=0.01, max_parallel_phases=3)
+        orchestrator.execute()
+        trace = orchestrator.get_execution_trace()
+        events = [
+            (event["type"], event["data"].get("phase_id") or event["data"].get("node_id"))
+            for event in orchestrator._trace
+            if event["type"] != "NODE_START"
+        ]
+        return trace.phase_sequence, events, orchestrator.dependency_graph.get_state_snapshot()
+
+    first = run()
+    assert first[0] == tuple(p.value for p in PhaseID)
+    for _ in range(3):
+        assert run() == first
+
+
+def test_sequential_mode_runs_one_node_at_a_time(make_orchestrator):
+    orchestrator = make_orchestrator(phase_delay=0.005, enable_parallel_execution=False)
+    result = orchestrator.execute()
+
+    assert orchestrator.max_concurrent == 1
+    assert result.metadata["scheduling"]["peak_concurrency"] == 1
+    assert len(result.phase_results) == len(PhaseID)
+
+
+def test_failed_phase_does_not_stop_later_phases_with_soft_edges(make_orchestrator):
+    orchestrator = make_orchestrator(failing={"P05"}, block_dependents_on_failure=False)
+    result = orchestrator.execute()
+
+    assert result.phase_results[PhaseID.PHASE_5].status == PhaseStatus.FAILED
+    assert [p.value for p in result.phase_results] == [p.value for p in PhaseID]
+    assert all(
+        r.status == PhaseStatus.COMPLETED
+        for phase_id, r in result.phase_results.items()
+        if phase_id != PhaseID.PHASE_5
+    )
+    assert orchestrator.calls.index("P06") > orchestrator.calls.index("P05")
+    assert result.metadata["scheduling"]["blocked"] == []
+    assert orchestrator.dependency_graph.nodes["P05"].status == DependencyStatus.FAILED
+
+
+def test_failed_phase_blocks_downstream_by_default(make_orchestrator):
+    orchestrator = make_orchestrator(failing={"P05", "P09_PREP"})
+    result = orchestrator.execute()
+
+    assert result.phase_results[PhaseID.PHASE_5].status == PhaseStatus.FAILED
+    assert PhaseID.PHASE_6 not in result.phase_results
+    assert result.metadata["scheduling"]["blocked"] == ["P06", "P07", "P08", "P09"]
+    assert orchestrator.dependency_graph.nodes["P09"].status == DependencyStatus.PERMANENTLY_BLOCKED
+    assert orchestrator.dependency_graph.nodes["P09_PREP"].status == DependencyStatus.COMPLETED
+
+
+def test_phase_selection_limits_the_graph(make_orchestrator):
+    orchestrator = make_orchestrator(phases_to_execute="P00-P02")
+    result = orchestrator.execute()
+
+    assert list(orchestrator.dependency_graph.nodes) == ["P00", "P01_PREP", "P01", "P02"]
+    assert sorted(orchestrator.calls) == ["P00", "P01", "P01_PREP", "P02"]
+    assert len(result.phase_results) == 3
+
+
+def test_phase_1_side_extraction_overlaps_phase_0(make_orchestrator):
+    orchestrator = make_orchestrator(phase_delay=0.05, prep_delay=0.05, phases_to_execute="P00-P01")
+    result = orchestrator.execute()
+
+    assert orchestrator.max_concurrent == 2
+    assert set(orchestrator.calls[:2]) == {"P00", "P01_PREP"}
+    assert result.metadata["scheduling"]["saved_s"] > 0.02
+
+
+def test_phase_1_preparation_parses_the_plan_into_the_store(tmp_path, monkeypatch):
+    fitz = pytest.importorskip("fitz")
+    from farfan_pipeline.infrastructure import parsed_document_store
+
+    monkeypatch.setenv("FARFAN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(parsed_document_store, "_parsed_document_store", None)
+    pdf = tmp_path / "plan.pdf"
+    doc = fitz.open()
+    for _ in range(2):
+        doc.new_page().insert_text((72, 72), "Plan de desarrollo")
+    doc.save(pdf)
+    doc.close()
+
+    orchestrator = UnifiedOrchestrator(
+        OrchestratorConfig(output_dir=str(tmp_path / "output"), document_path=str(pdf))
+    )
+    assert orchestrator._prepare_phase_01() == {"page_count": 2, "table_count": 0}
+    assert list((tmp_path / "cache" / "parsed_documents").glob("*.tables.fpd"))
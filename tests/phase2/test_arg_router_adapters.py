@@ -0,0 +1,111 @@
+"""
+Tests for compiled ArgRouter call adapters.
+
+A payload shape that passed strict validation is routed by its compiled
+adapter; results, errors and metrics must match strict routing.
+"""
+
+from typing import Any, Optional, Union
+
+import pytest
+
+from farfan_pipeline.phases.Phase_02.phase2_60_02_arg_router import (
+    ArgRouter,
+    ArgumentValidationError,
+    ExtendedArgRouter,
+)
+
+
+class Analyzer:
+    def analyze(
+        self,
+        text: str,
+        score: float,
+        meta: dict[str, Any],
+        tags: Optional[list[str]] = None,
+        *,
+        mode: str = "fast",
+    ) -> None:
+        pass
+
+    def loose(self, content, context=None, **kwargs) -> None:
+        pass
+
+    def _extract_quantitative_claims(self, content, **kwargs) -> None:
+        pass
+
+
+REGISTRY = {"Analyzer": Analyzer}
+
+PAYLOADS = [
+    ("analyze", {"text": "t", "score": 0.5, "meta": {"a": 1}, "tags": ["x"], "mode": "slow"}),
+    ("analyze", {"text": "t", "score": 0.5, "meta": {"a": 1}, "tags": [1], "mode": "slow"}),
+    ("analyze", {"text": "t", "score": "high", "meta": {}}),
+    ("analyze", {"text": "t", "score": 0.5, "meta": {}}),
+    ("analyze", {"text": "t", "meta": {}}),
+    ("loose", {"content": "c", "extra": 1, "context": {}}),
+    ("loose", {"context": {}}),
+    ("_extract_quantitative_claims", {"content": "c", "thresholds": [0.5]}),
+]
+
+
+def _outcome(router: ArgRouter, method_name: str, payload: dict) -> tuple:
+    try:
+        return ("ok", router.route("Analyzer", method_name, dict(payload)))
+    except ArgumentValidationError as exc:
+        return ("error", str(exc))
+
+
+@pytest.mark.parametrize("router_class", [ArgRouter, ExtendedArgRouter])
+def test_compiled_routing_matches_strict_routing(router_class):
+    compiled = router_class(REGISTRY)
+    strict = router_class(REGISTRY, compile_adapters=False)
+
+    for _ in range(3):
+        for method_name, payload in PAYLOADS:
+            assert _outcome(compiled, method_name, payload) == _outcome(strict, method_name, payload)
+
+    assert strict._adapters == {}
+    assert len(compiled._adapters) == 4  # only shapes that passed strict validation
+    if router_class is ExtendedArgRouter:
+        assert compiled.get_metrics() == strict.get_metrics()
+
+
+def test_proven_shape_falls_back_to_strict_errors():
+    router = ExtendedArgRouter(REGISTRY)
+    router.route("Analyzer", "analyze", {"text": "t", "score": 0.5, "meta": {}})
+
+    with pytest.raises(ArgumentValidationError) as excinfo:
+        router.route("Analyzer", "analyze", {"text": 1, "score": 0.5, "meta": {}})
+
+    assert excinfo.value.type_mismatches == {"text": "expected str; received int"}
+    assert router.get_metrics()["validation_errors"] == 1
+
+
+def test_var_keyword_extras_keep_payload_order():
+    router = ArgRouter(REGISTRY)
+    payload = {"z": 1, "content": "c", "a": 2}
+    for _ in range(2):
+        args, kwargs = router.route("Analyzer", "loose", payload)
+        assert args == ("c",)
+        assert list(kwargs) == ["z", "a"]
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        int,
+        Optional[int],
+        Union[int, Any],
+        list[str],
+        dict[str, list[int]],
+        tuple[int, ...],
+        tuple[int, str],
+        Union[list[int], dict[str, int], None],
+        int | None,
+    ],
+)
+def test_compiled_annotation_checks_match_matches_annotation(annotation):
+    check = ArgRouter._as_predicate(ArgRouter._compile_annotation_check(annotation))
+    for value in (None, 1, "a", [1], ["a"], {"k": [1]}, {"k": ["x"]}, (1,), (1, "a"), (1, 2)):
+        assert check(value) == ArgRouter._matches_annotation(value, annotation)
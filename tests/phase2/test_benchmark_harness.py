@@ -0,0 +1,92 @@
+"""
+Tests for the Phase 2 executor benchmark harness.
+
+Runs a slice of the real questionnaire's plan through every execution mode
+and round-trips the regression baseline through ExecutorProfiler.
+"""
+
+import pytest
+
+from farfan_pipeline.phases.Phase_02 import (
+    phase2_95_06_benchmark_performance_optimizations as benchmark,
+)
+from farfan_pipeline.phases.Phase_02.phase2_95_00_executor_profiler import ExecutorProfiler
+
+
+@pytest.fixture(scope="module")
+def small_fixture():
+    return benchmark.build_fixture(sentences_per_chunk=3, max_tasks=12)
+
+
+def _method_count(fixture) -> int:
+    questions = {q["question_id"]: q for q in fixture.questionnaire["blocks"]["micro_questions"]}
+    return sum(
+        sum(isinstance(method, dict) for method in questions[task.question_id]["method_sets"])
+        for task in fixture.plan.tasks
+    )
+
+
+def test_synthetic_cpp_is_seeded_and_complete():
+    cpp = benchmark.build_synthetic_cpp(seed=7, sentences_per_chunk=2)
+
+    assert len(cpp["chunks"]) == 60
+    assert {chunk["chunk_id"] for chunk in cpp["chunks"]} == {
+        f"{pa}-{dim}" for pa in benchmark.POLICY_AREAS for dim in benchmark.DIMENSIONS
+    }
+    assert cpp == benchmark.build_synthetic_cpp(seed=7, sentences_per_chunk=2)
+    assert cpp != benchmark.build_synthetic_cpp(seed=8, sentences_per_chunk=2)
+
+
+def test_every_mode_dispatches_methods_through_real_executors(small_fixture):
+    report = benchmark.run_benchmark(small_fixture, workers=2)
+    task_ids = [task.task_id for task in small_fixture.plan.tasks]
+
+    reference = None
+    for mode, run in report.runs.items():
+        assert [result.task_id for result in run.results] == task_ids, mode
+        assert all(result.success for result in run.results), mode
+        outputs = [result.output["output"]["method_outputs"] for result in run.results]
+        reference = reference or outputs
+        # The stubbed dispensary is deterministic: every mode computes the same outputs
+        assert outputs == reference, mode
+
+    metrics = report.profiler.metrics["mode:task_executor"][-1]
+    assert metrics.total_method_calls == _method_count(small_fixture) > 0
+    assert set(metrics.metadata["method_latency_ms"]) == {
+        m.full_method_name for m in metrics.method_calls
+    }
+    assert report.profiler.metrics["mode:batch_optimizer"][-1].metadata["contracts"] == 12
+    assert "optimizer:SmartBatchOptimizer" in report.profiler.metrics
+    assert report.summary()["modes"]["parallel_processes"]["failed_tasks"] == 0
+
+
+def test_baseline_round_trip_flags_slower_methods(small_fixture, tmp_path):
+    report = benchmark.run_benchmark(small_fixture, modes=("task_executor",))
+    baseline_path = benchmark.write_baseline(report.profiler, tmp_path / "baseline.json")
+    run = report.runs["task_executor"]
+
+    slower = benchmark.ModeRun(
+        mode=run.mode,
+        wall_time_ms=run.wall_time_ms * 3,
+        results=run.results,
+        task_latencies_ms=[latency * 3 for latency in run.task_latencies_ms],
+        method_latencies_ms={
+            method_id: [latency * 3 for latency in samples]
+            for method_id, samples in run.method_latencies_ms.items()
+        },
+    )
+    profiler = ExecutorProfiler(memory_tracking=False)
+    benchmark.record_mode_run(profiler, slower)
+    regressions = benchmark.compare_to_baseline(
+        profiler, baseline_path, {"execution_time_ms": 20.0}
+    )
+
+    assert profiler.baseline_metrics["mode:task_executor"].method_calls
+    assert {r.executor_id for r in regressions} == {"mode:task_executor"} | {
+        f"method:{method_id}" for method_id in run.method_latencies_ms
+    }
+
+
+def test_compare_requires_an_existing_baseline(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Benchmark baseline not found"):
+        benchmark.compare_to_baseline(ExecutorProfiler(), tmp_path / "missing.json")
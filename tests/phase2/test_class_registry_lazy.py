@@ -0,0 +1,165 @@
+"""
+Tests for the lazy class registry mode.
+
+Covers import-on-first-use proxies, manifest-based availability checks and
+a ``python -X importtime`` startup benchmark of eager vs lazy registries.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from farfan_pipeline.phases.Phase_02 import phase2_10_01_class_registry as class_registry
+from farfan_pipeline.phases.Phase_02.phase2_10_01_class_registry import (
+    ClassRegistryError,
+    build_class_registry,
+    generate_dependency_manifest,
+    load_dependency_manifest,
+)
+from farfan_pipeline.phases.Phase_02.phase2_60_02_arg_router import ArgRouter
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+WIDGET_MODULE = '''
+class Widget:
+    """Widget under test."""
+
+    KIND = "widget"
+
+    def __init__(self, size: int = 1) -> None:
+        self.size = size
+
+    def render(self, text: str, scale: float = 1.0) -> str:
+        return text * self.size
+'''
+
+
+@pytest.fixture
+def widget_registry(tmp_path, monkeypatch):
+    """Registry paths pointing at a throwaway module that nothing has imported."""
+    module_name = f"lazy_registry_widget_{tmp_path.name}"
+    (tmp_path / f"{module_name}.py").write_text(WIDGET_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = f"{module_name}.Widget"
+    monkeypatch.setattr(class_registry, "_CLASS_PATHS", {"Widget": path, "WidgetAlias": path})
+    monkeypatch.setattr(class_registry, "load_dependency_manifest", lambda: {path: []})
+    yield module_name
+    sys.modules.pop(module_name, None)
+
+
+def test_shipped_manifest_is_current():
+    assert load_dependency_manifest() == generate_dependency_manifest(), (
+        "Regenerate with: python scripts/generation/build_class_registry_manifest.py"
+    )
+
+
+def test_lazy_proxies_import_on_first_use(widget_registry):
+    registry = build_class_registry(lazy=True)
+    proxy = registry["Widget"]
+
+    assert registry["WidgetAlias"] is proxy
+    assert isinstance(proxy, type)
+    assert proxy.__name__ == "Widget"
+    assert widget_registry not in sys.modules
+
+    assert proxy.KIND == "widget"
+    assert widget_registry in sys.modules
+    instance = proxy(size=2)
+    assert isinstance(instance, proxy)
+    assert type(instance) is sys.modules[widget_registry].Widget
+    assert "(resolved)" in repr(proxy)
+
+
+def test_arg_router_routes_through_lazy_proxies(widget_registry):
+    router = ArgRouter(build_class_registry(lazy=True))
+
+    args, kwargs = router.route("Widget", "render", {"text": "ab", "scale": 2.0})
+
+    assert (args, kwargs) == (("ab", 2.0), {})
+    assert widget_registry in sys.modules
+
+
+def test_lazy_mode_from_environment(widget_registry, monkeypatch):
+    monkeypatch.setenv("FARFAN_LAZY_CLASS_REGISTRY", "1")
+    proxy = build_class_registry()["Widget"]
+
+    assert "(unresolved)" in repr(proxy)
+    assert widget_registry not in sys.modules
+
+
+def test_availability_comes_from_manifest(widget_registry, monkeypatch):
+    path = f"{widget_registry}.Widget"
+    monkeypatch.setattr(class_registry, "OPTIONAL_DEPENDENCIES", ("farfan_no_such_optional",))
+
+    monkeypatch.setattr(
+        class_registry, "load_dependency_manifest", lambda: {path: ["farfan_no_such_optional"]}
+    )
+    assert build_class_registry(lazy=True) == {}
+
+    monkeypatch.setattr(
+        class_registry, "load_dependency_manifest", lambda: {path: ["farfan_no_such_required"]}
+    )
+    with pytest.raises(ClassRegistryError, match="missing dependency: farfan_no_such_required"):
+        build_class_registry(lazy=True)
+    assert widget_registry not in sys.modules
+
+
+def test_unresolvable_proxy_raises_class_registry_error(widget_registry, monkeypatch):
+    path = f"{widget_registry}.Gadget"
+    monkeypatch.setattr(class_registry, "_CLASS_PATHS", {"Gadget": path})
+    monkeypatch.setattr(class_registry, "load_dependency_manifest", lambda: {path: []})
+    proxy = build_class_registry(lazy=True)["Gadget"]
+
+    with pytest.raises(ClassRegistryError, match="attribute missing"):
+        proxy.render
+
+
+def _importtime(lazy: bool) -> tuple[int, dict[str, int]]:
+    """Total cumulative import time (us) and per-module cumulative times of a registry build."""
+    code = (
+        "from farfan_pipeline.phases.Phase_02.phase2_10_01_class_registry import "
+        "build_class_registry\n"
+        "try:\n"
+        f"    build_class_registry(lazy={lazy})\n"
+        "except Exception:\n"
+        "    pass  # only import cost is measured\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(REPO_ROOT / "src"), str(REPO_ROOT)])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        timeout=600,
+    )
+    if result.returncode != 0:
+        pytest.skip(f"registry import failed in this environment: {result.stderr.splitlines()[-1]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name[1:].rstrip()] = int(cumulative)
+    # Top-level imports are not indented; their cumulative times add up to the total
+    total = sum(us for name, us in modules.items() if not name.startswith(" "))
+    return total, {name.strip(): us for name, us in modules.items()}
+
+
+@pytest.mark.performance
+def test_importtime_lazy_registry_skips_method_modules():
+    eager_total, eager_modules = _importtime(lazy=False)
+    lazy_total, lazy_modules = _importtime(lazy=True)
+
+    print(
+        f"\nclass registry startup (python -X importtime, cumulative): "
+        f"eager {eager_total / 1000:.1f} ms over {len(eager_modules)} modules, "
+        f"lazy {lazy_total / 1000:.1f} ms over {len(lazy_modules)} modules"
+    )
+    assert not [name for name in lazy_modules if name.startswith("farfan_pipeline.methods")]
+    assert any(name.startswith("farfan_pipeline.methods") for name in eager_modules)
+    assert lazy_total < eager_total
@@ -0,0 +1,202 @@
+"""
+Tests for the precompiled executor-contract bundle.
+
+Covers lazy lookup by question and policy area, recorded schema validation,
+and incremental rebuilds that skip unchanged contracts.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("jsonschema")
+
+from farfan_pipeline.phases.Phase_02.phase2_60_06_contract_bundle import (
+    ContractBundle,
+    build_contract_bundle,
+    default_bundle_path,
+    open_contract_bundle,
+)
+
+SCHEMA = {
+    "type": "object",
+    "required": ["identity"],
+    "properties": {"identity": {"type": "object", "required": ["contract_id"]}},
+}
+
+
+def _contract(question_id: str, policy_area_id: str, **extra) -> dict:
+    return {
+        "identity": {
+            "contract_id": f"{question_id}_{policy_area_id}",
+            "base_slot": "D1-Q1",
+        },
+        **extra,
+    }
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("FARFAN_CACHE_DIR", str(cache))
+    return cache
+
+
+@pytest.fixture
+def contracts_dir(tmp_path):
+    directory = tmp_path / "generated_contracts"
+    directory.mkdir()
+    for question_id in ("Q001", "Q002"):
+        for policy_area_id in ("PA01", "PA02"):
+            path = directory / f"{question_id}_{policy_area_id}_contract_v4.json"
+            path.write_text(json.dumps(_contract(question_id, policy_area_id, weight=1.0)))
+    (directory / "generation_manifest.json").write_text("{}")
+    return directory
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "executor_contract.v4.schema.json"
+    path.write_text(json.dumps(SCHEMA))
+    return path
+
+
+def test_bundle_serves_contracts_lazily_by_question_and_policy_area(contracts_dir, schema_path):
+    stats = build_contract_bundle(contracts_dir, schema_path=schema_path)
+    bundle = ContractBundle(default_bundle_path(contracts_dir))
+
+    assert stats["compiled"] == stats["validated"] == len(bundle) == 4
+    assert bundle.get("Q002", "PA01") == _contract("Q002", "PA01", weight=1.0)
+    assert bundle.get("Q003", "PA01") is None
+    assert bundle.keys()[0] == ("Q001", "PA01")
+    assert bundle.validation("Q001", "PA02")["schema_valid"] is True
+    assert bundle.validation("Q001", "PA02")["schema_version"].startswith("executor_contract.v4@")
+    assert bundle.is_current(contracts_dir)
+
+
+def test_rebuild_skips_unchanged_and_revalidates_only_changed(contracts_dir, schema_path):
+    first = build_contract_bundle(contracts_dir, schema_path=schema_path)
+
+    touched = contracts_dir / "Q001_PA01_contract_v4.json"
+    os.utime(touched, ns=(0, touched.stat().st_mtime_ns + 1_000_000))
+    assert build_contract_bundle(contracts_dir, schema_path=schema_path)["validated"] == 0
+
+    changed = contracts_dir / "Q002_PA02_contract_v4.json"
+    changed.write_text(json.dumps({"identity": {}}))
+    (contracts_dir / "Q001_PA02_contract_v4.json").unlink()
+    stats = build_contract_bundle(contracts_dir, schema_path=schema_path)
+
+    assert (stats["validated"], stats["removed"], stats["contracts"]) == (1, 1, 3)
+    assert stats["bundle_sha256"] != first["bundle_sha256"]
+    bundle = ContractBundle(default_bundle_path(contracts_dir))
+    assert list(bundle.invalid_contracts()) == ["Q002_PA02"]
+    assert "contract_id" in bundle.invalid_contracts()["Q002_PA02"][0]
+    assert bundle.validation("Q002", "PA02")["schema_valid"] is False
+
+
+def test_schema_change_revalidates_every_contract(contracts_dir, schema_path):
+    build_contract_bundle(contracts_dir, schema_path=schema_path)
+    schema_path.write_text(json.dumps({**SCHEMA, "required": ["identity", "weight"]}))
+
+    stats = build_contract_bundle(contracts_dir, schema_path=schema_path)
+
+    assert stats["validated"] == 4
+    assert stats["schema_invalid"] == 0
+
+
+def test_open_rebuilds_a_stale_bundle(contracts_dir):
+    open_contract_bundle(contracts_dir).close()
+    (contracts_dir / "Q003_PA01_contract_v4.json").write_text(json.dumps(_contract("Q003", "PA01")))
+
+    bundle = open_contract_bundle(contracts_dir)
+
+    assert bundle.get("Q003", "PA01")["identity"]["contract_id"] == "Q003_PA01"
+    assert bundle.is_current(contracts_dir)
+
+
+def test_missing_bundle_without_rebuild_raises(contracts_dir):
+    with pytest.raises(FileNotFoundError, match="Contract bundle not found"):
+        open_contract_bundle(contracts_dir, rebuild=False)
+
+
+def test_bundle_lives_in_the_user_cache(contracts_dir, cache_dir, tmp_path, monkeypatch):
+    path = default_bundle_path(contracts_dir)
+    assert path.parent == cache_dir / "contract_bundles"
+    assert path != default_bundle_path(tmp_path)
+
+    monkeypatch.delenv("FARFAN_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_bundle_path(contracts_dir).parent == tmp_path / "xdg" / "farfan" / "contract_bundles"
+
+    open_contract_bundle(contracts_dir).close()
+    assert not (contracts_dir / "contracts.bundle.sqlite").exists()
+
+
+def test_rebuild_swaps_the_bundle_atomically(contracts_dir, schema_path):
+    build_contract_bundle(contracts_dir, schema_path=schema_path)
+    reader = ContractBundle(default_bundle_path(contracts_dir))
+    (contracts_dir / "Q003_PA01_contract_v4.json").write_text(json.dumps(_contract("Q003", "PA01")))
+
+    errors = []
+
+    def build():
+        try:
+            build_contract_bundle(contracts_dir, schema_path=schema_path)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # The open reader keeps its snapshot; the swapped-in bundle has the new contract
+    assert len(reader) == 4 and reader.get("Q001", "PA01") is not None
+    fresh = ContractBundle(default_bundle_path(contracts_dir))
+    assert fresh.get("Q003", "PA01")["identity"]["contract_id"] == "Q003_PA01"
+    assert fresh.is_current()
+    assert [p.name for p in default_bundle_path(contracts_dir).parent.iterdir()] == [
+        default_bundle_path(contracts_dir).name
+    ]
+
+
+def test_executor_bundle_is_built_once_and_retried_after_failure(monkeypatch):
+    from farfan_pipeline.phases.Phase_02 import phase2_60_00_base_executor_with_contract as base
+
+    calls = []
+    started = threading.Event()
+
+    def fake_open():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("cache directory not writable")
+        started.wait(1)
+        return "bundle"
+
+    executor = base.BaseExecutorWithContract
+    executor.clear_contract_cache()
+    monkeypatch.setattr(base, "open_contract_bundle", fake_open)
+    monkeypatch.setattr(base, "CONTRACT_BUNDLE_RETRY_S", 0.0)
+    try:
+        assert executor._get_contract_bundle() is None
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(executor._get_contract_bundle()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["bundle"] * 4
+        assert len(calls) == 2
+    finally:
+        executor._contract_bundle = None
+        executor.clear_contract_cache()
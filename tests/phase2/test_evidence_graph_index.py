@@ -0,0 +1,97 @@
+"""
+Tests for the integer-indexed EvidenceGraph core.
+
+Covers incremental cycle rejection and equivalence of the level-synchronous
+(vectorized) belief propagation with the per-node loop.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from farfan_pipeline.phases.Phase_02 import phase2_80_00_evidence_nexus as nexus
+from farfan_pipeline.phases.Phase_02.phase2_80_00_evidence_nexus import (
+    EvidenceEdge,
+    EvidenceGraph,
+    EvidenceNode,
+    EvidenceType,
+    RelationType,
+)
+
+RELATIONS = [RelationType.SUPPORTS, RelationType.CONTRADICTS, RelationType.CITES]
+
+
+def _random_graph(seed: int, nodes: int, edges: int) -> tuple[EvidenceGraph, int]:
+    rng = random.Random(seed)
+    graph = EvidenceGraph()
+    ids = []
+    for i in range(nodes):
+        node = EvidenceNode.create(
+            evidence_type=EvidenceType.INDICATOR_NUMERIC,
+            content={"i": i},
+            confidence=rng.random(),
+            source_method="test",
+        )
+        graph.add_node(node)
+        ids.append(node.node_id)
+    rejected = 0
+    for _ in range(edges):
+        source, target = rng.sample(ids, 2)
+        edge = EvidenceEdge.create(
+            source, target, rng.choice(RELATIONS), weight=rng.random()
+        )
+        try:
+            graph.add_edge(edge)
+        except ValueError:
+            rejected += 1
+    return graph, rejected
+
+
+class TestIncrementalCycleDetection:
+    def test_back_edge_is_rejected_and_graph_unchanged(self):
+        graph, _ = _random_graph(seed=1, nodes=3, edges=0)
+        a, b, c = list(graph._nodes)
+        graph.add_edge(EvidenceEdge.create(a, b, RelationType.SUPPORTS))
+        graph.add_edge(EvidenceEdge.create(b, c, RelationType.SUPPORTS))
+
+        with pytest.raises(ValueError, match="would create cycle"):
+            graph.add_edge(EvidenceEdge.create(c, a, RelationType.SUPPORTS))
+
+        assert graph.edge_count == 2
+        assert graph._topological_sort() == [a, b, c]
+
+    def test_topological_order_respects_every_edge(self):
+        graph, rejected = _random_graph(seed=7, nodes=200, edges=800)
+        position = {nid: i for i, nid in enumerate(graph._topological_sort())}
+
+        assert rejected > 0
+        assert len(position) == graph.node_count
+        for edge in graph._edges.values():
+            assert position[edge.source_id] < position[edge.target_id]
+
+
+class TestVectorizedBeliefPropagation:
+    @pytest.mark.parametrize("seed", [3, 11, 29])
+    def test_matches_per_node_loop(self, seed, monkeypatch):
+        graph, _ = _random_graph(seed=seed, nodes=300, edges=900)
+        monkeypatch.setattr(nexus, "VECTORIZED_PROPAGATION_MIN_NODES", 10**9)
+        expected = graph.compute_belief_propagation()
+
+        monkeypatch.setattr(nexus, "VECTORIZED_PROPAGATION_MIN_NODES", 1)
+        monkeypatch.setattr(nexus, "VECTORIZED_PROPAGATION_MIN_LEVEL_WIDTH", 1)
+        actual = graph.compute_belief_propagation()
+
+        assert list(actual) == list(expected)
+        assert actual == pytest.approx(expected, abs=1e-12)
+
+    def test_deep_graph_uses_per_node_loop(self, monkeypatch):
+        graph, _ = _random_graph(seed=5, nodes=300, edges=900)
+        monkeypatch.setattr(nexus, "VECTORIZED_PROPAGATION_MIN_NODES", 1)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("vectorized path taken for a deep graph")
+
+        monkeypatch.setattr(EvidenceGraph, "_propagate_beliefs_vectorized", fail)
+        graph.compute_belief_propagation()
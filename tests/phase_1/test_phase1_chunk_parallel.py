@@ -0,0 +1,329 @@
+"""
+PHASE 1 CHUNK-PARALLEL SUBPHASES (SP5-SP10)
+============================================
+
+Serial, thread and worker-process runs of the per-chunk kernels must yield the
+same chunk outputs and the same _record_subphase hashes; the SP7-SP9 fan-out
+must report its timings to the metrics collector; a kernel failing inside a
+worker process must surface to the caller instead of being swallowed; the
+SP5/SP7 kernels consume the single-pass extractor scan of each chunk; and with
+the enricher run() builds, SP7 reuses SP5's extractions from the document's
+extraction cache.
+"""
+
+import multiprocessing
+import threading
+import tracemalloc
+
+import pytest
+
+from farfan_pipeline.phases.Phase_01 import phase1_13_00_cpp_ingestion as ingestion
+from farfan_pipeline.phases.Phase_01.phase1_03_00_models import Chunk
+from farfan_pipeline.phases.Phase_01.phase1_11_00_signal_enrichment import (
+    SignalEnricher,
+    create_signal_enricher,
+    get_extractor_scan_engine,
+)
+from farfan_pipeline.phases.Phase_01.phase1_17_00_performance_metrics import (
+    Phase1MetricsCollector,
+)
+from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+    release_document_extraction_cache,
+)
+from farfan_pipeline.infrastructure.process_pools import pool_context
+
+CHUNK_TEXTS = [
+    "El programa genera empleo porque mejora la educación técnica del municipio.",
+    "Debido a la inversión en vías, en 2024 se alcanzará la meta a corto plazo.",
+    "Sin embargo, la cobertura es baja; por lo tanto se debe ampliar la red de salud.",
+    "Mediante alianzas público-privadas se contribuye a reducir la pobreza rural.",
+    "Es necesario garantizar el acceso al agua potable antes de 2027.",
+    "La estrategia permite fortalecer la participación ciudadana en el mediano plazo.",
+    "Según el Decreto 1082 de 2015 se invertirán $1.200 millones para aumentar la cobertura.",
+]
+
+START_METHODS = [
+    method for method in ("fork", "forkserver") if method in multiprocessing.get_all_start_methods()
+]
+
+
+def _synthetic_chunks():
+    chunks = []
+    for index, text in enumerate(CHUNK_TEXTS):
+        pa_id = f"PA{index // 3 + 1:02d}"
+        dim_id = f"DIM{index % 3 + 1:02d}"
+        chunks.append(
+            Chunk(
+                chunk_id=f"{pa_id}-{dim_id}",
+                policy_area_id=pa_id,
+                dimension_id=dim_id,
+                chunk_index=index,
+                text=text,
+                segmentation_metadata={"text": text},
+            )
+        )
+    return chunks
+
+
+def _executor(**kwargs):
+    executor = ingestion.Phase1CPPIngestionFullContract(**kwargs)
+    # SP0-SP4 are out of scope: seed their trace entries so SP5 records at index 5
+    executor.execution_trace = [
+        (f"SP{sp_num}", "1970-01-01T00:00:00Z", "0" * 64) for sp_num in range(5)
+    ]
+    return executor
+
+
+def _run_sp5_to_sp10(executor, chunks):
+    """Same sequence as execute(): SP5, SP6, the SP7-SP9 fan-out, SP10."""
+    with executor._track_subphase(5):
+        causal_chains = executor._execute_sp5_causal_extraction(chunks)
+    executor._record_subphase(5, causal_chains)
+    with executor._track_subphase(6):
+        integrated = executor._execute_sp6_causal_integration(chunks, causal_chains)
+    executor._record_subphase(6, integrated)
+
+    group_results = executor._fan_out_sp7_to_sp9(chunks)
+    with executor._track_subphase(7, group_results):
+        arguments = executor._execute_sp7_arguments(
+            chunks, integrated, results=group_results.get(7)
+        )
+    executor._record_subphase(7, arguments)
+    with executor._track_subphase(8, group_results):
+        temporal = executor._execute_sp8_temporal(
+            chunks, integrated, results=group_results.get(8)
+        )
+    executor._record_subphase(8, temporal)
+    with executor._track_subphase(9, group_results):
+        discourse = executor._execute_sp9_discourse(
+            chunks, arguments, results=group_results.get(9)
+        )
+    executor._record_subphase(9, discourse)
+    with executor._track_subphase(10):
+        strategic = executor._execute_sp10_strategic(
+            chunks, integrated, arguments, temporal, discourse
+        )
+    executor._record_subphase(10, strategic)
+    return group_results
+
+
+def _run_mode(**kwargs):
+    executor = _executor(**kwargs)
+    chunks = _synthetic_chunks()
+    _run_sp5_to_sp10(executor, chunks)
+    hashes = [(sp, hash_value) for sp, _, hash_value in executor.execution_trace[5:]]
+    outputs = [executor._deterministic_serialize(chunk) for chunk in chunks]
+    return hashes, outputs
+
+
+class _NoThreadPool:
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("process mode fell back to the thread pool")
+
+
+class _FailingTemporalEnricher(SignalEnricher):
+    """Enricher whose temporal scan fails on one chunk text (picklable for any start method)."""
+
+    def __init__(self, failing_text):
+        super().__init__()
+        self.failing_text = failing_text
+
+    def extract_temporal_markers_with_signals(self, text, policy_area):
+        if text == self.failing_text:
+            raise ValueError(f"temporal scan failed in {policy_area}")
+        return super().extract_temporal_markers_with_signals(text, policy_area)
+
+
+@pytest.fixture(params=START_METHODS)
+def start_method(request, monkeypatch):
+    """Run process mode under each available start method."""
+    monkeypatch.setattr(
+        ingestion, "pool_context", lambda preload=(): multiprocessing.get_context(request.param)
+    )
+    return request.param
+
+
+@pytest.fixture
+def metrics_collector():
+    collector = Phase1MetricsCollector(plan_id="chunk-parallel-test")
+    yield collector
+    tracemalloc.stop()
+
+
+class TestModeEquivalence:
+    def test_serial_run_records_sp5_to_sp10(self):
+        hashes, outputs = _run_mode()
+        assert [sp for sp, _ in hashes] == [f"SP{n}" for n in range(5, 11)]
+        assert len(outputs) == len(CHUNK_TEXTS)
+
+    def test_thread_mode_matches_serial(self):
+        assert _run_mode(max_workers=3) == _run_mode()
+
+    def test_process_mode_matches_serial(self, start_method, monkeypatch):
+        serial = _run_mode()
+        monkeypatch.setattr(ingestion, "ThreadPoolExecutor", _NoThreadPool)
+        assert _run_mode(max_workers=3, use_processes=True) == serial
+
+    def test_process_mode_matches_serial_with_enricher(self, start_method):
+        def run(**kwargs):
+            executor = _executor(**kwargs)
+            executor.signal_enricher = SignalEnricher()
+            chunks = _synthetic_chunks()
+            _run_sp5_to_sp10(executor, chunks)
+            return [h for _, _, h in executor.execution_trace[5:]]
+
+        assert run(max_workers=2, use_processes=True) == run()
+
+    def test_workers_are_not_forked_from_a_multithreaded_process(self):
+        release = threading.Event()
+        thread = threading.Thread(target=release.wait)
+        thread.start()
+        try:
+            start = pool_context([ingestion.__name__]).get_start_method()
+        finally:
+            release.set()
+            thread.join()
+        assert start in ("forkserver", "spawn")
+
+    def test_map_chunk_kernels_keeps_chunk_order(self):
+        chunks = _synthetic_chunks()
+        jobs = [("_sp7_chunk_arguments", ()), ("_sp8_chunk_temporal", ())]
+        serial = _executor()._map_chunk_kernels(chunks, jobs)
+        threaded = _executor(max_workers=4)._map_chunk_kernels(chunks, jobs)
+
+        assert list(threaded) == ["_sp7_chunk_arguments", "_sp8_chunk_temporal"]
+        for kernel in threaded:
+            assert threaded[kernel][0] == serial[kernel][0]
+            assert len(threaded[kernel][0]) == len(chunks)
+            assert threaded[kernel][1] >= 0.0
+
+
+class TestFanOutMetrics:
+    def test_sequential_mode_has_no_fan_out(self):
+        assert _executor()._fan_out_sp7_to_sp9(_synthetic_chunks()) == {}
+
+    def test_fan_out_returns_results_and_timings(self):
+        chunks = _synthetic_chunks()
+        group_results = _executor(max_workers=2)._fan_out_sp7_to_sp9(chunks)
+
+        for sp_num in (7, 8, 9):
+            assert len(group_results[sp_num]) == len(chunks)
+        assert set(group_results["timings"]) == {7, 8, 9}
+        assert group_results["wall_seconds"] >= 0.0
+
+    def test_parallel_run_emits_metrics_per_subphase(self, metrics_collector):
+        executor = _executor(max_workers=2, metrics_collector=metrics_collector)
+        group_results = _run_sp5_to_sp10(executor, _synthetic_chunks())
+
+        recorded = {m.subphase_id: m for m in metrics_collector.get_metrics().subphase_metrics}
+        assert set(recorded) == {f"SP{n}" for n in range(5, 11)}
+        for sp_num in (7, 8, 9):
+            metrics = recorded[f"SP{sp_num}"]
+            assert metrics.duration_ms == pytest.approx(group_results["timings"][sp_num] * 1000)
+            assert metrics.metadata["parallel_group"] == "SP7-SP9"
+            assert metrics.metadata["group_wall_ms"] == pytest.approx(
+                group_results["wall_seconds"] * 1000
+            )
+            assert metrics.metadata["max_workers"] == 2
+        for sp_num in (5, 6, 10):
+            assert "parallel_group" not in recorded[f"SP{sp_num}"].metadata
+
+    def test_serial_run_tracks_every_subphase(self, metrics_collector):
+        executor = _executor(metrics_collector=metrics_collector)
+        _run_sp5_to_sp10(executor, _synthetic_chunks())
+
+        recorded = metrics_collector.get_metrics().subphase_metrics
+        assert [m.subphase_id for m in recorded] == [f"SP{n}" for n in range(5, 11)]
+        assert all("parallel_group" not in m.metadata for m in recorded)
+
+
+class TestWorkerProcessFailure:
+    def test_kernel_error_propagates(self, start_method, monkeypatch):
+        executor = _executor(max_workers=2, use_processes=True)
+        chunks = _synthetic_chunks()
+        executor.signal_enricher = _FailingTemporalEnricher(CHUNK_TEXTS[3])
+        monkeypatch.setattr(ingestion, "ThreadPoolExecutor", _NoThreadPool)
+
+        with pytest.raises(ValueError, match=chunks[3].policy_area_id):
+            executor._fan_out_sp7_to_sp9(chunks)
+        assert ingestion._CHUNK_WORKER_STATE is None
+
+
+class TestExtractorSignals:
+    def test_kernels_consume_the_extractor_scan(self):
+        executor = _executor()
+        executor.signal_enricher = SignalEnricher()
+        chunks = _synthetic_chunks()
+        engine = get_extractor_scan_engine()
+        scanned_before = engine.get_metrics()["chunks_scanned"]
+
+        _run_sp5_to_sp10(executor, chunks)
+
+        assert engine.get_metrics()["chunks_scanned"] > scanned_before
+        causal_sources = {event.get("source") for event in chunks[0].causal_graph.events}
+        assert "extractor:CAUSAL_VERBS" in causal_sources
+        evidence_patterns = {ev["pattern"] for ev in chunks[-1].arguments["evidence"]}
+        assert "extractor:NORMATIVE_REFERENCE" in evidence_patterns
+
+    def test_no_enricher_means_no_extractor_signals(self):
+        chunks = _synthetic_chunks()
+        _run_sp5_to_sp10(_executor(), chunks)
+        assert all(
+            not str(ev.get("pattern", "")).startswith("extractor:")
+            for chunk in chunks
+            for ev in chunk.arguments["evidence"]
+        )
+
+
+class TestDocumentExtractionCache:
+    @pytest.fixture
+    def document_id(self):
+        document_id = "chunk-parallel-cache-test"
+        yield document_id
+        release_document_extraction_cache(document_id)
+
+    @staticmethod
+    def _executor_as_run(document_id, **kwargs):
+        # Same enricher run() builds from the CanonicalInput
+        executor = _executor(**kwargs)
+        executor.document_id = document_id
+        executor.signal_enricher = create_signal_enricher(document_id=document_id)
+        return executor
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_sp7_reuses_the_sp5_extractions(self, document_id, max_workers):
+        executor = self._executor_as_run(document_id, max_workers=max_workers)
+        cache = executor.signal_enricher.extraction_cache
+        chunks = _synthetic_chunks()
+        extractor_lookups = len(get_extractor_scan_engine().extractors) * len(chunks)
+
+        with executor._track_subphase(5):
+            causal_chains = executor._execute_sp5_causal_extraction(chunks)
+        after_sp5 = cache.get_metrics()
+        assert after_sp5["hits"] == 0
+        assert after_sp5["misses"] >= extractor_lookups
+
+        integrated = executor._execute_sp6_causal_integration(chunks, causal_chains)
+        group_results = executor._fan_out_sp7_to_sp9(chunks)
+        executor._execute_sp7_arguments(chunks, integrated, results=group_results.get(7))
+        assert cache.get_metrics()["hits"] >= extractor_lookups
+
+    def test_rerun_is_served_from_the_cache_with_identical_output(self, document_id):
+        first = self._executor_as_run(document_id)
+        _run_sp5_to_sp10(first, _synthetic_chunks())
+        first_run = first.signal_enricher.extraction_cache.get_metrics()
+
+        rerun = self._executor_as_run(document_id)
+        _run_sp5_to_sp10(rerun, _synthetic_chunks())
+        metrics = release_document_extraction_cache(document_id)
+
+        assert metrics["misses"] == first_run["misses"]
+        assert metrics["hits"] > first_run["hits"]
+        assert metrics["bytes_saved"] > 0
+
+        uncached = _executor()
+        uncached.signal_enricher = SignalEnricher()
+        _run_sp5_to_sp10(uncached, _synthetic_chunks())
+        assert [h for _, _, h in rerun.execution_trace[5:]] == [
+            h for _, _, h in uncached.execution_trace[5:]
+        ]
@@ -0,0 +1,260 @@
+"""Tests for the Phase 2 result cache: stable keys and the cross-process backend."""
+
+import multiprocessing
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+import pytest
+
+from farfan_pipeline.phases.Phase_02.phase2_30_05_distributed_cache import (
+    IntelligentCache,
+    SharedSQLiteCache,
+    UncacheableKeyError,
+    cached_method,
+    compute_cache_key,
+    configure_global_cache,
+)
+
+
+class Mode(Enum):
+    FAST = "fast"
+
+
+@dataclass(frozen=True)
+class Query:
+    text: str
+    limit: int
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "same"
+
+
+class TestComputeCacheKey:
+    def test_key_is_order_independent_for_mappings_and_sets(self):
+        assert compute_cache_key("m", ({"a": 1, "b": 2},)) == compute_cache_key(
+            "m", ({"b": 2, "a": 1},)
+        )
+        assert compute_cache_key("m", ({3, 1, 2},)) == compute_cache_key("m", ({1, 2, 3},))
+
+    def test_key_distinguishes_types(self):
+        keys = {
+            compute_cache_key("m", (1,)),
+            compute_cache_key("m", ("1",)),
+            compute_cache_key("m", (1.0,)),
+            compute_cache_key("m", (True,)),
+            compute_cache_key("m", ([1],)),
+            compute_cache_key("m", ((1,),)),
+        }
+        assert len(keys) == 6
+
+    def test_supported_structured_values(self):
+        key = compute_cache_key("m", (Mode.FAST, Query("x", 3)), {"q": Query("x", 3)})
+        assert key == compute_cache_key("m", (Mode.FAST, Query("x", 3)), {"q": Query("x", 3)})
+        assert key != compute_cache_key("m", (Mode.FAST, Query("x", 4)), {"q": Query("x", 3)})
+
+    def test_objects_without_stable_encoding_are_rejected(self):
+        # default=str would have mapped both objects to the same key
+        with pytest.raises(UncacheableKeyError):
+            compute_cache_key("m", (Opaque(),))
+
+
+class TestSharedSQLiteCache:
+    def test_lru_bound_and_ttl(self, tmp_path):
+        cache = SharedSQLiteCache(tmp_path / "cache.sqlite", max_size=3, default_ttl=0)
+        for i in range(3):
+            cache.put("f", i, (i,))
+            time.sleep(0.01)
+        assert cache.get("f", (0,)) == 0  # refresh LRU position of key 0
+        cache.put("f", 3, (3,))
+
+        assert cache.get_size() == 3
+        assert cache.get("f", (1,)) is None
+        assert cache.get("f", (0,)) == 0
+
+        cache.put("g", "short", ttl=0.01)
+        time.sleep(0.03)
+        assert cache.get("g") is None
+        assert cache.get_statistics().expirations == 1
+
+    def test_hits_batch_their_access_time_updates(self, tmp_path):
+        cache = SharedSQLiteCache(tmp_path / "cache.sqlite", touch_flush_interval=2)
+        cache.put("f", 1, (1,))
+        cache.put("f", 2, (2,))
+
+        def access_count(x):
+            key = compute_cache_key("f", (x,))
+            return cache._connection().execute(
+                "SELECT access_count FROM entries WHERE key = ?", (key,)
+            ).fetchone()[0]
+
+        cache.get("f", (1,))
+        cache.get("f", (1,))
+        assert access_count(1) == 0  # one distinct key pending: not written yet
+        cache.get("f", (2,))
+        assert (access_count(1), access_count(2)) == (2, 1)
+
+    def test_put_if_absent_keeps_first_value(self, tmp_path):
+        cache = SharedSQLiteCache(tmp_path / "cache.sqlite")
+        assert cache.put_if_absent("f", "first", (1,)) == (True, "first")
+        assert cache.put_if_absent("f", "second", (1,)) == (False, "first")
+
+    def test_cached_method_targets_shared_cache(self, tmp_path):
+        cache = SharedSQLiteCache(tmp_path / "cache.sqlite")
+        calls = []
+
+        @cached_method(cache_instance=cache)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert square(4) == 16
+        assert square(4) == 16
+        assert calls == [4]
+
+    def test_uncacheable_arguments_bypass_the_cache(self, tmp_path):
+        cache = SharedSQLiteCache(tmp_path / "cache.sqlite")
+        calls = []
+
+        @cached_method(cache_instance=cache)
+        def describe(obj):
+            calls.append(obj)
+            return str(obj)
+
+        describe(Opaque())
+        describe(Opaque())
+        assert len(calls) == 2
+        assert cache.get_size() == 0
+
+    def test_global_cache_is_resolved_per_call(self, tmp_path):
+        calls = []
+
+        @cached_method()
+        def double(x):
+            calls.append(x)
+            return 2 * x
+
+        shared = SharedSQLiteCache(tmp_path / "cache.sqlite")
+        configure_global_cache(shared)
+        try:
+            double(5)
+            double(5)
+            assert shared.get("double", (5,)) == 10
+        finally:
+            configure_global_cache(None)
+        assert calls == [5]
+
+
+class Scorer:
+    def __init__(self, weight: int = 1):
+        self.weight = weight
+        self.calls = []
+
+    @cached_method()
+    def score(self, x):
+        self.calls.append(x)
+        return x * self.weight
+
+    @cached_method(instance_key=lambda scorer: scorer.weight)
+    def weighted(self, x):
+        self.calls.append(x)
+        return x * self.weight
+
+    @classmethod
+    @cached_method()
+    def unit(cls, x):
+        return x
+
+
+class KeyedScorer(Scorer):
+    def __cache_key__(self):
+        return self.weight
+
+
+class TestCachedInstanceMethods:
+    @pytest.fixture(autouse=True)
+    def _isolated_global_cache(self):
+        cache = IntelligentCache(max_size=100, default_ttl=0)
+        configure_global_cache(cache)
+        yield cache
+        configure_global_cache(None)
+
+    def test_second_call_is_served_from_cache(self, _isolated_global_cache):
+        scorer = KeyedScorer()
+
+        assert scorer.score(3) == 3
+        assert scorer.score(3) == 3
+
+        assert scorer.calls == [3]
+        stats = _isolated_global_cache.get_statistics()
+        assert stats.total_queries == 2
+        assert stats.hits == 1
+
+    def test_unkeyed_instances_run_uncached(self, _isolated_global_cache):
+        first, second = Scorer(weight=2), Scorer(weight=5)
+
+        assert first.score(3) == 6
+        assert second.score(3) == 15
+        assert first.score(3) == 6
+        assert first.calls == [3, 3]
+        assert _isolated_global_cache.get_size() == 0
+        assert not Scorer.score.invalidate_cache(first, 3)
+
+    def test_keyed_instances_get_their_own_entries(self):
+        first, second = KeyedScorer(weight=2), KeyedScorer(weight=5)
+        assert first.score(3) == 6
+        assert second.score(3) == 15
+        assert KeyedScorer(weight=2).score(3) == 6
+
+        first, second = Scorer(weight=2), Scorer(weight=5)
+        assert first.weighted(3) == 6
+        assert second.weighted(3) == 15
+        assert Scorer(weight=2).weighted(3) == 6
+        assert first.calls == second.calls == [3]
+
+    def test_class_receivers_are_keyed_by_class(self, _isolated_global_cache):
+        assert Scorer.unit(4) == 4
+        assert Scorer.unit(4) == 4
+        assert _isolated_global_cache.get_statistics().hits == 1
+
+    def test_invalidate_uses_the_same_key(self):
+        scorer = KeyedScorer()
+        scorer.score(4)
+        assert Scorer.score.invalidate_cache(scorer, 4)
+        scorer.score(4)
+        assert scorer.calls == [4, 4]
+
+
+def _child_lookup(path, queue):
+    cache = SharedSQLiteCache(path)
+    queue.put(cache.get("expensive", (7,)))
+    cache.close()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork start method"
+)
+def test_hits_are_shared_and_reported_across_processes(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    parent = SharedSQLiteCache(path)
+    parent.put("expensive", {"score": 0.9}, (7,))
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    child = ctx.Process(target=_child_lookup, args=(path, queue))
+    child.start()
+    child.join(timeout=30)
+
+    assert queue.get(timeout=5) == {"score": 0.9}
+    shared = parent.get_shared_statistics()
+    assert shared.hits == 1
+    assert shared.cross_process_hits == 1
+    assert shared.cross_process_hit_rate == 1.0
+
+
+def test_in_process_cache_put_if_absent():
+    cache = IntelligentCache(max_size=2)
+    assert cache.put_if_absent("f", 1, (1,)) == (True, 1)
+    assert cache.put_if_absent("f", 2, (1,)) == (False, 1)
@@ -0,0 +1,318 @@
+"""Tests for ParallelTaskExecutor scheduling (level barriers vs. dependency DAG) and method dispatch."""
+
+import multiprocessing
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from farfan_pipeline.infrastructure.process_pools import pool_context
+from farfan_pipeline.phases.Phase_02 import phase2_50_00_task_executor as task_executor
+from farfan_pipeline.phases.Phase_02.phase2_50_00_task_executor import (
+    CheckpointManager,
+    ParallelTaskExecutor,
+    TaskResult,
+)
+from farfan_pipeline.phases.Phase_02.phase2_50_01_task_planner import ExecutableTask
+
+
+def _task(task_id, question_id, level, chunk_id="CH01", duration=0.0, fail=False, **metadata):
+    return ExecutableTask(
+        task_id=task_id,
+        question_id=question_id,
+        question_global=int(question_id[1:]),
+        policy_area_id="PA01",
+        dimension_id="DIM01",
+        chunk_id=chunk_id,
+        patterns=[],
+        signals={},
+        creation_timestamp="2026-01-01T00:00:00Z",
+        expected_elements=[],
+        metadata={"epistemic_level": f"N{level}", "duration": duration, "fail": fail, **metadata},
+    )
+
+
+def _plan(tasks, plan_id="plan-1"):
+    return SimpleNamespace(plan_id=plan_id, correlation_id="corr-1", tasks=tasks)
+
+
+class RecordingExecutor(ParallelTaskExecutor):
+    """Runs tasks as timed sleeps and records when each one starts and ends."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("max_workers", 4)
+        super().__init__(
+            questionnaire_monolith={"blocks": {}}, preprocessed_document=None, signal_registry=object(), **kwargs
+        )
+        self._event_emission_enabled = False
+        self.started: dict[str, float] = {}
+        self.finished: dict[str, float] = {}
+        self.start_order: list[str] = []
+        self._log_lock = threading.Lock()
+
+    def _execute_task_safe(self, task):
+        with self._log_lock:
+            self.started[task.task_id] = time.monotonic()
+            self.start_order.append(task.task_id)
+        time.sleep(task.metadata["duration"])
+        with self._log_lock:
+            self.finished[task.task_id] = time.monotonic()
+        if task.metadata["fail"]:
+            raise RuntimeError("boom")
+        return TaskResult(
+            task_id=task.task_id,
+            question_id=task.question_id,
+            question_global=task.question_global,
+            policy_area_id=task.policy_area_id,
+            dimension_id=task.dimension_id,
+            chunk_id=task.chunk_id,
+            success=True,
+            output={},
+            execution_time_ms=task.metadata["duration"] * 1000,
+        )
+
+
+class StubProfiler:
+    """PredictiveProfiler stand-in with fixed predictions per question."""
+
+    def __init__(self, predictions):
+        self.predictions = predictions
+        self.recorded: list[str] = []
+
+    def predict(self, contract):
+        return SimpleNamespace(predicted_time_ms=self.predictions[contract["identity"]["contract_id"]])
+
+    def record_execution(self, contract, execution_time_ms, memory_mb):
+        self.recorded.append(contract["identity"]["contract_id"])
+
+
+def _straggler_plan():
+    return [
+        _task("n1-slow", "Q001", 1, duration=0.4),
+        _task("n1-fast", "Q002", 1, duration=0.01),
+        _task("n2-fast", "Q002", 2, duration=0.01),
+        _task("n3-fast", "Q002", 3, duration=0.01),
+    ]
+
+
+def test_level_mode_waits_for_the_whole_level():
+    executor = RecordingExecutor()
+    results = executor.execute_plan_parallel(_plan(_straggler_plan()))
+    assert [r.task_id for r in results] == ["n1-slow", "n1-fast", "n2-fast", "n3-fast"]
+    assert executor.started["n2-fast"] >= executor.finished["n1-slow"]
+
+
+def test_dag_mode_releases_tasks_when_their_own_inputs_finish():
+    executor = RecordingExecutor(scheduling="dag")
+    results = executor.execute_plan_parallel(_plan(_straggler_plan()))
+    assert [r.task_id for r in results] == ["n1-slow", "n1-fast", "n2-fast", "n3-fast"]
+    assert all(r.success for r in results)
+    assert executor.finished["n3-fast"] < executor.finished["n1-slow"]
+
+
+def test_dag_infers_chunk_level_then_question_level_dependencies():
+    executor = RecordingExecutor(scheduling="dag")
+    tasks = [
+        _task("a1", "Q001", 1, chunk_id="CH01"),
+        _task("a2", "Q001", 1, chunk_id="CH02"),
+        _task("b1", "Q002", 1),
+        _task("a2-n2", "Q001", 2, chunk_id="CH02"),
+        _task("a9-n2", "Q001", 2, chunk_id="CH09"),
+        _task("c-n2", "Q003", 2),
+    ]
+    upstream, downstream = executor._build_task_graph(tasks, completed_ids=set())
+    assert upstream["a2-n2"] == {"a2"}
+    assert upstream["a9-n2"] == {"a1", "a2"}
+    assert upstream["c-n2"] == {"a1", "a2", "b1"}
+    assert sorted(downstream["a2"]) == ["a2-n2", "a9-n2", "c-n2"]
+
+
+def test_explicit_dependencies_and_cycles():
+    executor = RecordingExecutor(scheduling="dag")
+    tasks = [
+        _task("x", "Q001", 1, depends_on=["y"]),
+        _task("y", "Q002", 1),
+        _task("z", "Q003", 2, depends_on=[]),
+    ]
+    upstream, _ = executor._build_task_graph(tasks, completed_ids=set())
+    assert upstream == {"x": {"y"}, "y": set(), "z": set()}
+
+    cyclic = [_task("x", "Q001", 1, depends_on=["y"]), _task("y", "Q002", 1, depends_on=["x"])]
+    with pytest.raises(ValueError, match="cycle"):
+        executor.execute_plan_parallel(_plan(cyclic))
+
+
+def test_critical_path_runs_first_and_durations_are_recorded():
+    profiler = StubProfiler({"Q001": 10.0, "Q002": 50.0, "Q003": 30.0})
+    executor = RecordingExecutor(scheduling="dag", max_workers=1, execution_profiler=profiler)
+    tasks = [
+        _task("short", "Q002", 1),  # 50 ms, no successors
+        _task("head", "Q001", 1),  # 10 ms + 30 ms + 30 ms chain
+        _task("mid", "Q003", 2, depends_on=["head"]),
+        _task("tail", "Q003", 3, depends_on=["mid"]),
+    ]
+    results = executor.execute_plan_parallel(_plan(tasks))
+    assert executor.start_order == ["head", "mid", "short", "tail"]
+    assert [r.task_id for r in results] == ["short", "head", "mid", "tail"]
+    assert sorted(profiler.recorded) == ["Q001", "Q002", "Q003", "Q003"]
+
+
+def test_failed_upstream_does_not_block_dependents():
+    executor = RecordingExecutor(scheduling="dag")
+    tasks = [_task("n1", "Q001", 1, fail=True), _task("n2", "Q001", 2)]
+    results = executor.execute_plan_parallel(_plan(tasks))
+    assert [(r.task_id, r.success) for r in results] == [("n1", False), ("n2", True)]
+    assert results[0].error == "boom"
+
+
+def test_dag_resumes_from_checkpoint(tmp_path):
+    manager = CheckpointManager(tmp_path)
+    manager.save_checkpoint("plan-1", ["n1-slow", "n1-fast"])
+    executor = RecordingExecutor(scheduling="dag", checkpoint_manager=manager, checkpoint_batch_size=1)
+    results = executor.execute_plan_parallel(_plan(_straggler_plan()))
+    assert [r.task_id for r in results] == ["n2-fast", "n3-fast"]
+    assert set(executor.started) == {"n2-fast", "n3-fast"}
+    assert manager.get_checkpoint_info("plan-1") is None
+
+
+def test_unknown_scheduling_mode_is_rejected():
+    with pytest.raises(ValueError, match="scheduling"):
+        RecordingExecutor(scheduling="fifo")
+
+
+class WorkerProbeExecutor(ParallelTaskExecutor):
+    """Reports which process ran each task and how warm its local cache was."""
+
+    def _execute_task_safe(self, task):
+        self._calibration_cache[task.task_id] = {}
+        return TaskResult(
+            task_id=task.task_id,
+            question_id=task.question_id,
+            question_global=task.question_global,
+            policy_area_id=task.policy_area_id,
+            dimension_id=task.dimension_id,
+            chunk_id=task.chunk_id,
+            success=True,
+            output={"pid": os.getpid(), "seen": len(self._calibration_cache), "doc": self.preprocessed_document()},
+            execution_time_ms=1.0,
+        )
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+@pytest.mark.parametrize("scheduling", ["levels", "dag"])
+def test_process_mode_shares_state_and_dispatches_by_id(scheduling, monkeypatch):
+    monkeypatch.setattr(
+        task_executor, "pool_context", lambda preload=(): multiprocessing.get_context("fork")
+    )
+    # Neither the document (a lambda) nor the tasks (a lock) are picklable:
+    # workers must inherit them rather than receive them per task.
+    executor = WorkerProbeExecutor(
+        questionnaire_monolith={"blocks": {}},
+        preprocessed_document=lambda: "doc-60-chunks",
+        signal_registry=object(),
+        max_workers=2,
+        use_processes=True,
+        scheduling=scheduling,
+    )
+    executor._event_emission_enabled = False
+    tasks = [
+        _task(f"t{i}", f"Q{i % 3 + 1:03d}", 1 + i % 2, lock=threading.Lock()) for i in range(8)
+    ]
+    results = executor.execute_plan_parallel(_plan(tasks))
+
+    assert [r.task_id for r in results] == [t.task_id for t in tasks]
+    assert all(r.success and r.output["doc"] == "doc-60-chunks" for r in results)
+    assert [r.question_id for r in results] == [t.question_id for t in tasks]
+    pids = {r.output["pid"] for r in results}
+    assert os.getpid() not in pids
+    # One pool for the whole run: worker caches carry over between levels
+    for pid in pids:
+        seen = sorted(r.output["seen"] for r in results if r.output["pid"] == pid)
+        assert seen == list(range(1, len(seen) + 1))
+    assert executor._calibration_cache == {}
+
+
+def test_process_mode_does_not_fork_a_multithreaded_process(monkeypatch):
+    start_methods = []
+
+    def recording_pool_context(preload=()):
+        context = pool_context(preload)
+        start_methods.append(context.get_start_method())
+        return context
+
+    monkeypatch.setattr(task_executor, "pool_context", recording_pool_context)
+    executor = WorkerProbeExecutor(
+        questionnaire_monolith={"blocks": {}},
+        preprocessed_document=str,  # picklable: workers receive it through the initializer
+        signal_registry="registry",
+        max_workers=2,
+        use_processes=True,
+    )
+    executor._event_emission_enabled = False
+    release = threading.Event()
+    thread = threading.Thread(target=release.wait)
+    thread.start()
+    try:
+        results = executor.execute_plan_parallel(_plan([_task(f"t{i}", "Q001", 1) for i in range(4)]))
+    finally:
+        release.set()
+        thread.join()
+
+    assert start_methods and "fork" not in start_methods
+    assert all(r.success for r in results), [r.error for r in results]
+    assert {r.output["pid"] for r in results}.isdisjoint({os.getpid()})
+    assert task_executor._FORK_SHARED_STATE == {}
+
+
+class RecordingDispensary:
+    """Method executor stand-in that records every dispatched call."""
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def execute(self, class_name, method_name, **payload):
+        self.calls.append((class_name, method_name, payload["chunk_text"], payload["question_text"]))
+        return {"method": method_name}
+
+
+def test_method_executor_dispatches_method_sets_of_planner_tasks():
+    questionnaire = {
+        "blocks": {
+            "micro_questions": [
+                {
+                    "question_id": "Q001",
+                    "text": "¿Existe diagnóstico?",
+                    "method_sets": [
+                        {"class": "TextMiningEngine", "function": "diagnose"},
+                        "N1-EMP",
+                        {"class": "CausalExtractor", "function": "extract"},
+                    ],
+                }
+            ]
+        }
+    }
+    dispensary = RecordingDispensary()
+    executor = ParallelTaskExecutor(
+        questionnaire_monolith=questionnaire,
+        preprocessed_document={"chunks": [{"chunk_id": "CH01", "text": "línea base 2023"}]},
+        signal_registry=object(),
+        max_workers=2,
+        method_executor=dispensary,
+    )
+    executor._event_emission_enabled = False
+
+    [result] = executor.execute_plan_parallel(_plan([_task("t1", "Q001", 1)]))
+
+    assert result.success, result.error
+    assert dispensary.calls == [
+        ("TextMiningEngine", "diagnose", "línea base 2023", "¿Existe diagnóstico?"),
+        ("CausalExtractor", "extract", "línea base 2023", "¿Existe diagnóstico?"),
+    ]
+    output = result.output["output"]
+    assert output["method_outputs"] == {
+        "TextMiningEngine.diagnose": {"method": "diagnose"},
+        "CausalExtractor.extract": {"method": "extract"},
+    }
+    assert [t["method_name"] for t in output["method_timings"]] == ["diagnose", "extract"]
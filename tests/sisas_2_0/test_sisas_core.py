@@ -177,9 +177,11 @@ class TestSignalDistributionOrchestrator:
     """Tests for SignalDistributionOrchestrator."""
     
     @pytest.fixture
-    def sdo(self):
-        """Create SDO with default rules."""
-        return SignalDistributionOrchestrator()
+    def sdo(self, tmp_path):
+        """Create SDO with default rules, dead-lettering into tmp_path."""
+        return SignalDistributionOrchestrator(
+            rules=RoutingRules(dead_letter_path=str(tmp_path / "dead_letter"))
+        )
     
     @pytest.fixture
     def sample_signal(self):
@@ -355,9 +357,11 @@ class TestExtractors:
     """Tests for signal extractors."""
     
     @pytest.fixture
-    def sdo(self):
+    def sdo(self, tmp_path):
         """Create SDO with phase_01 consumer."""
-        sdo = SignalDistributionOrchestrator()
+        sdo = SignalDistributionOrchestrator(
+            rules=RoutingRules(dead_letter_path=str(tmp_path / "dead_letter"))
+        )
         sdo.register_consumer(
             consumer_id="phase_01",
             scopes=[{"phase": "phase_01", "policy_area": "ALL", "slot": "ALL"}],
@@ -0,0 +1,168 @@
+"""Tests for batched, single-flight embedding computation."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from farfan_pipeline.methods.embedding_cache_sota import (
+    CacheConfig,
+    EmbeddingBackendABC,
+    EmbeddingMicroBatcher,
+    SOTAEmbeddingCache,
+)
+
+
+class RecordingBackend(EmbeddingBackendABC):
+    """Deterministic backend that records every text it encodes."""
+
+    def __init__(self, dimension: int = 8, delay: float = 0.0, fail: bool = False):
+        self.dimension = dimension
+        self.delay = delay
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def encode(self, texts):
+        with self._lock:
+            self.batches.append(list(texts))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("backend down")
+        return np.stack([self.encode_single(t) for t in texts])
+
+    def encode_single(self, text):
+        return np.random.default_rng(sum(text.encode())).normal(size=self.dimension)
+
+    def get_dimension(self):
+        return self.dimension
+
+    @property
+    def encoded(self) -> list[str]:
+        return [text for batch in self.batches for text in batch]
+
+
+def _cache(backend, **options) -> SOTAEmbeddingCache:
+    config = CacheConfig(enable_persistence=False, **options)
+    return SOTAEmbeddingCache(config, backend=backend)
+
+
+class TestGetEmbeddingsBatch:
+    def test_duplicates_are_encoded_once_and_stats_are_exact(self):
+        backend = RecordingBackend()
+        cache = _cache(backend)
+        cache.get_embedding("a")
+
+        result = cache.get_embeddings_batch(["a", "b", "b", "c"])
+
+        assert result.dtype == np.float32
+        assert result.shape == (4, 8)
+        np.testing.assert_array_equal(result[1], result[2])
+        np.testing.assert_allclose(result[3], backend.encode_single("c"), rtol=1e-6)
+        assert sorted(backend.encoded) == ["b", "c"]
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses) == (2, 3)
+        assert stats.backend_batches == 1
+        assert stats.encoded_texts == 2
+
+    def test_batch_hits_refresh_lru_order(self):
+        cache = _cache(RecordingBackend(), max_cache_size=2)
+        cache.get_embeddings_batch(["old", "new"])
+        cache.get_embeddings_batch(["old"])
+        cache.get_embedding("third")
+        assert set(cache._cache) == {cache._compute_hash("old"), cache._compute_hash("third")}
+
+    def test_large_batches_are_split_by_batch_size(self):
+        backend = RecordingBackend()
+        cache = _cache(backend, batch_size=4)
+        cache.get_embeddings_batch([f"t{i}" for i in range(10)])
+        assert [len(batch) for batch in backend.batches] == [4, 4, 2]
+
+    def test_empty_input(self):
+        assert _cache(RecordingBackend()).get_embeddings_batch([]).shape == (0, 8)
+
+
+class TestConcurrentBatches:
+    def test_concurrent_callers_share_inflight_work(self):
+        backend = RecordingBackend(delay=0.05)
+        cache = _cache(backend, batch_size=256, batch_max_latency_ms=20)
+        texts = [f"chunk {i}" for i in range(20)]
+        results = [None] * 8
+
+        def worker(k):
+            results[k] = cache.get_embeddings_batch(texts[k % 3 :] + texts[: k % 3])
+
+        threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(backend.encoded) == sorted(texts)
+        for k, result in enumerate(results):
+            np.testing.assert_array_equal(result, results[0][np.roll(np.arange(20), -(k % 3))])
+        stats = cache.get_stats()
+        assert stats.hits + stats.misses == 160
+        assert stats.misses == 20
+
+    def test_leader_failure_propagates_to_waiters(self):
+        backend = RecordingBackend(delay=0.05, fail=True)
+        cache = _cache(backend, batch_max_latency_ms=0)
+        errors = []
+
+        def worker():
+            try:
+                cache.get_embeddings_batch(["shared"])
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == ["backend down"] * 4
+        assert cache._inflight == {}
+        backend.fail = False
+        assert cache.get_embeddings_batch(["shared"]).shape == (1, 8)
+
+
+def test_micro_batcher_combines_concurrent_requests():
+    seen = []
+
+    def encode(texts):
+        seen.append(list(texts))
+        return np.arange(len(texts), dtype=np.float64)[:, None] + np.zeros((1, 2))
+
+    batcher = EmbeddingMicroBatcher(encode, max_batch_size=6, max_latency_s=1.0)
+    outputs = {}
+    barrier = threading.Barrier(3)
+
+    def worker(name):
+        barrier.wait()
+        outputs[name] = batcher.encode([f"{name}{i}" for i in range(2)])
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in "abc"]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start < 0.9  # flushed on size, not on the latency budget
+    assert len(seen) == 1 and len(seen[0]) == 6
+    rows = {text: i for i, text in enumerate(seen[0])}
+    for name, result in outputs.items():
+        assert result.dtype == np.float32
+        assert result[:, 0].tolist() == [rows[f"{name}0"], rows[f"{name}1"]]
+
+
+def test_micro_batcher_skips_wait_when_alone_and_propagates_errors():
+    batcher = EmbeddingMicroBatcher(lambda texts: np.ones((len(texts), 3)), max_latency_s=5.0)
+    start = time.monotonic()
+    assert batcher.encode(["x"], wait_for_peers=False).shape == (1, 3)
+    assert time.monotonic() - start < 1.0
+    with pytest.raises(ValueError):
+        EmbeddingMicroBatcher(lambda texts: (_ for _ in ()).throw(ValueError("boom"))).encode(["x"])
@@ -0,0 +1,147 @@
+"""Tests for DocumentSearchSession reuse in PolicyAnalysisEmbedder."""
+
+import threading
+
+import numpy as np
+import pytest
+
+embedding_policy = pytest.importorskip("farfan_pipeline.methods.embedding_policy")
+
+
+class FakeSentenceTransformer:
+    """Deterministic bi-encoder keyed on the text bytes."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        return np.stack(
+            [np.random.default_rng(sum(t.encode())).normal(size=8) for t in texts]
+        ).astype(np.float32)
+
+
+class FakeCrossEncoder:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def embedder(monkeypatch):
+    monkeypatch.setattr(embedding_policy, "SentenceTransformer", FakeSentenceTransformer)
+    monkeypatch.setattr(embedding_policy, "CrossEncoder", FakeCrossEncoder)
+    return embedding_policy.PolicyAnalysisEmbedder(embedding_policy.PolicyEmbeddingConfig())
+
+
+def _chunks(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "content": f"chunk {i}",
+            "embedding": rng.normal(size=8).astype(np.float32),
+            "pdq_context": {"policy": "PA01", "dimension": f"DIM0{i % 2 + 1}"},
+        }
+        for i in range(n)
+    ]
+
+
+class TestSearchSessionReuse:
+    def test_same_list_reuses_session(self, embedder):
+        chunks = _chunks(6)
+        first = embedder.create_search_session(chunks)
+        assert embedder.create_search_session(chunks) is first
+        assert embedder.get_diagnostics()["search_session_count"] == 1
+
+    def test_equal_content_list_shares_matrices_with_its_own_chunks(self, embedder):
+        chunks = _chunks(6)
+        copy_of_chunks = [dict(chunk) for chunk in chunks]
+        first = embedder.create_search_session(chunks)
+
+        second = embedder.create_search_session(copy_of_chunks)
+
+        assert second.chunks is copy_of_chunks
+        assert second.matrix is first.matrix
+        results = second.search("query", use_reranking=False)
+        assert all(any(chunk is c for c in copy_of_chunks) for chunk, _ in results)
+
+    def test_in_place_edit_invalidates_session(self, embedder):
+        chunks = _chunks(6)
+        first = embedder.create_search_session(chunks)
+
+        chunks[2] = {**chunks[2], "embedding": np.ones(8, dtype=np.float32)}
+        second = embedder.create_search_session(chunks)
+        assert second is not first
+        np.testing.assert_allclose(second.matrix[2], np.full(8, 1 / np.sqrt(8)), rtol=1e-6)
+
+        chunks[3]["pdq_context"] = {"policy": "PA02", "dimension": "DIM01"}
+        third = embedder.create_search_session(chunks)
+        assert third is not second
+        assert third.pdq_mask({"policy": "PA02", "dimension": "DIM01"}).tolist() == [
+            False, False, False, True, False, False
+        ]
+
+    def test_repeat_queries_skip_the_full_digest(self, embedder, monkeypatch):
+        chunks = _chunks(6)
+        first = embedder.create_search_session(chunks)
+
+        def no_digest(document_chunks):
+            raise AssertionError("digest_chunks called on the fast path")
+
+        monkeypatch.setattr(embedding_policy.DocumentSearchSession, "digest_chunks", no_digest)
+        assert embedder.create_search_session(chunks) is first
+        embedder.semantic_search("q", chunks, use_reranking=False)
+
+        chunks.append(_chunks(1, seed=9)[0])
+        with pytest.raises(AssertionError, match="fast path"):
+            embedder.create_search_session(chunks)
+
+    def test_in_place_embedding_mutation_needs_invalidation(self, embedder):
+        chunks = _chunks(4)
+        first = embedder.create_search_session(chunks)
+
+        chunks[0]["embedding"][:] = 1.0
+        assert embedder.create_search_session(chunks) is first
+        embedder.invalidate_search_sessions()
+        second = embedder.create_search_session(chunks)
+        assert second is not first
+        np.testing.assert_allclose(second.matrix[0], np.full(8, 1 / np.sqrt(8)), rtol=1e-6)
+
+    def test_explicit_session_handle(self, embedder):
+        chunks = _chunks(6)
+        session = embedder.create_search_session(chunks)
+        embedder.invalidate_search_sessions()
+
+        got = embedder.semantic_search("q", chunks, use_reranking=False, session=session)
+        assert got == session.search("q", use_reranking=False)
+        assert embedder.get_diagnostics()["search_session_count"] == 0
+
+    def test_sessions_are_bounded(self, embedder):
+        for seed in range(embedder._MAX_SEARCH_SESSIONS + 3):
+            embedder.create_search_session(_chunks(3, seed=seed))
+        assert embedder.get_diagnostics()["search_session_count"] == embedder._MAX_SEARCH_SESSIONS
+
+    def test_concurrent_searches_share_results(self, embedder):
+        documents = [_chunks(10, seed=seed) for seed in range(4)]
+        expected = [
+            [chunk["content"] for chunk, _ in embedder.semantic_search("q", doc, use_reranking=False)]
+            for doc in documents
+        ]
+        errors = []
+
+        def worker(index):
+            try:
+                for _ in range(25):
+                    doc = documents[index % len(documents)]
+                    got = embedder.semantic_search("q", doc, use_reranking=False)
+                    assert [chunk["content"] for chunk, _ in got] == expected[index % len(documents)]
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert embedder.get_diagnostics()["search_session_count"] == len(documents)
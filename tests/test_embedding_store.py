@@ -0,0 +1,131 @@
+"""Tests for the memory-mapped embedding store."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from farfan_pipeline.methods.embedding_cache_sota import (
+    CacheConfig,
+    EmbeddingBackendABC,
+    SOTAEmbeddingCache,
+)
+from farfan_pipeline.methods.embedding_store import MemmapEmbeddingStore
+
+
+class CountingBackend(EmbeddingBackendABC):
+    """Deterministic backend that counts encode calls."""
+
+    def __init__(self, dimension: int = 8):
+        self.dimension = dimension
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        return np.stack([self.encode_single(t) for t in texts])
+
+    def encode_single(self, text):
+        self.calls += 1
+        return np.random.default_rng(sum(text.encode())).normal(size=self.dimension)
+
+    def get_dimension(self):
+        return self.dimension
+
+
+def _hash(i: int) -> str:
+    return f"{i:016x}"
+
+
+class TestMemmapEmbeddingStore:
+    def test_put_get_and_reopen(self, tmp_path):
+        store = MemmapEmbeddingStore(tmp_path, initial_capacity=2)
+        vectors = {_hash(i): np.full(4, i, dtype=np.float32) for i in range(10)}
+        for text_hash, vector in vectors.items():
+            store.put(text_hash, vector, text_length=7)
+        store.close()
+
+        reopened = MemmapEmbeddingStore(tmp_path)
+        assert len(reopened) == 10
+        assert reopened.dimension == 4
+        for text_hash, vector in vectors.items():
+            np.testing.assert_array_equal(reopened.get(text_hash), vector)
+        assert reopened.metadata(_hash(3))["text_length"] == 7
+        assert reopened.get(_hash(99)) is None
+
+    def test_get_returns_read_only_view(self, tmp_path):
+        store = MemmapEmbeddingStore(tmp_path)
+        store.put(_hash(0), np.ones(4))
+
+        vector = store.get(_hash(0))
+        with pytest.raises(ValueError):
+            vector /= 2.0
+        normalized = vector / np.linalg.norm(vector)
+
+        assert normalized[0] == pytest.approx(0.5)
+        np.testing.assert_array_equal(store.get(_hash(0)), np.ones(4, dtype=np.float32))
+        store.close()
+
+    def test_dimension_mismatch_raises(self, tmp_path):
+        store = MemmapEmbeddingStore(tmp_path)
+        store.put(_hash(1), np.ones(4))
+        with pytest.raises(ValueError):
+            store.put(_hash(2), np.ones(5))
+
+    def test_delete_survives_reopen(self, tmp_path):
+        store = MemmapEmbeddingStore(tmp_path)
+        store.put(_hash(1), np.ones(3))
+        store.put(_hash(2), np.zeros(3))
+        assert store.delete(_hash(1))
+        assert not store.delete(_hash(1))
+        store.close()
+
+        reopened = MemmapEmbeddingStore(tmp_path)
+        assert reopened.keys() == [_hash(2)]
+
+    def test_compaction_rewrites_live_rows(self, tmp_path):
+        store = MemmapEmbeddingStore(tmp_path, compaction_ratio=0.25, min_compaction_rows=4)
+        for i in range(8):
+            store.put(_hash(i), np.full(2, i))
+        for i in range(4):
+            store.delete(_hash(i))
+
+        assert store.generation == 1
+        assert store.dead_rows == 0
+        assert sorted(p.name for p in tmp_path.glob("vectors-*.f32")) == ["vectors-000001.f32"]
+        np.testing.assert_array_equal(store.get(_hash(6)), np.full(2, 6))
+
+    def test_gather_marks_missing_rows(self, tmp_path):
+        store = MemmapEmbeddingStore(tmp_path)
+        store.put(_hash(1), np.array([1.0, 2.0]))
+        matrix, found = store.gather([_hash(1), _hash(2)])
+        assert found.tolist() == [True, False]
+        np.testing.assert_array_equal(matrix, [[1.0, 2.0], [0.0, 0.0]])
+
+    def test_pickle_import_is_one_shot(self, tmp_path):
+        legacy = tmp_path / "legacy"
+        legacy.mkdir()
+        with open(legacy / f"{_hash(5)}.pkl", "wb") as f:
+            pickle.dump({"text_hash": _hash(5), "embedding": np.ones(3), "text_length": 4}, f)
+
+        store = MemmapEmbeddingStore(tmp_path / "store")
+        assert store.import_pickle_dir(legacy) == 1
+        assert store.import_pickle_dir(legacy) == 0
+        np.testing.assert_array_equal(store.get(_hash(5)), np.ones(3))
+
+
+def test_cache_promotes_persisted_embeddings(tmp_path):
+    config = CacheConfig(cache_dir=tmp_path, enable_persistence=True, enable_mmap=True)
+    first = SOTAEmbeddingCache(config, backend=CountingBackend())
+    expected = first.get_embedding("persisted text")
+    first._store.close()
+
+    backend = CountingBackend()
+    second = SOTAEmbeddingCache(config, backend=backend)
+    np.testing.assert_allclose(second.get_embedding("persisted text"), expected, rtol=1e-6)
+    assert backend.calls == 0
+    assert second.get_stats().hits == 1
+
+    batch = second.get_embeddings_batch(["persisted text", "new text"])
+    np.testing.assert_allclose(batch[0], expected, rtol=1e-6)
+    assert second.invalidate("persisted text")
+    assert second._compute_hash("persisted text") not in second._store
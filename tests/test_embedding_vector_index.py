@@ -0,0 +1,195 @@
+"""Tests for the embedding cache vector index subsystem."""
+
+import numpy as np
+import pytest
+
+from farfan_pipeline.methods.embedding_cache_sota import (
+    CacheConfig,
+    EmbeddingBackendABC,
+    SOTAEmbeddingCache,
+)
+from farfan_pipeline.methods.embedding_vector_index import (
+    ExactVectorIndex,
+    IVFVectorIndex,
+    benchmark_vector_index,
+)
+
+
+class HashingBackend(EmbeddingBackendABC):
+    """Deterministic backend: a seeded random vector per text."""
+
+    def __init__(self, dimension: int = 16):
+        self.dimension = dimension
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        return np.stack([self.encode_single(t) for t in texts])
+
+    def encode_single(self, text):
+        seed = sum(text.encode()) + len(text)
+        return np.random.default_rng(seed).normal(size=self.dimension)
+
+    def get_dimension(self):
+        return self.dimension
+
+
+def _cosine(a, b):
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestExactVectorIndex:
+    def test_search_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        vectors = {f"k{i}": rng.normal(size=8) for i in range(200)}
+        index = ExactVectorIndex()
+        for key, vector in vectors.items():
+            index.add(key, vector)
+
+        query = rng.normal(size=8)
+        expected = sorted(vectors, key=lambda k: _cosine(query, vectors[k]), reverse=True)[:5]
+        results = index.search(query, 5)
+        assert [key for key, _ in results] == expected
+        assert results[0][1] == pytest.approx(_cosine(query, vectors[expected[0]]), abs=1e-5)
+
+    def test_remove_keeps_rows_compact(self):
+        index = ExactVectorIndex(initial_capacity=2)
+        for i in range(5):
+            index.add(f"k{i}", np.eye(5)[i])
+        assert index.remove("k1")
+        assert not index.remove("k1")
+        assert len(index) == 4
+        assert index.vectors.shape == (4, 5)
+        assert index.search(np.eye(5)[4], 1)[0][0] == "k4"
+        assert "k1" not in index
+
+    def test_get_normalized_is_a_copy(self):
+        index = ExactVectorIndex(initial_capacity=1)
+        index.add("k0", np.array([3.0, 4.0]))
+        unit = index.get_normalized("k0")
+        index.add("k1", np.array([0.0, 1.0]))  # grows the matrix
+        index.remove("k0")  # moves k1 into k0's row
+        np.testing.assert_allclose(unit, [0.6, 0.8])
+
+    def test_threshold_filters_results(self):
+        index = ExactVectorIndex()
+        index.add("same", np.array([1.0, 0.0]))
+        index.add("orthogonal", np.array([0.0, 1.0]))
+        index.add("zero", np.zeros(2))
+        assert index.search(np.array([1.0, 0.0]), 10, threshold=0.5) == [("same", 1.0)]
+
+
+class TestIVFVectorIndex:
+    def test_untrained_index_is_exact(self):
+        index = IVFVectorIndex(nlist=4, train_threshold=100)
+        index.add("a", np.array([1.0, 0.0]))
+        index.add("b", np.array([0.0, 1.0]))
+        assert not index.is_trained
+        assert index.search(np.array([1.0, 0.1]), 1)[0][0] == "a"
+
+    def test_incremental_updates_after_training(self):
+        rng = np.random.default_rng(3)
+        index = IVFVectorIndex(nlist=8, nprobe=8, train_threshold=64)
+        for i in range(100):
+            index.add(f"k{i}", rng.normal(size=12))
+        assert index.is_trained
+
+        probe = rng.normal(size=12)
+        index.add("probe", probe)
+        assert index.search(probe, 1)[0][0] == "probe"
+        index.remove("probe")
+        assert all(key != "probe" for key, _ in index.search(probe, 10))
+
+    def test_two_step_training_without_auto_train(self):
+        rng = np.random.default_rng(5)
+        index = IVFVectorIndex(nlist=4, nprobe=4, train_threshold=16, auto_train=False)
+        for i in range(20):
+            index.add(f"k{i}", rng.normal(size=6))
+        assert index.training_due and not index.is_trained
+
+        centroids = index.fit_centroids(index.training_vectors())
+        index.add("late", rng.normal(size=6))  # inserted while the centroids were fitted
+        index.install_centroids(centroids)
+
+        assert index.is_trained and not index.training_due
+        assert index.search(index.get_normalized("late"), 1)[0][0] == "late"
+
+    def test_benchmark_reports_recall_and_latency(self):
+        results = benchmark_vector_index(
+            n_vectors=2000, dimension=32, n_queries=10, k=5, n_clusters=16
+        )
+        assert results["exact"]["recall_at_k"] == 1.0
+        assert results["ivf"]["recall_at_k"] >= 0.8
+        assert results["exact"]["latency_ms"] < results["loop"]["latency_ms"]
+
+
+class TestCacheIntegration:
+    @pytest.fixture(params=["exact", "ivf"])
+    def cache(self, request):
+        config = CacheConfig(
+            enable_persistence=False,
+            max_cache_size=50,
+            vector_index=request.param,
+            ivf_nlist=4,
+            ivf_nprobe=4,
+        )
+        return SOTAEmbeddingCache(config, backend=HashingBackend())
+
+    def test_find_similar_tracks_inserts_and_invalidation(self, cache):
+        texts = [f"chunk {i}" for i in range(20)]
+        for text in texts:
+            cache.get_embedding(text)
+
+        hits = cache.find_similar("chunk 3", n_results=3, threshold=-1.0)
+        assert hits[0][0] == cache._compute_hash("chunk 3")
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+        cache.invalidate("chunk 5")
+        hashes = {h for h, _ in cache.find_similar("chunk 6", n_results=50, threshold=-1.0)}
+        assert cache._compute_hash("chunk 5") not in hashes
+
+    def test_index_survives_lru_eviction(self, cache):
+        for i in range(80):
+            cache.get_embedding(f"text {i}")
+        assert len(cache._similarity_index) == len(cache._cache) <= 50
+        hashes = {h for h, _ in cache.find_similar("text 79", n_results=100, threshold=-1.0)}
+        assert hashes == set(cache._cache)
+
+    def test_similarity_uses_normalized_vectors(self, cache):
+        backend = cache.backend
+        expected = _cosine(backend.encode_single("alpha"), backend.encode_single("beta"))
+        assert cache.similarity("alpha", "beta") == pytest.approx(expected, abs=1e-5)
+
+    def test_ivf_training_runs_outside_the_cache_lock(self):
+        import threading
+
+        cache = SOTAEmbeddingCache(
+            CacheConfig(enable_persistence=False, max_cache_size=100), backend=HashingBackend()
+        )
+        index = cache._similarity_index = IVFVectorIndex(
+            nlist=4, nprobe=4, train_threshold=32, auto_train=False
+        )
+        lock_free_during_fit = []
+        fit_centroids = index.fit_centroids
+
+        def probe_lock():
+            acquired = cache._lock.acquire(timeout=5)
+            if acquired:
+                cache._lock.release()
+            lock_free_during_fit.append(acquired)
+
+        def probing_fit(vectors, iterations=10):
+            probe = threading.Thread(target=probe_lock)
+            probe.start()
+            probe.join()
+            return fit_centroids(vectors, iterations)
+
+        index.fit_centroids = probing_fit
+        for i in range(40):
+            cache.get_embedding(f"text {i}")
+
+        assert index.is_trained
+        assert lock_free_during_fit == [True]
+        assert cache.find_similar("text 7", n_results=1, threshold=-1.0)[0][0] == cache._compute_hash(
+            "text 7"
+        )
@@ -0,0 +1,235 @@
+"""Tests for the shared parsed-document store (one parse per PDF content hash)."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from farfan_pipeline.infrastructure import parsed_document_store as store_module
+from farfan_pipeline.infrastructure.parsed_document_store import ParsedDocumentStore
+
+PAGES = [
+    "Plan de Desarrollo Municipal 2024-2027\nPresentación",
+    "Diagnóstico: la cobertura en salud es del 45%.",
+    "Plan Plurianual de Inversiones",
+]
+
+
+@pytest.fixture
+def plan_pdf(tmp_path: Path) -> Path:
+    path = tmp_path / "plan.pdf"
+    doc = fitz.open()
+    for text in PAGES:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.set_metadata({"title": "Plan de prueba"})
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def count_opens(monkeypatch):
+    opens = []
+    real_open = store_module.fitz.open
+
+    def counting_open(*args, **kwargs):
+        opens.append(args)
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(store_module.fitz, "open", counting_open)
+    return opens
+
+
+def _direct_texts(path: Path) -> list[str]:
+    with fitz.open(path) as doc:
+        return [page.get_text() for page in doc]
+
+
+def test_document_matches_direct_pymupdf_extraction(tmp_path, plan_pdf):
+    document = ParsedDocumentStore(tmp_path / "store").open(plan_pdf)
+
+    assert document.page_count == len(PAGES)
+    assert list(document.iter_page_texts()) == _direct_texts(plan_pdf)
+    assert document.page_char_counts == [len(t) for t in _direct_texts(plan_pdf)]
+    assert document.metadata["title"] == "Plan de prueba"
+    assert "cobertura en salud" in document.page_blocks(1)[0].text
+    assert document.page_tables(0) == []
+    with pytest.raises(IndexError):
+        document.page_text(len(PAGES))
+
+
+def test_pdf_is_parsed_once_across_consumers_and_stores(tmp_path, plan_pdf, count_opens):
+    store = ParsedDocumentStore(tmp_path / "store")
+    first = store.open(plan_pdf)
+    assert store.open(str(plan_pdf)) is first
+    first.tables()
+    first.tables()
+    assert len(count_opens) == 2  # layout layer, then table layer on first table access
+
+    # A new process (fresh store) reuses the artifacts without touching the PDF
+    fresh = ParsedDocumentStore(tmp_path / "store")
+    document = fresh.open(plan_pdf)
+    assert document.page_text(2) == first.page_text(2)
+    document.tables()
+    assert len(count_opens) == 2
+    assert fresh.get_metrics()["artifact_hits"] == 2
+    assert fresh.get_metrics()["pages_parsed"] == 0
+
+
+def test_damaged_segment_is_reparsed_from_pdf(tmp_path, plan_pdf):
+    root = tmp_path / "store"
+    store = ParsedDocumentStore(root)
+    sha256 = store.open(plan_pdf).sha256
+    store.close()
+
+    artifact = store.artifact_path(sha256, "layout")
+    data = bytearray(artifact.read_bytes())
+    data[-3] ^= 0xFF  # corrupt the last page's blocks segment
+    artifact.write_bytes(bytes(data))
+
+    document = ParsedDocumentStore(root).open(plan_pdf)
+    assert document.page_text(2) == _direct_texts(plan_pdf)[2]
+    assert "Plurianual" in document.page_blocks(2)[0].text
+
+
+def test_mismatched_artifact_is_rebuilt(tmp_path, plan_pdf):
+    store = ParsedDocumentStore(tmp_path / "store")
+    sha256 = store.open(plan_pdf).sha256
+    store.close()
+    store.artifact_path(sha256, "layout").write_bytes(b"not an artifact")
+
+    fresh = ParsedDocumentStore(tmp_path / "store")
+    assert fresh.open(plan_pdf).page_count == len(PAGES)
+    assert fresh.get_metrics()["layout_layers_built"] == 1
+
+
+def test_artifact_from_another_parser_version_is_rebuilt(tmp_path, plan_pdf, monkeypatch):
+    store = ParsedDocumentStore(tmp_path / "store")
+    sha256 = store.open(plan_pdf).sha256
+    store.close()
+    assert store_module.parser_fingerprint().startswith(f"{store_module.PARSER_VERSION}/pymupdf-")
+
+    monkeypatch.setattr(store_module, "PARSER_VERSION", store_module.PARSER_VERSION + 1)
+    fresh = ParsedDocumentStore(tmp_path / "store")
+    assert fresh.open(plan_pdf).page_count == len(PAGES)
+    assert fresh.get_metrics()["layout_layers_built"] == 1
+    assert fresh.get_metrics()["artifact_hits"] == 0
+
+    # The rebuilt artifact carries the new fingerprint and is reused from now on
+    again = ParsedDocumentStore(tmp_path / "store")
+    again.open(plan_pdf)
+    assert again.get_metrics()["artifact_hits"] == 1
+    assert again.artifact_path(sha256, "layout").exists()
+
+
+def test_missing_pdf_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="PDF file not found"):
+        ParsedDocumentStore(tmp_path / "store").open(tmp_path / "missing.pdf")
+
+
+@pytest.mark.parametrize(("page_count", "workers"), [(0, 4), (1, 4), (7, 2), (500, 8)])
+def test_page_shards_cover_document_in_order(page_count, workers):
+    shards = store_module.page_shards(page_count, workers)
+    covered = [page for start, stop in shards for page in range(start, stop)]
+    assert covered == list(range(page_count))
+
+
+def test_parallel_parse_matches_serial_artifacts(tmp_path, plan_pdf, monkeypatch):
+    monkeypatch.setattr(store_module, "MIN_PAGES_PER_WORKER", 1)
+    serial = ParsedDocumentStore(tmp_path / "serial", workers=1)
+    parallel = ParsedDocumentStore(tmp_path / "parallel", workers=2)
+    sha256 = serial.open(plan_pdf).sha256
+    parallel.open(plan_pdf).tables()
+    serial.open(plan_pdf).tables()
+
+    assert parallel.get_metrics()["parallel_parses"] == 2
+    assert serial.get_metrics()["parallel_parses"] == 0
+    for layer in ("layout", "tables"):
+        assert (
+            parallel.artifact_path(sha256, layer).read_bytes()
+            == serial.artifact_path(sha256, layer).read_bytes()
+        )
+
+
+def _make_pdf(path: Path, text: str) -> Path:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_default_worker_count_is_capped(monkeypatch):
+    monkeypatch.delenv("FARFAN_PDF_WORKERS", raising=False)
+    monkeypatch.setattr(store_module.os, "cpu_count", lambda: 64)
+    assert store_module._default_workers() == store_module.DEFAULT_MAX_WORKERS
+
+
+def test_workers_are_not_forked_from_a_multithreaded_process():
+    release = threading.Event()
+    thread = threading.Thread(target=release.wait)
+    thread.start()
+    try:
+        start_method = ParsedDocumentStore._pool_context().get_start_method()
+    finally:
+        release.set()
+        thread.join()
+    assert start_method in ("forkserver", "spawn")
+
+
+def test_least_recently_opened_documents_are_forgotten(tmp_path):
+    store = ParsedDocumentStore(tmp_path / "store", workers=1, max_open_documents=2)
+    pdfs = [_make_pdf(tmp_path / f"plan{n}.pdf", f"Plan {n}") for n in range(3)]
+    first, second = store.open(pdfs[0]), store.open(pdfs[1])
+    assert store.open(pdfs[0]) is first  # refreshes plan0
+    store.open(pdfs[2])
+
+    assert store.get_metrics()["open_documents"] == 2
+    assert store.open(pdfs[0]) is first
+    assert store.open(pdfs[1]) is not second
+    # A forgotten document stays usable by whoever still holds it
+    assert "Plan 1" in second.page_text(0)
+
+    assert store.release(first.sha256)
+    assert not store.release(first.sha256)
+    assert store.open(pdfs[0]) is not first
+
+
+def test_building_one_document_does_not_block_another(tmp_path, monkeypatch):
+    import threading
+
+    slow_pdf = _make_pdf(tmp_path / "slow.pdf", "Plan lento")
+    fast_pdf = _make_pdf(tmp_path / "fast.pdf", "Plan rápido")
+    store = ParsedDocumentStore(tmp_path / "store", workers=1)
+    started, release = threading.Event(), threading.Event()
+    real_parse = store._parse_layer
+
+    def parse_layer(pdf_path, layer):
+        if pdf_path == slow_pdf:
+            started.set()
+            assert release.wait(10)
+        return real_parse(pdf_path, layer)
+
+    monkeypatch.setattr(store, "_parse_layer", parse_layer)
+    slow = threading.Thread(target=store.open, args=(slow_pdf,))
+    slow.start()
+    assert started.wait(10)
+    try:
+        assert "rápido" in store.open(fast_pdf).page_text(0)
+    finally:
+        release.set()
+        slow.join()
+    assert store.get_metrics()["layout_layers_built"] == 2
+
+
+def test_default_root_is_outside_the_repository(monkeypatch, tmp_path):
+    monkeypatch.delenv("FARFAN_PARSED_DOCUMENT_DIR", raising=False)
+    monkeypatch.setenv("FARFAN_CACHE_DIR", str(tmp_path / "cache"))
+    assert store_module._default_root() == tmp_path / "cache" / "parsed_documents"
+
+    monkeypatch.delenv("FARFAN_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert store_module._default_root() == tmp_path / "xdg" / "farfan" / "parsed_documents"
@@ -0,0 +1,102 @@
+"""Tests for the inverted question → pattern index of the questionnaire resolver."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from canonic_questionnaire_central.resolver import (
+    CanonicalQuestionnaireResolver,
+    QuestionPatternIndex,
+)
+
+PATTERN_REGISTRY = {
+    "PAT-A": {"pattern": "a", "applies_to_questions": ["Q001", "Q002", "Q001"]},
+    "PAT-W": {"pattern": "w", "applies_to_questions": ["*"], "category": "WILD"},
+    "PAT-B": {"pattern": "b", "applies_to_questions": ["Q002"], "confidence_weight": 0.5},
+    "PAT-NONE": {"pattern": "n"},
+    "NOT-A-PATTERN": "ignored",
+}
+
+
+def _write(path: Path, payload) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+@pytest.fixture
+def questionnaire_root(tmp_path: Path) -> Path:
+    root = tmp_path / "cqc"
+    _write(root / "config/canonical_notation.json", {"notation": "v1"})
+    for d in range(1, 7):
+        _write(root / f"dimensions/DIM{d:02d}/metadata.json", {"dimension_id": f"DIM{d:02d}"})
+        questions = [
+            {"question_id": f"Q{(d - 1) * 50 + n:03d}", "dimension_id": f"DIM{d:02d}"}
+            for n in range(1, 51)
+        ]
+        questions[-1]["patterns"] = [{"id": "INLINE"}]
+        _write(root / f"dimensions/DIM{d:02d}/questions.json", {"questions": questions})
+    for pa in range(1, 11):
+        _write(root / f"policy_areas/PA{pa:02d}_area/metadata.json", {"policy_area_id": f"PA{pa:02d}"})
+    for cl in range(1, 5):
+        _write(root / f"clusters/CL{cl:02d}_c/metadata.json", {"name": f"cluster {cl}"})
+    _write(root / "patterns/index.json", {"patterns": PATTERN_REGISTRY})
+    return root
+
+
+def _linear_scan(question_id: str) -> list[str]:
+    """The per-question scan the index replaces."""
+    return [
+        pattern_id
+        for pattern_id, data in PATTERN_REGISTRY.items()
+        if isinstance(data, dict)
+        and (
+            question_id in data.get("applies_to_questions", [])
+            or "*" in data.get("applies_to_questions", [])
+        )
+    ]
+
+
+def test_index_matches_linear_scan_in_registry_order():
+    index = QuestionPatternIndex.build(PATTERN_REGISTRY)
+    for question_id in ("Q001", "Q002", "Q003", "Q300"):
+        assert list(index.pattern_ids(question_id)) == _linear_scan(question_id)
+    assert index.pattern_ids("Q001") == ("PAT-A", "PAT-W")
+    assert index.pattern_ids("Q002") == ("PAT-A", "PAT-W", "PAT-B")
+    assert index.wildcard == ("PAT-W",)
+    assert "Q001" in index and "Q003" not in index
+    assert len(index) == 2
+
+
+def test_assembly_uses_index_and_questionnaire_exposes_lookup(questionnaire_root):
+    resolver = CanonicalQuestionnaireResolver(
+        root=questionnaire_root, sdo_enabled=False, snapshot_enabled=False
+    )
+    questionnaire = resolver.resolve()
+
+    patterns = questionnaire.patterns_for_question("Q002")
+    assert [p["id"] for p in patterns] == ["PAT-A", "PAT-W", "PAT-B"]
+    assert patterns[1]["category"] == "WILD"
+    assert patterns[2]["confidence_weight"] == 0.5
+    assert patterns[0]["match_type"] == "REGEX"
+    assert patterns is questionnaire.get_question("Q002")["patterns"]
+
+    # Pre-populated patterns win over the registry, unknown ids are empty
+    assert questionnaire.patterns_for_question("Q050") == [{"id": "INLINE"}]
+    assert questionnaire.patterns_for_question("Q999") == []
+
+    assert questionnaire.pattern_ids_for_question("Q001") == ("PAT-A", "PAT-W")
+    assert questionnaire.pattern_ids_for_question("Q999") == ("PAT-W",)
+    # 300 questions, 6 with inline patterns, Q001/Q002 carry extra registry hits
+    assert resolver.get_metrics()["patterns_merged"] == 294 + 1 + 2
+
+
+def test_snapshot_loaded_questionnaire_rebuilds_index(questionnaire_root):
+    built = CanonicalQuestionnaireResolver(root=questionnaire_root, sdo_enabled=False).resolve()
+    resolver = CanonicalQuestionnaireResolver(root=questionnaire_root, sdo_enabled=False)
+    loaded = resolver.resolve()
+
+    assert resolver.get_metrics()["snapshot_status"] == "hit"
+    assert loaded.sha256 == built.sha256
+    assert loaded.pattern_index.by_question == built.pattern_index.by_question
+    assert loaded.patterns_for_question("Q002") == built.patterns_for_question("Q002")
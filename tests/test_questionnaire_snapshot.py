@@ -0,0 +1,223 @@
+"""Tests for the compiled questionnaire snapshot of CanonicalQuestionnaireResolver."""
+
+import hashlib
+import json
+import os
+import pickle
+import stat as stat_module
+from pathlib import Path
+
+import pytest
+
+from canonic_questionnaire_central.resolver import (
+    SNAPSHOT_HEADER,
+    SNAPSHOT_KEY_NAME,
+    CanonicalQuestionnaireResolver,
+    IntegrityError,
+    default_snapshot_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("FARFAN_CACHE_DIR", str(cache))
+    return cache
+
+
+def _write(path: Path, payload) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+@pytest.fixture
+def questionnaire_root(tmp_path: Path) -> Path:
+    """Minimal modular tree that passes strict count validation."""
+    root = tmp_path / "cqc"
+    _write(root / "config/canonical_notation.json", {"notation": "v1"})
+    _write(root / "governance/versioning.json", {"current_version": "3.1.0"})
+    for d in range(1, 7):
+        _write(root / f"dimensions/DIM{d:02d}/metadata.json", {"dimension_id": f"DIM{d:02d}"})
+        questions = [
+            {
+                "question_id": f"Q{(d - 1) * 50 + n:03d}",
+                "dimension_id": f"DIM{d:02d}",
+                "text": f"question {d}-{n}",
+            }
+            for n in range(1, 51)
+        ]
+        _write(root / f"dimensions/DIM{d:02d}/questions.json", {"questions": questions})
+    for pa in range(1, 11):
+        _write(root / f"policy_areas/PA{pa:02d}_area/metadata.json", {"policy_area_id": f"PA{pa:02d}"})
+        _write(root / f"policy_areas/PA{pa:02d}_area/keywords.json", {"keywords": [f"kw{pa}"]})
+    for cl in range(1, 5):
+        _write(root / f"clusters/CL{cl:02d}_c/metadata.json", {"name": f"cluster {cl}"})
+    _write(
+        root / "patterns/index.json",
+        {"patterns": {"PAT-1": {"pattern": "meta", "applies_to_questions": ["Q001", "Q002"]}}},
+    )
+    return root
+
+
+def _resolver(root: Path, **kwargs) -> CanonicalQuestionnaireResolver:
+    return CanonicalQuestionnaireResolver(root=root, sdo_enabled=False, **kwargs)
+
+
+def _snapshot_file(root: Path) -> Path:
+    return default_snapshot_path(root)
+
+
+def _reference_hash(root: Path) -> str:
+    return _resolver(root, snapshot_enabled=False).resolve().sha256
+
+
+def test_snapshot_round_trip_preserves_hash_and_data(questionnaire_root):
+    first = _resolver(questionnaire_root)
+    built = first.resolve()
+    assert first.get_metrics()["snapshot_status"] == "written"
+    assert _snapshot_file(questionnaire_root).exists()
+
+    second = _resolver(questionnaire_root)
+    loaded = second.resolve(expected_hash=built.sha256)
+    assert second.get_metrics()["snapshot_status"] == "hit"
+    assert second.get_metrics()["files_loaded"] == 0
+    assert loaded.sha256 == built.sha256 == _reference_hash(questionnaire_root)
+    assert loaded.data == built.data
+    assert loaded.micro_questions is loaded.data["blocks"]["micro_questions"]
+    assert loaded.micro_questions[0]["patterns"][0]["id"] == "PAT-1"
+    assert loaded.provenance == built.provenance
+
+    with pytest.raises(IntegrityError):
+        _resolver(questionnaire_root).resolve(expected_hash="0" * 64)
+
+
+def test_changed_module_triggers_incremental_rebuild(questionnaire_root):
+    _resolver(questionnaire_root).resolve()
+    _write(questionnaire_root / "policy_areas/PA03_area/keywords.json", {"keywords": ["nuevo"]})
+
+    resolver = _resolver(questionnaire_root)
+    rebuilt = resolver.resolve()
+    metrics = resolver.get_metrics()
+    assert metrics["snapshot_status"] == "written"
+    # 39 source files are parsed; only the edited one was parsed again
+    assert metrics["snapshot_reused_sources"] == 38
+    assert rebuilt.sha256 == _reference_hash(questionnaire_root)
+    assert rebuilt.data["blocks"]["niveles_abstraccion"]["policy_areas"][2]["keywords"] == ["nuevo"]
+
+    again = _resolver(questionnaire_root)
+    assert again.resolve().sha256 == rebuilt.sha256
+    assert again.get_metrics()["snapshot_status"] == "hit"
+
+
+def test_new_source_file_invalidates_snapshot(questionnaire_root):
+    _resolver(questionnaire_root).resolve()
+    _write(questionnaire_root / "cross_cutting/themes.json", {"themes": ["paz"]})
+
+    resolver = _resolver(questionnaire_root)
+    assert resolver.resolve().data["cross_cutting"] == {"themes": {"themes": ["paz"]}}
+    assert resolver.get_metrics()["snapshot_status"] == "written"
+
+
+def test_touched_but_identical_sources_stay_valid(questionnaire_root):
+    built = _resolver(questionnaire_root).resolve()
+    metadata = questionnaire_root / "clusters/CL01_c/metadata.json"
+    stat = metadata.stat()
+    os.utime(metadata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    resolver = _resolver(questionnaire_root)
+    assert resolver.resolve().sha256 == built.sha256
+    assert resolver.get_metrics()["snapshot_status"] == "hit"
+    snapshot = resolver._open_snapshot()
+    assert snapshot.index["sources"]["clusters/CL01_c/metadata.json"][0] == stat.st_mtime_ns + 10**9
+    snapshot.close()
+
+
+@pytest.mark.parametrize("damage", ["truncate", "flip_payload", "garbage"])
+def test_damaged_snapshot_is_rebuilt(questionnaire_root, damage):
+    built = _resolver(questionnaire_root).resolve()
+    snapshot = _snapshot_file(questionnaire_root)
+    blob = bytearray(snapshot.read_bytes())
+    if damage == "truncate":
+        blob = blob[:10]
+    elif damage == "flip_payload":
+        blob[-1] ^= 0xFF
+        blob[len(blob) // 2] ^= 0xFF
+    else:
+        blob = bytearray(b"not a snapshot at all")
+    snapshot.write_bytes(bytes(blob))
+
+    resolver = _resolver(questionnaire_root)
+    assert resolver.resolve().sha256 == built.sha256
+    assert resolver.get_metrics()["snapshot_status"] == "written"
+
+
+def test_tampered_source_segment_discards_snapshot(questionnaire_root):
+    _resolver(questionnaire_root).resolve()
+    snapshot_path = _snapshot_file(questionnaire_root)
+    blob = bytearray(snapshot_path.read_bytes())
+    _magic, _version, index_length, _mac = SNAPSHOT_HEADER.unpack_from(blob, 0)
+    index = json.loads(blob[SNAPSHOT_HEADER.size : SNAPSHOT_HEADER.size + index_length])
+    offset, length = index["sources"]["dimensions/DIM01/questions.json"][3:5]
+    blob[SNAPSHOT_HEADER.size + index_length + offset + length // 2] ^= 0xFF
+    snapshot_path.write_bytes(bytes(blob))
+    _write(questionnaire_root / "config/canonical_notation.json", {"notation": "v2"})
+
+    resolver = _resolver(questionnaire_root)
+    rebuilt = resolver.resolve()
+    assert resolver.get_metrics()["snapshot_reused_sources"] == 0
+    assert rebuilt.sha256 == _reference_hash(questionnaire_root)
+
+
+def test_forged_payload_with_matching_digest_is_rejected(questionnaire_root, tmp_path):
+    built = _resolver(questionnaire_root).resolve()
+    snapshot_path = _snapshot_file(questionnaire_root)
+    blob = bytes(snapshot_path.read_bytes())
+    magic, version, index_length, mac = SNAPSHOT_HEADER.unpack_from(blob, 0)
+    index = json.loads(blob[SNAPSHOT_HEADER.size : SNAPSHOT_HEADER.size + index_length])
+    body = blob[SNAPSHOT_HEADER.size + index_length :]
+
+    # Replace the payload and update every digest stored in the snapshot itself
+    forged = pickle.dumps({"blocks": {"micro_questions": []}, "forged": True})
+    index["payload"] = [len(body), len(forged), hashlib.sha256(forged).hexdigest()]
+    forged_index = json.dumps(index).encode("utf-8")
+    snapshot_path.write_bytes(
+        SNAPSHOT_HEADER.pack(magic, version, len(forged_index), mac) + forged_index + body + forged
+    )
+
+    resolver = _resolver(questionnaire_root)
+    loaded = resolver.resolve()
+    assert resolver.get_metrics()["snapshot_status"] == "written"
+    assert "forged" not in loaded.data
+    assert loaded.sha256 == built.sha256
+
+
+def test_snapshot_lives_in_user_cache_with_private_key(questionnaire_root, cache_dir):
+    resolver = _resolver(questionnaire_root)
+    resolver.resolve()
+
+    snapshot_path = Path(resolver.get_metrics()["snapshot_path"])
+    assert snapshot_path.parent == cache_dir / "questionnaire"
+    assert not list(questionnaire_root.rglob("*.bin"))
+    key_mode = (snapshot_path.parent / SNAPSHOT_KEY_NAME).stat().st_mode
+    assert stat_module.S_IMODE(key_mode) == 0o600
+
+    # Snapshots signed with another key are not trusted
+    (snapshot_path.parent / SNAPSHOT_KEY_NAME).write_bytes(os.urandom(32))
+    again = _resolver(questionnaire_root)
+    again.resolve()
+    assert again.get_metrics()["snapshot_status"] == "written"
+
+
+def test_invalid_assemblies_are_not_snapshotted(questionnaire_root):
+    (questionnaire_root / "clusters/CL04_c/metadata.json").unlink()
+    resolver = _resolver(questionnaire_root, strict_mode=False)
+    resolver.resolve()
+    assert resolver.get_metrics()["validation_errors"]
+    assert not _snapshot_file(questionnaire_root).exists()
+
+
+def test_force_rebuild_bypasses_snapshot(questionnaire_root):
+    built = _resolver(questionnaire_root).resolve()
+    resolver = _resolver(questionnaire_root)
+    assert resolver.resolve(force_rebuild=True).sha256 == built.sha256
+    assert resolver.get_metrics()["snapshot_reused_sources"] == 0
@@ -0,0 +1,139 @@
+# tests/test_sisas/test_bus_delivery.py
+
+import threading
+import time
+
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.core.bus import (
+    BusRegistry,
+    BusType,
+    DeliveryMode,
+    SignalBus,
+)
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.core.contracts import (
+    ConsumptionContract,
+    PublicationContract,
+    SignalTypeSpec,
+)
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.scripts.benchmark_bus_delivery import (
+    BENCHMARK_SIGNAL_TYPE,
+    _BenchmarkSignal,
+    run_comparison,
+)
+
+
+def _publication(bus: SignalBus) -> PublicationContract:
+    return PublicationContract(
+        contract_id="PC_TEST",
+        publisher_vehicle="test_vehicle",
+        allowed_signal_types=[SignalTypeSpec(signal_type=BENCHMARK_SIGNAL_TYPE)],
+        allowed_buses=[bus.name],
+        require_context=False,
+        require_source=False,
+    )
+
+
+def _consumer(bus: SignalBus, consumer_id: str, on_receive) -> ConsumptionContract:
+    return ConsumptionContract(
+        contract_id=f"CC_{consumer_id}",
+        consumer_id=consumer_id,
+        subscribed_signal_types=[BENCHMARK_SIGNAL_TYPE],
+        subscribed_buses=[bus.name],
+        on_receive=on_receive,
+    )
+
+
+class TestAsyncDelivery:
+    """Entrega asíncrona con cola acotada por suscriptor"""
+
+    def test_slow_consumer_does_not_block_fast_consumer(self):
+        bus = SignalBus(bus_type=BusType.OPERATIONAL, delivery_mode=DeliveryMode.ASYNC)
+        release = threading.Event()
+        fast_received = []
+
+        bus.subscribe(_consumer(bus, "slow", lambda signal, cid: release.wait(5)))
+        bus.subscribe(_consumer(bus, "fast", lambda signal, cid: fast_received.append(signal.sequence)))
+
+        publication = _publication(bus)
+        for i in range(20):
+            ok, _ = bus.publish(_BenchmarkSignal(sequence=i), "test_vehicle", publication)
+            assert ok
+
+        deadline = time.monotonic() + 5
+        while len(fast_received) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert fast_received == list(range(20))
+        assert bus.check_consumer_backpressure("slow", threshold=5, quiet=True)["has_backpressure"]
+
+        release.set()
+        assert bus.drain(timeout=5)
+        assert bus.get_stats()["total_delivered"] == 40
+        assert all(len(m.acknowledged_by) == 2 for m in bus._message_history)
+        bus.shutdown()
+
+    def test_full_queue_blocks_publisher_without_losing_messages(self):
+        bus = SignalBus(
+            bus_type=BusType.OPERATIONAL,
+            delivery_mode=DeliveryMode.ASYNC,
+            delivery_queue_size=2,
+            max_backpressure_delay=0.0,
+        )
+        received = []
+        bus.subscribe(_consumer(bus, "slow", lambda signal, cid: (time.sleep(0.005), received.append(signal.sequence))))
+
+        publication = _publication(bus)
+        for i in range(10):
+            bus.publish(_BenchmarkSignal(sequence=i), "test_vehicle", publication)
+
+        assert bus.drain(timeout=5)
+        assert received == list(range(10))
+        assert bus.get_stats()["total_backpressure_blocks"] > 0
+        bus.shutdown()
+
+    def test_registry_propagates_delivery_mode(self):
+        registry = BusRegistry(delivery_mode=DeliveryMode.ASYNC)
+        assert registry.get_bus("structural_bus").delivery_mode is DeliveryMode.ASYNC
+
+
+class TestShardedHistory:
+    """Historial fragmentado round-robin"""
+
+    def test_history_preserves_publication_order_across_threads(self):
+        bus = SignalBus(bus_type=BusType.OPERATIONAL, history_shards=4)
+        publication = _publication(bus)
+
+        def publish_many(offset):
+            for i in range(50):
+                bus.publish(_BenchmarkSignal(sequence=offset + i), "test_vehicle", publication)
+
+        threads = [threading.Thread(target=publish_many, args=(k * 1000,)) for k in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        history = bus._message_history
+        assert len(history) == 200
+        for k in range(4):
+            own = [m.signal.sequence for m in history if m.signal.sequence // 1000 == k]
+            assert own == sorted(own)
+        assert bus.get_stats()["total_published"] == 200
+        assert bus.history_size() == 200
+        assert sorted(m.signal.sequence for m in bus.iter_history()) == sorted(
+            m.signal.sequence for m in history
+        )
+
+    def test_single_publisher_spreads_over_all_shards(self):
+        bus = SignalBus(bus_type=BusType.OPERATIONAL, history_shards=4)
+        publication = _publication(bus)
+        for i in range(8):
+            bus.publish(_BenchmarkSignal(sequence=i), "test_vehicle", publication)
+
+        assert [len(shard.entries) for shard in bus._history] == [2, 2, 2, 2]
+
+
+def test_publish_benchmark_runs_in_both_modes():
+    results = run_comparison([2], messages=50, consumer_delay=0.0)
+    assert {r["mode"] for r in results} == {"sync", "async"}
+    for result in results:
+        assert result["stats"]["total_delivered"] == 100
+        assert result["msgs_per_second"] > 0
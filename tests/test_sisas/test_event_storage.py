@@ -0,0 +1,189 @@
+# tests/test_sisas/test_event_storage.py
+
+import pytest
+
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.core.event import (
+    Event,
+    EventPayload,
+    EventStore,
+    EventType,
+    InMemoryEventStorage,
+    LazyEventPayload,
+    SegmentedLogEventStorage,
+)
+
+
+def _make_events(n: int, correlation_id: str = "corr-1"):
+    events = []
+    previous = None
+    for i in range(n):
+        event = Event(
+            event_type=EventType.SIGNAL_GENERATED if i % 2 else EventType.IRRIGATION_STARTED,
+            source_file=f"file_{i % 3}.json",
+            phase=f"phase_0{i % 4}",
+            correlation_id=correlation_id,
+            causation_id=previous,
+            payload=EventPayload(data={"index": i, "text": "x" * 50}),
+        )
+        previous = event.event_id
+        events.append(event)
+    return events
+
+
+@pytest.fixture(params=["memory", "log"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        event_store = EventStore()
+    else:
+        event_store = EventStore(
+            storage=SegmentedLogEventStorage(
+                storage_dir=str(tmp_path / "log"),
+                segment_max_bytes=4096,
+                hot_capacity=8,
+            )
+        )
+    yield event_store
+    event_store.close()
+
+
+class TestEventStoreEngines:
+    """Los motores de almacenamiento exponen la misma semántica"""
+
+    def test_indexed_lookups(self, store):
+        events = _make_events(40)
+        for event in events:
+            store.append(event)
+
+        assert store.count() == 40
+        assert store.get_by_id(events[17].event_id).event_id == events[17].event_id
+        assert store.get_by_id("missing") is None
+        assert [e.event_id for e in store.get_by_type(EventType.SIGNAL_GENERATED)] == [
+            e.event_id for e in events if e.event_type == EventType.SIGNAL_GENERATED
+        ]
+        assert len(store.get_by_file("file_0.json")) == 14
+        assert len(store.get_by_phase("phase_01")) == 10
+        assert len(store.get_by_correlation("corr-1")) == 40
+
+        stats = store.get_statistics()
+        assert stats["total_events"] == 40
+        assert stats["by_type"] == {"irrigation_started": 20, "signal_generated": 20}
+
+    def test_causality_chain(self, store):
+        events = _make_events(30)
+        for event in events:
+            store.append(event)
+
+        chain = store.get_causality_chain(events[-1].event_id, max_depth=5)
+        assert [e.event_id for e in chain] == [e.event_id for e in events[-5:]]
+        assert chain[0].payload.data["index"] == 25
+
+    def test_jsonl_roundtrip(self, store):
+        for event in _make_events(12):
+            store.append(event)
+
+        restored = EventStore.from_jsonl(store.to_jsonl())
+        assert restored.count() == 12
+        assert restored.get_statistics()["by_phase"] == store.get_statistics()["by_phase"]
+
+
+class TestSegmentedLogEventStorage:
+    """Log segmentado append-only"""
+
+    def test_segments_rotate_and_memory_stays_bounded(self, tmp_path):
+        storage = SegmentedLogEventStorage(
+            storage_dir=str(tmp_path), segment_max_bytes=2048, hot_capacity=5
+        )
+        for event in _make_events(100):
+            storage.append(event)
+
+        assert len(list(tmp_path.glob("events-*.log"))) > 1
+        assert storage.get_stats()["hot_events"] <= 5
+        storage.close()
+
+    def test_payload_is_decoded_lazily(self, tmp_path):
+        storage = SegmentedLogEventStorage(storage_dir=str(tmp_path), hot_capacity=1)
+        events = _make_events(3)
+        for event in events:
+            storage.append(event)
+
+        loaded = storage.get(events[0].event_id)
+        assert isinstance(loaded.payload, LazyEventPayload)
+        assert not loaded.payload.is_decoded
+        assert loaded.payload.data == {"index": 0, "text": "x" * 50}
+        assert loaded.payload == events[0].payload
+        storage.close()
+
+    def test_reopen_recovers_index_and_state(self, tmp_path):
+        storage = SegmentedLogEventStorage(storage_dir=str(tmp_path), hot_capacity=2)
+        events = _make_events(10)
+        for event in events:
+            storage.append(event)
+        storage.get(events[3].event_id).mark_processed()
+        storage.close()
+
+        with open(next(iter(sorted(tmp_path.glob("events-*.log")))), "ab") as f:
+            f.write(b'{"event_id": "torn')
+
+        reopened = EventStore(storage=SegmentedLogEventStorage(storage_dir=str(tmp_path)))
+        assert reopened.count() == 10
+        assert reopened.get_by_id(events[3].event_id).processed
+        assert len(reopened.get_unprocessed()) == 9
+        assert len(reopened.get_by_phase("phase_02")) == 2
+        reopened.close()
+
+    def test_initial_events_are_moved_to_storage(self, tmp_path):
+        events = _make_events(4)
+        store = EventStore(
+            events=events, storage=SegmentedLogEventStorage(storage_dir=str(tmp_path))
+        )
+        assert store.count() == 4
+        assert len(store.events) == 4
+        assert [e.event_id for e in store.events] == [e.event_id for e in events]
+        assert store.events[-1].event_id == events[-1].event_id
+        store.close()
+
+    def test_evict_drops_rows_and_survives_reopen(self, tmp_path):
+        storage = SegmentedLogEventStorage(storage_dir=str(tmp_path), hot_capacity=4)
+        events = _make_events(20)
+        for event in events:
+            storage.append(event)
+
+        storage.evict([e.event_id for e in events[:15]])
+        assert storage.count() == 5
+        assert len(storage._row_by_id) == 5
+        assert storage.get(events[0].event_id) is None
+        assert storage.get(events[16].event_id).event_id == events[16].event_id
+        assert sum(storage.index_counts("type").values()) == 5
+        storage.close()
+
+        reopened = SegmentedLogEventStorage(storage_dir=str(tmp_path))
+        assert [e.event_id for e in reopened.iter_events()] == [
+            e.event_id for e in events[15:]
+        ]
+        assert len(reopened.ids_for("correlation", "corr-1")) == 5
+        reopened.close()
+
+
+def test_in_memory_storage_indexes_initial_events():
+    events = _make_events(6)
+    store = EventStore(events=events)
+    assert isinstance(store.storage, InMemoryEventStorage)
+    assert store.get_by_id(events[2].event_id) is events[2]
+    assert len(store.get_by_type(EventType.IRRIGATION_STARTED)) == 3
+
+
+def test_in_memory_append_of_existing_id_replaces_event():
+    events = _make_events(3)
+    store = EventStore(events=list(events))
+    replacement = Event.from_dict(events[1].to_dict())
+    replacement.phase = "phase_09"
+    replacement.mark_processed()
+
+    store.append(replacement)
+
+    assert store.count() == 3
+    assert store.events[1] is replacement
+    assert store.get_by_id(events[1].event_id) is replacement
+    assert [e.event_id for e in store.get_by_phase("phase_09")] == [events[1].event_id]
+    assert store.get_by_phase("phase_01") == []
+    assert len(store.get_unprocessed()) == 2
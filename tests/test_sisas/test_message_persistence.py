@@ -0,0 +1,187 @@
+# tests/test_sisas/test_message_persistence.py
+
+import json
+
+import pytest
+
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.core import bus as bus_module
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.core.bus import (
+    BusMessage,
+    BusType,
+    SegmentedBinaryMessagePersistence,
+    SignalBus,
+    configure_message_persistence,
+)
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.core.contracts import (
+    PublicationContract,
+    SignalTypeSpec,
+)
+from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.scripts.benchmark_bus_delivery import (
+    BENCHMARK_SIGNAL_TYPE,
+    _BenchmarkSignal,
+)
+
+
+class _Signal(_BenchmarkSignal):
+    def to_dict(self):
+        return {"signal_type": self.signal_type, "sequence": self.sequence}
+
+
+def _messages(start: int, count: int):
+    return [BusMessage(signal=_Signal(sequence=i), publisher_vehicle="v") for i in range(start, start + count)]
+
+
+@pytest.fixture
+def backend(tmp_path):
+    persistence = SegmentedBinaryMessagePersistence(
+        storage_dir=str(tmp_path), segment_max_bytes=4096, index_interval=8
+    )
+    yield persistence
+    persistence.close()
+
+
+class TestSegmentedBinaryMessagePersistence:
+    """Persistencia binaria por lotes con índice disperso"""
+
+    def test_retrieve_reads_tail_across_segments(self, backend, tmp_path):
+        for start in range(0, 200, 20):
+            backend.persist_messages("bus_a", _messages(start, 20))
+
+        tail = backend.retrieve_messages("bus_a", limit=30)
+        assert [m["signal"]["sequence"] for m in tail] == list(range(170, 200))
+        assert len(list((tmp_path / "bus_a").glob("segment_*.bin"))) > 1
+        assert backend.retrieve_messages("missing_bus") == []
+
+    def test_reopen_recovers_frames(self, tmp_path):
+        first = SegmentedBinaryMessagePersistence(storage_dir=str(tmp_path), index_interval=4)
+        first.persist_messages("bus_a", _messages(0, 10))
+        first.close()
+
+        segment = next((tmp_path / "bus_a").glob("segment_*.bin"))
+        with open(segment, "ab") as f:
+            f.write(b"\xff\x00\x00")  # frame truncado
+
+        reopened = SegmentedBinaryMessagePersistence(storage_dir=str(tmp_path), index_interval=4)
+        reopened.persist_messages("bus_a", _messages(10, 5))
+        tail = reopened.retrieve_messages("bus_a", limit=100)
+        assert [m["signal"]["sequence"] for m in tail] == list(range(15))
+        reopened.close()
+
+    def test_stats_expose_latency_counters(self, backend):
+        backend.persist_messages("bus_a", _messages(0, 5))
+        backend.flush()
+        stats = backend.get_stats()
+        assert stats["messages_written"] == 5
+        assert stats["flushes"] >= 1
+        assert stats["flush_latency_ms_max"] >= stats["flush_latency_ms_avg"] >= 0.0
+        assert stats["enqueue_latency_ms_avg"] >= 0.0
+
+
+class TestWriteFailures:
+    """Un lote cuya escritura falla no se pierde"""
+
+    @staticmethod
+    def _failing(backend, monkeypatch, failures):
+        calls = {"n": 0}
+        append_frames = backend._append_frames
+
+        def flaky(bus_name, messages):
+            calls["n"] += 1
+            if calls["n"] <= failures:
+                raise OSError("disk full")
+            return append_frames(bus_name, messages)
+
+        monkeypatch.setattr(backend, "_append_frames", flaky)
+        return calls
+
+    def test_failed_batch_is_requeued_and_retried(self, tmp_path, monkeypatch):
+        backend = SegmentedBinaryMessagePersistence(storage_dir=str(tmp_path), flush_interval=60)
+        self._failing(backend, monkeypatch, failures=2)
+
+        backend.persist_messages("bus_a", _messages(0, 5))
+        backend.persist_messages("bus_a", _messages(5, 5))
+        for _ in range(3):
+            backend.flush()
+
+        stats = backend.get_stats()
+        assert stats["write_errors"] == 2
+        assert stats["messages_requeued"] > 0
+        assert stats["last_write_error"] == "bus_a: disk full"
+        assert stats["messages_written"] == 10
+        assert stats["pending_batches"] == 0
+        tail = backend.retrieve_messages("bus_a", limit=100)
+        assert [m["signal"]["sequence"] for m in tail] == list(range(10))
+        backend.close()
+
+    def test_failure_in_later_segment_retries_only_unwritten_messages(self, tmp_path, monkeypatch):
+        backend = SegmentedBinaryMessagePersistence(
+            storage_dir=str(tmp_path), segment_max_bytes=512, flush_interval=60
+        )
+        append_to_segment = backend._append_to_segment
+        calls = {"n": 0}
+
+        def flaky(segment, messages, position):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise OSError("disk full")
+            return append_to_segment(segment, messages, position)
+
+        monkeypatch.setattr(backend, "_append_to_segment", flaky)
+        backend.persist_messages("bus_a", _messages(0, 40))
+        backend.flush()
+        backend.flush()
+
+        tail = backend.retrieve_messages("bus_a", limit=100)
+        assert [m["signal"]["sequence"] for m in tail] == list(range(40))
+        assert backend.get_stats()["messages_written"] == 40
+        backend.close()
+
+    def test_persistent_failure_goes_to_dead_letter(self, tmp_path, monkeypatch):
+        backend = SegmentedBinaryMessagePersistence(
+            storage_dir=str(tmp_path), flush_interval=60, max_write_attempts=2
+        )
+        self._failing(backend, monkeypatch, failures=10**6)
+
+        backend.persist_messages("bus_a", _messages(0, 4))
+        for _ in range(2):
+            backend.flush()
+
+        stats = backend.get_stats()
+        assert stats["messages_dead_lettered"] == 4
+        assert stats["messages_written"] == 0
+        assert stats["pending_batches"] == 0
+        lines = (tmp_path / "dead_letter" / "bus_a.jsonl").read_text().splitlines()
+        assert [json.loads(line)["signal"]["sequence"] for line in lines] == list(range(4))
+        backend.close()
+
+    def test_close_dead_letters_pending_failures(self, tmp_path, monkeypatch):
+        backend = SegmentedBinaryMessagePersistence(storage_dir=str(tmp_path), flush_interval=60)
+        self._failing(backend, monkeypatch, failures=10**6)
+
+        backend.persist_messages("bus_a", _messages(0, 3))
+        backend.close()
+
+        assert backend.get_stats()["messages_dead_lettered"] == 3
+
+
+@pytest.mark.parametrize("shards", [1, 4, 16])
+def test_bus_overflow_spills_to_binary_backend(backend, monkeypatch, shards):
+    monkeypatch.setattr(bus_module, "_message_persistence_backend", None)
+    configure_message_persistence(backend)
+
+    bus = SignalBus(bus_type=BusType.OPERATIONAL, history_shards=shards, _max_history_size=10)
+    publication = PublicationContract(
+        contract_id="PC_TEST",
+        allowed_signal_types=[SignalTypeSpec(signal_type=BENCHMARK_SIGNAL_TYPE)],
+        allowed_buses=[bus.name],
+        require_context=False,
+        require_source=False,
+    )
+    for i in range(25):
+        bus.publish(_Signal(sequence=i), "v", publication)
+
+    assert bus.history_size() == 10
+    assert [m.signal.sequence for m in bus._message_history] == list(range(15, 25))
+    persisted = backend.retrieve_messages(bus.name, limit=100)
+    assert [m["signal"]["sequence"] for m in persisted] == list(range(15))
+    assert bus.get_stats()["persistence"]["messages_written"] == 15
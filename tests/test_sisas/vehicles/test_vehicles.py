@@ -69,3 +69,52 @@ class TestSignalContextScoperVehicle:
         # Check determinacy
         det_signal = next(s for s in signals if s.signal_type == "AnswerDeterminacySignal")
         assert "sí" in det_signal.affirmative_markers
+
+class TestVehicleExtractionCache:
+    ANSWER = {"answer": "Sí, existe la Ley 1448 y el Ministerio de Salud debe verificar el porcentaje"}
+
+    def test_text_analyses_are_shared_through_document_cache(self, sample_context):
+        from farfan_pipeline.infrastructure.extractors.extraction_cache import DocumentExtractionCache
+        from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.vehicles.signal_evidence_extractor import (
+            SignalEvidenceExtractorVehicle,
+        )
+
+        uncached = SignalEvidenceExtractorVehicle().process(self.ANSWER, sample_context)
+
+        cache = DocumentExtractionCache("plan", spill=False)
+        vehicle = SignalEvidenceExtractorVehicle(extraction_cache=cache)
+        vehicle.process(self.ANSWER, sample_context)
+        cached = vehicle.process(self.ANSWER, sample_context)
+
+        metrics = cache.get_metrics()
+        assert (metrics["misses"], metrics["hits"]) == (2, 2)
+        for before, after in zip(uncached, cached):
+            assert before.signal_type == after.signal_type
+            assert before.rationale == after.rationale
+
+    def test_vehicles_use_the_active_document_cache(self, sample_context):
+        from farfan_pipeline.infrastructure.extractors.extraction_cache import (
+            document_extraction_scope,
+            peek_document_extraction_cache,
+            release_document_extraction_cache,
+        )
+        from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.vehicles.signal_evidence_extractor import (
+            SignalEvidenceExtractorVehicle,
+        )
+        from farfan_pipeline.infrastructure.irrigation_using_signals.SISAS.vehicles.signal_intelligence_layer import (
+            SignalIntelligenceLayerVehicle,
+        )
+
+        SignalEvidenceExtractorVehicle().process(self.ANSWER, sample_context)
+        assert peek_document_extraction_cache("plan-vehicles") is None
+
+        try:
+            with document_extraction_scope("plan-vehicles"):
+                for vehicle_cls in (SignalEvidenceExtractorVehicle, SignalIntelligenceLayerVehicle):
+                    vehicle_cls().process(self.ANSWER, sample_context)
+                    vehicle_cls().process(self.ANSWER, sample_context)
+            metrics = peek_document_extraction_cache("plan-vehicles").get_metrics()
+        finally:
+            release_document_extraction_cache("plan-vehicles")
+
+        assert metrics["misses"] == metrics["hits"] > 0